@@ -10,6 +10,7 @@ import json
 import logging
 import os
 import re
+from contextlib import nullcontext
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -75,6 +76,7 @@ from .base import (
     sanitize_error_message,
 )
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .scheduler import SubtaskScheduler, get_max_parallel_subtasks
 from .session import post_session_processing, run_agent_session
 from .utils import (
     find_phase_for_subtask,
@@ -300,6 +302,158 @@ def parse_rate_limit_reset_time(error_info: dict | None) -> int | None:
     return None
 
 
+async def _build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+    concurrent: bool = False,
+) -> str:
+    """Generate the coder prompt for a subtask, with file and memory context."""
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+        concurrent=concurrent,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
+async def _check_stuck_subtask(
+    spec_dir: Path,
+    subtask_id: str,
+    success: bool,
+    recovery_manager: RecoveryManager,
+    linear_enabled: bool,
+) -> None:
+    """Mark a subtask as stuck once it has failed three sessions."""
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if success or attempt_count < 3:
+        return
+
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"Failed after {attempt_count} attempts"
+    )
+    print()
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+        "error",
+    )
+    print(muted("Consider: manual intervention or skipping this subtask"))
+
+    # Record stuck subtask in Linear (if enabled)
+    if linear_enabled:
+        await linear_task_stuck(
+            spec_dir=spec_dir,
+            subtask_id=subtask_id,
+            attempt_count=attempt_count,
+        )
+        print_status("Linear notified of stuck subtask", "info")
+
+
+async def _run_parallel_session(
+    subtask: dict,
+    session_num: int,
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    verbose: bool,
+    recovery_manager: RecoveryManager,
+    linear_enabled: bool,
+    source_spec_dir: Path | None,
+) -> str:
+    """
+    Run one coder session for a subtask scheduled alongside others.
+
+    Session errors are only reported through the returned status: the
+    scheduler stops dispatching, and the main loop's sequential path deals
+    with rate limits, authentication pauses and retry backoff.
+
+    Returns:
+        The session status ("continue", "complete" or "error")
+    """
+    subtask_id = subtask["id"]
+    print_status(
+        f"Session {session_num}: starting {subtask_id} - "
+        f"{subtask.get('description', 'No description')}",
+        "progress",
+    )
+
+    phase_model = get_phase_model(spec_dir, "coding", model)
+    client = create_client(
+        project_dir,
+        spec_dir,
+        phase_model,
+        agent_type="coder",
+        max_thinking_tokens=get_phase_thinking_budget(spec_dir, "coding"),
+    )
+    prompt = await _build_subtask_prompt(
+        spec_dir, project_dir, subtask, recovery_manager, concurrent=True
+    )
+
+    # Other sessions commit to the same branch, so post-processing finds this
+    # subtask's commits by their message rather than by the HEAD range
+    commit_before = get_latest_commit(project_dir)
+    commit_count_before = get_commit_count(project_dir)
+
+    task_logger = get_task_logger(spec_dir)
+    log_context = (
+        task_logger.session_context(subtask_id, session_num)
+        if task_logger
+        else nullcontext()
+    )
+    with log_context:
+        async with client:
+            status, _response, _error_info = await run_agent_session(
+                client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+            )
+
+        success = await post_session_processing(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commit_before,
+            commit_count_before=commit_count_before,
+            recovery_manager=recovery_manager,
+            linear_enabled=linear_enabled,
+            source_spec_dir=source_spec_dir,
+            own_commits_only=True,
+        )
+        await _check_stuck_subtask(
+            spec_dir, subtask_id, success, recovery_manager, linear_enabled
+        )
+    return status
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -314,6 +468,11 @@ async def run_autonomous_agent(
     The agent can use subagents (via Task tool) for parallel execution if needed.
     This is decided by the agent itself based on the task complexity.
 
+    When the task allows more than one worker (maxParallelSubtasks in
+    task_metadata.json, or MAX_PARALLEL_SUBTASKS), independent subtasks from
+    parallel_safe phases or phases whose dependencies are met run in
+    concurrent coder sessions; see agents/scheduler.py.
+
     Args:
         project_dir: Root directory for the project
         spec_dir: Directory containing the spec (auto-claude/specs/001-name/)
@@ -461,6 +620,56 @@ async def run_autonomous_agent(
         current_retry_delay = INITIAL_RETRY_DELAY_SECONDS
         concurrency_error_context = None
 
+    async def _complete_build() -> None:
+        """Report a finished build (all subtasks done, QA still to run)."""
+        # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
+        # QA loop will emit COMPLETE after actual approval
+        print_build_complete_banner(spec_dir)
+        status_manager.update(state=BuildState.COMPLETE)
+
+        # Reset error tracking on success
+        _reset_concurrency_state()
+
+        if task_logger:
+            task_logger.end_phase(
+                LogPhase.CODING,
+                success=True,
+                message="All subtasks completed successfully",
+            )
+
+        if linear_task and linear_task.task_id:
+            await linear_build_complete(spec_dir)
+            print_status("Linear notified: build complete, ready for QA", "success")
+
+    # Parallel subtask sessions
+    parallel_workers = get_max_parallel_subtasks(spec_dir)
+    active_workers = 0
+    next_session_num = 0
+
+    async def _run_scheduled_subtask(subtask: dict) -> str:
+        """Run a subtask dispatched by the parallel scheduler."""
+        nonlocal active_workers, next_session_num
+        session_num = next_session_num
+        next_session_num += 1
+        active_workers += 1
+        status_manager.update_workers(active_workers, parallel_workers)
+        try:
+            return await _run_parallel_session(
+                subtask,
+                session_num,
+                project_dir=project_dir,
+                spec_dir=spec_dir,
+                model=model,
+                verbose=verbose,
+                recovery_manager=recovery_manager,
+                linear_enabled=linear_task is not None
+                and linear_task.task_id is not None,
+                source_spec_dir=source_spec_dir,
+            )
+        finally:
+            active_workers -= 1
+            status_manager.update_workers(active_workers, parallel_workers)
+
     while True:
         iteration += 1
 
@@ -487,6 +696,45 @@ async def run_autonomous_agent(
             print("To continue, run the script again without --max-iterations")
             break
 
+        # Run independent subtasks side by side when the plan allows it. The
+        # first coding iteration after planning stays sequential so the phase
+        # transition below is recorded first.
+        if parallel_workers > 1 and not first_run and not is_planning_phase:
+            scheduler = SubtaskScheduler(
+                spec_dir,
+                parallel_workers,
+                excluded=lambda: [
+                    s["subtask_id"] for s in recovery_manager.get_stuck_subtasks()
+                ],
+            )
+            if len(scheduler.ready()) > 1:
+                print_status(
+                    f"Running independent subtasks in up to {parallel_workers} "
+                    "parallel sessions",
+                    "info",
+                )
+                next_session_num = iteration
+                parallel_ok = await scheduler.run(
+                    _run_scheduled_subtask,
+                    max_sessions=max_iterations - iteration + 1
+                    if max_iterations
+                    else None,
+                )
+                iteration += max(scheduler.sessions_run - 1, 0)
+                print_progress_summary(spec_dir)
+
+                if is_build_complete(spec_dir):
+                    await _complete_build()
+                    break
+                if parallel_ok:
+                    continue
+                # A session failed: the sequential session below handles rate
+                # limits, authentication pauses and retry backoff
+                print_status(
+                    "Parallel session failed - continuing with one session",
+                    "warning",
+                )
+
         # Get the next subtask to work on (planner sessions shouldn't bind to a subtask)
         next_subtask = None if first_run else get_next_subtask(spec_dir)
         subtask_id = next_subtask.get("id") if next_subtask else None
@@ -615,40 +863,10 @@ async def run_autonomous_agent(
                     print("No pending subtasks found - build may be complete!")
                     break
 
-            # Get attempt count for recovery context
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
-            )
-
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
+            prompt = await _build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
+            attempt_count = recovery_manager.get_attempt_count(subtask_id)
 
             # Add concurrency error context if recovering from 400 error
             if concurrency_error_context:
@@ -733,26 +951,9 @@ async def run_autonomous_agent(
             )
 
             # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
-                )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
-                )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
-                    )
-                    print_status("Linear notified of stuck subtask", "info")
+            await _check_stuck_subtask(
+                spec_dir, subtask_id, success, recovery_manager, linear_is_enabled
+            )
         elif plan_validated and source_spec_dir:
             # After planning phase, sync the newly created implementation plan back to source
             if sync_spec_to_source(spec_dir, source_spec_dir):
@@ -760,25 +961,7 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            # Don't emit COMPLETE here - subtasks are done but QA hasn't run yet
-            # QA loop will emit COMPLETE after actual approval
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
-            # Reset error tracking on success
-            _reset_concurrency_state()
-
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _complete_build()
             break
 
         elif status == "continue":
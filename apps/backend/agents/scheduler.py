@@ -0,0 +1,278 @@
+"""
+Parallel Subtask Scheduler
+==========================
+
+Runs independent subtasks of an implementation plan in concurrent coder
+sessions, up to a worker limit.
+
+A subtask is ready when every phase its phase depends_on is complete:
+- subtasks of a `parallel_safe` phase may all run at once
+- other phases run their subtasks one at a time, in order, but independent
+  phases proceed side by side
+
+Sessions share one working directory, so subtasks whose declared files
+(files_to_modify + files_to_create) overlap never run at the same time, and a
+subtask that declares no files runs alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path, PurePosixPath
+
+from core.plan_normalization import normalize_subtask_aliases
+from phase_config import load_task_metadata
+
+logger = logging.getLogger(__name__)
+
+# Environment fallback for the number of concurrent coder sessions
+MAX_PARALLEL_SUBTASKS_ENV = "MAX_PARALLEL_SUBTASKS"
+
+# Sequential builds unless configured otherwise
+DEFAULT_MAX_PARALLEL_SUBTASKS = 1
+
+_PENDING_STATUSES = {"pending", "not_started", "not started"}
+
+
+def get_max_parallel_subtasks(spec_dir: Path | None = None) -> int:
+    """
+    Number of concurrent coder sessions allowed for a task.
+
+    Priority:
+    1. maxParallelSubtasks in the spec's task_metadata.json
+    2. MAX_PARALLEL_SUBTASKS environment variable
+    3. 1 (sequential)
+    """
+    candidates = []
+    if spec_dir is not None:
+        metadata = load_task_metadata(Path(spec_dir)) or {}
+        candidates.append(("maxParallelSubtasks", metadata.get("maxParallelSubtasks")))
+    candidates.append(
+        (MAX_PARALLEL_SUBTASKS_ENV, os.environ.get(MAX_PARALLEL_SUBTASKS_ENV))
+    )
+
+    for source, value in candidates:
+        if value is None or str(value).strip() == "":
+            continue
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            logger.warning(f"Ignoring invalid {source}={value!r}")
+    return DEFAULT_MAX_PARALLEL_SUBTASKS
+
+
+def subtask_files(subtask: dict) -> frozenset[str] | None:
+    """
+    Normalized paths a subtask declares it will touch, or None if it
+    declares none.
+    """
+    paths = [
+        *(subtask.get("files_to_modify") or []),
+        *(subtask.get("files_to_create") or []),
+    ]
+    normalized = {
+        str(PurePosixPath(str(path).replace("\\", "/").removeprefix("./")))
+        for path in paths
+        if path
+    }
+    return frozenset(normalized) or None
+
+
+def _phase_key(phase: dict, index: int) -> str:
+    phase_id = phase.get("id")
+    if phase_id is None:
+        phase_id = phase.get("phase")
+    return str(phase_id) if phase_id is not None else f"unknown:{index}"
+
+
+def _depends_on(phase: dict) -> list[str]:
+    raw = phase.get("depends_on", [])
+    if isinstance(raw, list):
+        return [str(d) for d in raw if d is not None]
+    return [] if raw is None else [str(raw)]
+
+
+def ready_subtasks(
+    plan: dict,
+    running: dict[str, dict] | None = None,
+    excluded: Iterable[str] = (),
+) -> list[dict]:
+    """
+    Subtasks that can start now, in plan order.
+
+    Args:
+        plan: Implementation plan dict
+        running: Subtasks already running, keyed by ID (as returned here)
+        excluded: Subtask IDs never to schedule (e.g. stuck ones)
+
+    Returns:
+        Subtask dicts shaped like get_next_subtask() results (with phase_id,
+        phase_name and phase_num), none of which conflict with each other or
+        with the running subtasks
+    """
+    running = running or {}
+    excluded = set(excluded)
+    phases = plan.get("phases", [])
+
+    phase_complete = {
+        _phase_key(phase, i): all(
+            s.get("status") == "completed"
+            for s in phase.get("subtasks", phase.get("chunks", []))
+        )
+        for i, phase in enumerate(phases)
+    }
+
+    claimed: set[str] = set()
+    exclusive = False
+    for subtask in running.values():
+        files = subtask_files(subtask)
+        if files is None:
+            exclusive = True
+        else:
+            claimed |= files
+    if exclusive:
+        return []
+
+    ready: list[dict] = []
+    for phase in phases:
+        if not all(phase_complete.get(dep, False) for dep in _depends_on(phase)):
+            continue
+
+        subtasks = phase.get("subtasks", phase.get("chunks", []))
+        parallel_safe = bool(phase.get("parallel_safe"))
+        if not parallel_safe and any(s.get("id") in running for s in subtasks):
+            continue
+
+        for subtask in subtasks:
+            if subtask.get("status", "pending") not in _PENDING_STATUSES:
+                continue
+            subtask_id = subtask.get("id")
+            files = subtask_files(subtask)
+            if subtask_id in running or subtask_id in excluded:
+                pass
+            elif files is None:
+                # Undeclared files: only when nothing else is scheduled
+                if not running and not ready:
+                    ready.append(_scheduled(subtask, phase))
+                    return ready
+            elif not files & claimed:
+                claimed |= files
+                ready.append(_scheduled(subtask, phase))
+
+            if not parallel_safe:
+                # Sequential phase: only its first pending subtask is eligible,
+                # so an excluded (stuck) one holds back the rest of the phase
+                break
+
+    return ready
+
+
+def _scheduled(subtask: dict, phase: dict) -> dict:
+    subtask_out, _changed = normalize_subtask_aliases(subtask)
+    subtask_out["status"] = "pending"
+    phase_id = phase.get("id")
+    return {
+        **subtask_out,
+        "phase_id": phase_id if phase_id is not None else phase.get("phase"),
+        "phase_name": phase.get("name"),
+        "phase_num": phase.get("phase"),
+    }
+
+
+class SubtaskScheduler:
+    """
+    Dispatches ready subtasks of a spec's plan to concurrent sessions.
+
+    The plan is re-read after every session, so status changes made by the
+    sessions themselves (update_subtask_status) drive what runs next. A
+    subtask whose session didn't complete it becomes ready again, unless
+    `excluded` (e.g. the recovery manager's stuck list) says otherwise.
+    """
+
+    def __init__(
+        self,
+        spec_dir: Path,
+        max_workers: int,
+        excluded: Callable[[], Iterable[str]] | None = None,
+    ):
+        self.spec_dir = Path(spec_dir)
+        self.max_workers = max(1, max_workers)
+        self.excluded = excluded or (lambda: ())
+        self.sessions_run = 0
+
+    def load_plan(self) -> dict:
+        plan_file = self.spec_dir / "implementation_plan.json"
+        try:
+            with open(plan_file, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read {plan_file}: {e}")
+            return {}
+
+    def ready(self, running: dict[str, dict] | None = None) -> list[dict]:
+        """Subtasks that could start now alongside `running`."""
+        return ready_subtasks(self.load_plan(), running, self.excluded())
+
+    async def run(
+        self,
+        run_subtask: Callable[[dict], Awaitable[str]],
+        max_sessions: int | None = None,
+    ) -> bool:
+        """
+        Run sessions until no subtask is ready and none is running.
+
+        Args:
+            run_subtask: Runs one coder session for a subtask and returns the
+                session status ("continue", "complete" or "error")
+            max_sessions: Stop dispatching after this many sessions
+
+        Returns:
+            False if a session ended in an error; dispatching stops at the
+            first error and the sessions already running are awaited
+        """
+        running: dict[str, dict] = {}
+        tasks: dict[asyncio.Task, str] = {}
+        failed = False
+
+        try:
+            while True:
+                if not failed:
+                    self._dispatch(run_subtask, running, tasks, max_sessions)
+                if not tasks:
+                    return not failed
+
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    subtask_id = tasks.pop(task)
+                    running.pop(subtask_id, None)
+                    try:
+                        status = task.result()
+                    except Exception as e:
+                        logger.error(f"Session for subtask {subtask_id} failed: {e}")
+                        status = "error"
+                    if status == "error":
+                        failed = True
+        finally:
+            # Only left over if we were cancelled
+            for task in tasks:
+                task.cancel()
+
+    def _dispatch(
+        self,
+        run_subtask: Callable[[dict], Awaitable[str]],
+        running: dict[str, dict],
+        tasks: dict[asyncio.Task, str],
+        max_sessions: int | None,
+    ) -> None:
+        for subtask in self.ready(running):
+            if len(running) >= self.max_workers:
+                return
+            if max_sessions is not None and self.sessions_run >= max_sessions:
+                return
+            running[subtask["id"]] = subtask
+            tasks[asyncio.create_task(run_subtask(subtask))] = subtask["id"]
+            self.sessions_run += 1
@@ -41,6 +41,7 @@ from .utils import (
     find_subtask_in_plan,
     get_commit_count,
     get_latest_commit,
+    get_subtask_commit_range,
     load_implementation_plan,
     sync_spec_to_source,
 )
@@ -168,6 +169,7 @@ async def post_session_processing(
     linear_enabled: bool = False,
     status_manager: StatusManager | None = None,
     source_spec_dir: Path | None = None,
+    own_commits_only: bool = False,
 ) -> bool:
     """
     Process session results and update memory automatically.
@@ -185,6 +187,8 @@ async def post_session_processing(
         linear_enabled: Whether Linear integration is enabled
         status_manager: Optional status manager for ccstatusline
         source_spec_dir: Original spec directory (for syncing back from worktree)
+        own_commits_only: Only count commits made for this subtask, by their
+            message (for sessions sharing the workspace with others)
 
     Returns:
         True if subtask was completed successfully
@@ -210,9 +214,14 @@ async def post_session_processing(
     subtask_status = subtask.get("status", "pending")
 
     # Check for new commits
-    commit_after = get_latest_commit(project_dir)
-    commit_count_after = get_commit_count(project_dir)
-    new_commits = commit_count_after - commit_count_before
+    if own_commits_only:
+        commit_before, commit_after, new_commits = get_subtask_commit_range(
+            project_dir, subtask_id, since=commit_before
+        )
+    else:
+        commit_after = get_latest_commit(project_dir)
+        commit_count_after = get_commit_count(project_dir)
+        new_commits = commit_count_after - commit_count_before
 
     print_key_value("Subtask status", subtask_status)
     print_key_value("New commits", str(new_commits))
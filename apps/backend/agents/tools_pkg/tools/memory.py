@@ -38,6 +38,10 @@ async def _save_to_graphiti_async(
     """
     Save data to Graphiti/LadybugDB (async implementation).
 
+    The write goes through the process-wide memory pool, so repeated saves
+    reuse one initialized GraphitiMemory instead of opening the database,
+    indices and LLM/embedder clients each time.
+
     Args:
         spec_dir: Spec directory for GraphitiMemory initialization
         project_dir: Project root directory
@@ -48,41 +52,31 @@ async def _save_to_graphiti_async(
         True if save succeeded, False otherwise
     """
     try:
-        # Use centralized helper for GraphitiMemory instantiation
-        # The helper handles enablement checks internally
-        from memory.graphiti_helpers import get_graphiti_memory
+        # The helpers handle enablement checks and memory instantiation
+        from memory.graphiti_helpers import get_memory_pool, is_graphiti_memory_enabled
 
-        memory = await get_graphiti_memory(spec_dir, project_dir)
-        if memory is None:
+        if not is_graphiti_memory_enabled():
             return False
 
-        try:
-            if save_type == "discovery":
-                # Save as codebase discovery
-                # Format: {file_path: description}
-                result = await memory.save_codebase_discoveries(
-                    {data["file_path"]: data["description"]}
-                )
-            elif save_type == "gotcha":
-                # Save as gotcha
-                gotcha_text = data["gotcha"]
-                if data.get("context"):
-                    gotcha_text += f" (Context: {data['context']})"
-                result = await memory.save_gotcha(gotcha_text)
-            elif save_type == "pattern":
-                # Save as pattern
-                result = await memory.save_pattern(data["pattern"])
-            else:
-                result = False
-            return result
-        finally:
-            # Always close the memory connection (swallow exceptions to avoid overriding)
-            try:
-                await memory.close()
-            except Exception as e:
-                logger.debug(
-                    "Failed to close Graphiti memory connection", exc_info=True
-                )
+        if save_type == "discovery":
+            # Save as codebase discovery
+            # Format: {file_path: description}
+            method = "save_codebase_discoveries"
+            payload = {data["file_path"]: data["description"]}
+        elif save_type == "gotcha":
+            # Save as gotcha
+            method = "save_gotcha"
+            payload = data["gotcha"]
+            if data.get("context"):
+                payload += f" (Context: {data['context']})"
+        elif save_type == "pattern":
+            # Save as pattern
+            method = "save_pattern"
+            payload = data["pattern"]
+        else:
+            return False
+
+        return await get_memory_pool().write(spec_dir, project_dir, method, payload)
 
     except Exception as e:
         logger.warning(f"Failed to save to Graphiti: {e}")
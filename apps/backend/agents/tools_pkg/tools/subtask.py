@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from core.file_utils import write_json_atomic
+from core.file_utils import update_json_locked
 from spec.validate_pkg.auto_fix import auto_fix_plan
 
 try:
@@ -113,10 +113,10 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             }
 
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
-
-            subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
+            # Locked read-modify-write with an atomic replace: parallel coder
+            # sessions update other subtasks in the same plan
+            with update_json_locked(plan_file) as plan:
+                subtask_found = _update_subtask_in_plan(plan, subtask_id, status, notes)
 
             if not subtask_found:
                 return {
@@ -128,9 +128,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Use atomic write to prevent file corruption
-            write_json_atomic(plan_file, plan, indent=2)
-
             return {
                 "content": [
                     {
@@ -145,15 +142,12 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
             if auto_fix_plan(spec_dir):
                 # Retry after fix
                 try:
-                    with open(plan_file, encoding="utf-8") as f:
-                        plan = json.load(f)
-
-                    subtask_found = _update_subtask_in_plan(
-                        plan, subtask_id, status, notes
-                    )
+                    with update_json_locked(plan_file) as plan:
+                        subtask_found = _update_subtask_in_plan(
+                            plan, subtask_id, status, notes
+                        )
 
                     if subtask_found:
-                        write_json_atomic(plan_file, plan, indent=2)
                         return {
                             "content": [
                                 {
@@ -7,6 +7,7 @@ Helper functions for git operations, plan management, and file syncing.
 
 import json
 import logging
+import re
 import shutil
 from pathlib import Path
 
@@ -42,6 +43,49 @@ def get_commit_count(project_dir: Path) -> int:
     return 0
 
 
+def get_subtask_commit_range(
+    project_dir: Path, subtask_id: str, since: str | None
+) -> tuple[str | None, str | None, int]:
+    """
+    Find the commits made for one subtask since a given commit.
+
+    Commits are matched by their "auto-claude: <subtask_id>" message, so
+    commits from sessions running alongside aren't counted.
+
+    Returns:
+        Tuple of (commit before, commit after, number of commits). The range
+        covers the latest unbroken run of the subtask's commits; without any,
+        both ends are `since`.
+    """
+    revisions = f"{since}..HEAD" if since else "HEAD"
+    result = run_git(
+        ["log", "--format=%H %P%x00%s", revisions],
+        cwd=project_dir,
+        timeout=10,
+    )
+    if result.returncode != 0:
+        return since, since, 0
+
+    pattern = re.compile(
+        rf"^auto-claude: (?:Complete )?{re.escape(subtask_id)}(?:\s|$)"
+    )
+    parents: dict[str, str | None] = {}
+    own: list[str] = []  # newest first
+    for line in result.stdout.splitlines():
+        hashes, _, subject = line.partition("\0")
+        commit, *commit_parents = hashes.split()
+        parents[commit] = commit_parents[0] if commit_parents else None
+        if pattern.match(subject):
+            own.append(commit)
+    if not own:
+        return since, since, 0
+
+    first = own[0]
+    while parents.get(first) in own:
+        first = parents[first]
+    return parents.get(first), own[0], len(own)
+
+
 def load_implementation_plan(spec_dir: Path) -> dict | None:
     """Load the implementation plan JSON."""
     plan_file = spec_dir / "implementation_plan.json"
@@ -10,35 +10,8 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-# Directories to skip during analysis
-SKIP_DIRS = {
-    "node_modules",
-    ".git",
-    "__pycache__",
-    ".venv",
-    "venv",
-    ".env",
-    "env",
-    "dist",
-    "build",
-    ".next",
-    ".nuxt",
-    "target",
-    "vendor",
-    ".idea",
-    ".vscode",
-    ".pytest_cache",
-    ".mypy_cache",
-    "coverage",
-    ".coverage",
-    "htmlcov",
-    "eggs",
-    "*.egg-info",
-    ".turbo",
-    ".cache",
-    ".worktrees",  # Skip git worktrees directory
-    ".auto-claude",  # Skip auto-claude metadata directory
-}
+# Directories to skip during analysis (shared with ProjectInventory)
+from project.inventory import SKIP_DIRS, ProjectInventory  # noqa: F401
 
 # Common service directory names
 SERVICE_INDICATORS = {
@@ -89,8 +62,19 @@ SERVICE_ROOT_FILES = {
 class BaseAnalyzer:
     """Base class with common utilities for all analyzers."""
 
-    def __init__(self, path: Path):
+    def __init__(self, path: Path, inventory: ProjectInventory | None = None):
+        """
+        Initialize analyzer.
+
+        Args:
+            path: Directory to analyze
+            inventory: Shared file inventory; a new one rooted at ``path`` is
+                created (and walked lazily) if not provided or not covering it
+        """
         self.path = path.resolve()
+        if inventory is None or not inventory.covers(self.path):
+            inventory = ProjectInventory(self.path)
+        self.inventory = inventory
 
     def _exists(self, path: str) -> bool:
         """Check if a file exists relative to the analyzer's path."""
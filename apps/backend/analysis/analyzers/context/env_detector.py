@@ -15,14 +15,19 @@ import re
 from pathlib import Path
 from typing import Any
 
-from ..base import BaseAnalyzer
+from ..base import BaseAnalyzer, ProjectInventory
 
 
 class EnvironmentDetector(BaseAnalyzer):
     """Detects environment variables and their configurations."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -15,14 +15,19 @@ import re
 from pathlib import Path
 from typing import Any
 
-from ..base import BaseAnalyzer
+from ..base import BaseAnalyzer, ProjectInventory
 
 
 class JobsDetector(BaseAnalyzer):
     """Detects background job and task queue systems."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -43,8 +48,8 @@ class JobsDetector(BaseAnalyzer):
 
     def _detect_celery(self) -> dict[str, Any] | None:
         """Detect Celery (Python) task queue."""
-        celery_files = list(self.path.glob("**/celery.py")) + list(
-            self.path.glob("**/tasks.py")
+        celery_files = list(self.inventory.glob("**/celery.py", self.path)) + list(
+            self.inventory.glob("**/tasks.py", self.path)
         )
         if not celery_files:
             return None
@@ -15,14 +15,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from ..base import BaseAnalyzer
+from ..base import BaseAnalyzer, ProjectInventory
 
 
 class MigrationsDetector(BaseAnalyzer):
     """Detects database migration setup and tools."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect(self) -> None:
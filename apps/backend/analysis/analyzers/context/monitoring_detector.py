@@ -14,14 +14,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from ..base import BaseAnalyzer
+from ..base import BaseAnalyzer, ProjectInventory
 
 
 class MonitoringDetector(BaseAnalyzer):
     """Detects monitoring and observability setup."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect(self) -> None:
@@ -68,7 +73,8 @@ class MonitoringDetector(BaseAnalyzer):
         """Detect Prometheus metrics endpoint."""
         # Look for actual Prometheus imports/usage, not just keywords
         all_files = (
-            list(self.path.glob("**/*.py"))[:30] + list(self.path.glob("**/*.js"))[:30]
+            list(self.inventory.glob("**/*.py", self.path))[:30]
+            + list(self.inventory.glob("**/*.js", self.path))[:30]
         )
 
         for file_path in all_files:
@@ -19,7 +19,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, ProjectInventory
 from .context import (
     ApiDocsDetector,
     AuthDetector,
@@ -34,8 +34,13 @@ from .context import (
 class ContextAnalyzer(BaseAnalyzer):
     """Orchestrates project context and configuration analysis."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect_environment_variables(self) -> None:
@@ -44,7 +49,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to EnvironmentDetector for actual detection logic.
         """
-        detector = EnvironmentDetector(self.path, self.analysis)
+        detector = EnvironmentDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_external_services(self) -> None:
@@ -53,7 +58,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to ServicesDetector for actual detection logic.
         """
-        detector = ServicesDetector(self.path, self.analysis)
+        detector = ServicesDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_auth_patterns(self) -> None:
@@ -62,7 +67,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to AuthDetector for actual detection logic.
         """
-        detector = AuthDetector(self.path, self.analysis)
+        detector = AuthDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_migrations(self) -> None:
@@ -71,7 +76,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MigrationsDetector for actual detection logic.
         """
-        detector = MigrationsDetector(self.path, self.analysis)
+        detector = MigrationsDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_background_jobs(self) -> None:
@@ -80,7 +85,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to JobsDetector for actual detection logic.
         """
-        detector = JobsDetector(self.path, self.analysis)
+        detector = JobsDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_api_documentation(self) -> None:
@@ -89,7 +94,7 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to ApiDocsDetector for actual detection logic.
         """
-        detector = ApiDocsDetector(self.path, self.analysis)
+        detector = ApiDocsDetector(self.path, self.analysis, self.inventory)
         detector.detect()
 
     def detect_monitoring(self) -> None:
@@ -98,5 +103,5 @@ class ContextAnalyzer(BaseAnalyzer):
 
         Delegates to MonitoringDetector for actual detection logic.
         """
-        detector = MonitoringDetector(self.path, self.analysis)
+        detector = MonitoringDetector(self.path, self.analysis, self.inventory)
         detector.detect()
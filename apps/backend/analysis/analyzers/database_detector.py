@@ -12,14 +12,14 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, ProjectInventory
 
 
 class DatabaseDetector(BaseAnalyzer):
     """Detects database models across multiple ORMs."""
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(self, path: Path, inventory: ProjectInventory | None = None):
+        super().__init__(path, inventory)
 
     def detect_all_models(self) -> dict:
         """Detect all database models across different ORMs."""
@@ -48,7 +48,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_sqlalchemy_models(self) -> dict:
         """Detect SQLAlchemy models."""
         models = {}
-        py_files = list(self.path.glob("**/*.py"))
+        py_files = list(self.inventory.glob("**/*.py", self.path))
 
         for file_path in py_files:
             try:
@@ -113,8 +113,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_django_models(self) -> dict:
         """Detect Django models."""
         models = {}
-        model_files = list(self.path.glob("**/models.py")) + list(
-            self.path.glob("**/models/*.py")
+        model_files = list(self.inventory.glob("**/models.py", self.path)) + list(
+            self.inventory.glob("**/models/*.py", self.path)
         )
 
         for file_path in model_files:
@@ -210,8 +210,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_typeorm_models(self) -> dict:
         """Detect TypeORM entities."""
         models = {}
-        ts_files = list(self.path.glob("**/*.entity.ts")) + list(
-            self.path.glob("**/entities/*.ts")
+        ts_files = list(self.inventory.glob("**/*.entity.ts", self.path)) + list(
+            self.inventory.glob("**/entities/*.ts", self.path)
         )
 
         for file_path in ts_files:
@@ -259,8 +259,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_drizzle_models(self) -> dict:
         """Detect Drizzle ORM schemas."""
         models = {}
-        schema_files = list(self.path.glob("**/schema.ts")) + list(
-            self.path.glob("**/db/schema.ts")
+        schema_files = list(self.inventory.glob("**/schema.ts", self.path)) + list(
+            self.inventory.glob("**/db/schema.ts", self.path)
         )
 
         for file_path in schema_files:
@@ -289,8 +289,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_mongoose_models(self) -> dict:
         """Detect Mongoose models."""
         models = {}
-        model_files = list(self.path.glob("**/models/*.js")) + list(
-            self.path.glob("**/models/*.ts")
+        model_files = list(self.inventory.glob("**/models/*.js", self.path)) + list(
+            self.inventory.glob("**/models/*.ts", self.path)
         )
 
         for file_path in model_files:
@@ -11,14 +11,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, ProjectInventory
 
 
 class FrameworkAnalyzer(BaseAnalyzer):
     """Analyzes and detects programming languages and frameworks."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect_language_and_framework(self) -> None:
@@ -111,7 +116,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = info["type"]
                 # Try to detect actual port, fall back to default
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(self.path, self.analysis, self.inventory)
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -165,7 +170,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
             "@nestjs/core": {"name": "NestJS", "type": "backend", "port": 3000},
         }
 
-        port_detector = PortDetector(self.path, self.analysis)
+        port_detector = PortDetector(self.path, self.analysis, self.inventory)
 
         # Check frontend first (Next.js includes React, etc.)
         for key, info in frontend_frameworks.items():
@@ -255,7 +260,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
             if key in content:
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = "backend"
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(self.path, self.analysis, self.inventory)
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -274,7 +279,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
             if key in content:
                 self.analysis["framework"] = info["name"]
                 self.analysis["type"] = "backend"
-                port_detector = PortDetector(self.path, self.analysis)
+                port_detector = PortDetector(self.path, self.analysis, self.inventory)
                 detected_port = port_detector.detect_port_from_sources(info["port"])
                 self.analysis["default_port"] = detected_port
                 break
@@ -283,7 +288,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
         """Detect Ruby framework."""
         from .port_detector import PortDetector
 
-        port_detector = PortDetector(self.path, self.analysis)
+        port_detector = PortDetector(self.path, self.analysis, self.inventory)
 
         if "rails" in content.lower():
             self.analysis["framework"] = "Ruby on Rails"
@@ -304,7 +309,7 @@ class FrameworkAnalyzer(BaseAnalyzer):
         try:
             # Scan Swift files for imports, excluding hidden/vendor dirs
             swift_files = []
-            for swift_file in self.path.rglob("*.swift"):
+            for swift_file in self.inventory.glob("**/*.swift", self.path):
                 # Skip hidden directories, node_modules, .worktrees, etc.
                 if any(
                     part.startswith(".") or part in ("node_modules", "Pods", "Carthage")
@@ -12,14 +12,19 @@ import re
 from pathlib import Path
 from typing import Any
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, ProjectInventory
 
 
 class PortDetector(BaseAnalyzer):
     """Detects application ports from various configuration sources."""
 
-    def __init__(self, path: Path, analysis: dict[str, Any]):
-        super().__init__(path)
+    def __init__(
+        self,
+        path: Path,
+        analysis: dict[str, Any],
+        inventory: ProjectInventory | None = None,
+    ):
+        super().__init__(path, inventory)
         self.analysis = analysis
 
     def detect_port_from_sources(self, default_port: int) -> int:
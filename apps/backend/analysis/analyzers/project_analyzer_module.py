@@ -10,7 +10,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
+from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS, ProjectInventory
 from .service_analyzer import ServiceAnalyzer
 
 
@@ -19,6 +19,8 @@ class ProjectAnalyzer:
 
     def __init__(self, project_dir: Path):
         self.project_dir = project_dir.resolve()
+        # One traversal of the tree, shared by every service analyzer
+        self.inventory = ProjectInventory(self.project_dir)
         self.index = {
             "project_root": str(self.project_dir),
             "project_type": "single",  # or "monorepo"
@@ -109,7 +111,7 @@ class ProjectAnalyzer:
                     if has_root_file or (
                         location == self.project_dir and is_service_name
                     ):
-                        analyzer = ServiceAnalyzer(item, item.name)
+                        analyzer = ServiceAnalyzer(item, item.name, self.inventory)
                         service_info = analyzer.analyze()
                         if service_info.get(
                             "language"
@@ -117,7 +119,7 @@ class ProjectAnalyzer:
                             services[item.name] = service_info
         else:
             # Single project - analyze root
-            analyzer = ServiceAnalyzer(self.project_dir, "main")
+            analyzer = ServiceAnalyzer(self.project_dir, "main", self.inventory)
             service_info = analyzer.analyze()
             if service_info.get("language"):
                 services["main"] = service_info
@@ -14,7 +14,7 @@ from __future__ import annotations
 import re
 from pathlib import Path
 
-from .base import BaseAnalyzer
+from .base import BaseAnalyzer, ProjectInventory
 
 
 class RouteDetector(BaseAnalyzer):
@@ -23,8 +23,8 @@ class RouteDetector(BaseAnalyzer):
     # Directories to exclude from route detection
     EXCLUDED_DIRS = {"node_modules", ".venv", "venv", "__pycache__", ".git"}
 
-    def __init__(self, path: Path):
-        super().__init__(path)
+    def __init__(self, path: Path, inventory: ProjectInventory | None = None):
+        super().__init__(path, inventory)
 
     def _should_include_file(self, file_path: Path) -> bool:
         """Check if file should be included (not in excluded directories)."""
@@ -61,7 +61,9 @@ class RouteDetector(BaseAnalyzer):
         """Detect FastAPI routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.py", self.path)
+            if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -125,7 +127,9 @@ class RouteDetector(BaseAnalyzer):
         """Detect Flask routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.py", self.path)
+            if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -174,7 +178,9 @@ class RouteDetector(BaseAnalyzer):
         """Detect Django routes from urls.py files."""
         routes = []
         url_files = [
-            f for f in self.path.glob("**/urls.py") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/urls.py", self.path)
+            if self._should_include_file(f)
         ]
 
         for file_path in url_files:
@@ -210,10 +216,14 @@ class RouteDetector(BaseAnalyzer):
         """Detect Express/Fastify/Koa routes."""
         routes = []
         js_files = [
-            f for f in self.path.glob("**/*.js") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.js", self.path)
+            if self._should_include_file(f)
         ]
         ts_files = [
-            f for f in self.path.glob("**/*.ts") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.ts", self.path)
+            if self._should_include_file(f)
         ]
         files_to_check = js_files + ts_files
         for file_path in files_to_check:
@@ -270,7 +280,7 @@ class RouteDetector(BaseAnalyzer):
             # Find all route.ts/js files
             route_files = [
                 f
-                for f in app_dir.glob("**/route.{ts,js,tsx,jsx}")
+                for f in self.inventory.glob("**/route.{ts,js,tsx,jsx}", app_dir)
                 if self._should_include_file(f)
             ]
             for route_file in route_files:
@@ -308,7 +318,7 @@ class RouteDetector(BaseAnalyzer):
         if pages_api.exists():
             api_files = [
                 f
-                for f in pages_api.glob("**/*.{ts,js,tsx,jsx}")
+                for f in self.inventory.glob("**/*.{ts,js,tsx,jsx}", pages_api)
                 if self._should_include_file(f)
             ]
             for api_file in api_files:
@@ -343,7 +353,9 @@ class RouteDetector(BaseAnalyzer):
         """Detect Go framework routes (Gin, Echo, Chi, Fiber)."""
         routes = []
         go_files = [
-            f for f in self.path.glob("**/*.go") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.go", self.path)
+            if self._should_include_file(f)
         ]
 
         for file_path in go_files:
@@ -379,7 +391,9 @@ class RouteDetector(BaseAnalyzer):
         """Detect Rust framework routes (Axum, Actix)."""
         routes = []
         rust_files = [
-            f for f in self.path.glob("**/*.rs") if self._should_include_file(f)
+            f
+            for f in self.inventory.glob("**/*.rs", self.path)
+            if self._should_include_file(f)
         ]
 
         for file_path in rust_files:
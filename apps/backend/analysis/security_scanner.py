@@ -29,6 +29,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from project.inventory import ProjectInventory
+
 # Import the existing secrets scanner
 try:
     from security.scan_secrets import SecretMatch, get_all_tracked_files, scan_files
@@ -179,7 +181,7 @@ class SecurityScanner:
             if changed_files:
                 files_to_scan = changed_files
             else:
-                files_to_scan = get_all_tracked_files()
+                files_to_scan = get_all_tracked_files(project_dir)
 
             # Run scan
             matches = scan_files(files_to_scan, project_dir)
@@ -237,8 +239,8 @@ class SecurityScanner:
 
             if not src_dirs:
                 # Try to find any Python files
-                py_files = list(project_dir.glob("**/*.py"))
-                if not py_files:
+                inventory = ProjectInventory(project_dir)
+                if not inventory.with_suffix(".py"):
                     return
                 src_dirs = ["."]
 
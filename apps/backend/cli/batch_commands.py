@@ -3,14 +3,43 @@ Batch Task Management Commands
 ==============================
 
 Commands for creating and managing multiple tasks from batch files.
+
+--batch-run builds every approved spec, several at a time, each in its own
+run.py process and isolated worktree. Specs are started in priority order
+(requirements.json "priority", lowest first). All builds share one resolved
+auth token, and when any build reports a rate limit no new build starts
+until the limit resets.
 """
 
+import asyncio
+import heapq
 import json
+import os
 import shutil
 import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
 from pathlib import Path
 
-from ui import highlight, print_status
+from core.phase_event import PHASE_MARKER_PREFIX, ExecutionPhase
+from review import ReviewState
+from ui import highlight, muted, print_status
+
+# Specs built at the same time by --batch-run
+DEFAULT_BATCH_CONCURRENCY = 2
+
+# Priority for specs whose requirements.json doesn't set one
+DEFAULT_BATCH_PRIORITY = 5
+
+# Per-spec build logs, shared pause/resume files
+BATCH_DIR = Path(".auto-claude") / "batch"
+
+# Longest line read from a build's output
+BUILD_OUTPUT_LINE_LIMIT = 16 * 1024 * 1024
+
+RUN_SCRIPT = Path(__file__).resolve().parent.parent / "run.py"
 
 
 def handle_batch_create_command(batch_file: str, project_dir: str) -> bool:
@@ -264,3 +293,275 @@ def handle_batch_cleanup_command(project_dir: str, dry_run: bool = True) -> bool
         print_status(f"Cleaned up {deleted_count} spec(s)", "info")
 
     return True
+
+
+@dataclass(order=True)
+class BatchSpec:
+    """A spec queued for --batch-run, ordered by (priority, name)."""
+
+    priority: int
+    name: str
+    spec_dir: Path = field(compare=False)
+
+
+def collect_batch_specs(project_dir: Path, force: bool = False) -> list[BatchSpec]:
+    """
+    Specs that are ready to build, in the order they should start.
+
+    A spec is ready when spec.md exists, its build isn't complete and it is
+    approved (or `force` is set). Skipped specs are reported.
+    """
+    from progress import is_build_complete
+
+    specs_dir = Path(project_dir) / ".auto-claude" / "specs"
+    if not specs_dir.exists():
+        return []
+
+    ready: list[BatchSpec] = []
+    for spec_dir in sorted(d for d in specs_dir.iterdir() if d.is_dir()):
+        if not (spec_dir / "spec.md").exists():
+            print(muted(f"  skip {spec_dir.name}: spec not created yet"))
+            continue
+        if is_build_complete(spec_dir):
+            print(muted(f"  skip {spec_dir.name}: build already complete"))
+            continue
+        if not force and not ReviewState.load(spec_dir).is_approval_valid(spec_dir):
+            print(muted(f"  skip {spec_dir.name}: not approved (use --force)"))
+            continue
+
+        priority = DEFAULT_BATCH_PRIORITY
+        try:
+            with open(spec_dir / "requirements.json", encoding="utf-8") as f:
+                priority = int(json.load(f).get("priority", priority))
+        except (OSError, json.JSONDecodeError, TypeError, ValueError, AttributeError):
+            pass
+        ready.append(BatchSpec(priority, spec_dir.name, spec_dir))
+
+    return sorted(ready)
+
+
+class BatchRunner:
+    """
+    Builds several specs concurrently, one run.py process per spec.
+
+    Every build gets the same environment (including the auth token resolved
+    once by the caller) and runs in isolated, non-interactive mode. Phase
+    markers from the builds make up the progress stream; everything else
+    goes to a per-spec log under .auto-claude/batch/.
+
+    A rate_limit_paused marker holds back new builds until its reset time.
+    Running builds wait out the limit themselves.
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        specs: list[BatchSpec],
+        max_concurrent: int = DEFAULT_BATCH_CONCURRENCY,
+        build_args: list[str] | None = None,
+        env: dict[str, str] | None = None,
+        verbose: bool = False,
+        run_script: Path = RUN_SCRIPT,
+    ):
+        self.project_dir = Path(project_dir)
+        self.queue = list(specs)
+        heapq.heapify(self.queue)
+        self.max_concurrent = max(1, max_concurrent)
+        self.build_args = build_args or []
+        self.env = env if env is not None else dict(os.environ)
+        self.verbose = verbose
+        self.run_script = Path(run_script)
+        self.batch_dir = self.project_dir / BATCH_DIR
+        self.results: dict[str, int] = {}
+        self.paused_until = 0.0
+
+    def command(self, spec: BatchSpec) -> list[str]:
+        return [
+            sys.executable,
+            str(self.run_script),
+            "--spec",
+            spec.name,
+            "--project-dir",
+            str(self.project_dir),
+            "--isolated",
+            "--auto-continue",
+            *self.build_args,
+        ]
+
+    async def run(self) -> dict[str, int]:
+        """
+        Build every queued spec.
+
+        Returns:
+            Exit code of each build, keyed by spec name
+        """
+        self.batch_dir.mkdir(parents=True, exist_ok=True)
+        running: set[asyncio.Task] = set()
+        try:
+            while self.queue or running:
+                while self.queue and len(running) < self.max_concurrent:
+                    if self.paused_until > time.time():
+                        await self._wait_for_rate_limit()
+                        continue
+                    spec = heapq.heappop(self.queue)
+                    running.add(asyncio.create_task(self._build(spec)))
+                if running:
+                    _, running = await asyncio.wait(
+                        running, return_when=asyncio.FIRST_COMPLETED
+                    )
+        finally:
+            for task in running:
+                task.cancel()
+        return self.results
+
+    async def _wait_for_rate_limit(self) -> None:
+        from agents.base import RATE_LIMIT_PAUSE_FILE
+        from agents.coder import wait_for_rate_limit_reset
+
+        wait_seconds = self.paused_until - time.time()
+        self._report("batch", f"rate limited - next build in {wait_seconds:.0f}s")
+        pause_data = {
+            "paused_at": datetime.now().isoformat(),
+            "reset_timestamp": self.paused_until,
+            "error": "Rate limit reached",
+        }
+        (self.batch_dir / RATE_LIMIT_PAUSE_FILE).write_text(
+            json.dumps(pause_data), encoding="utf-8"
+        )
+        if await wait_for_rate_limit_reset(self.batch_dir, wait_seconds):
+            self._report("batch", "resumed early by user")
+        self.paused_until = 0.0
+
+    async def _build(self, spec: BatchSpec) -> None:
+        self._report(spec.name, f"starting (priority {spec.priority})")
+        env = {**self.env, "PYTHONUNBUFFERED": "1"}
+        log_path = self.batch_dir / f"{spec.name}.log"
+        process = await asyncio.create_subprocess_exec(
+            *self.command(spec),
+            cwd=str(self.project_dir),
+            env=env,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=BUILD_OUTPUT_LINE_LIMIT,
+        )
+        try:
+            with open(log_path, "w", encoding="utf-8") as log:
+                async for raw in process.stdout:
+                    line = raw.decode("utf-8", errors="replace").rstrip()
+                    log.write(line + "\n")
+                    self._handle_line(spec, line)
+            code = await process.wait()
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+            raise
+
+        self.results[spec.name] = code
+        if code == 0:
+            self._report(spec.name, "finished")
+        else:
+            self._report(spec.name, f"failed (exit {code}), see {log_path}")
+
+    def _handle_line(self, spec: BatchSpec, line: str) -> None:
+        if not line.startswith(PHASE_MARKER_PREFIX):
+            if self.verbose and line:
+                self._report(spec.name, line)
+            return
+        try:
+            event = json.loads(line[len(PHASE_MARKER_PREFIX) :])
+        except json.JSONDecodeError:
+            return
+
+        phase = event.get("phase")
+        message = event.get("message") or ""
+        self._report(spec.name, f"{phase}: {message}" if message else str(phase))
+
+        reset_timestamp = event.get("reset_timestamp")
+        if phase == ExecutionPhase.RATE_LIMIT_PAUSED.value and reset_timestamp:
+            try:
+                self.paused_until = max(self.paused_until, float(reset_timestamp))
+            except (TypeError, ValueError):
+                pass
+
+    def _report(self, name: str, message: str) -> None:
+        stamp = datetime.now().strftime("%H:%M:%S")
+        print(f"{muted(stamp)} [{name}] {message}", flush=True)
+
+
+def handle_batch_run_command(
+    project_dir: str,
+    model: str | None = None,
+    max_concurrent: int = DEFAULT_BATCH_CONCURRENCY,
+    force: bool = False,
+    skip_qa: bool = False,
+    verbose: bool = False,
+) -> bool:
+    """
+    Build all approved specs, several at a time.
+
+    Args:
+        project_dir: Project directory
+        model: Model passed to each build
+        max_concurrent: Number of builds running at once
+        force: Also build specs that aren't approved
+        skip_qa: Skip QA validation in each build
+        verbose: Echo each build's full output
+
+    Returns:
+        True if every build succeeded
+    """
+    from core.auth import get_auth_token
+
+    print_status("Collecting specs to build", "info")
+    specs = collect_batch_specs(Path(project_dir), force=force)
+    if not specs:
+        print_status("No specs ready to build", "warning")
+        return True
+
+    # Resolve the token once instead of once per build
+    token = get_auth_token()
+    if not token:
+        print_status("No OAuth token found", "error")
+        print("Set CLAUDE_CODE_OAUTH_TOKEN or run: claude setup-token")
+        return False
+    env = {**os.environ, "CLAUDE_CODE_OAUTH_TOKEN": token}
+
+    build_args = []
+    if model:
+        build_args += ["--model", model]
+    if force:
+        build_args.append("--force")
+    if skip_qa:
+        build_args.append("--skip-qa")
+
+    print()
+    print(highlight(f"Building {len(specs)} spec(s), {max_concurrent} at a time:"))
+    for spec in specs:
+        print(f"  {spec.priority:>3}  {spec.name}")
+    print()
+
+    runner = BatchRunner(
+        Path(project_dir),
+        specs,
+        max_concurrent=max_concurrent,
+        build_args=build_args,
+        env=env,
+        verbose=verbose,
+    )
+    try:
+        results = asyncio.run(runner.run())
+    except KeyboardInterrupt:
+        print_status("Batch run interrupted", "warning")
+        return False
+
+    failed = sorted(name for name, code in results.items() if code != 0)
+    print()
+    print_status(
+        f"Built {len(results) - len(failed)}/{len(specs)} spec(s)",
+        "success" if not failed else "warning",
+    )
+    for name in failed:
+        print(f"  - {name}: see {runner.batch_dir / (name + '.log')}")
+    return not failed
@@ -17,8 +17,10 @@ if str(_PARENT_DIR) not in sys.path:
 
 
 from .batch_commands import (
+    DEFAULT_BATCH_CONCURRENCY,
     handle_batch_cleanup_command,
     handle_batch_create_command,
+    handle_batch_run_command,
     handle_batch_status_command,
 )
 from .build_commands import handle_build_command
@@ -269,6 +271,21 @@ Environment Variables:
         action="store_true",
         help="Show status of all specs in the project",
     )
+    parser.add_argument(
+        "--batch-run",
+        action="store_true",
+        help="Build all approved specs concurrently in isolated worktrees",
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=DEFAULT_BATCH_CONCURRENCY,
+        metavar="N",
+        help=(
+            "Number of specs built at once by --batch-run "
+            f"(default: {DEFAULT_BATCH_CONCURRENCY})"
+        ),
+    )
     parser.add_argument(
         "--batch-cleanup",
         action="store_true",
@@ -352,6 +369,17 @@ def _run_cli() -> None:
         handle_batch_status_command(str(project_dir))
         return
 
+    if args.batch_run:
+        ok = handle_batch_run_command(
+            str(project_dir),
+            model=model,
+            max_concurrent=args.batch_concurrency,
+            force=args.force,
+            skip_qa=args.skip_qa,
+            verbose=args.verbose,
+        )
+        sys.exit(0 if ok else 1)
+
     if args.batch_cleanup:
         handle_batch_cleanup_command(str(project_dir), dry_run=not args.no_dry_run)
         return
@@ -7,6 +7,7 @@ Task context building for autonomous coding.
 
 from .builder import ContextBuilder
 from .categorizer import FileCategorizer
+from .code_index import CodeIndex
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
@@ -23,6 +24,7 @@ __all__ = [
     "TaskContext",
     # Components
     "CodeSearcher",
+    "CodeIndex",
     "ServiceMatcher",
     "KeywordExtractor",
     "FileCategorizer",
@@ -11,6 +11,7 @@ from dataclasses import asdict
 from pathlib import Path
 
 from .categorizer import FileCategorizer
+from .code_index import CodeIndex
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
 from .models import FileMatch, TaskContext
@@ -22,16 +23,24 @@ from .service_matcher import ServiceMatcher
 class ContextBuilder:
     """Builds task-specific context by searching the codebase."""
 
-    def __init__(self, project_dir: Path, project_index: dict | None = None):
+    def __init__(
+        self,
+        project_dir: Path,
+        project_index: dict | None = None,
+        use_code_index: bool = True,
+    ):
         self.project_dir = project_dir.resolve()
         self.project_index = project_index or self._load_project_index()
 
+        # Persistent token index shared by search and pattern discovery
+        self.code_index = CodeIndex(self.project_dir) if use_code_index else None
+
         # Initialize components
-        self.searcher = CodeSearcher(self.project_dir)
+        self.searcher = CodeSearcher(self.project_dir, self.code_index)
         self.service_matcher = ServiceMatcher(self.project_index)
         self.keyword_extractor = KeywordExtractor()
         self.categorizer = FileCategorizer()
-        self.pattern_discoverer = PatternDiscoverer(self.project_dir)
+        self.pattern_discoverer = PatternDiscoverer(self.project_dir, self.code_index)
 
     def _load_project_index(self) -> dict:
         """Load project index from file or create new one (.auto-claude is the installed instance)."""
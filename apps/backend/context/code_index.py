@@ -0,0 +1,311 @@
+"""
+Persistent Code Index
+=====================
+
+On-disk inverted index (token -> file, line) used by CodeSearcher and
+PatternDiscoverer so context building is a lookup instead of a full-tree scan.
+
+The index lives in ``.auto-claude/context_index.db`` (SQLite) and is updated
+incrementally: files are enumerated with ``git ls-files`` (falling back to a
+directory walk outside git repos) and only files whose mtime or size changed
+since the last run are re-read and re-tokenized.
+
+Tokens are maximal runs of ``[a-z0-9_]`` in the lowercased file content. Any
+lowercase keyword made of those characters can only occur inside a single
+token, so substring matches, occurrence counts and matching line numbers are
+all answered exactly from the vocabulary and postings.
+"""
+
+import os
+import re
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from core.git_executable import run_git
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+# Bump when the schema or tokenization changes to force a rebuild
+INDEX_VERSION = 1
+
+INDEX_FILE = "context_index.db"
+
+# Tokens shorter than this are not indexed (extracted keywords are longer)
+MIN_TOKEN_LENGTH = 3
+
+# Line numbers stored per (token, file); the searcher only needs the first few
+MAX_LINES_PER_POSTING = 3
+
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_KEYWORD_RE = re.compile(r"^[a-z0-9_]+$")
+
+
+@dataclass
+class KeywordHits:
+    """Occurrences of one keyword in one file."""
+
+    count: int = 0
+    lines: list[int] = field(default_factory=list)
+
+
+class CodeIndex:
+    """Incrementally maintained inverted index over project code files."""
+
+    def __init__(self, project_dir: Path, index_path: Path | None = None):
+        self.project_dir = project_dir.resolve()
+        self.index_path = index_path or (self.project_dir / ".auto-claude" / INDEX_FILE)
+        self._conn: sqlite3.Connection | None = None
+        self._refreshed = False
+
+    @staticmethod
+    def supports_keyword(keyword: str) -> bool:
+        """Whether a keyword can be answered exactly from the index."""
+        return len(keyword) >= MIN_TOKEN_LENGTH and bool(_KEYWORD_RE.match(keyword))
+
+    # ------------------------------------------------------------------
+    # Storage
+    # ------------------------------------------------------------------
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.index_path, timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != INDEX_VERSION:
+            conn.executescript(
+                """
+                DROP TABLE IF EXISTS postings;
+                DROP TABLE IF EXISTS tokens;
+                DROP TABLE IF EXISTS files;
+                """
+            )
+        conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS files (
+                id INTEGER PRIMARY KEY,
+                path TEXT NOT NULL UNIQUE,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS tokens (
+                id INTEGER PRIMARY KEY,
+                token TEXT NOT NULL UNIQUE
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                token_id INTEGER NOT NULL,
+                file_id INTEGER NOT NULL,
+                count INTEGER NOT NULL,
+                lines TEXT NOT NULL,
+                PRIMARY KEY (token_id, file_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_file ON postings(file_id);
+            """
+        )
+        conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ------------------------------------------------------------------
+    # Updating
+    # ------------------------------------------------------------------
+
+    def _list_files(self) -> list[str]:
+        """List candidate code files (relative POSIX paths) under the project."""
+        result = run_git(
+            ["ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=self.project_dir,
+        )
+        if result.returncode == 0:
+            paths = [p for p in result.stdout.split("\0") if p]
+        else:
+            paths = []
+            for root, dirs, files in os.walk(self.project_dir):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                rel_root = Path(root).relative_to(self.project_dir)
+                paths.extend((rel_root / name).as_posix() for name in files)
+
+        return [
+            p
+            for p in paths
+            if os.path.splitext(p)[1] in CODE_EXTENSIONS
+            and not any(part in SKIP_DIRS for part in p.split("/")[:-1])
+        ]
+
+    def refresh(self, force: bool = False) -> None:
+        """
+        Bring the index up to date with the working tree.
+
+        Only runs once per CodeIndex instance unless ``force`` is set, so a
+        single build_context() call pays for at most one stat pass.
+        """
+        if self._refreshed and not force:
+            return
+
+        conn = self._connect()
+        known = {
+            path: (file_id, mtime_ns, size)
+            for file_id, path, mtime_ns, size in conn.execute(
+                "SELECT id, path, mtime_ns, size FROM files"
+            )
+        }
+
+        seen: set[str] = set()
+        changed: list[tuple[str, int, int]] = []
+        for rel_path in self._list_files():
+            try:
+                stat = (self.project_dir / rel_path).stat()
+            except OSError:
+                continue
+            seen.add(rel_path)
+            entry = known.get(rel_path)
+            if entry is None or entry[1:] != (stat.st_mtime_ns, stat.st_size):
+                changed.append((rel_path, stat.st_mtime_ns, stat.st_size))
+
+        removed = [known[p][0] for p in known.keys() - seen]
+
+        with conn:
+            for file_id in removed:
+                conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+                conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+            for rel_path, mtime_ns, size in changed:
+                self._index_file(conn, rel_path, mtime_ns, size, known.get(rel_path))
+
+        self._refreshed = True
+
+    def _index_file(
+        self,
+        conn: sqlite3.Connection,
+        rel_path: str,
+        mtime_ns: int,
+        size: int,
+        existing: tuple[int, int, int] | None,
+    ) -> None:
+        """(Re)index a single file inside an open transaction."""
+        try:
+            content = (self.project_dir / rel_path).read_text(
+                encoding="utf-8", errors="ignore"
+            )
+        except OSError:
+            return
+
+        if existing is not None:
+            file_id = existing[0]
+            conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+            conn.execute(
+                "UPDATE files SET mtime_ns = ?, size = ? WHERE id = ?",
+                (mtime_ns, size, file_id),
+            )
+        else:
+            file_id = conn.execute(
+                "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+                (rel_path, mtime_ns, size),
+            ).lastrowid
+
+        counts: dict[str, int] = {}
+        lines: dict[str, list[int]] = {}
+        for line_no, line in enumerate(content.lower().split("\n"), 1):
+            for token in _TOKEN_RE.findall(line):
+                if len(token) < MIN_TOKEN_LENGTH:
+                    continue
+                counts[token] = counts.get(token, 0) + 1
+                token_lines = lines.setdefault(token, [])
+                if len(token_lines) < MAX_LINES_PER_POSTING and (
+                    not token_lines or token_lines[-1] != line_no
+                ):
+                    token_lines.append(line_no)
+
+        if not counts:
+            return
+
+        conn.executemany(
+            "INSERT OR IGNORE INTO tokens (token) VALUES (?)",
+            ((token,) for token in counts),
+        )
+        token_ids = self._token_ids(conn, list(counts))
+        conn.executemany(
+            "INSERT INTO postings (token_id, file_id, count, lines) VALUES (?, ?, ?, ?)",
+            (
+                (
+                    token_ids[token],
+                    file_id,
+                    count,
+                    ",".join(str(n) for n in lines[token]),
+                )
+                for token, count in counts.items()
+            ),
+        )
+
+    @staticmethod
+    def _token_ids(conn: sqlite3.Connection, tokens: list[str]) -> dict[str, int]:
+        """Resolve token strings to ids, in chunks to stay under SQLite's variable limit."""
+        ids: dict[str, int] = {}
+        for start in range(0, len(tokens), 500):
+            chunk = tokens[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            ids.update(
+                (token, token_id)
+                for token_id, token in conn.execute(
+                    f"SELECT id, token FROM tokens WHERE token IN ({placeholders})",
+                    chunk,
+                )
+            )
+        return ids
+
+    # ------------------------------------------------------------------
+    # Querying
+    # ------------------------------------------------------------------
+
+    def lookup(self, keyword: str, path_prefix: str = "") -> dict[str, KeywordHits]:
+        """
+        Find files containing ``keyword`` as a substring.
+
+        Args:
+            keyword: Lowercase keyword (see supports_keyword())
+            path_prefix: Only return files under this relative POSIX directory
+
+        Returns:
+            Mapping of relative file path to occurrence count and the first
+            MAX_LINES_PER_POSTING line numbers containing the keyword
+        """
+        self.refresh()
+        conn = self._connect()
+
+        prefix = path_prefix.strip("/")
+        prefix_clause = ""
+        params: list = [keyword]
+        if prefix and prefix != ".":
+            prefix_clause = "AND substr(f.path, 1, ?) = ?"
+            params.extend([len(prefix) + 1, prefix + "/"])
+
+        hits: dict[str, KeywordHits] = {}
+        rows = conn.execute(
+            f"""
+            SELECT f.path, t.token, p.count, p.lines
+            FROM tokens t
+            JOIN postings p ON p.token_id = t.id
+            JOIN files f ON f.id = p.file_id
+            WHERE instr(t.token, ?) > 0 {prefix_clause}
+            """,
+            params,
+        )
+        for path, token, count, lines in rows:
+            hit = hits.setdefault(path, KeywordHits())
+            hit.count += count * token.count(keyword)
+            hit.lines.extend(int(n) for n in lines.split(","))
+
+        for hit in hits.values():
+            hit.lines = sorted(set(hit.lines))[:MAX_LINES_PER_POSTING]
+        return hits
@@ -5,16 +5,41 @@ Pattern Discovery
 Discovers code patterns from reference files to guide implementation.
 """
 
+import sqlite3
 from pathlib import Path
 
+from .code_index import CodeIndex
 from .models import FileMatch
 
 
 class PatternDiscoverer:
     """Discovers code patterns from reference files."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, index: CodeIndex | None = None):
         self.project_dir = project_dir.resolve()
+        self.index = index
+
+    def _first_lines(self, keywords: list[str], paths: set[str]) -> dict | None:
+        """
+        Look up the first matching line per (file, keyword) in the code index.
+
+        Returns:
+            Mapping of (relative path, keyword) to 0-based line index, or None
+            if the index cannot answer for these keywords.
+        """
+        if self.index is None or not all(
+            CodeIndex.supports_keyword(k) for k in keywords
+        ):
+            return None
+        try:
+            first_lines = {}
+            for keyword in keywords:
+                for rel_path, hit in self.index.lookup(keyword).items():
+                    if rel_path in paths and hit.lines:
+                        first_lines[(rel_path, keyword)] = hit.lines[0] - 1
+            return first_lines
+        except (sqlite3.Error, OSError):
+            return None
 
     def discover_patterns(
         self,
@@ -34,10 +59,39 @@ class PatternDiscoverer:
             Dictionary mapping pattern keys to code snippets
         """
         patterns = {}
+        first_lines = self._first_lines(
+            keywords,
+            {Path(m.path).as_posix() for m in reference_files[:max_files]},
+        )
 
         for match in reference_files[:max_files]:
             try:
                 file_path = self.project_dir / match.path
+
+                if first_lines is not None:
+                    # Indexed path: only files with a known hit need reading
+                    rel_path = Path(match.path).as_posix()
+                    hits = [
+                        (keyword, first_lines[(rel_path, keyword)])
+                        for keyword in keywords
+                        if (rel_path, keyword) in first_lines
+                    ]
+                    if not hits:
+                        continue
+                    lines = file_path.read_text(
+                        encoding="utf-8", errors="ignore"
+                    ).split("\n")
+                    for keyword, i in hits:
+                        pattern_key = f"{keyword}_pattern"
+                        if pattern_key not in patterns:
+                            snippet = "\n".join(
+                                lines[max(0, i - 3) : min(len(lines), i + 4)]
+                            )
+                            patterns[pattern_key] = (
+                                f"From {match.path}:\n{snippet[:300]}"
+                            )
+                    continue
+
                 content = file_path.read_text(encoding="utf-8", errors="ignore")
 
                 # Look for common patterns
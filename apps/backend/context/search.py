@@ -5,8 +5,10 @@ Code Search Functionality
 Search codebase for relevant files based on keywords.
 """
 
+import sqlite3
 from pathlib import Path
 
+from .code_index import CodeIndex
 from .constants import CODE_EXTENSIONS, SKIP_DIRS
 from .models import FileMatch
 
@@ -14,8 +16,9 @@ from .models import FileMatch
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, index: CodeIndex | None = None):
         self.project_dir = project_dir.resolve()
+        self.index = index
 
     def search_service(
         self,
@@ -39,6 +42,15 @@ class CodeSearcher:
         if not service_path.exists():
             return matches
 
+        if self.index is not None and all(
+            CodeIndex.supports_keyword(k) for k in keywords
+        ):
+            try:
+                return self._search_index(service_path, service_name, keywords)
+            except (sqlite3.Error, OSError, ValueError):
+                # Index unavailable (e.g. read-only project) - fall back to scanning
+                pass
+
         for file_path in self._iter_code_files(service_path):
             try:
                 content = file_path.read_text(encoding="utf-8", errors="ignore")
@@ -83,6 +95,60 @@ class CodeSearcher:
         matches.sort(key=lambda m: m.relevance_score, reverse=True)
         return matches[:20]  # Top 20 per service
 
+    def _search_index(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """
+        Search a service using the persistent code index.
+
+        Produces the same scores and matching lines as the scanning search,
+        but only reads the files that make the top 20 (for line text).
+        """
+        prefix = service_path.resolve().relative_to(self.project_dir).as_posix()
+
+        scores: dict[str, int] = {}
+        file_keywords: dict[str, list[str]] = {}
+        file_lines: dict[str, list[int]] = {}
+        for keyword in keywords:
+            for rel_path, hit in self.index.lookup(keyword, prefix).items():
+                scores[rel_path] = scores.get(rel_path, 0) + min(hit.count, 10)
+                file_keywords.setdefault(rel_path, []).append(keyword)
+                file_lines.setdefault(rel_path, []).extend(hit.lines)
+
+        ranked = sorted(
+            (p for p in scores if scores[p] > 0),
+            key=lambda p: (-scores[p], p),
+        )[:20]
+
+        matches = []
+        for rel_path in ranked:
+            try:
+                lines = (
+                    (self.project_dir / rel_path)
+                    .read_text(encoding="utf-8", errors="ignore")
+                    .split("\n")
+                )
+            except OSError:
+                continue
+            matching_lines = [
+                (n, lines[n - 1].strip()[:100])
+                for n in file_lines[rel_path]
+                if n <= len(lines)
+            ]
+            matches.append(
+                FileMatch(
+                    path=str(Path(rel_path)),
+                    service=service_name,
+                    reason=f"Contains: {', '.join(file_keywords[rel_path])}",
+                    relevance_score=scores[rel_path],
+                    matching_lines=matching_lines[:5],  # Top 5 lines
+                )
+            )
+        return matches
+
     def _iter_code_files(self, directory: Path):
         """
         Iterate over code files in a directory.
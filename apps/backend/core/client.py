@@ -12,14 +12,15 @@ The client factory now uses AGENT_CONFIGS from agents/tools_pkg/models.py as the
 single source of truth for phase-aware tool and MCP server configuration.
 """
 
-import copy
 import json
 import logging
 import os
 import threading
 import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
 from core.platform import (
     is_windows,
@@ -33,18 +34,94 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 # Caches project index and capabilities to avoid reloading on every create_client() call.
 # This significantly reduces the time to create new agent sessions.
+#
+# Cached data is frozen once at load time and the same read-only snapshot is
+# returned to every caller (no per-call copies). An entry stays valid until the
+# mtime or size of project_index.json or a dependency manifest changes.
+
+# Manifests checked in the project root and in each indexed service directory
+_MANIFEST_FILES = (
+    "package.json",
+    "pyproject.toml",
+    "requirements.txt",
+    "Gemfile",
+    "go.mod",
+    "Cargo.toml",
+    "composer.json",
+)
+
+
+class _ProjectSnapshot(NamedTuple):
+    index: Mapping[str, Any]
+    capabilities: Mapping[str, bool]
+    watched: tuple[Path, ...]
+    signature: tuple[tuple[int, int] | None, ...]
+
+
+_PROJECT_INDEX_CACHE: dict[str, _ProjectSnapshot] = {}
+_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE and _CACHE_STATS
+_CACHE_STATS = {"hits": 0, "misses": 0, "invalidations": 0, "load_time_ms": 0.0}
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-_PROJECT_INDEX_CACHE: dict[str, tuple[dict[str, Any], dict[str, bool], float]] = {}
-_CACHE_TTL_SECONDS = 300  # 5 minute TTL
-_CACHE_LOCK = threading.Lock()  # Protects _PROJECT_INDEX_CACHE access
+
+def _index_file(project_dir: Path) -> Path:
+    return project_dir / ".auto-claude" / "project_index.json"
+
+
+def _watched_files(project_dir: Path, project_index: dict[str, Any]) -> list[Path]:
+    """Files whose changes invalidate the cached index (index file first)."""
+    services = project_index.get("services", {})
+    # Handle both dict format (services by name) and list format
+    if isinstance(services, dict):
+        services = list(services.values())
+    if not isinstance(services, list):
+        services = []
+
+    service_dirs = [project_dir]
+    for service in services:
+        if isinstance(service, dict) and isinstance(service.get("path"), str):
+            service_dirs.append(project_dir / service["path"])
+
+    watched = [_index_file(project_dir)]
+    seen = set()
+    for directory in service_dirs:
+        if directory in seen:
+            continue
+        seen.add(directory)
+        watched.extend(directory / name for name in _MANIFEST_FILES)
+    return watched
+
+
+def _file_signature(
+    paths: tuple[Path, ...],
+) -> tuple[tuple[int, int] | None, ...]:
+    signature = []
+    for path in paths:
+        try:
+            stat = path.stat()
+            signature.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
 
 
 def _get_cached_project_data(
     project_dir: Path,
-) -> tuple[dict[str, Any], dict[str, bool]]:
+) -> tuple[Mapping[str, Any], Mapping[str, bool]]:
     """
     Get project index and capabilities with caching.
 
+    The returned mappings are read-only and shared between callers; copy
+    them (e.g. with dict()) before modifying.
+
     Args:
         project_dir: Path to the project directory
 
@@ -53,58 +130,67 @@ def _get_cached_project_data(
     """
 
     key = str(project_dir.resolve())
-    now = time.time()
     debug = os.environ.get("DEBUG", "").lower() in ("true", "1")
 
-    # Check cache with lock
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = now - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                if debug:
-                    print(
-                        f"[ClientCache] Cache HIT for project index (age: {cache_age:.1f}s / TTL: {_CACHE_TTL_SECONDS}s)"
-                    )
-                logger.debug(f"Using cached project index for {project_dir}")
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-            elif debug:
-                print(
-                    f"[ClientCache] Cache EXPIRED for project index (age: {cache_age:.1f}s > TTL: {_CACHE_TTL_SECONDS}s)"
-                )
-
-    # Cache miss or expired - load fresh data (outside lock to avoid blocking)
-    load_start = time.time()
+        snapshot = _PROJECT_INDEX_CACHE.get(key)
+
+    # Stat the watched files outside the lock
+    if snapshot is not None:
+        if _file_signature(snapshot.watched) == snapshot.signature:
+            with _CACHE_LOCK:
+                _CACHE_STATS["hits"] += 1
+            if debug:
+                print("[ClientCache] Cache HIT for project index")
+            logger.debug(f"Using cached project index for {project_dir}")
+            return snapshot.index, snapshot.capabilities
+        if debug:
+            print("[ClientCache] Cache STALE - project index or manifests changed")
+
+    # Cache miss or stale - load fresh data (outside lock to avoid blocking)
+    load_start = time.perf_counter()
     logger.debug(f"Loading project index for {project_dir}")
+    index_before = _file_signature((_index_file(project_dir),))[0]
     project_index = load_project_index(project_dir)
+    watched = tuple(_watched_files(project_dir, project_index))
+    signature = _file_signature(watched)
+    if signature[0] != index_before:
+        # Index rewritten while we read it; make the next call reload
+        signature = ((-1, -1),) + signature[1:]
     project_capabilities = detect_project_capabilities(project_index)
+    fresh = _ProjectSnapshot(
+        index=_freeze(project_index),
+        capabilities=_freeze(project_capabilities),
+        watched=watched,
+        signature=signature,
+    )
+    load_duration = (time.perf_counter() - load_start) * 1000
 
     if debug:
-        load_duration = (time.time() - load_start) * 1000
         print(
             f"[ClientCache] Cache MISS - loaded project index in {load_duration:.1f}ms"
         )
 
-    # Store in cache with lock - use double-checked locking pattern
-    # Re-check if another thread populated the cache while we were loading
     with _CACHE_LOCK:
-        if key in _PROJECT_INDEX_CACHE:
-            cached_index, cached_capabilities, cached_time = _PROJECT_INDEX_CACHE[key]
-            cache_age = time.time() - cached_time
-            if cache_age < _CACHE_TTL_SECONDS:
-                # Another thread already cached valid data while we were loading
-                if debug:
-                    print(
-                        "[ClientCache] Cache was populated by another thread, using cached data"
-                    )
-                # Return deep copies to prevent callers from corrupting the cache
-                return copy.deepcopy(cached_index), copy.deepcopy(cached_capabilities)
-        # Either no cache entry or it's expired - store our fresh data
-        _PROJECT_INDEX_CACHE[key] = (project_index, project_capabilities, time.time())
+        _CACHE_STATS["misses"] += 1
+        _CACHE_STATS["load_time_ms"] += load_duration
+        if snapshot is not None:
+            _CACHE_STATS["invalidations"] += 1
+        _PROJECT_INDEX_CACHE[key] = fresh
+
+    return fresh.index, fresh.capabilities
 
-    # Return the freshly loaded data (no need to copy since it's not from cache)
-    return project_index, project_capabilities
+
+def get_project_cache_stats() -> dict[str, Any]:
+    """
+    Get project index cache counters.
+
+    Returns:
+        Dict with hits, misses, invalidations (reloads after a file change),
+        total load_time_ms and the number of cached projects
+    """
+    with _CACHE_LOCK:
+        return {**_CACHE_STATS, "entries": len(_PROJECT_INDEX_CACHE)}
 
 
 def invalidate_project_cache(project_dir: Path | None = None) -> None:
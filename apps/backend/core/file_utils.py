@@ -9,20 +9,35 @@ Uses temp file + os.replace() pattern which is atomic on POSIX systems
 and atomic on Windows when source and destination are on the same volume.
 
 Usage:
-    from core.file_utils import write_json_atomic
+    from core.file_utils import update_json_locked, write_json_atomic
 
     write_json_atomic("/path/to/file.json", {"key": "value"})
+
+    # Read-modify-write shared with other threads and processes
+    with update_json_locked("/path/to/file.json") as data:
+        data["key"] = "new value"
 """
 
 import json
 import logging
 import os
 import tempfile
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import IO, Any, Literal
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # POSIX
+    msvcrt = None
+
 
 @contextmanager
 def atomic_write(
@@ -119,3 +134,72 @@ def write_json_atomic(
     """
     with atomic_write(filepath, "w", encoding=encoding) as f:
         json.dump(data, f, indent=indent, ensure_ascii=ensure_ascii)
+
+
+# In-process locks per JSON file; flock() alone doesn't exclude threads that
+# share a process on every platform
+_path_locks: dict[Path, threading.Lock] = {}
+_path_locks_guard = threading.Lock()
+
+
+def _path_lock(filepath: Path) -> threading.Lock:
+    with _path_locks_guard:
+        return _path_locks.setdefault(filepath, threading.Lock())
+
+
+@contextmanager
+def update_json_locked(
+    filepath: str | Path,
+    indent: int = 2,
+    ensure_ascii: bool = False,
+    encoding: str = "utf-8",
+) -> Iterator[Any]:
+    """
+    Read, modify and atomically rewrite a JSON file under an exclusive lock.
+
+    Concurrent updaters (threads, coroutines in other threads, and other
+    processes using this helper) are serialized through a `<file>.lock`
+    sidecar, so no update is lost to a read-modify-write race. The file is
+    only rewritten if the block exits without an exception.
+
+    Args:
+        filepath: JSON file to update (must exist)
+        indent: JSON indentation for the rewritten file (default: 2)
+        ensure_ascii: Whether to escape non-ASCII characters (default: False)
+        encoding: File encoding (default: "utf-8")
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file isn't valid JSON
+
+    Example:
+        with update_json_locked(spec_dir / "implementation_plan.json") as plan:
+            plan["status"] = "in_progress"
+    """
+    filepath = Path(filepath).resolve()
+    lock_path = filepath.with_name(filepath.name + ".lock")
+
+    with _path_lock(filepath), open(lock_path, "a+b") as lock_file:
+        fd = lock_file.fileno()
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        elif msvcrt is not None:
+            lock_file.seek(0)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+        try:
+            with open(filepath, encoding=encoding) as f:
+                data = json.load(f)
+            yield data
+            write_json_atomic(
+                filepath,
+                data,
+                indent=indent,
+                ensure_ascii=ensure_ascii,
+                encoding=encoding,
+            )
+        finally:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            elif msvcrt is not None:
+                lock_file.seek(0)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
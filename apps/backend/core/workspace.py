@@ -121,7 +121,9 @@ from merge import (
     FileTimelineTracker,
     MergeOrchestrator,
 )
+from merge.diff3 import Diff3Result, merge3
 from merge.progress import MergeProgressCallback, MergeProgressStage, emit_progress
+from merge.prompts import build_conflict_only_prompt, extract_conflict_resolutions
 
 MODULE = "workspace"
 
@@ -1301,8 +1303,13 @@ def _resolve_git_conflicts_with_ai(
                     # This handles cases where:
                     # - Only one side changed from base (ours==base or theirs==base)
                     # - Both sides made identical changes (ours==theirs)
+                    # - Both sides changed non-overlapping hunks (line-level diff3)
                     simple_success, simple_merged = _try_simple_3way_merge(
-                        base_content, main_content, worktree_content
+                        base_content,
+                        main_content,
+                        worktree_content,
+                        target_file_path,
+                        project_dir,
                     )
 
                     if simple_success and simple_merged is not None:
@@ -1700,6 +1707,15 @@ CRITICAL RULES:
 - Never output error messages like "I need more context" - always provide a best-effort merge
 - Ensure the output is complete and syntactically valid code"""
 
+# System prompt when only the conflicting hunks from diff3 are sent
+AI_CONFLICT_MERGE_SYSTEM_PROMPT = """You are an expert code merge assistant. Non-overlapping changes have already been merged; you only resolve the listed conflict regions.
+
+CRITICAL RULES:
+- Resolve every conflict, using the exact "--- CONFLICT_N RESOLVED ---" format requested, one fenced code block per conflict
+- Output only the code that replaces each conflict region - never repeat the surrounding context
+- Preserve the intent of both versions; keep additions from both sides where they are compatible
+- Never output explanations or requests for more context - always provide a best-effort resolution"""
+
 # Model constants for AI merge two-tier strategy (ACS-194)
 MERGE_FAST_MODEL = "claude-haiku-4-5-20251001"  # Fast model for simple merges
 MERGE_CAPABLE_MODEL = "claude-sonnet-4-5-20250929"  # Capable model for complex merges
@@ -1745,9 +1761,16 @@ def _try_simple_3way_merge(
     base: str | None,
     ours: str,
     theirs: str,
+    file_path: str | None = None,
+    project_dir: Path | None = None,
 ) -> tuple[bool, str | None]:
     """
-    Attempt a simple 3-way merge without AI.
+    Attempt a 3-way merge without AI.
+
+    Whole-file shortcuts are checked first; otherwise a line-level diff3
+    merge succeeds whenever the two sides changed non-overlapping hunks.
+    When file_path and project_dir are given, a clean diff3 result must also
+    pass the same syntax check as AI merges.
 
     Returns:
         (success, merged_content) - if success is True, merged_content is the result
@@ -1772,9 +1795,18 @@ def _try_simple_3way_merge(
     if ours == theirs:
         return True, ours
 
-    # Both changed differently from base - need AI merge
-    # We could try a line-by-line merge here, but for safety let's use AI
-    return False, None
+    # Both changed differently from base - merge line by line
+    result = merge3(base, ours, theirs)
+    if not result.is_clean:
+        return False, None
+    if file_path is not None and project_dir is not None:
+        is_valid, syntax_error = _validate_merged_syntax(
+            file_path, result.merged_content, project_dir
+        )
+        if not is_valid:
+            debug(MODULE, f"{file_path}: diff3 merge rejected ({syntax_error})")
+            return False, None
+    return True, result.merged_content
 
 
 def _build_merge_prompt(
@@ -1843,6 +1875,7 @@ async def _attempt_ai_merge(
     prompt: str,
     model: str = MERGE_FAST_MODEL,
     max_thinking_tokens: int = MERGE_FAST_THINKING,
+    diff3_result: Diff3Result | None = None,
 ) -> tuple[bool, str | None, str]:
     """
     Attempt an AI merge with a specific model.
@@ -1852,6 +1885,8 @@ async def _attempt_ai_merge(
         prompt: The merge prompt
         model: Model to use for merge
         max_thinking_tokens: Max thinking tokens for the model
+        diff3_result: When set, the prompt holds only its conflict hunks and
+            the response is spliced back into the diff3 merge
 
     Returns:
         Tuple of (success, merged_content, error_message)
@@ -1864,7 +1899,11 @@ async def _attempt_ai_merge(
     client = create_simple_client(
         agent_type="merge_resolver",
         model=model,
-        system_prompt=AI_MERGE_SYSTEM_PROMPT,
+        system_prompt=(
+            AI_CONFLICT_MERGE_SYSTEM_PROMPT
+            if diff3_result is not None
+            else AI_MERGE_SYSTEM_PROMPT
+        ),
         max_thinking_tokens=max_thinking_tokens,
     )
 
@@ -1880,7 +1919,24 @@ async def _attempt_ai_merge(
                     if block_type == "TextBlock" and hasattr(block, "text"):
                         response_text += block.text
 
-    if response_text:
+    if response_text and diff3_result is not None:
+        conflicts = diff3_result.conflict_dicts()
+        resolutions = extract_conflict_resolutions(
+            response_text, conflicts, _infer_language_from_path(task.file_path)
+        )
+        merged_content = diff3_result.render(resolutions)
+        if merged_content is None:
+            missing = [c["id"] for c in conflicts if c["id"] not in resolutions]
+            return False, None, f"AI did not resolve {', '.join(missing)}"
+
+        is_valid, syntax_error = _validate_merged_syntax(
+            task.file_path, merged_content, task.project_dir
+        )
+        if not is_valid:
+            return False, None, f"Invalid syntax: {syntax_error}"
+
+        return True, merged_content, ""
+    elif response_text:
         merged_content = _strip_code_fences(response_text.strip())
 
         # Check if AI returned natural language instead of code (case-insensitive)
@@ -1965,6 +2021,8 @@ async def _merge_file_with_ai_async(
                 task.base_content,
                 task.main_content,
                 task.worktree_content,
+                task.file_path,
+                task.project_dir,
             )
 
             if success and merged is not None:
@@ -1992,14 +2050,38 @@ async def _merge_file_with_ai_async(
 
             ensure_claude_code_oauth_token()
 
-            # Build prompt
-            prompt = _build_merge_prompt(
-                task.file_path,
-                task.base_content,
-                task.main_content,
-                task.worktree_content,
-                task.spec_name,
-            )
+            # With a base, diff3 has already merged the non-overlapping hunks,
+            # so only the conflicting ones go to the model
+            diff3_result = None
+            if task.base_content is not None:
+                diff3_result = merge3(
+                    task.base_content, task.main_content, task.worktree_content
+                )
+                if diff3_result.is_clean:
+                    # The clean merge failed the syntax check, so let the model
+                    # see the whole file rather than an empty hunk list
+                    diff3_result = None
+
+            if diff3_result is not None:
+                debug(
+                    MODULE,
+                    f"Sending {len(diff3_result.conflicts)} conflict hunk(s) "
+                    f"of {task.file_path} to AI",
+                )
+                prompt = build_conflict_only_prompt(
+                    task.file_path,
+                    diff3_result.conflict_dicts(),
+                    task.spec_name,
+                    _infer_language_from_path(task.file_path),
+                )
+            else:
+                prompt = _build_merge_prompt(
+                    task.file_path,
+                    task.base_content,
+                    task.main_content,
+                    task.worktree_content,
+                    task.spec_name,
+                )
 
             # Call Claude Haiku for fast merge first, then fallback to Sonnet if it fails
             # This two-tier approach matches the chat agent's success rate
@@ -2011,6 +2093,7 @@ async def _merge_file_with_ai_async(
                 prompt,
                 model=MERGE_FAST_MODEL,
                 max_thinking_tokens=MERGE_FAST_THINKING,
+                diff3_result=diff3_result,
             )
 
             if success and merged_content:
@@ -2033,6 +2116,7 @@ async def _merge_file_with_ai_async(
                 prompt,
                 model=MERGE_CAPABLE_MODEL,
                 max_thinking_tokens=MERGE_COMPLEX_THINKING,
+                diff3_result=diff3_result,
             )
 
             if success and merged_content:
@@ -0,0 +1,362 @@
+"""
+Keyword search index for Graphiti episodes.
+
+Keyword search over Episodic nodes ranks matches with BM25 from a maintained
+full-text index instead of scanning every episode with CONTAINS:
+
+- Where the kuzu/LadybugDB FTS extension is installed, a full-text index on
+  Episodic(name, content, source_description) is created on first use and
+  queried with QUERY_FTS_INDEX. Searches only load the extension; they never
+  run INSTALL, which can download it.
+- Otherwise a local SQLite FTS5 index is kept next to the database
+  (`<database>.keywords.db`). Writers add episodes to it as they save them,
+  and searches rebuild it whenever its episode count no longer matches the
+  graph (e.g. episodes written before the index existed).
+
+The local index also records that kuzu FTS was unavailable: once it exists,
+searches of that database go straight to it. Delete it to try kuzu FTS again
+(e.g. after installing the extension).
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+KEYWORD_INDEX_SUFFIX = ".keywords.db"
+
+# Name of the FTS index created on the Episodic table by kuzu's extension
+KUZU_FTS_INDEX = "episode_keyword_search"
+
+EPISODE_FIELDS = (
+    "uuid",
+    "name",
+    "content",
+    "source_description",
+    "group_id",
+    "created_at",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    rowid INTEGER PRIMARY KEY,
+    uuid TEXT NOT NULL UNIQUE,
+    name TEXT,
+    content TEXT,
+    source_description TEXT,
+    group_id TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_group ON episodes (group_id);
+CREATE VIRTUAL TABLE IF NOT EXISTS episodes_fts USING fts5(
+    name, content, source_description,
+    content='episodes', content_rowid='rowid',
+    tokenize='porter unicode61', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS episodes_ai AFTER INSERT ON episodes BEGIN
+    INSERT INTO episodes_fts (rowid, name, content, source_description)
+    VALUES (new.rowid, new.name, new.content, new.source_description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_ad AFTER DELETE ON episodes BEGIN
+    INSERT INTO episodes_fts (episodes_fts, rowid, name, content, source_description)
+    VALUES ('delete', old.rowid, old.name, old.content, old.source_description);
+END;
+CREATE TRIGGER IF NOT EXISTS episodes_au AFTER UPDATE ON episodes BEGIN
+    INSERT INTO episodes_fts (episodes_fts, rowid, name, content, source_description)
+    VALUES ('delete', old.rowid, old.name, old.content, old.source_description);
+    INSERT INTO episodes_fts (rowid, name, content, source_description)
+    VALUES (new.rowid, new.name, new.content, new.source_description);
+END;
+"""
+
+
+def keyword_index_path(database_path: Path | str) -> Path:
+    """Path of the local keyword index kept beside a database."""
+    return Path(str(database_path) + KEYWORD_INDEX_SUFFIX)
+
+
+def match_expression(query: str) -> str | None:
+    """
+    Convert free text into an FTS5 MATCH expression.
+
+    Each word becomes a quoted prefix term, OR-ed together so BM25 ranks
+    episodes matching more (and rarer) terms first. Returns None if the
+    query has no searchable words.
+    """
+    terms = re.findall(r"\w+", query.lower())
+    if not terms:
+        return None
+    return " OR ".join(f'"{term}"*' for term in dict.fromkeys(terms))
+
+
+class EpisodeKeywordIndex:
+    """
+    SQLite FTS5 index of episode text for one graph database.
+
+    A single connection is shared by all threads of a process and
+    serialized with a lock; other processes coordinate through SQLite.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(self.path, timeout=10.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def count(self) -> int:
+        """Number of indexed episodes."""
+        with self._lock:
+            return self._conn.execute("SELECT count(*) FROM episodes").fetchone()[0]
+
+    def add(self, episodes: Iterable[dict]) -> None:
+        """Insert or update episodes, keyed by uuid."""
+        rows = [_episode_row(episode) for episode in episodes]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO episodes
+                    (uuid, name, content, source_description, group_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (uuid) DO UPDATE SET
+                    name = excluded.name,
+                    content = excluded.content,
+                    source_description = excluded.source_description,
+                    group_id = excluded.group_id,
+                    created_at = excluded.created_at
+                """,
+                rows,
+            )
+
+    def rebuild(self, episodes: Iterable[dict]) -> None:
+        """Replace the index contents with `episodes`."""
+        rows = [_episode_row(episode) for episode in episodes]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM episodes")
+            self._conn.execute(
+                "INSERT INTO episodes_fts (episodes_fts) VALUES ('rebuild')"
+            )
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO episodes
+                    (uuid, name, content, source_description, group_id, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+
+    def search(
+        self, query: str, limit: int = 20, group_id: str | None = None
+    ) -> list[dict]:
+        """
+        Return the best BM25 matches for `query`, highest score first.
+
+        Each result has the episode fields plus `score` (larger is better).
+        """
+        expression = match_expression(query)
+        if expression is None:
+            return []
+
+        sql = """
+            SELECT e.uuid, e.name, e.content, e.source_description, e.group_id,
+                   e.created_at, -bm25(episodes_fts) AS score
+            FROM episodes_fts
+            JOIN episodes e ON e.rowid = episodes_fts.rowid
+            WHERE episodes_fts MATCH ?
+        """
+        params: list = [expression]
+        if group_id:
+            sql += " AND e.group_id = ?"
+            params.append(group_id)
+        sql += " ORDER BY score DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(zip((*EPISODE_FIELDS, "score"), row)) for row in rows]
+
+
+def _episode_row(episode: dict) -> tuple:
+    created_at = episode.get("created_at")
+    if hasattr(created_at, "isoformat"):
+        created_at = created_at.isoformat()
+    return (
+        str(episode["uuid"]),
+        episode.get("name") or "",
+        episode.get("content") or "",
+        episode.get("source_description") or "",
+        episode.get("group_id") or "",
+        str(created_at) if created_at is not None else None,
+    )
+
+
+_indexes: dict[Path, EpisodeKeywordIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_keyword_index(path: Path) -> EpisodeKeywordIndex:
+    """Return the shared local index stored at `path`, creating it if needed."""
+    key = Path(path).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None or not index.path.exists():
+            if index is not None:
+                index.close()
+            index = EpisodeKeywordIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def index_episode(database_path: Path | str, episode: dict) -> bool:
+    """
+    Add a newly saved episode to the local index of its database.
+
+    Only updates an index that already exists: databases searched through
+    kuzu FTS never get one, and a missing index is built in full by the
+    first search that needs it.
+
+    Returns:
+        True if the episode was indexed
+    """
+    path = keyword_index_path(database_path)
+    if not path.exists():
+        return False
+    try:
+        get_keyword_index(path).add([episode])
+        return True
+    except sqlite3.Error as e:
+        logger.debug(f"Failed to index episode in {path}: {e}")
+        return False
+
+
+# =============================================================================
+# kuzu / LadybugDB full-text search
+# =============================================================================
+
+
+def _fts_query(group_id: str | None) -> str:
+    query = f"""
+        CALL QUERY_FTS_INDEX('Episodic', '{KUZU_FTS_INDEX}', $query)
+        WITH node AS e, score
+    """
+    if group_id:
+        query += " WHERE e.group_id = $group_id"
+    return (
+        query
+        + """
+        RETURN e.uuid, e.name, e.content, e.source_description, e.group_id,
+               e.created_at, score
+        ORDER BY score DESC
+        LIMIT $limit
+        """
+    )
+
+
+def _prepare_kuzu_fts(conn) -> bool:
+    """Load the installed FTS extension and create the Episodic index if missing."""
+    try:
+        conn.execute("LOAD EXTENSION fts")
+    except Exception as e:
+        # Already loaded is fine; anything else shows up below
+        logger.debug(f"LOAD EXTENSION fts: {e}")
+    try:
+        conn.execute(
+            f"CALL CREATE_FTS_INDEX('Episodic', '{KUZU_FTS_INDEX}', "
+            "['name', 'content', 'source_description'])"
+        )
+    except Exception as e:
+        if "already exists" not in str(e).lower():
+            logger.debug(f"kuzu full-text search unavailable: {e}")
+            return False
+    return True
+
+
+def kuzu_fts_search(
+    conn, query: str, limit: int = 20, group_id: str | None = None
+) -> list[dict] | None:
+    """
+    Search episodes through the database's own FTS index.
+
+    The index is created the first time a search fails for lack of it; kuzu
+    keeps it current as episodes are inserted.
+
+    Returns:
+        Results shaped like EpisodeKeywordIndex.search(), or None if the
+        FTS extension can't be used with this database
+    """
+    parameters = {"query": query, "limit": limit}
+    if group_id:
+        parameters["group_id"] = group_id
+
+    for attempt in range(2):
+        try:
+            result = conn.execute(_fts_query(group_id), parameters=parameters)
+            break
+        except Exception as e:
+            if attempt or not _prepare_kuzu_fts(conn):
+                logger.debug(f"kuzu full-text query failed: {e}")
+                return None
+
+    rows = []
+    while result.has_next():
+        rows.append(dict(zip((*EPISODE_FIELDS, "score"), result.get_next())))
+    return rows
+
+
+def _count_episodes(conn) -> int:
+    result = conn.execute("MATCH (e:Episodic) RETURN count(e)")
+    return result.get_next()[0] if result.has_next() else 0
+
+
+def _iter_kuzu_episodes(conn):
+    result = conn.execute(
+        """
+        MATCH (e:Episodic)
+        RETURN e.uuid, e.name, e.content, e.source_description, e.group_id,
+               e.created_at
+        """
+    )
+    while result.has_next():
+        yield dict(zip(EPISODE_FIELDS, result.get_next()))
+
+
+def search_episodes(
+    conn,
+    database_path: Path | str,
+    query: str,
+    limit: int = 20,
+    group_id: str | None = None,
+) -> list[dict]:
+    """
+    Rank episodes matching `query` with BM25, best first.
+
+    Uses kuzu FTS if available, otherwise the local index beside
+    `database_path` (brought in sync with the graph first if its episode
+    count differs).
+    """
+    if match_expression(query) is None:
+        return []
+
+    path = keyword_index_path(database_path)
+    # An existing local index means kuzu FTS already failed for this database
+    if not path.exists():
+        rows = kuzu_fts_search(conn, query, limit, group_id)
+        if rows is not None:
+            return rows
+
+    index = get_keyword_index(path)
+    if index.count() != _count_episodes(conn):
+        index.rebuild(_iter_kuzu_episodes(conn))
+    return index.search(query, limit, group_id)
@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from core.sentry import capture_exception
 
+from .keyword_index import index_episode
 from .schema import (
     EPISODE_TYPE_CODEBASE_DISCOVERY,
     EPISODE_TYPE_GOTCHA,
@@ -42,6 +43,34 @@ class GraphitiQueries:
         self.group_id = group_id
         self.spec_context_id = spec_context_id
 
+    async def _add_episode(self, **kwargs):
+        """
+        Add an episode through Graphiti and to the keyword search index.
+
+        Indexing is best-effort; a search rebuilds the local index if it
+        ever falls behind the graph.
+        """
+        result = await self.client.graphiti.add_episode(**kwargs)
+
+        episode = getattr(result, "episode", None)
+        config = getattr(self.client, "config", None)
+        if episode is not None and config is not None:
+            try:
+                index_episode(
+                    config.get_db_path(),
+                    {
+                        "uuid": episode.uuid,
+                        "name": episode.name,
+                        "content": episode.content,
+                        "source_description": episode.source_description,
+                        "group_id": episode.group_id,
+                        "created_at": episode.created_at,
+                    },
+                )
+            except Exception as e:
+                logger.debug(f"Failed to index episode {episode.name}: {e}")
+        return result
+
     async def add_session_insight(
         self,
         session_num: int,
@@ -68,7 +97,7 @@ class GraphitiQueries:
                 **insights,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"session_{session_num:03d}_{self.spec_context_id}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -119,7 +148,7 @@ class GraphitiQueries:
                 "files": discoveries,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"codebase_discovery_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -162,7 +191,7 @@ class GraphitiQueries:
                 "pattern": pattern,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -205,7 +234,7 @@ class GraphitiQueries:
                 "gotcha": gotcha,
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -260,7 +289,7 @@ class GraphitiQueries:
                 **(metadata or {}),
             }
 
-            await self.client.graphiti.add_episode(
+            await self._add_episode(
                 name=f"task_outcome_{task_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                 episode_body=json.dumps(episode_content),
                 source=EpisodeType.text,
@@ -320,7 +349,7 @@ class GraphitiQueries:
                         "gotchas": file_insight.get("gotchas", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"file_insight_{file_insight.get('path', 'unknown').replace('/', '_')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -363,7 +392,7 @@ class GraphitiQueries:
                         "example": example,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"pattern_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -404,7 +433,7 @@ class GraphitiQueries:
                         "solution": solution,
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"gotcha_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S%f')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -441,7 +470,7 @@ class GraphitiQueries:
                         "changed_files": insights.get("changed_files", []),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"task_outcome_{subtask_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -474,7 +503,7 @@ class GraphitiQueries:
                         "success": insights.get("success", False),
                     }
 
-                    await self.client.graphiti.add_episode(
+                    await self._add_episode(
                         name=f"recommendations_{insights.get('subtask_id', 'unknown')}",
                         episode_body=json.dumps(episode_content),
                         source=EpisodeType.text,
@@ -5,6 +5,7 @@ Linear Integration
 Integration with Linear issue tracking.
 """
 
+from .client import LinearAPIError, LinearGraphQLClient, LinearOutbox
 from .config import LinearConfig
 from .integration import LinearManager
 from .updater import (
@@ -15,6 +16,7 @@ from .updater import (
     STATUS_TODO,
     LinearTaskState,
     create_linear_task,
+    flush_linear_updates,
     get_linear_api_key,
     is_linear_enabled,
     update_linear_status,
@@ -25,7 +27,10 @@ LinearIntegration = LinearManager
 LinearUpdater = LinearTaskState  # Alias - old code may expect this name
 
 __all__ = [
+    "LinearAPIError",
     "LinearConfig",
+    "LinearGraphQLClient",
+    "LinearOutbox",
     "LinearManager",
     "LinearIntegration",
     "LinearTaskState",
@@ -33,6 +38,7 @@ __all__ = [
     "is_linear_enabled",
     "get_linear_api_key",
     "create_linear_task",
+    "flush_linear_updates",
     "update_linear_status",
     "STATUS_TODO",
     "STATUS_IN_PROGRESS",
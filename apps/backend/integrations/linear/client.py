@@ -0,0 +1,391 @@
+"""
+Linear GraphQL Client
+=====================
+
+Direct client for the Linear GraphQL API, used for task status changes and
+comments instead of starting an agent session for each update.
+
+LinearOutbox collects updates per issue and sends everything pending in one
+batched mutation: the latest status wins and queued comments are merged
+into a single comment.
+
+The endpoint can be pointed at a local stand-in server with LINEAR_API_URL.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+LINEAR_API_URL = "https://api.linear.app/graphql"
+
+# Environment override for the GraphQL endpoint
+LINEAR_API_URL_ENV = "LINEAR_API_URL"
+
+# Seconds queued updates wait for more updates to the same issues
+OUTBOX_FLUSH_DELAY = 5.0
+
+TEAMS_QUERY = "query Teams { teams { nodes { id key name } } }"
+
+CREATE_ISSUE_MUTATION = """
+mutation CreateIssue($input: IssueCreateInput!) {
+  issueCreate(input: $input) {
+    success
+    issue { id identifier team { id } }
+  }
+}
+"""
+
+TEAM_STATES_QUERY = """
+query TeamStates($id: String!) {
+  team(id: $id) { states { nodes { id name } } }
+}
+"""
+
+ISSUE_TEAM_QUERY = "query IssueTeam($id: String!) { issue(id: $id) { team { id } } }"
+
+
+class LinearAPIError(Exception):
+    """A Linear API request failed or returned GraphQL errors."""
+
+
+@dataclass
+class IssueUpdate:
+    """Pending changes for one issue."""
+
+    issue_id: str
+    team_id: str | None = None
+    status: str | None = None
+    comments: list[str] = field(default_factory=list)
+    # Called with the (merged) update once Linear has applied it
+    on_applied: list[Callable[[IssueUpdate], None]] = field(
+        default_factory=list, compare=False, repr=False
+    )
+
+    def merge(self, other: IssueUpdate) -> None:
+        """Fold a later update for the same issue into this one."""
+        self.team_id = other.team_id or self.team_id
+        self.status = other.status or self.status
+        self.comments.extend(other.comments)
+        self.on_applied.extend(other.on_applied)
+
+    @property
+    def comment_body(self) -> str | None:
+        """Queued comments as one comment body, oldest first."""
+        if not self.comments:
+            return None
+        return "\n\n".join(self.comments)
+
+
+class LinearGraphQLClient:
+    """Client for the Linear GraphQL API."""
+
+    def __init__(
+        self,
+        api_key: str,
+        url: str | None = None,
+        default_timeout: float = 30.0,
+    ):
+        self.api_key = api_key
+        self.url = url or os.environ.get(LINEAR_API_URL_ENV) or LINEAR_API_URL
+        self.default_timeout = default_timeout
+        # team_id -> {state name (lowercase): state id}
+        self._states: dict[str, dict[str, str]] = {}
+        self._issue_teams: dict[str, str] = {}
+
+    def execute(
+        self,
+        query: str,
+        variables: dict | None = None,
+        timeout: float | None = None,
+        max_retries: int = 3,
+    ) -> dict:
+        """
+        POST a GraphQL document and return the raw response payload.
+
+        Rate-limited requests (HTTP 429) are retried with backoff. GraphQL
+        errors are returned in the payload's "errors" for the caller.
+
+        Raises:
+            LinearAPIError: on HTTP or transport failures
+        """
+        body = json.dumps({"query": query, "variables": variables or {}}).encode()
+        headers = {
+            "Authorization": self.api_key,
+            "Content-Type": "application/json",
+        }
+
+        last_error: Exception | None = None
+        for attempt in range(max_retries):
+            request = urllib.request.Request(
+                self.url, data=body, headers=headers, method="POST"
+            )
+            try:
+                with urllib.request.urlopen(
+                    request, timeout=timeout or self.default_timeout
+                ) as response:
+                    return json.loads(response.read().decode("utf-8"))
+            except urllib.error.HTTPError as e:
+                error_body = e.read().decode("utf-8") if e.fp else ""
+                last_error = e
+                if e.code == 429 and attempt < max_retries - 1:
+                    retry_after = e.headers.get("Retry-After")
+                    wait_time = 2**attempt
+                    if retry_after and retry_after.isdigit():
+                        wait_time = int(retry_after)
+                    time.sleep(wait_time)
+                    continue
+                raise LinearAPIError(f"Linear API error {e.code}: {error_body}") from e
+            except (urllib.error.URLError, OSError, json.JSONDecodeError) as e:
+                raise LinearAPIError(f"Linear API request failed: {e}") from e
+
+        raise LinearAPIError(
+            f"Linear API error after {max_retries} retries"
+        ) from last_error
+
+    def query(self, query: str, variables: dict | None = None) -> dict:
+        """Run a GraphQL document and return its data, raising on any error."""
+        payload = self.execute(query, variables)
+        if payload.get("errors"):
+            messages = "; ".join(e.get("message", "") for e in payload["errors"])
+            raise LinearAPIError(f"Linear API error: {messages}")
+        return payload.get("data") or {}
+
+    def list_teams(self) -> list[dict]:
+        """Teams visible to the API key."""
+        return self.query(TEAMS_QUERY)["teams"]["nodes"]
+
+    def create_issue(
+        self, team_id: str, title: str, description: str | None = None
+    ) -> dict:
+        """Create an issue and return {"id", "identifier", "team": {"id"}}."""
+        issue_input = {"teamId": team_id, "title": title}
+        if description:
+            issue_input["description"] = description
+        result = self.query(CREATE_ISSUE_MUTATION, {"input": issue_input})
+        created = result.get("issueCreate") or {}
+        if not created.get("success") or not created.get("issue"):
+            raise LinearAPIError(f"Linear issue creation failed: {result}")
+        issue = created["issue"]
+        self._issue_teams[issue["identifier"]] = issue["team"]["id"]
+        return issue
+
+    def workflow_state_id(self, team_id: str, name: str) -> str | None:
+        """ID of a team's workflow state by (case-insensitive) name."""
+        states = self._states.get(team_id)
+        if states is None:
+            result = self.query(TEAM_STATES_QUERY, {"id": team_id})
+            nodes = (result.get("team") or {}).get("states", {}).get("nodes", [])
+            states = {node["name"].lower(): node["id"] for node in nodes}
+            self._states[team_id] = states
+        return states.get(name.lower())
+
+    def issue_team_id(self, issue_id: str) -> str:
+        """Team that owns an issue (ID or identifier such as "VAL-123")."""
+        team_id = self._issue_teams.get(issue_id)
+        if team_id is None:
+            result = self.query(ISSUE_TEAM_QUERY, {"id": issue_id})
+            team_id = result["issue"]["team"]["id"]
+            self._issue_teams[issue_id] = team_id
+        return team_id
+
+    def apply_updates(self, updates: list[IssueUpdate]) -> list[IssueUpdate]:
+        """
+        Apply status changes and comments for several issues in one mutation.
+
+        Returns:
+            The parts of updates that could not be applied, as updates holding
+            only the failed status or comments (every update whole if the
+            request itself failed)
+        """
+        unapplied: dict[int, IssueUpdate] = {}
+        declarations: list[str] = []
+        fields: list[str] = []
+        variables: dict[str, Any] = {}
+        aliases: dict[str, int] = {}
+
+        def remainder(i: int) -> IssueUpdate:
+            if i not in unapplied:
+                update = updates[i]
+                unapplied[i] = IssueUpdate(update.issue_id, team_id=update.team_id)
+            return unapplied[i]
+
+        for i, update in enumerate(updates):
+            state_id = None
+            if update.status:
+                try:
+                    team_id = update.team_id or self.issue_team_id(update.issue_id)
+                    state_id = self.workflow_state_id(team_id, update.status)
+                except (LinearAPIError, KeyError, TypeError) as e:
+                    logger.warning(f"Linear state lookup failed: {e}")
+                if state_id is None:
+                    remainder(i).status = update.status
+            if not state_id and not update.comment_body:
+                continue
+
+            variables[f"issue{i}"] = update.issue_id
+            declarations.append(f"$issue{i}: String!")
+            if state_id:
+                variables[f"state{i}"] = state_id
+                declarations.append(f"$state{i}: String!")
+                fields.append(
+                    f"status{i}: issueUpdate(id: $issue{i}, "
+                    f"input: {{stateId: $state{i}}}) {{ success }}"
+                )
+                aliases[f"status{i}"] = i
+            if update.comment_body:
+                variables[f"body{i}"] = update.comment_body
+                declarations.append(f"$body{i}: String!")
+                fields.append(
+                    f"comment{i}: commentCreate("
+                    f"input: {{issueId: $issue{i}, body: $body{i}}}) {{ success }}"
+                )
+                aliases[f"comment{i}"] = i
+
+        if not fields:
+            return list(unapplied.values())
+
+        document = (
+            f"mutation LinearOutboxFlush({', '.join(declarations)}) {{\n  "
+            + "\n  ".join(fields)
+            + "\n}"
+        )
+        try:
+            payload = self.execute(document, variables)
+        except LinearAPIError as e:
+            logger.warning(str(e))
+            return list(updates)
+
+        data = payload.get("data") or {}
+        rejected = {
+            error["path"][0]
+            for error in payload.get("errors") or []
+            if error.get("path")
+        }
+        if payload.get("errors") and not rejected:
+            # Errors without a path apply to the whole document
+            rejected = set(aliases)
+        for alias, i in aliases.items():
+            if alias in rejected or not (data.get(alias) or {}).get("success"):
+                # Only the failed part is retried, so an applied status or
+                # comment isn't sent twice
+                if alias.startswith("status"):
+                    remainder(i).status = updates[i].status
+                else:
+                    remainder(i).comments = list(updates[i].comments)
+        return list(unapplied.values())
+
+
+class LinearOutbox:
+    """
+    Per-issue queue of Linear updates, flushed as batched mutations.
+
+    Updates queued while an event loop is running are flushed
+    OUTBOX_FLUSH_DELAY seconds after the first one, so bursts of status
+    changes and comments for an issue cost one request. Updates the direct
+    client can't apply are handed to `fallback` one issue at a time.
+    """
+
+    def __init__(
+        self,
+        client: LinearGraphQLClient,
+        fallback: Callable[[IssueUpdate], Awaitable[bool]] | None = None,
+        flush_delay: float = OUTBOX_FLUSH_DELAY,
+    ):
+        self.client = client
+        self.fallback = fallback
+        self.flush_delay = flush_delay
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending: dict[str, IssueUpdate] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_loop: asyncio.AbstractEventLoop | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        """Number of issues with queued updates."""
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, update: IssueUpdate) -> None:
+        """Queue an update, merging it with any pending one for the issue."""
+        with self._lock:
+            existing = self._pending.get(update.issue_id)
+            if existing is None:
+                self._pending[update.issue_id] = update
+            else:
+                existing.merge(update)
+        self._schedule_flush()
+
+    async def flush(self) -> bool:
+        """
+        Send every queued update.
+
+        Returns:
+            True if all updates were applied directly or by the fallback
+        """
+        with self._lock:
+            updates = list(self._pending.values())
+            self._pending = {}
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = self._timer_loop = None
+        if not updates:
+            return True
+
+        failed = await asyncio.to_thread(self._apply, updates)
+        # Pending updates are keyed by issue, so an issue id names one update
+        lost = set()
+        for update in failed:
+            if self.fallback is None or not await self.fallback(update):
+                logger.warning(f"Linear update for {update.issue_id} was not applied")
+                lost.add(update.issue_id)
+        for update in updates:
+            if update.issue_id not in lost:
+                self._notify_applied(update)
+        return not lost
+
+    @staticmethod
+    def _notify_applied(update: IssueUpdate) -> None:
+        for callback in update.on_applied:
+            try:
+                callback(update)
+            except Exception as e:
+                logger.warning(f"Linear update callback failed: {e}")
+
+    def _apply(self, updates: list[IssueUpdate]) -> list[IssueUpdate]:
+        # One batch in flight at a time keeps each issue's updates in order
+        with self._flush_lock:
+            return self.client.apply_updates(updates)
+
+    def _schedule_flush(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop to flush on; the caller (or the exit hook) flushes
+            return
+        with self._lock:
+            # A timer left on a finished loop never fires; replace it
+            if self._timer is not None and self._timer_loop is loop:
+                return
+            self._timer = loop.call_later(self.flush_delay, self._start_flush, loop)
+            self._timer_loop = loop
+
+    def _start_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        with self._lock:
+            self._timer = self._timer_loop = None
+        task = loop.create_task(self.flush())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
@@ -2,9 +2,14 @@
 Linear Updater - Python-Orchestrated Linear Updates
 ====================================================
 
-Provides reliable Linear updates via focused mini-agent calls.
-Instead of relying on agents to remember Linear updates in long prompts,
-the Python orchestrator triggers small, focused agents at key transitions.
+Provides reliable Linear updates at key build transitions, triggered by the
+Python orchestrator instead of relying on agents to remember Linear updates
+in long prompts.
+
+Updates go straight to the Linear GraphQL API through an outbox that
+coalesces status changes and comments per issue into batched mutations.
+A focused mini-agent with the Linear MCP server is only used as a fallback
+for updates the API client couldn't apply.
 
 Design Principles:
 - ONE task per spec (not one issue per subtask)
@@ -20,15 +25,21 @@ Status Flow:
     +-- Task created from spec
 """
 
+import asyncio
+import atexit
 import json
 import os
+import threading
 from dataclasses import dataclass
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Optional
 
 from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
+from .client import IssueUpdate, LinearAPIError, LinearGraphQLClient, LinearOutbox
+
 # Linear status constants (matching Valma AI team setup)
 STATUS_TODO = "Todo"
 STATUS_IN_PROGRESS = "In Progress"
@@ -206,6 +217,16 @@ async def create_linear_task(
         print(f"Linear task already exists: {existing.task_id}")
         return existing
 
+    try:
+        state = await asyncio.to_thread(_create_task_direct, title, description)
+    except LinearAPIError as e:
+        print(f"Linear API task creation failed, falling back to agent: {e}")
+        state = None
+    if state is not None:
+        state.save(spec_dir)
+        print(f"Created Linear task: {state.task_id}")
+        return state
+
     desc_part = f'\n   - description: "{description}"' if description else ""
 
     prompt = f"""Create a Linear task with these details:
@@ -264,12 +285,16 @@ async def update_linear_status(
     """
     Update the Linear task status.
 
+    The change is queued on the outbox and sent with the next batch.
+    .linear_task.json records the new status only once Linear has applied
+    it, so a change that fails to send is queued again by the next call.
+
     Args:
         spec_dir: Spec directory with .linear_task.json
         new_status: New status (STATUS_TODO, STATUS_IN_PROGRESS, STATUS_IN_REVIEW, STATUS_DONE)
 
     Returns:
-        True if successful, False otherwise
+        True if the update was queued, False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -283,24 +308,24 @@ async def update_linear_status(
     if state.status == new_status:
         return True
 
-    prompt = f"""Update Linear issue status:
-
-1. First, use mcp__linear-server__list_issue_statuses with teamId: "{state.team_id}" to find the state ID for "{new_status}"
-2. Then, use mcp__linear-server__update_issue with:
-   - issueId: "{state.task_id}"
-   - stateId: [the state ID for "{new_status}" from step 1]
+    get_linear_outbox().add(
+        IssueUpdate(
+            issue_id=state.task_id,
+            team_id=state.team_id,
+            status=new_status,
+            on_applied=[partial(_record_status, spec_dir)],
+        )
+    )
+    print(f"Queued Linear task {state.task_id} update to: {new_status}")
+    return True
 
-Confirm when done.
-"""
 
-    response = await _run_linear_agent(prompt)
-    if response:
-        state.status = new_status
+def _record_status(spec_dir: Path, update: IssueUpdate) -> None:
+    """Save the status Linear applied to the spec's task state."""
+    state = LinearTaskState.load(spec_dir)
+    if state and state.task_id == update.issue_id and update.status:
+        state.status = update.status
         state.save(spec_dir)
-        print(f"Updated Linear task {state.task_id} to: {new_status}")
-        return True
-
-    return False
 
 
 async def add_linear_comment(
@@ -310,12 +335,15 @@ async def add_linear_comment(
     """
     Add a comment to the Linear task.
 
+    The comment is queued on the outbox; comments queued together for the
+    task are posted as one.
+
     Args:
         spec_dir: Spec directory with .linear_task.json
         comment: Comment text to add
 
     Returns:
-        True if successful, False otherwise
+        True if the comment was queued, False otherwise
     """
     if not is_linear_enabled():
         return False
@@ -325,24 +353,102 @@ async def add_linear_comment(
         print("No Linear task found for this spec")
         return False
 
-    # Escape any quotes in the comment
-    safe_comment = comment.replace('"', '\\"').replace("\n", "\\n")
+    get_linear_outbox().add(IssueUpdate(issue_id=state.task_id, comments=[comment]))
+    return True
+
+
+# === Direct API and outbox ===
+
+_outbox: LinearOutbox | None = None
+_outbox_lock = threading.Lock()
+
 
-    prompt = f"""Add a comment to Linear issue:
+def get_linear_outbox() -> LinearOutbox:
+    """Return the process-wide outbox, flushed at interpreter exit."""
+    global _outbox
+    with _outbox_lock:
+        if _outbox is None:
+            _outbox = LinearOutbox(
+                LinearGraphQLClient(get_linear_api_key()),
+                fallback=_apply_update_with_agent,
+            )
+            atexit.register(_flush_at_exit)
+        return _outbox
+
+
+async def flush_linear_updates() -> bool:
+    """
+    Send queued Linear updates now.
+
+    Returns:
+        True if every queued update was applied
+    """
+    if _outbox is None:
+        return True
+    return await _outbox.flush()
+
+
+def _flush_at_exit() -> None:
+    if _outbox is not None and _outbox.pending:
+        try:
+            asyncio.run(_outbox.flush())
+        except Exception as e:
+            print(f"Linear update flush failed: {e}")
+
+
+def _create_task_direct(title: str, description: str | None) -> LinearTaskState:
+    """Create the task through the GraphQL API (blocking)."""
+    client = get_linear_outbox().client
+    team_id = os.environ.get("LINEAR_TEAM_ID")
+    if not team_id:
+        teams = client.list_teams()
+        if not teams:
+            raise LinearAPIError("No Linear teams available for this API key")
+        team_id = teams[0]["id"]
+
+    issue = client.create_issue(team_id, title, description)
+    return LinearTaskState(
+        task_id=issue["identifier"],
+        task_title=title,
+        team_id=issue["team"]["id"],
+        status=STATUS_TODO,
+        created_at=datetime.now().isoformat(),
+    )
+
+
+async def _apply_update_with_agent(update: IssueUpdate) -> bool:
+    """Fallback: apply an update the API client couldn't, via a mini-agent."""
+    if update.status:
+        prompt = f"""Update Linear issue status:
+
+1. First, use mcp__linear-server__list_issue_statuses with teamId: "{update.team_id}" to find the state ID for "{update.status}"
+2. Then, use mcp__linear-server__update_issue with:
+   - issueId: "{update.issue_id}"
+   - stateId: [the state ID for "{update.status}" from step 1]
+
+Confirm when done.
+"""
+        if not await _run_linear_agent(prompt):
+            return False
+        print(f"Updated Linear task {update.issue_id} to: {update.status}")
+
+    if update.comment_body:
+        # Escape any quotes in the comment
+        safe_comment = update.comment_body.replace('"', '\\"').replace("\n", "\\n")
+
+        prompt = f"""Add a comment to Linear issue:
 
 Use mcp__linear-server__create_comment with:
-- issueId: "{state.task_id}"
+- issueId: "{update.issue_id}"
 - body: "{safe_comment}"
 
 Confirm when done.
 """
+        if not await _run_linear_agent(prompt):
+            return False
+        print(f"Added comment to Linear task {update.issue_id}")
 
-    response = await _run_linear_agent(prompt)
-    if response:
-        print(f"Added comment to Linear task {state.task_id}")
-        return True
-
-    return False
+    return True
 
 
 # === Convenience functions for specific transitions ===
@@ -356,6 +462,7 @@ async def linear_task_started(spec_dir: Path) -> bool:
     success = await update_linear_status(spec_dir, STATUS_IN_PROGRESS)
     if success:
         await add_linear_comment(spec_dir, "Build started - planning phase initiated")
+        success = await flush_linear_updates()
     return success
 
 
@@ -393,7 +500,9 @@ async def linear_build_complete(spec_dir: Path) -> bool:
     Called when all subtasks are completed.
     """
     comment = "All subtasks completed - moving to QA validation"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates()
 
 
 async def linear_qa_started(spec_dir: Path) -> bool:
@@ -404,6 +513,7 @@ async def linear_qa_started(spec_dir: Path) -> bool:
     success = await update_linear_status(spec_dir, STATUS_IN_REVIEW)
     if success:
         await add_linear_comment(spec_dir, "QA validation started")
+        success = await flush_linear_updates()
     return success
 
 
@@ -413,7 +523,9 @@ async def linear_qa_approved(spec_dir: Path) -> bool:
     Called when QA approves the build.
     """
     comment = "QA approved - awaiting human review for merge"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates()
 
 
 async def linear_qa_rejected(
@@ -435,7 +547,9 @@ async def linear_qa_max_iterations(spec_dir: Path, iterations: int) -> bool:
     Called when QA loop exhausts retries.
     """
     comment = f"QA reached max iterations ({iterations}) - needs human intervention"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates()
 
 
 async def linear_task_stuck(
@@ -448,4 +562,6 @@ async def linear_task_stuck(
     Called when subtask exceeds retry limit.
     """
     comment = f"Subtask {subtask_id} is STUCK after {attempt_count} attempts - needs human review"
-    return await add_linear_comment(spec_dir, comment)
+    if not await add_linear_comment(spec_dir, comment):
+        return False
+    return await flush_linear_updates()
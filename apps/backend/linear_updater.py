@@ -9,6 +9,7 @@ from integrations.linear.updater import (
     LinearTaskState,
     add_linear_comment,
     create_linear_task,
+    flush_linear_updates,
     get_linear_api_key,
     is_linear_enabled,
     linear_build_complete,
@@ -27,6 +28,7 @@ __all__ = [
     "LinearTaskState",
     "add_linear_comment",
     "create_linear_task",
+    "flush_linear_updates",
     "get_linear_api_key",
     "is_linear_enabled",
     "linear_build_complete",
@@ -11,7 +11,7 @@ import logging
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .graphiti_helpers import get_graphiti_memory, is_graphiti_memory_enabled, run_async
+from .graphiti_helpers import get_memory_pool, is_graphiti_memory_enabled
 from .paths import get_memory_dir
 
 logger = logging.getLogger(__name__)
@@ -63,12 +63,11 @@ def update_codebase_map(spec_dir: Path, discoveries: dict[str, str]) -> None:
 
     # Also save to Graphiti if enabled
     if is_graphiti_memory_enabled() and discoveries:
+        # Queued on the shared memory pool; failures are logged there
         try:
-            graphiti = run_async(get_graphiti_memory(spec_dir))
-            if graphiti:
-                run_async(graphiti.save_codebase_discoveries(discoveries))
-                run_async(graphiti.close())
-                logger.info("Codebase discoveries also saved to Graphiti")
+            get_memory_pool().submit(
+                spec_dir, None, "save_codebase_discoveries", dict(discoveries)
+            )
         except Exception as e:
             logger.warning(f"Graphiti codebase save failed: {e}")
 
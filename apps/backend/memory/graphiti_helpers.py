@@ -8,7 +8,10 @@ Handles checking if Graphiti is available and managing async operations.
 """
 
 import asyncio
+import atexit
+import concurrent.futures
 import logging
+import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -40,7 +43,9 @@ def is_graphiti_memory_enabled() -> bool:
 
 
 async def get_graphiti_memory(
-    spec_dir: Path, project_dir: Path | None = None
+    spec_dir: Path,
+    project_dir: Path | None = None,
+    group_id_mode: str | None = None,
 ) -> "GraphitiMemory | None":
     """
     Get an initialized GraphitiMemory instance if available.
@@ -48,6 +53,7 @@ async def get_graphiti_memory(
     Args:
         spec_dir: Spec directory
         project_dir: Project root directory (defaults to spec_dir.parent.parent)
+        group_id_mode: Memory namespace (defaults to project-wide shared memory)
 
     Returns:
         Initialized GraphitiMemory instance or None if not available
@@ -66,7 +72,7 @@ async def get_graphiti_memory(
             project_dir = spec_dir.parent.parent
         # Use project-wide shared memory for cross-spec learning
         memory = GraphitiMemory(
-            spec_dir, project_dir, group_id_mode=GroupIdMode.PROJECT
+            spec_dir, project_dir, group_id_mode=group_id_mode or GroupIdMode.PROJECT
         )
 
         # Initialize the memory instance (following GitHub pattern)
@@ -185,3 +191,249 @@ async def save_to_graphiti_async(
                     spec_dir=str(spec_dir),
                     session_num=session_num,
                 )
+
+
+# =============================================================================
+# Pooled memory writes
+# =============================================================================
+
+# Writes taken from a queue per wakeup; the rest wait for the next batch
+WRITE_BATCH_SIZE = 32
+
+# Seconds a pooled memory with no queued writes stays open. Kept short so the
+# database isn't held open long after a burst of writes
+POOL_IDLE_TIMEOUT = 5.0
+
+# Seconds close() waits for queued writes at interpreter exit
+POOL_SHUTDOWN_TIMEOUT = 30.0
+
+
+class _PoolEntry:
+    """Queued writes and the warm memory instance for one pool key."""
+
+    def __init__(self, spec_dir: Path, project_dir: Path | None, group_id_mode: str):
+        self.spec_dir = spec_dir
+        self.project_dir = project_dir
+        self.group_id_mode = group_id_mode
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.memory: GraphitiMemory | None = None
+        self.worker: asyncio.Task | None = None
+
+
+class GraphitiMemoryPool:
+    """
+    Per-process pool of initialized GraphitiMemory instances for writes.
+
+    Opening a memory initializes the database, indices and LLM/embedder
+    clients, which costs far more than writing one episode. The pool keeps
+    one instance per (project, spec, group mode) on a background event
+    loop and feeds it from a write queue, so sync and async callers
+    recording many episodes pay the initialization once. A key's writes
+    run in submission order, in batches of up to WRITE_BATCH_SIZE per
+    wakeup; instances are closed after POOL_IDLE_TIMEOUT without writes
+    and when the interpreter exits.
+
+    Usage:
+        pool = get_memory_pool()
+        pool.submit(spec_dir, project_dir, "save_gotcha", text)  # sync
+        saved = await pool.write(spec_dir, project_dir, "save_pattern", text)
+    """
+
+    def __init__(self, idle_timeout: float = POOL_IDLE_TIMEOUT):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        # Only touched from the pool's event loop
+        self._entries: dict[tuple[str, str, str], _PoolEntry] = {}
+
+    def submit(
+        self,
+        spec_dir: Path,
+        project_dir: Path | None,
+        method: str,
+        *args: Any,
+        group_id_mode: str | None = None,
+    ) -> concurrent.futures.Future:
+        """
+        Queue a GraphitiMemory save call without waiting for it.
+
+        Args:
+            spec_dir: Spec directory
+            project_dir: Project root directory (defaults to spec_dir.parent.parent)
+            method: GraphitiMemory method to call, e.g. "save_gotcha"
+            *args: Arguments for the method
+            group_id_mode: Memory namespace (defaults to project-wide)
+
+        Returns:
+            Future resolving to the method's result, or False if memory is
+            unavailable or the save failed
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        loop = self._ensure_loop()
+        loop.call_soon_threadsafe(
+            self._enqueue,
+            Path(spec_dir),
+            Path(project_dir) if project_dir else None,
+            group_id_mode or "project",
+            (method, args, future),
+        )
+        return future
+
+    async def write(
+        self,
+        spec_dir: Path,
+        project_dir: Path | None,
+        method: str,
+        *args: Any,
+        group_id_mode: str | None = None,
+    ) -> bool:
+        """Queue a save call and wait for its result (for async callers)."""
+        future = self.submit(
+            spec_dir, project_dir, method, *args, group_id_mode=group_id_mode
+        )
+        return await asyncio.wrap_future(future)
+
+    def close(self, timeout: float = POOL_SHUTDOWN_TIMEOUT) -> None:
+        """Finish queued writes, close every memory and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Graphiti memory pool did not shut down cleanly: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    # -------------------------------------------------------------------------
+    # Event loop side
+    # -------------------------------------------------------------------------
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever,
+                    name="graphiti-memory-pool",
+                    daemon=True,
+                )
+                self._thread.start()
+            return self._loop
+
+    def _enqueue(
+        self,
+        spec_dir: Path,
+        project_dir: Path | None,
+        group_id_mode: str,
+        item: tuple,
+    ) -> None:
+        # Same default as get_graphiti_memory(), so callers that pass None
+        # and callers that pass the real path share one memory
+        if project_dir is None:
+            project_dir = spec_dir.parent.parent
+        key = (str(project_dir.resolve()), str(spec_dir.resolve()), group_id_mode)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _PoolEntry(spec_dir, project_dir, group_id_mode)
+            self._entries[key] = entry
+        entry.queue.put_nowait(item)
+        if entry.worker is None or entry.worker.done():
+            entry.worker = asyncio.get_running_loop().create_task(
+                self._drain(key, entry)
+            )
+
+    async def _drain(self, key: tuple, entry: _PoolEntry) -> None:
+        """Run an entry's queued writes until it has been idle too long."""
+        try:
+            while True:
+                try:
+                    first = await asyncio.wait_for(
+                        entry.queue.get(), timeout=self.idle_timeout
+                    )
+                except asyncio.TimeoutError:
+                    return
+
+                batch = [first]
+                while len(batch) < WRITE_BATCH_SIZE and not entry.queue.empty():
+                    batch.append(entry.queue.get_nowait())
+
+                if entry.memory is None:
+                    entry.memory = await get_graphiti_memory(
+                        entry.spec_dir, entry.project_dir, entry.group_id_mode
+                    )
+                await self._run_batch(entry, batch)
+        finally:
+            # Nothing else can enqueue between the timeout and this cleanup,
+            # since both run on the pool's loop
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+            await self._close_entry(entry)
+
+    async def _run_batch(self, entry: _PoolEntry, batch: list[tuple]) -> None:
+        for method, args, future in batch:
+            try:
+                if entry.memory is None:
+                    result = False
+                else:
+                    result = await getattr(entry.memory, method)(*args)
+            except Exception as e:
+                logger.warning(f"Graphiti {method} failed: {e}")
+                capture_exception(
+                    e,
+                    function="GraphitiMemoryPool",
+                    method=method,
+                    spec_dir=str(entry.spec_dir),
+                )
+                result = False
+            finally:
+                entry.queue.task_done()
+            if not future.done():
+                future.set_result(result)
+
+    async def _close_entry(self, entry: _PoolEntry) -> None:
+        # Writes still queued (e.g. the worker was cancelled) are reported lost
+        while not entry.queue.empty():
+            _, _, future = entry.queue.get_nowait()
+            if not future.done():
+                future.set_result(False)
+        memory, entry.memory = entry.memory, None
+        if memory is not None:
+            try:
+                await memory.close()
+            except Exception:
+                logger.debug(
+                    "Failed to close Graphiti memory connection", exc_info=True
+                )
+
+    async def _shutdown(self) -> None:
+        entries = list(self._entries.values())
+        for entry in entries:
+            await entry.queue.join()
+        for entry in entries:
+            if entry.worker is not None:
+                entry.worker.cancel()
+        await asyncio.gather(
+            *(e.worker for e in entries if e.worker is not None),
+            return_exceptions=True,
+        )
+
+
+_memory_pool: GraphitiMemoryPool | None = None
+_memory_pool_lock = threading.Lock()
+
+
+def get_memory_pool() -> GraphitiMemoryPool:
+    """Return the process-wide pool, flushed and closed at interpreter exit."""
+    global _memory_pool
+    with _memory_pool_lock:
+        if _memory_pool is None:
+            _memory_pool = GraphitiMemoryPool()
+            atexit.register(_memory_pool.close)
+        return _memory_pool
@@ -0,0 +1,164 @@
+"""
+Resolution Cache
+================
+
+Persistent cache of AI merge responses.
+
+Entries are keyed by a hash of everything that determines the response:
+the prompt version, the model namespace and the full system and user
+prompts (which embed the baseline code and every task's changes). Re-running
+a merge preview, or retrying a merge with the same inputs, reuses earlier
+responses instead of calling the model again.
+
+Each entry is one JSON file under the cache directory, written atomically,
+with an in-memory LRU in front of it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.file_utils import write_json_atomic
+
+from .prompts import PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+
+# Entries kept on disk; the oldest are pruned beyond this
+DEFAULT_MAX_ENTRIES = 1000
+
+# Entries kept in memory
+MEMORY_CACHE_SIZE = 128
+
+
+@dataclass
+class CachedResolution:
+    """A cached AI response and the tokens its call cost."""
+
+    response: str
+    tokens: int
+    created_at: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "response": self.response,
+            "tokens": self.tokens,
+            "created_at": self.created_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> CachedResolution:
+        return cls(
+            response=data["response"],
+            tokens=int(data.get("tokens", 0)),
+            created_at=float(data.get("created_at", 0.0)),
+        )
+
+
+class ResolutionCache:
+    """
+    Content-addressed store of AI merge responses.
+
+    Safe to share between threads. Without a cache_dir, entries live in
+    memory only.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        namespace: str = "",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files (None for memory only)
+            namespace: Distinguishes responses from different models/settings
+            max_entries: Maximum number of entries kept on disk
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, CachedResolution] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, system_prompt: str, user_prompt: str) -> str:
+        """Cache key for a prompt pair."""
+        material = json.dumps(
+            [PROMPT_VERSION, self.namespace, system_prompt, user_prompt]
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CachedResolution | None:
+        """Look up an entry by key."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+
+        path = self._path(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = CachedResolution.from_dict(json.load(f))
+        except (OSError, json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry {path}: {e}")
+            return None
+
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, response: str, tokens: int) -> None:
+        """Store a response."""
+        entry = CachedResolution(
+            response=response, tokens=tokens, created_at=time.time()
+        )
+        self._remember(key, entry)
+
+        path = self._path(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_json_atomic(path, entry.to_dict())
+            self._prune()
+        except OSError as e:
+            logger.warning(f"Could not write merge cache entry {path}: {e}")
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._memory.clear()
+        if self.cache_dir and self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, entry: CachedResolution) -> None:
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > MEMORY_CACHE_SIZE:
+                self._memory.popitem(last=False)
+
+    def _path(self, key: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{key}.json"
+
+    def _prune(self) -> None:
+        files = list(self.cache_dir.glob("*.json"))
+        if len(files) <= self.max_entries:
+            return
+        files.sort(key=lambda p: p.stat().st_mtime)
+        for path in files[: len(files) - self.max_entries]:
+            path.unlink(missing_ok=True)
@@ -13,6 +13,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import sys
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def create_claude_resolver() -> AIResolver:
+def create_claude_resolver(cache_dir: Path | None = None) -> AIResolver:
     """
     Create an AIResolver configured to use Claude via the Agent SDK.
 
@@ -30,6 +31,9 @@ def create_claude_resolver() -> AIResolver:
     - UTILITY_MODEL_ID: Full model ID (e.g., "claude-haiku-4-5-20251001")
     - UTILITY_THINKING_BUDGET: Thinking budget tokens (e.g., "1024")
 
+    Args:
+        cache_dir: Directory for cached responses (None disables caching)
+
     Returns:
         Configured AIResolver instance
     """
@@ -37,6 +41,7 @@ def create_claude_resolver() -> AIResolver:
     from core.auth import ensure_claude_code_oauth_token, get_auth_token
     from core.model_config import get_utility_model_config
 
+    from .cache import ResolutionCache
     from .resolver import AIResolver
 
     if not get_auth_token():
@@ -102,5 +107,10 @@ def create_claude_resolver() -> AIResolver:
             print(f"    [ERROR] asyncio error: {e}", file=sys.stderr)
             return ""
 
+    # Responses from other models or thinking budgets aren't reused
+    cache = None
+    if cache_dir is not None:
+        cache = ResolutionCache(cache_dir, namespace=f"{model}:{thinking_budget}")
+
     logger.info("Using Claude Agent SDK for merge resolution")
-    return AIResolver(ai_call_fn=call_claude)
+    return AIResolver(ai_call_fn=call_claude, cache=cache)
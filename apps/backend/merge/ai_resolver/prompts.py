@@ -10,6 +10,10 @@ in merging conflicting code changes.
 
 from __future__ import annotations
 
+# Bump when the prompts or response parsing change; cached responses
+# from other versions are ignored
+PROMPT_VERSION = 1
+
 # System prompt for the AI
 SYSTEM_PROMPT = "You are an expert code merge assistant. Be concise and precise."
 
@@ -11,6 +11,7 @@ resolution of conflicts using AI with minimal context.
 from __future__ import annotations
 
 import logging
+import threading
 from collections.abc import Callable
 
 from ..types import (
@@ -21,6 +22,7 @@ from ..types import (
     MergeStrategy,
     TaskSnapshot,
 )
+from .cache import ResolutionCache
 from .context import ConflictContext
 from .language_utils import infer_language, locations_overlap
 from .parsers import extract_batch_code_blocks, extract_code_block
@@ -35,6 +37,9 @@ logger = logging.getLogger(__name__)
 # Type for the AI call function
 AICallFunction = Callable[[str, str], str]
 
+# Files merged at the same time by MergeOrchestrator.merge_tasks()
+DEFAULT_MAX_CONCURRENCY = 4
+
 
 class AIResolver:
     """
@@ -43,7 +48,7 @@ class AIResolver:
     This class:
     1. Builds minimal conflict context
     2. Creates focused prompts
-    3. Calls AI and parses response
+    3. Calls AI (or reuses a cached response) and parses response
     4. Returns MergeResult with merged code
 
     Usage:
@@ -58,6 +63,8 @@ class AIResolver:
         self,
         ai_call_fn: AICallFunction | None = None,
         max_context_tokens: int = MAX_CONTEXT_TOKENS,
+        cache: ResolutionCache | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Initialize the AI resolver.
@@ -66,28 +73,80 @@ class AIResolver:
             ai_call_fn: Function that calls AI. Signature: (system_prompt, user_prompt) -> response
                         If None, uses a stub that requires explicit calls.
             max_context_tokens: Maximum tokens to include in context
+            cache: Optional cache of earlier AI responses
+            max_concurrency: Files merged at once by MergeOrchestrator.merge_tasks()
         """
         self.ai_call_fn = ai_call_fn
         self.max_context_tokens = max_context_tokens
+        self.cache = cache
+        self.max_concurrency = max(1, max_concurrency)
+        self._stats_lock = threading.Lock()
         self._call_count = 0
         self._total_tokens = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._tokens_saved = 0
 
     def set_ai_function(self, ai_call_fn: AICallFunction) -> None:
         """Set the AI call function after initialization."""
         self.ai_call_fn = ai_call_fn
 
     @property
-    def stats(self) -> dict[str, int]:
+    def stats(self) -> dict[str, int | float]:
         """Get usage statistics."""
-        return {
-            "calls_made": self._call_count,
-            "estimated_tokens_used": self._total_tokens,
-        }
+        with self._stats_lock:
+            lookups = self._cache_hits + self._cache_misses
+            return {
+                "calls_made": self._call_count,
+                "estimated_tokens_used": self._total_tokens,
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses,
+                "cache_hit_rate": self._cache_hits / lookups if lookups else 0.0,
+                "estimated_tokens_saved": self._tokens_saved,
+            }
 
     def reset_stats(self) -> None:
         """Reset usage statistics."""
-        self._call_count = 0
-        self._total_tokens = 0
+        with self._stats_lock:
+            self._call_count = 0
+            self._total_tokens = 0
+            self._cache_hits = 0
+            self._cache_misses = 0
+            self._tokens_saved = 0
+
+    def _call_ai(
+        self, prompt: str, context_tokens: int
+    ) -> tuple[str, str | None, bool]:
+        """
+        Get the AI response for a prompt, from the cache when possible.
+
+        Returns:
+            (response, cache key, whether it came from the cache). Callers
+            store responses they could parse with _cache_response().
+        """
+        key = self.cache.key(SYSTEM_PROMPT, prompt) if self.cache else None
+        if key is not None:
+            cached = self.cache.get(key)
+            with self._stats_lock:
+                if cached is not None:
+                    self._cache_hits += 1
+                    self._tokens_saved += cached.tokens
+                else:
+                    self._cache_misses += 1
+            if cached is not None:
+                return cached.response, key, True
+
+        response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
+        with self._stats_lock:
+            self._call_count += 1
+            self._total_tokens += context_tokens + len(response) // 4
+        return response, key, False
+
+    def _cache_response(
+        self, key: str | None, response: str, context_tokens: int, from_cache: bool
+    ) -> None:
+        if key is not None and not from_cache:
+            self.cache.put(key, response, context_tokens + len(response) // 4)
 
     def build_context(
         self,
@@ -198,22 +257,26 @@ class AIResolver:
         # Call AI
         try:
             logger.info(f"Calling AI to resolve conflict in {conflict.file_path}")
-            response = self.ai_call_fn(SYSTEM_PROMPT, prompt)
-            self._call_count += 1
-            self._total_tokens += context.estimated_tokens + len(response) // 4
+            response, cache_key, cached = self._call_ai(
+                prompt, context.estimated_tokens
+            )
 
             # Parse response
             merged_code = extract_code_block(response, context.language)
 
             if merged_code:
+                self._cache_response(
+                    cache_key, response, context.estimated_tokens, cached
+                )
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED,
                     file_path=conflict.file_path,
                     merged_content=merged_code,
                     conflicts_resolved=[conflict],
-                    ai_calls_made=1,
-                    tokens_used=context.estimated_tokens,
-                    explanation=f"AI resolved conflict at {conflict.location}",
+                    ai_calls_made=0 if cached else 1,
+                    tokens_used=0 if cached else context.estimated_tokens,
+                    explanation=f"AI resolved conflict at {conflict.location}"
+                    + (" (cached)" if cached else ""),
                 )
             else:
                 logger.warning("Could not parse AI response")
@@ -222,8 +285,8 @@ class AIResolver:
                     file_path=conflict.file_path,
                     explanation="Could not parse AI merge response",
                     conflicts_remaining=[conflict],
-                    ai_calls_made=1,
-                    tokens_used=context.estimated_tokens,
+                    ai_calls_made=0 if cached else 1,
+                    tokens_used=0 if cached else context.estimated_tokens,
                 )
 
         except Exception as e:
@@ -255,39 +318,47 @@ class AIResolver:
             List of MergeResults
         """
         results = []
+        for file_conflicts in self._group_conflicts(conflicts, batch):
+            results.extend(
+                self._resolve_group(file_conflicts, baseline_codes, task_snapshots)
+            )
+        return results
 
-        if batch and len(conflicts) > 1:
-            # Try to batch conflicts from the same file
-            by_file: dict[str, list[ConflictRegion]] = {}
-            for conflict in conflicts:
-                if conflict.file_path not in by_file:
-                    by_file[conflict.file_path] = []
-                by_file[conflict.file_path].append(conflict)
-
-            for file_path, file_conflicts in by_file.items():
-                if len(file_conflicts) == 1:
-                    # Single conflict, resolve individually
-                    baseline = baseline_codes.get(file_conflicts[0].location, "")
-                    results.append(
-                        self.resolve_conflict(
-                            file_conflicts[0], baseline, task_snapshots
-                        )
-                    )
-                else:
-                    # Multiple conflicts in same file - batch resolve
-                    result = self._resolve_file_batch(
-                        file_path, file_conflicts, baseline_codes, task_snapshots
-                    )
-                    results.append(result)
-        else:
-            # Resolve each individually
-            for conflict in conflicts:
-                baseline = baseline_codes.get(conflict.location, "")
-                results.append(
-                    self.resolve_conflict(conflict, baseline, task_snapshots)
-                )
+    @staticmethod
+    def _group_conflicts(
+        conflicts: list[ConflictRegion], batch: bool
+    ) -> list[list[ConflictRegion]]:
+        """
+        Units of work for resolving several conflicts.
 
-        return results
+        With batching, conflicts from the same file form one group (one AI
+        call); otherwise each conflict is its own group.
+        """
+        if not (batch and len(conflicts) > 1):
+            return [[conflict] for conflict in conflicts]
+
+        by_file: dict[str, list[ConflictRegion]] = {}
+        for conflict in conflicts:
+            by_file.setdefault(conflict.file_path, []).append(conflict)
+        return list(by_file.values())
+
+    def _resolve_group(
+        self,
+        conflicts: list[ConflictRegion],
+        baseline_codes: dict[str, str],
+        task_snapshots: list[TaskSnapshot],
+    ) -> list[MergeResult]:
+        if len(conflicts) == 1:
+            # Single conflict, resolve individually
+            baseline = baseline_codes.get(conflicts[0].location, "")
+            return [self.resolve_conflict(conflicts[0], baseline, task_snapshots)]
+
+        # Multiple conflicts in same file - batch resolve
+        return [
+            self._resolve_file_batch(
+                conflicts[0].file_path, conflicts, baseline_codes, task_snapshots
+            )
+        ]
 
     def _resolve_file_batch(
         self,
@@ -351,9 +422,9 @@ class AIResolver:
         )
 
         try:
-            response = self.ai_call_fn(SYSTEM_PROMPT, batch_prompt)
-            self._call_count += 1
-            self._total_tokens += total_tokens + len(response) // 4
+            response, cache_key, cached = self._call_ai(batch_prompt, total_tokens)
+            calls_made = 0 if cached else 1
+            tokens_used = 0 if cached else total_tokens
 
             # Parse batch response
             # This is a simplified parser - production would be more robust
@@ -373,6 +444,7 @@ class AIResolver:
 
             # Return combined result
             if resolved:
+                self._cache_response(cache_key, response, total_tokens, cached)
                 return MergeResult(
                     decision=MergeDecision.AI_MERGED
                     if not remaining
@@ -381,8 +453,8 @@ class AIResolver:
                     merged_content=response,  # Full response for manual extraction
                     conflicts_resolved=resolved,
                     conflicts_remaining=remaining,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
+                    ai_calls_made=calls_made,
+                    tokens_used=tokens_used,
                     explanation=f"Batch resolved {len(resolved)}/{len(conflicts)} conflicts",
                 )
             else:
@@ -391,8 +463,8 @@ class AIResolver:
                     file_path=file_path,
                     explanation="Could not parse batch AI response",
                     conflicts_remaining=conflicts,
-                    ai_calls_made=1,
-                    tokens_used=total_tokens,
+                    ai_calls_made=calls_made,
+                    tokens_used=tokens_used,
                 )
 
         except Exception as e:
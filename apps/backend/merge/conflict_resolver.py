@@ -81,6 +81,7 @@ class ConflictResolver:
         resolved: list[ConflictRegion] = []
         remaining: list[ConflictRegion] = []
         ai_calls = 0
+        ai_resolved = False
         tokens_used = 0
         total_conflicts = len(conflicts)
 
@@ -147,6 +148,7 @@ class ConflictResolver:
                         ai_result.merged_content or "",
                     )
                     resolved.append(conflict)
+                    ai_resolved = True
                     continue
 
             # Could not resolve
@@ -154,8 +156,9 @@ class ConflictResolver:
 
         # Determine final decision
         if not remaining:
+            # AI resolutions may come from the cache without a new call
             decision = (
-                MergeDecision.AUTO_MERGED if ai_calls == 0 else MergeDecision.AI_MERGED
+                MergeDecision.AI_MERGED if ai_resolved else MergeDecision.AUTO_MERGED
             )
         elif remaining and resolved:
             decision = MergeDecision.NEEDS_HUMAN_REVIEW
@@ -0,0 +1,227 @@
+"""
+Diff3 Merge
+===========
+
+Line-level three-way merge engine used before any AI call.
+
+Both sides are aligned against the common ancestor (base); regions where
+base, ours and theirs all agree are "stable" and split the file into
+hunks. Each hunk is then resolved deterministically:
+
+- Only one side changed it -> take that side
+- Both sides made the same change -> take either
+- Both sides changed it differently -> conflict
+
+Non-overlapping edits therefore merge cleanly in-process, and only the
+genuinely conflicting hunks need to be sent to a model. Conflicts are
+exposed in the same dict shape that ``merge.prompts.build_conflict_only_prompt``
+and ``extract_conflict_resolutions`` already understand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+
+# Lines of merged context shown around each conflict hunk
+CONFLICT_CONTEXT_LINES = 3
+
+
+@dataclass
+class ConflictHunk:
+    """A region both sides changed differently relative to base."""
+
+    id: str
+    base_lines: list[str]
+    ours_lines: list[str]
+    theirs_lines: list[str]
+    ours_start: int  # 0-based line index in ours where the hunk begins
+
+
+@dataclass
+class Diff3Result:
+    """
+    Outcome of a three-way merge.
+
+    ``segments`` is the merged file in order: plain strings are resolved
+    text, ConflictHunk entries are regions that still need a decision.
+    """
+
+    segments: list[str | ConflictHunk] = field(default_factory=list)
+
+    @property
+    def conflicts(self) -> list[ConflictHunk]:
+        return [s for s in self.segments if isinstance(s, ConflictHunk)]
+
+    @property
+    def is_clean(self) -> bool:
+        return not self.conflicts
+
+    @property
+    def merged_content(self) -> str | None:
+        """The merged file, or None if any conflict is unresolved."""
+        if not self.is_clean:
+            return None
+        return "".join(self.segments)
+
+    def conflict_dicts(self, context_lines: int = CONFLICT_CONTEXT_LINES) -> list[dict]:
+        """
+        Describe conflicts for the conflict-only AI prompt.
+
+        Returns:
+            List of dicts with id, base_lines, main_lines (ours),
+            worktree_lines (theirs), context_before and context_after.
+        """
+        result = []
+        for i, segment in enumerate(self.segments):
+            if not isinstance(segment, ConflictHunk):
+                continue
+            before = self.segments[i - 1] if i > 0 else ""
+            after = self.segments[i + 1] if i + 1 < len(self.segments) else ""
+            if isinstance(before, ConflictHunk):
+                before = ""
+            if isinstance(after, ConflictHunk):
+                after = ""
+            result.append(
+                {
+                    "id": segment.id,
+                    "start_line": segment.ours_start + 1,
+                    "base_lines": "".join(segment.base_lines).rstrip("\n"),
+                    "main_lines": "".join(segment.ours_lines).rstrip("\n"),
+                    "worktree_lines": "".join(segment.theirs_lines).rstrip("\n"),
+                    "context_before": "".join(
+                        before.splitlines(keepends=True)[-context_lines:]
+                    ).rstrip("\n"),
+                    "context_after": "".join(
+                        after.splitlines(keepends=True)[:context_lines]
+                    ).rstrip("\n"),
+                }
+            )
+        return result
+
+    def render(self, resolutions: dict[str, str]) -> str | None:
+        """
+        Assemble the merged file with a resolution for every conflict.
+
+        Args:
+            resolutions: Dict mapping conflict id to resolved code. Trailing
+                newlines are normalized to match the surrounding text.
+
+        Returns:
+            The merged content, or None if any conflict lacks a resolution
+        """
+        parts: list[str] = []
+        for segment in self.segments:
+            if not isinstance(segment, ConflictHunk):
+                parts.append(segment)
+                continue
+            if segment.id not in resolutions:
+                return None
+            resolved = resolutions[segment.id].rstrip("\n")
+            if resolved and _ends_with_newline(segment):
+                resolved += "\n"
+            parts.append(resolved)
+        return "".join(parts)
+
+
+def _ends_with_newline(hunk: ConflictHunk) -> bool:
+    for lines in (hunk.ours_lines, hunk.theirs_lines, hunk.base_lines):
+        if lines:
+            return lines[-1].endswith("\n")
+    return True
+
+
+def _sync_regions(
+    base: list[str], ours: list[str], theirs: list[str]
+) -> list[tuple[int, int, int, int]]:
+    """
+    Find runs of base lines matched unchanged in both ours and theirs.
+
+    Returns:
+        List of (base_start, base_end, ours_start, theirs_start), terminated
+        by a zero-length sentinel at the end of all three sequences.
+    """
+    ours_blocks = SequenceMatcher(
+        None, base, ours, autojunk=False
+    ).get_matching_blocks()
+    theirs_blocks = SequenceMatcher(
+        None, base, theirs, autojunk=False
+    ).get_matching_blocks()
+
+    regions = []
+    oi = ti = 0
+    # The final block of get_matching_blocks() is always a zero-length sentinel
+    while oi < len(ours_blocks) - 1 and ti < len(theirs_blocks) - 1:
+        o_base, o_match, o_len = ours_blocks[oi]
+        t_base, t_match, t_len = theirs_blocks[ti]
+
+        start = max(o_base, t_base)
+        end = min(o_base + o_len, t_base + t_len)
+        if start < end:
+            regions.append(
+                (start, end, o_match + (start - o_base), t_match + (start - t_base))
+            )
+
+        if o_base + o_len < t_base + t_len:
+            oi += 1
+        else:
+            ti += 1
+
+    regions.append((len(base), len(base), len(ours), len(theirs)))
+    return regions
+
+
+def merge3(base: str, ours: str, theirs: str) -> Diff3Result:
+    """
+    Three-way merge of ours and theirs against their common ancestor.
+
+    Args:
+        base: Common ancestor content
+        ours: Current branch content
+        theirs: Incoming branch content
+
+    Returns:
+        Diff3Result; ``merged_content`` is set when the merge is clean
+    """
+    base_lines = base.splitlines(keepends=True)
+    ours_lines = ours.splitlines(keepends=True)
+    theirs_lines = theirs.splitlines(keepends=True)
+
+    result = Diff3Result()
+    pending: list[str] = []
+
+    def flush() -> None:
+        if pending:
+            result.segments.append("".join(pending))
+            pending.clear()
+
+    b_pos = o_pos = t_pos = 0
+    for b_start, b_end, o_start, t_start in _sync_regions(
+        base_lines, ours_lines, theirs_lines
+    ):
+        base_chunk = base_lines[b_pos:b_start]
+        ours_chunk = ours_lines[o_pos:o_start]
+        theirs_chunk = theirs_lines[t_pos:t_start]
+
+        if ours_chunk == theirs_chunk or theirs_chunk == base_chunk:
+            pending.extend(ours_chunk)
+        elif ours_chunk == base_chunk:
+            pending.extend(theirs_chunk)
+        else:
+            flush()
+            result.segments.append(
+                ConflictHunk(
+                    id=f"CONFLICT_{len(result.conflicts) + 1}",
+                    base_lines=base_chunk,
+                    ours_lines=ours_chunk,
+                    theirs_lines=theirs_chunk,
+                    ours_start=o_pos,
+                )
+            )
+
+        length = b_end - b_start
+        pending.extend(base_lines[b_start:b_end])
+        b_pos, o_pos, t_pos = b_end, o_start + length, t_start + length
+
+    flush()
+    return result
@@ -7,6 +7,7 @@ File content manipulation and merging utilities.
 This module handles the actual merging of file content:
 - Applying single task changes
 - Combining non-conflicting changes from multiple tasks
+- Reporting changes that could not be applied
 - Finding import locations
 - Extracting content from specific code locations
 """
@@ -48,10 +49,57 @@ def detect_line_ending(content: str) -> str:
     return "\n"
 
 
+def replace_change(content: str, change: SemanticChange) -> tuple[str, bool]:
+    """
+    Apply a modification by replacing its original content.
+
+    The original content must appear exactly once, so an ambiguous match
+    never rewrites the wrong code. A change whose new content is already in
+    place (applied as part of an enclosing change) counts as applied.
+
+    Args:
+        content: Current file content
+        change: Change with both content_before and content_after
+
+    Returns:
+        Tuple of (updated content, whether the change is applied)
+    """
+    if content.count(change.content_before) == 1:
+        return content.replace(change.content_before, change.content_after), True
+    applied = change.content_before not in content and change.content_after in content
+    return content, applied
+
+
+def remove_import(content: str, change: SemanticChange) -> tuple[str, bool]:
+    """
+    Apply an import removal by deleting the matching import line.
+
+    Args:
+        content: Current file content
+        change: REMOVE_IMPORT change with content_before
+
+    Returns:
+        Tuple of (updated content, whether the import was removed)
+    """
+    statement = change.content_before.strip()
+    lines = content.splitlines(keepends=True)
+    matches = [i for i, line in enumerate(lines) if line.strip() == statement]
+    if len(matches) != 1:
+        return content, False
+    del lines[matches[0]]
+    return "".join(lines), True
+
+
+def _enclosing_first(changes: list[SemanticChange]) -> list[SemanticChange]:
+    """Order replacements so a class is replaced before the methods inside it."""
+    return sorted(changes, key=lambda c: -len(c.content_before or ""))
+
+
 def apply_single_task_changes(
     baseline: str,
     snapshot: TaskSnapshot,
     file_path: str,
+    skipped: list[SemanticChange] | None = None,
 ) -> str:
     """
     Apply changes from a single task to baseline content.
@@ -60,10 +108,14 @@ def apply_single_task_changes(
         baseline: The baseline file content
         snapshot: Task snapshot with semantic changes
         file_path: Path to the file (for context on file type)
+        skipped: Optional list that receives changes that could not be applied
 
     Returns:
         Modified content with changes applied
     """
+    if skipped is None:
+        skipped = []
+
     # Detect line ending style before normalizing
     original_line_ending = detect_line_ending(baseline)
 
@@ -75,10 +127,12 @@ def apply_single_task_changes(
     # Use LF for internal processing
     line_ending = "\n"
 
-    for change in snapshot.semantic_changes:
+    for change in _enclosing_first(snapshot.semantic_changes):
         if change.content_before and change.content_after:
             # Modification - replace
-            content = content.replace(change.content_before, change.content_after)
+            content, applied = replace_change(content, change)
+            if not applied:
+                skipped.append(change)
         elif change.content_after and not change.content_before:
             # Addition - need to determine where to add
             if change.change_type == ChangeType.ADD_IMPORT:
@@ -96,6 +150,15 @@ def apply_single_task_changes(
             elif change.change_type == ChangeType.ADD_FUNCTION:
                 # Add function at end (before exports)
                 content += f"{line_ending}{line_ending}{change.content_after}"
+            else:
+                skipped.append(change)
+        elif change.change_type == ChangeType.REMOVE_IMPORT and change.content_before:
+            content, applied = remove_import(content, change)
+            if not applied:
+                skipped.append(change)
+        else:
+            # Other removals, and changes without content, aren't applied
+            skipped.append(change)
 
     # Restore original line ending style if it was CRLF
     if original_line_ending == "\r\n":
@@ -110,6 +173,7 @@ def combine_non_conflicting_changes(
     baseline: str,
     snapshots: list[TaskSnapshot],
     file_path: str,
+    skipped: list[SemanticChange] | None = None,
 ) -> str:
     """
     Combine changes from multiple non-conflicting tasks.
@@ -118,10 +182,14 @@ def combine_non_conflicting_changes(
         baseline: The baseline file content
         snapshots: List of task snapshots with changes
         file_path: Path to the file
+        skipped: Optional list that receives changes that could not be applied
 
     Returns:
         Combined content with all changes applied
     """
+    if skipped is None:
+        skipped = []
+
     # Detect line ending style before normalizing
     original_line_ending = detect_line_ending(baseline)
 
@@ -164,7 +232,9 @@ def combine_non_conflicting_changes(
             import_content = (
                 imp.content_after.rstrip("\n\r") if imp.content_after else ""
             )
-            if import_content and import_content not in content:
+            if not import_content:
+                skipped.append(imp)
+            elif import_content not in content:
                 lines.insert(import_end, import_content)
                 import_end += 1
         content = line_ending.join(lines)
@@ -172,21 +242,39 @@ def combine_non_conflicting_changes(
             content += line_ending
 
     # Apply modifications
-    for mod in modifications:
+    for mod in _enclosing_first(modifications):
         if mod.content_before and mod.content_after:
-            content = content.replace(mod.content_before, mod.content_after)
+            content, applied = replace_change(content, mod)
+            if not applied:
+                skipped.append(mod)
+        else:
+            skipped.append(mod)
 
     # Add functions
     for func in functions:
         if func.content_after:
             content += f"{line_ending}{line_ending}{func.content_after}"
+        else:
+            skipped.append(func)
 
     # Apply other changes
-    for change in other:
+    for change in _enclosing_first(other):
         if change.content_after and not change.content_before:
-            content += f"{line_ending}{change.content_after}"
+            if change.change_type == ChangeType.ADD_METHOD:
+                # A method can't be placed outside its class
+                skipped.append(change)
+            else:
+                content += f"{line_ending}{change.content_after}"
         elif change.content_before and change.content_after:
-            content = content.replace(change.content_before, change.content_after)
+            content, applied = replace_change(content, change)
+            if not applied:
+                skipped.append(change)
+        elif change.change_type == ChangeType.REMOVE_IMPORT and change.content_before:
+            content, applied = remove_import(content, change)
+            if not applied:
+                skipped.append(change)
+        else:
+            skipped.append(change)
 
     # Restore original line ending style if it was CRLF
     if original_line_ending == "\r\n":
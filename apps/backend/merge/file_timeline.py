@@ -38,6 +38,7 @@ Architecture:
     - timeline_models.py: Data classes for timeline representation
     - timeline_git.py: Git operations and queries
     - timeline_persistence.py: Storage and loading of timelines
+    - timeline_store.py: Content-addressed storage for file snapshots
     - timeline_tracker.py: Main service coordinating all components
 
     This file serves as the main entry point and re-exports all public APIs
@@ -60,6 +61,7 @@ from .timeline_models import (
     WorktreeState,
 )
 from .timeline_persistence import TimelinePersistence
+from .timeline_store import TimelineContentStore
 
 # Re-export the main tracker service
 from .timeline_tracker import FileTimelineTracker
@@ -78,4 +80,5 @@ __all__ = [
     # Helper components (advanced usage)
     "TimelineGitHelper",
     "TimelinePersistence",
+    "TimelineContentStore",
 ]
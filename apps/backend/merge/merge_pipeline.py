@@ -21,9 +21,12 @@ from .file_merger import apply_single_task_changes, combine_non_conflicting_chan
 from .progress import MergeProgressCallback, MergeProgressStage
 from .types import (
     ChangeType,
+    ConflictRegion,
+    ConflictSeverity,
     FileAnalysis,
     MergeDecision,
     MergeResult,
+    SemanticChange,
     TaskSnapshot,
 )
 
@@ -99,7 +102,22 @@ class MergePipeline:
                     explanation=f"File modified by {snapshot.task_id} but no semantic changes detected - use worktree version",
                 )
 
-            merged = apply_single_task_changes(baseline_content, snapshot, file_path)
+            skipped: list[SemanticChange] = []
+            merged = apply_single_task_changes(
+                baseline_content, snapshot, file_path, skipped
+            )
+            if skipped:
+                # Applying the rest would silently drop these - take the task's file
+                return MergeResult(
+                    decision=MergeDecision.DIRECT_COPY,
+                    file_path=file_path,
+                    merged_content=None,  # Caller must read from worktree
+                    explanation=(
+                        f"{len(skipped)} change(s) from {snapshot.task_id} could not "
+                        "be applied to the baseline - use worktree version"
+                    ),
+                )
+
             return MergeResult(
                 decision=MergeDecision.AUTO_MERGED,
                 file_path=file_path,
@@ -115,9 +133,24 @@ class MergePipeline:
 
         if not conflicts:
             # No conflicts - combine all changes
+            skipped = []
             merged = combine_non_conflicting_changes(
-                baseline_content, task_snapshots, file_path
+                baseline_content, task_snapshots, file_path, skipped
             )
+            if skipped:
+                return MergeResult(
+                    decision=MergeDecision.NEEDS_HUMAN_REVIEW,
+                    file_path=file_path,
+                    merged_content=merged,
+                    conflicts_remaining=self._unapplied_regions(
+                        file_path, task_snapshots, skipped
+                    ),
+                    explanation=(
+                        f"{len(skipped)} change(s) could not be applied to the "
+                        "baseline - need human review"
+                    ),
+                )
+
             return MergeResult(
                 decision=MergeDecision.AUTO_MERGED,
                 file_path=file_path,
@@ -171,3 +204,40 @@ class MergePipeline:
             analyses[snapshot.task_id] = analysis
 
         return analyses
+
+    def _unapplied_regions(
+        self,
+        file_path: str,
+        task_snapshots: list[TaskSnapshot],
+        skipped: list[SemanticChange],
+    ) -> list[ConflictRegion]:
+        """
+        Describe changes that could not be applied, for human review.
+
+        Args:
+            file_path: Path to the file
+            task_snapshots: List of task snapshots
+            skipped: Changes the combine step could not apply
+
+        Returns:
+            One ConflictRegion per unapplied change
+        """
+        regions = []
+        for change in skipped:
+            task_ids = [
+                s.task_id
+                for s in task_snapshots
+                if any(c is change for c in s.semantic_changes)
+            ]
+            regions.append(
+                ConflictRegion(
+                    file_path=file_path,
+                    location=change.location,
+                    tasks_involved=task_ids,
+                    change_types=[change.change_type],
+                    severity=ConflictSeverity.MEDIUM,
+                    can_auto_merge=False,
+                    reason="Change could not be located in the baseline",
+                )
+            )
+        return regions
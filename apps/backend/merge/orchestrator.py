@@ -19,6 +19,8 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -39,6 +41,8 @@ from .types import (
     ConflictRegion,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -177,7 +181,9 @@ class MergeOrchestrator:
         """Get the AI resolver, initializing if needed."""
         if not self._ai_resolver_initialized:
             if self.enable_ai:
-                self._ai_resolver = create_claude_resolver()
+                self._ai_resolver = create_claude_resolver(
+                    cache_dir=self.storage_dir / "merge_ai_cache"
+                )
             else:
                 self._ai_resolver = AIResolver()  # No AI function
             self._ai_resolver_initialized = True
@@ -545,16 +551,10 @@ class MergeOrchestrator:
             )
 
             # --- RESOLVING stage (50-75%) ---
-            total_files = len(file_tasks)
-            for idx, (file_path, modifying_tasks) in enumerate(file_tasks.items()):
-                file_percent = 50 + int((idx / max(total_files, 1)) * 25)
-                _emit(
-                    MergeProgressStage.RESOLVING,
-                    file_percent,
-                    f"Merging file {idx + 1}/{total_files}",
-                    {"current_file": file_path},
-                )
-
+            # Gather each file's inputs first; the evolution tracker is only
+            # used from this thread
+            file_inputs: list[tuple[str, list[TaskSnapshot], str]] = []
+            for file_path, modifying_tasks in file_tasks.items():
                 # Get snapshots from all tasks that modified this file
                 evolution = self.evolution_tracker.get_file_evolution(file_path)
                 if not evolution:
@@ -569,11 +569,13 @@ class MergeOrchestrator:
                 if not snapshots:
                     continue
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
-                )
+                baseline_content = self._get_baseline_content(file_path, target_branch)
+                file_inputs.append((file_path, snapshots, baseline_content))
+
+            results = self._merge_files_concurrently(file_inputs, _emit)
+
+            for (file_path, _, _), result in zip(file_inputs, results):
+                modifying_tasks = file_tasks[file_path]
 
                 # Handle DIRECT_COPY: read file directly from worktree
                 # For multi-task merges, use the first task's worktree that modified this file
@@ -680,7 +682,15 @@ class MergeOrchestrator:
             target_branch=target_branch,
         )
 
-        # Get baseline content
+        # Delegate to merge pipeline
+        return self.merge_pipeline.merge_file(
+            file_path=file_path,
+            baseline_content=self._get_baseline_content(file_path, target_branch),
+            task_snapshots=task_snapshots,
+        )
+
+    def _get_baseline_content(self, file_path: str, target_branch: str) -> str:
+        """Get a file's content before any task changed it ("" for new files)."""
         baseline_content = self.evolution_tracker.get_baseline_content(file_path)
         if baseline_content is None:
             # Try to get from target branch
@@ -692,12 +702,59 @@ class MergeOrchestrator:
             # File is new - created by task(s)
             baseline_content = ""
 
-        # Delegate to merge pipeline
-        return self.merge_pipeline.merge_file(
-            file_path=file_path,
-            baseline_content=baseline_content,
-            task_snapshots=task_snapshots,
-        )
+        return baseline_content
+
+    def _merge_files_concurrently(
+        self,
+        file_inputs: list[tuple[str, list[TaskSnapshot], str]],
+        emit: Callable[[MergeProgressStage, int, str, dict[str, Any] | None], None],
+    ) -> list[MergeResult]:
+        """
+        Run the merge pipeline for several files, working on different files at once.
+
+        Merging a file can block on an AI call, so files are merged in worker
+        threads, at most ai_resolver.max_concurrency at a time (one at a time
+        without AI). Results come back in the order of file_inputs.
+
+        Args:
+            file_inputs: (file_path, task_snapshots, baseline_content) per file
+            emit: Progress callback for the RESOLVING stage (50-75%)
+
+        Returns:
+            One MergeResult per file
+        """
+        total_files = len(file_inputs)
+        max_concurrency = self.ai_resolver.max_concurrency if self.enable_ai else 1
+        # Build the lazily created pipeline here, not in the worker threads
+        pipeline = self.merge_pipeline
+
+        def merge(
+            inputs: tuple[str, list[TaskSnapshot], str],
+        ) -> MergeResult:
+            file_path, snapshots, baseline_content = inputs
+            debug(
+                MODULE,
+                f"Merging {file_path}",
+                tasks=[s.task_id for s in snapshots],
+            )
+            return pipeline.merge_file(
+                file_path=file_path,
+                baseline_content=baseline_content,
+                task_snapshots=snapshots,
+            )
+
+        results: list[MergeResult] = []
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            # Progress is reported from this thread, in file order
+            for result in executor.map(merge, file_inputs):
+                results.append(result)
+                emit(
+                    MergeProgressStage.RESOLVING,
+                    50 + int((len(results) / max(total_files, 1)) * 25),
+                    f"Merged file {len(results)}/{total_files}",
+                    {"current_file": result.file_path},
+                )
+        return results
 
     def get_pending_conflicts(self) -> list[tuple[str, list[ConflictRegion]]]:
         """
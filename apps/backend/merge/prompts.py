@@ -259,6 +259,7 @@ def build_conflict_only_prompt(
             - worktree_lines: Lines from feature branch (the >>>>>>> section)
             - context_before: Few lines before the conflict for context
             - context_after: Few lines after the conflict for context
+            - base_lines: Optional common-ancestor lines for the region
         spec_name: Name of the feature branch/spec
         language: Programming language
         task_intent: Optional dict with title, description, spec_summary
@@ -280,10 +281,18 @@ FEATURE INTENT: {task_intent.get("title", spec_name)}
         main_lines = conflict.get("main_lines", "")
         worktree_lines = conflict.get("worktree_lines", "")
         conflict_id = conflict.get("id", f"CONFLICT_{i}")
+        base_section = ""
+        if "base_lines" in conflict:
+            base_section = f"""
+COMMON ANCESTOR (BASE):
+```{language}
+{conflict["base_lines"]}
+```
+"""
 
         section = f"""
 --- {conflict_id} ---
-{f"CONTEXT BEFORE:{chr(10)}{context_before}{chr(10)}" if context_before else ""}
+{f"CONTEXT BEFORE:{chr(10)}{context_before}{chr(10)}" if context_before else ""}{base_section}
 MAIN BRANCH VERSION:
 ```{language}
 {main_lines}
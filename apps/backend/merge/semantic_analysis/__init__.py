@@ -4,6 +4,7 @@ Semantic analyzer package for code analysis.
 This package provides modular semantic analysis capabilities:
 - models.py: Data structures for extracted elements
 - comparison.py: Element comparison and change classification
+- python_analyzer.py: AST-based analysis for Python files
 - regex_analyzer.py: Regex-based analysis for code changes
 """
 
@@ -0,0 +1,572 @@
+"""
+AST-based semantic analysis for Python files.
+
+Each change is attributed to the element that encloses it - an import, a
+top-level function, a class, a method or a module-level variable - with the
+element's exact line span from the syntax tree. Other module-level statements
+are compared in order, under the "module" location.
+
+The content of every change is a contiguous span of the file, so the merge
+pipeline can apply it by replacing the old span with the new one.
+
+Parsed structures are cached by content hash, since the same baseline is
+analyzed against every task that touches a file.
+"""
+
+from __future__ import annotations
+
+import ast
+import difflib
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from ..types import ChangeType, FileAnalysis, SemanticChange
+from .comparison import get_add_change_type, get_location, get_remove_change_type
+from .models import ExtractedElement
+
+# Parsed files kept in the cache
+PARSE_CACHE_SIZE = 256
+
+_FUNCTION_NODES = (ast.FunctionDef, ast.AsyncFunctionDef)
+_COMPOUND_NODES = (ast.If, ast.Try) + (
+    (ast.TryStar,) if hasattr(ast, "TryStar") else ()
+)
+
+_cache: OrderedDict[bytes, PythonStructure | None] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class PythonStructure:
+    """Structural elements of one version of a Python file."""
+
+    imports: dict[str, ExtractedElement]
+    elements: dict[str, ExtractedElement]
+    statements: list[ExtractedElement]
+    lines: list[str]
+
+
+def parse_python(content: str) -> PythonStructure | None:
+    """
+    Extract the structure of Python source, or None if it doesn't parse.
+
+    Results are cached by the SHA-256 of the content.
+    """
+    key = hashlib.sha256(content.encode("utf-8", "surrogatepass")).digest()
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+    try:
+        structure = _extract(content)
+    except (SyntaxError, ValueError, RecursionError):
+        structure = None
+
+    with _cache_lock:
+        _cache[key] = structure
+        while len(_cache) > PARSE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return structure
+
+
+def clear_parse_cache() -> None:
+    """Drop all cached parse results."""
+    with _cache_lock:
+        _cache.clear()
+
+
+def analyze_with_ast(
+    file_path: str,
+    before: str,
+    after: str,
+) -> FileAnalysis | None:
+    """
+    Analyze changes to a Python file using its syntax trees.
+
+    Args:
+        file_path: Path to the file being analyzed
+        before: Content before changes
+        after: Content after changes
+
+    Returns:
+        FileAnalysis with one change per changed element, or None if either
+        version doesn't parse
+    """
+    before = _normalize_newlines(before)
+    after = _normalize_newlines(after)
+
+    structure_before = parse_python(before)
+    structure_after = parse_python(after)
+    if structure_before is None or structure_after is None:
+        return None
+
+    changes = [
+        *_compare_imports(structure_before.imports, structure_after.imports),
+        *_compare_elements(structure_before.elements, structure_after.elements),
+        *_compare_statements(structure_before, structure_after),
+    ]
+    changes.sort(key=lambda c: (c.line_start, c.line_end, c.location))
+
+    analysis = FileAnalysis(file_path=file_path, changes=changes)
+    for change in changes:
+        if change.change_type == ChangeType.ADD_IMPORT:
+            analysis.imports_added.add(change.target)
+        elif change.change_type == ChangeType.REMOVE_IMPORT:
+            analysis.imports_removed.add(change.target)
+        elif change.change_type in {ChangeType.ADD_FUNCTION, ChangeType.ADD_METHOD}:
+            analysis.functions_added.add(change.target)
+        elif change.change_type in {
+            ChangeType.MODIFY_FUNCTION,
+            ChangeType.MODIFY_METHOD,
+            ChangeType.ADD_DECORATOR,
+            ChangeType.REMOVE_DECORATOR,
+        }:
+            analysis.functions_modified.add(change.target)
+
+        if change.change_type == ChangeType.MODIFY_CLASS:
+            analysis.classes_modified.add(change.target)
+        elif change.location.startswith("method:"):
+            analysis.classes_modified.add(change.target.split(".")[0])
+
+    analysis.total_lines_changed = _count_changed_lines(before, after)
+    return analysis
+
+
+def _normalize_newlines(content: str) -> str:
+    return content.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _count_changed_lines(before: str, after: str) -> int:
+    diff = difflib.unified_diff(
+        before.splitlines(), after.splitlines(), lineterm="", n=0
+    )
+    return sum(
+        1
+        for line in diff
+        if line[:1] in {"+", "-"} and not line.startswith(("+++", "---"))
+    )
+
+
+# =============================================================================
+# Extraction
+# =============================================================================
+
+
+def _extract(content: str) -> PythonStructure:
+    tree = ast.parse(content)
+    lines = content.splitlines(keepends=True)
+    imports: dict[str, ExtractedElement] = {}
+    elements: dict[str, ExtractedElement] = {}
+    statements: list[ExtractedElement] = []
+
+    for index, node in enumerate(tree.body):
+        if _is_import(node):
+            _add_imports(node, imports)
+        elif isinstance(node, _FUNCTION_NODES):
+            _put(elements, _element("function", node.name, node, lines), lines)
+        elif isinstance(node, ast.ClassDef):
+            for element in _class_elements(node, lines):
+                _put(elements, element, lines)
+        elif _variable_names(node):
+            for name in _variable_names(node):
+                _put(elements, _element("variable", name, node, lines), lines)
+        else:
+            # Imports inside `if TYPE_CHECKING:` / `try: ... except ImportError:`
+            nested = _nested_imports(node)
+            for child in nested:
+                _add_imports(child, imports, nested=True)
+            if _only_imports(node):
+                continue
+            skip = {i for child in nested for i in range(child.lineno, _end(child) + 1)}
+            statement = _element("module", "module", node, lines)
+            statement.metadata["own"] = "".join(
+                lines[lineno - 1]
+                for lineno in range(_start(node), _end(node) + 1)
+                if lineno not in skip
+            )
+            statement.metadata["index"] = index
+            statements.append(statement)
+
+    return PythonStructure(
+        imports=imports, elements=elements, statements=statements, lines=lines
+    )
+
+
+def _put(
+    elements: dict[str, ExtractedElement],
+    element: ExtractedElement,
+    lines: list[str],
+) -> None:
+    """Add an element; repeated definitions (overloads, reassignments) merge."""
+    location = get_location(element)
+    existing = elements.get(location)
+    if existing is None:
+        elements[location] = element
+        return
+    own = _own(existing) + _own(element)
+    for key, value in element.metadata.items():
+        existing.metadata[key] = existing.metadata.get(key, type(value)()) + value
+    existing.metadata["own"] = own
+    # The content spans every definition, so it stays replaceable as one block
+    existing.end_line = max(existing.end_line, element.end_line)
+    existing.content = _segment(lines, existing.start_line, existing.end_line)
+
+
+def _own(element: ExtractedElement) -> str:
+    """The text a change to this element is detected from."""
+    return element.metadata.get("own", element.content)
+
+
+def _replace_fields(node: ast.AST, **changes) -> ast.AST:
+    fields = {name: getattr(node, name, None) for name in node._fields}
+    return type(node)(**{**fields, **changes})
+
+
+def _start(node: ast.AST) -> int:
+    decorators = getattr(node, "decorator_list", None) or []
+    return min([node.lineno, *(d.lineno for d in decorators)])
+
+
+def _end(node: ast.AST) -> int:
+    return node.end_lineno or node.lineno
+
+
+def _segment(lines: list[str], start: int, end: int) -> str:
+    return "".join(lines[start - 1 : end])
+
+
+def _element(
+    element_type: str,
+    name: str,
+    node: ast.AST,
+    lines: list[str],
+    parent: str | None = None,
+) -> ExtractedElement:
+    metadata = {"ast": ast.dump(node)}
+    if isinstance(node, _FUNCTION_NODES):
+        metadata["decorators"] = [ast.dump(d) for d in node.decorator_list]
+        metadata["ast_undecorated"] = ast.dump(_replace_fields(node, decorator_list=[]))
+    return ExtractedElement(
+        element_type=element_type,
+        name=name,
+        start_line=_start(node),
+        end_line=_end(node),
+        content=_segment(lines, _start(node), _end(node)),
+        parent=parent,
+        metadata=metadata,
+    )
+
+
+def _class_elements(node: ast.ClassDef, lines: list[str]) -> list[ExtractedElement]:
+    """
+    The class itself followed by its methods.
+
+    The class element's content is the whole class, but only changes outside
+    its methods count as changes to the class.
+    """
+    methods = [child for child in node.body if isinstance(child, _FUNCTION_NODES)]
+    method_lines = {lineno for m in methods for lineno in range(_start(m), _end(m) + 1)}
+    own_content = "".join(
+        lines[lineno - 1]
+        for lineno in range(_start(node), _end(node) + 1)
+        if lineno not in method_lines
+    )
+    own_ast = ast.dump(
+        _replace_fields(
+            node, body=[child for child in node.body if child not in methods]
+        )
+    )
+
+    elements = [
+        ExtractedElement(
+            element_type="class",
+            name=node.name,
+            start_line=_start(node),
+            end_line=_end(node),
+            content=_segment(lines, _start(node), _end(node)),
+            metadata={"ast": own_ast, "own": own_content},
+        )
+    ]
+    for method in methods:
+        elements.append(
+            _element("method", f"{node.name}.{method.name}", method, lines, node.name)
+        )
+    return elements
+
+
+def _variable_names(node: ast.AST) -> list[str]:
+    if isinstance(node, ast.Assign):
+        targets = node.targets
+    elif isinstance(node, ast.AnnAssign):
+        targets = [node.target]
+    else:
+        return []
+
+    names = []
+    for target in targets:
+        elts = target.elts if isinstance(target, (ast.Tuple, ast.List)) else [target]
+        if not all(isinstance(elt, ast.Name) for elt in elts):
+            return []
+        names.extend(elt.id for elt in elts)
+    return names
+
+
+def _is_import(node: ast.AST) -> bool:
+    return isinstance(node, (ast.Import, ast.ImportFrom))
+
+
+def _blocks(node: ast.AST) -> list[list[ast.stmt]]:
+    """Statement blocks of an if/try statement."""
+    blocks = [node.body, node.orelse]
+    if not isinstance(node, ast.If):
+        blocks.append(node.finalbody)
+        blocks.extend(handler.body for handler in node.handlers)
+    return blocks
+
+
+def _nested_imports(node: ast.AST) -> list[ast.Import | ast.ImportFrom]:
+    """Imports in (possibly nested) module-level if/try statements."""
+    if _is_import(node):
+        return [node]
+    if not isinstance(node, _COMPOUND_NODES):
+        return []
+    return [
+        found
+        for block in _blocks(node)
+        for child in block
+        for found in _nested_imports(child)
+    ]
+
+
+def _only_imports(node: ast.AST) -> bool:
+    """Whether a compound statement holds nothing but imports."""
+    if _is_import(node) or isinstance(node, ast.Pass):
+        return True
+    if not isinstance(node, _COMPOUND_NODES):
+        return False
+    return all(_only_imports(child) for block in _blocks(node) for child in block)
+
+
+def _add_imports(
+    node: ast.Import | ast.ImportFrom,
+    imports: dict[str, ExtractedElement],
+    nested: bool = False,
+) -> None:
+    """
+    One element per imported name, keyed by its normalized statement.
+
+    Changes to nested imports (inside if/try) carry no content, since applying
+    them at the top of the file would drop their guard.
+    """
+    if isinstance(node, ast.ImportFrom):
+        module = "." * node.level + (node.module or "")
+        prefix = f"from {module} import "
+    else:
+        prefix = "import "
+
+    for alias in node.names:
+        statement = prefix + alias.name
+        if alias.asname:
+            statement += f" as {alias.asname}"
+        imports.setdefault(
+            statement,
+            ExtractedElement(
+                element_type="import",
+                name=statement,
+                start_line=node.lineno,
+                end_line=_end(node),
+                content=statement,
+                metadata={"nested": nested},
+            ),
+        )
+
+
+# =============================================================================
+# Comparison
+# =============================================================================
+
+
+def _compare_imports(
+    before: dict[str, ExtractedElement],
+    after: dict[str, ExtractedElement],
+) -> list[SemanticChange]:
+    changes = []
+    for statement in after.keys() - before.keys():
+        element = after[statement]
+        changes.append(
+            SemanticChange(
+                change_type=ChangeType.ADD_IMPORT,
+                target=statement,
+                location="file_top",
+                line_start=element.start_line,
+                line_end=element.end_line,
+                content_after=None if element.metadata["nested"] else statement,
+            )
+        )
+    for statement in before.keys() - after.keys():
+        element = before[statement]
+        changes.append(
+            SemanticChange(
+                change_type=ChangeType.REMOVE_IMPORT,
+                target=statement,
+                location="file_top",
+                line_start=element.start_line,
+                line_end=element.end_line,
+                content_before=None if element.metadata["nested"] else statement,
+            )
+        )
+    return changes
+
+
+def _compare_elements(
+    before: dict[str, ExtractedElement],
+    after: dict[str, ExtractedElement],
+) -> list[SemanticChange]:
+    changes = []
+    for location in before.keys() | after.keys():
+        elem_before = before.get(location)
+        elem_after = after.get(location)
+
+        if elem_after is None:
+            change_type = get_remove_change_type(elem_before.element_type)
+        elif elem_before is None:
+            change_type = get_add_change_type(elem_after.element_type)
+        elif _own(elem_before) == _own(elem_after):
+            continue
+        else:
+            change_type = _classify_modification(elem_before, elem_after)
+
+        current = elem_after or elem_before
+        changes.append(
+            SemanticChange(
+                change_type=change_type,
+                target=current.name,
+                location=location,
+                line_start=current.start_line,
+                line_end=current.end_line,
+                content_before=elem_before.content if elem_before else None,
+                content_after=elem_after.content if elem_after else None,
+            )
+        )
+    return changes
+
+
+def _compare_statements(
+    before: PythonStructure,
+    after: PythonStructure,
+) -> list[SemanticChange]:
+    """
+    Changes to module-level statements outside the structural elements.
+
+    Modified statements are paired one to one. Insertions and deletions are
+    widened to an unchanged neighbouring statement, when it directly precedes
+    or follows them, so the change can be applied by replacement.
+    """
+    old, new = before.statements, after.statements
+    matcher = difflib.SequenceMatcher(
+        a=[_own(s) for s in old], b=[_own(s) for s in new], autojunk=False
+    )
+
+    changes = []
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if tag == "replace" and i2 - i1 == j2 - j1:
+            for k in range(i2 - i1):
+                pair = ([old[i1 + k]], [new[j1 + k]])
+                changes.append(_statement_change(before, after, *pair, pair[1]))
+            continue
+
+        changed = new[j1:j2] or old[i1:i2]
+        group_before, group_after = old[i1:i2], new[j1:j2]
+        for back, ahead in ((0, 0), (1, 0), (0, 1), (1, 1)):
+            if i1 - back < 0 or i2 + ahead > len(old):
+                continue
+            candidate = (
+                old[i1 - back : i2 + ahead],
+                new[j1 - back : j2 + ahead],
+            )
+            if all(group and _consecutive(group) for group in candidate):
+                group_before, group_after = candidate
+                break
+        changes.append(
+            _statement_change(before, after, group_before, group_after, changed)
+        )
+    return changes
+
+
+def _consecutive(statements: list[ExtractedElement]) -> bool:
+    """Whether statements follow each other with nothing else between them."""
+    indexes = [s.metadata["index"] for s in statements]
+    return indexes == list(range(indexes[0], indexes[0] + len(indexes)))
+
+
+def _statement_span(
+    structure: PythonStructure, statements: list[ExtractedElement]
+) -> str | None:
+    if not statements:
+        return None
+    if _consecutive(statements):
+        return _segment(
+            structure.lines, statements[0].start_line, statements[-1].end_line
+        )
+    return "".join(s.content for s in statements)
+
+
+def _statement_change(
+    before: PythonStructure,
+    after: PythonStructure,
+    group_before: list[ExtractedElement],
+    group_after: list[ExtractedElement],
+    changed: list[ExtractedElement],
+) -> SemanticChange:
+    if not group_before:
+        change_type = get_add_change_type("module")
+    elif not group_after:
+        change_type = get_remove_change_type("module")
+    elif len(group_before) == len(group_after) == 1:
+        change_type = _classify_modification(group_before[0], group_after[0])
+    else:
+        change_type = ChangeType.UNKNOWN
+
+    return SemanticChange(
+        change_type=change_type,
+        target="module",
+        location="module",
+        line_start=changed[0].start_line,
+        line_end=changed[-1].end_line,
+        content_before=_statement_span(before, group_before),
+        content_after=_statement_span(after, group_after),
+    )
+
+
+def _classify_modification(
+    before: ExtractedElement, after: ExtractedElement
+) -> ChangeType:
+    """Classify a change to an element present in both versions."""
+    if before.metadata.get("ast") and before.metadata["ast"] == after.metadata.get(
+        "ast"
+    ):
+        # Same syntax tree: whitespace, comments or line wrapping only
+        return ChangeType.FORMATTING_ONLY
+
+    if after.element_type in {"function", "method"}:
+        if before.metadata["ast_undecorated"] == after.metadata["ast_undecorated"]:
+            decorators_before = set(before.metadata["decorators"])
+            decorators_after = set(after.metadata["decorators"])
+            if decorators_after > decorators_before:
+                return ChangeType.ADD_DECORATOR
+            if decorators_after < decorators_before:
+                return ChangeType.REMOVE_DECORATOR
+        if after.element_type == "method":
+            return ChangeType.MODIFY_METHOD
+        return ChangeType.MODIFY_FUNCTION
+
+    if after.element_type == "class":
+        return ChangeType.MODIFY_CLASS
+    if after.element_type == "variable":
+        return ChangeType.MODIFY_VARIABLE
+    return ChangeType.UNKNOWN
@@ -2,7 +2,8 @@
 Semantic Analyzer
 =================
 
-Analyzes code changes at a semantic level using regex-based heuristics.
+Analyzes code changes at a semantic level: Python files through their syntax
+trees, other languages using regex-based heuristics.
 
 This module provides analysis of code changes, extracting meaningful
 semantic changes like "added import", "modified function", "wrapped JSX element"
@@ -42,14 +43,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.semantic_analyzer"
 
-# Import regex-based analyzer
+# Import AST- and regex-based analyzers
 from .semantic_analysis.models import ExtractedElement
+from .semantic_analysis.python_analyzer import analyze_with_ast
 from .semantic_analysis.regex_analyzer import analyze_with_regex
 
 
 class SemanticAnalyzer:
     """
-    Analyzes code changes at a semantic level using regex-based heuristics.
+    Analyzes code changes at a semantic level.
+
+    Python files are compared by syntax tree, so each change is attributed
+    to its enclosing function, class, method or variable. Other languages,
+    and Python that doesn't parse, use regex-based heuristics.
 
     Example:
         analyzer = SemanticAnalyzer()
@@ -60,7 +66,7 @@ class SemanticAnalyzer:
 
     def __init__(self):
         """Initialize the analyzer."""
-        debug(MODULE, "Initializing SemanticAnalyzer (regex-based)")
+        debug(MODULE, "Initializing SemanticAnalyzer")
 
     def analyze_diff(
         self,
@@ -93,8 +99,16 @@ class SemanticAnalyzer:
             task_id=task_id,
         )
 
-        # Use regex-based analysis
-        analysis = analyze_with_regex(file_path, before, after, ext)
+        analysis = None
+        if ext == ".py":
+            analysis = analyze_with_ast(file_path, before, after)
+            if analysis is None:
+                debug_detailed(
+                    MODULE,
+                    f"Python parse failed for {file_path}, using regex analysis",
+                )
+        if analysis is None:
+            analysis = analyze_with_regex(file_path, before, after, ext)
 
         debug_success(
             MODULE,
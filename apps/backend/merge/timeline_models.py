@@ -18,6 +18,16 @@ from datetime import datetime
 from typing import Literal
 
 
+def _content_fields(snapshot, include_content: bool) -> dict:
+    """Serialize a snapshot's content inline, by hash, or both."""
+    data = {}
+    if include_content or snapshot.content_hash is None:
+        data["content"] = snapshot.content
+    if snapshot.content_hash is not None:
+        data["content_hash"] = snapshot.content_hash
+    return data
+
+
 @dataclass
 class MainBranchEvent:
     """
@@ -31,8 +41,8 @@ class MainBranchEvent:
     commit_hash: str
     timestamp: datetime
 
-    # Content at this point
-    content: str
+    # Content at this point (None until loaded from the content store)
+    content: str | None
 
     # Source of change
     source: Literal["human", "merged_task"]
@@ -45,29 +55,34 @@ class MainBranchEvent:
     author: str | None = None
     diff_summary: str | None = None  # e.g., "+15 -3 lines"
 
-    def to_dict(self) -> dict:
-        return {
+    # Blob hash of content in the timeline content store
+    content_hash: str | None = None
+
+    def to_dict(self, include_content: bool = True) -> dict:
+        data = {
             "commit_hash": self.commit_hash,
             "timestamp": self.timestamp.isoformat(),
-            "content": self.content,
             "source": self.source,
             "merged_from_task": self.merged_from_task,
             "commit_message": self.commit_message,
             "author": self.author,
             "diff_summary": self.diff_summary,
         }
+        data.update(_content_fields(self, include_content))
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> MainBranchEvent:
         return cls(
             commit_hash=data["commit_hash"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            content=data["content"],
+            content=data.get("content"),
             source=data["source"],
             merged_from_task=data.get("merged_from_task"),
             commit_message=data.get("commit_message", ""),
             author=data.get("author"),
             diff_summary=data.get("diff_summary"),
+            content_hash=data.get("content_hash"),
         )
 
 
@@ -76,22 +91,25 @@ class BranchPoint:
     """The exact point a task branched from main."""
 
     commit_hash: str
-    content: str
+    content: str | None  # None until loaded from the content store
     timestamp: datetime
+    content_hash: str | None = None
 
-    def to_dict(self) -> dict:
-        return {
+    def to_dict(self, include_content: bool = True) -> dict:
+        data = {
             "commit_hash": self.commit_hash,
-            "content": self.content,
             "timestamp": self.timestamp.isoformat(),
         }
+        data.update(_content_fields(self, include_content))
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> BranchPoint:
         return cls(
             commit_hash=data["commit_hash"],
-            content=data["content"],
+            content=data.get("content"),
             timestamp=datetime.fromisoformat(data["timestamp"]),
+            content_hash=data.get("content_hash"),
         )
 
 
@@ -99,20 +117,21 @@ class BranchPoint:
 class WorktreeState:
     """Current state of a file in a task's worktree."""
 
-    content: str
+    content: str | None  # None until loaded from the content store
     last_modified: datetime
+    content_hash: str | None = None
 
-    def to_dict(self) -> dict:
-        return {
-            "content": self.content,
-            "last_modified": self.last_modified.isoformat(),
-        }
+    def to_dict(self, include_content: bool = True) -> dict:
+        data = {"last_modified": self.last_modified.isoformat()}
+        data.update(_content_fields(self, include_content))
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> WorktreeState:
         return cls(
-            content=data["content"],
+            content=data.get("content"),
             last_modified=datetime.fromisoformat(data["last_modified"]),
+            content_hash=data.get("content_hash"),
         )
 
 
@@ -167,11 +186,11 @@ class TaskFileView:
     status: Literal["active", "merged", "abandoned"] = "active"
     merged_at: datetime | None = None
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_content: bool = True) -> dict:
         return {
             "task_id": self.task_id,
-            "branch_point": self.branch_point.to_dict(),
-            "worktree_state": self.worktree_state.to_dict()
+            "branch_point": self.branch_point.to_dict(include_content),
+            "worktree_state": self.worktree_state.to_dict(include_content)
             if self.worktree_state
             else None,
             "task_intent": self.task_intent.to_dict(),
@@ -260,11 +279,22 @@ class FileTimeline:
             return self.main_branch_history[-1]
         return None
 
-    def to_dict(self) -> dict:
+    def to_dict(self, include_content: bool = True) -> dict:
+        """
+        Serialize the timeline.
+
+        Args:
+            include_content: Inline snapshot text; when False, snapshots that
+                have a content_hash are written as the hash only
+        """
         return {
             "file_path": self.file_path,
-            "main_branch_history": [e.to_dict() for e in self.main_branch_history],
-            "task_views": {k: v.to_dict() for k, v in self.task_views.items()},
+            "main_branch_history": [
+                e.to_dict(include_content) for e in self.main_branch_history
+            ],
+            "task_views": {
+                k: v.to_dict(include_content) for k, v in self.task_views.items()
+            },
             "created_at": self.created_at.isoformat(),
             "last_updated": self.last_updated.isoformat(),
         }
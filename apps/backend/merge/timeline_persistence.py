@@ -8,6 +8,7 @@ This module handles:
 - Saving/loading timelines to/from disk
 - Managing the timeline index
 - File path encoding for safe storage
+- Moving snapshot content into the shared content store
 """
 
 from __future__ import annotations
@@ -18,8 +19,17 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .timeline_store import TimelineContentStore
+
 if TYPE_CHECKING:
-    from .timeline_models import FileTimeline
+    from .timeline_models import (
+        BranchPoint,
+        FileTimeline,
+        MainBranchEvent,
+        WorktreeState,
+    )
+
+    Snapshot = BranchPoint | MainBranchEvent | WorktreeState
 
 logger = logging.getLogger(__name__)
 
@@ -40,14 +50,17 @@ class TimelinePersistence:
     Handles persistence of file timelines to disk.
 
     Timelines are stored as JSON files with an index for quick lookup.
+    Snapshot content is kept out of the JSON: each snapshot records a blob
+    hash into a TimelineContentStore and is loaded on demand.
     """
 
-    def __init__(self, storage_path: Path):
+    def __init__(self, storage_path: Path, project_path: Path | None = None):
         """
         Initialize the persistence layer.
 
         Args:
             storage_path: Directory for timeline storage (e.g., .auto-claude/)
+            project_path: Git repository whose blobs can back snapshots
         """
         self.storage_path = Path(storage_path).resolve()
         self.timelines_dir = self.storage_path / "file-timelines"
@@ -55,37 +68,77 @@ class TimelinePersistence:
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        self.store = TimelineContentStore(self.timelines_dir / "objects", project_path)
+
+    def load_index(self) -> dict[str, dict]:
         """
-        Load all timelines from disk on startup.
+        Load per-file timeline metadata without opening any timeline file.
+
+        Indexes written before metadata was recorded (a bare list of files)
+        are upgraded once by reading each timeline and rewriting the index.
 
         Returns:
-            Dictionary mapping file_path to FileTimeline objects
+            Dictionary mapping file_path to its index entry
         """
-        from .timeline_models import FileTimeline
-
-        timelines = {}
         index_path = self.timelines_dir / "index.json"
-
         if not index_path.exists():
-            return timelines
+            return {}
 
         try:
             with open(index_path, encoding="utf-8") as f:
-                index = json.load(f)
+                files = json.load(f).get("files", {})
+        except Exception as e:
+            logger.error(f"Failed to load timeline index: {e}")
+            return {}
+
+        if isinstance(files, dict):
+            return files
+
+        entries = {}
+        for file_path in files:
+            timeline = self.load_timeline(file_path)
+            if timeline:
+                entries[file_path] = self.index_entry(timeline)
+        self.update_index(entries)
+        debug(MODULE, f"Upgraded timeline index with {len(entries)} files")
+        return entries
+
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load a single timeline from disk.
 
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file, encoding="utf-8") as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+        Args:
+            file_path: The file path (used as key)
 
-            debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
+        Returns:
+            The FileTimeline, or None if it is not stored
+        """
+        from .timeline_models import FileTimeline
 
+        timeline_file = self._get_timeline_file_path(file_path)
+        try:
+            with open(timeline_file, encoding="utf-8") as f:
+                return FileTimeline.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Failed to load timelines: {e}")
+            logger.error(f"Failed to load timeline for {file_path}: {e}")
+            return None
 
+    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        """
+        Load every indexed timeline from disk.
+
+        Returns:
+            Dictionary mapping file_path to FileTimeline objects
+        """
+        timelines = {}
+        for file_path in self.load_index():
+            timeline = self.load_timeline(file_path)
+            if timeline:
+                timelines[file_path] = timeline
+
+        debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
         return timelines
 
     def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
@@ -97,30 +150,99 @@ class TimelinePersistence:
             timeline: The FileTimeline object to save
         """
         try:
+            self._store_contents(timeline)
+
             # Save timeline file
             timeline_file = self._get_timeline_file_path(file_path)
             timeline_file.parent.mkdir(parents=True, exist_ok=True)
 
             with open(timeline_file, "w", encoding="utf-8") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
+                json.dump(
+                    timeline.to_dict(include_content=False), f, separators=(",", ":")
+                )
 
         except Exception as e:
             logger.error(f"Failed to persist timeline for {file_path}: {e}")
 
-    def update_index(self, file_paths: list[str]) -> None:
+    def load_content(self, snapshot: Snapshot) -> str:
+        """
+        Return a snapshot's content, loading it from the store if needed.
+
+        Args:
+            snapshot: A BranchPoint, MainBranchEvent or WorktreeState
+
+        Returns:
+            The content (empty string if it can no longer be found)
+        """
+        if snapshot.content is None:
+            content = None
+            if snapshot.content_hash:
+                content = self.store.get(snapshot.content_hash)
+            if content is None:
+                logger.warning(f"Timeline content {snapshot.content_hash} not found")
+                content = ""
+            snapshot.content = content
+        return snapshot.content
+
+    def update_index(self, entries: dict[str, dict]) -> None:
         """
         Update the index file with all tracked files.
 
         Args:
-            file_paths: List of all file paths being tracked
+            entries: Mapping of every tracked file path to its index entry
         """
         index_path = self.timelines_dir / "index.json"
         index = {
-            "files": file_paths,
+            "files": entries,
             "last_updated": datetime.now().isoformat(),
         }
         with open(index_path, "w", encoding="utf-8") as f:
-            json.dump(index, f, indent=2)
+            json.dump(index, f, separators=(",", ":"))
+
+    @staticmethod
+    def index_entry(timeline: FileTimeline) -> dict:
+        """
+        Summarize a timeline for the index.
+
+        The entry answers task and drift queries without loading the
+        timeline: each task's status and commits behind main, plus the
+        latest main branch commit seen for the file.
+        """
+        current_main = timeline.get_current_main_state()
+        return {
+            "tasks": {
+                task_id: {
+                    "status": view.status,
+                    "commits_behind_main": view.commits_behind_main,
+                }
+                for task_id, view in timeline.task_views.items()
+            },
+            "last_event_commit": current_main.commit_hash if current_main else None,
+            "main_events": len(timeline.main_branch_history),
+        }
+
+    def _store_contents(self, timeline: FileTimeline) -> None:
+        """Put every snapshot not yet hashed into the content store."""
+        # Consecutive main events are usually small edits of each other,
+        # so each one is delta-compressed against its predecessor
+        previous_hash = None
+        for event in timeline.main_branch_history:
+            previous_hash = self._store_snapshot(event, previous_hash, in_git=True)
+
+        for task_view in timeline.task_views.values():
+            branch_hash = self._store_snapshot(task_view.branch_point, in_git=True)
+            if task_view.worktree_state:
+                self._store_snapshot(task_view.worktree_state, branch_hash)
+
+    def _store_snapshot(
+        self,
+        snapshot: Snapshot,
+        base_hash: str | None = None,
+        in_git: bool = False,
+    ) -> str | None:
+        if snapshot.content_hash is None and snapshot.content is not None:
+            snapshot.content_hash = self.store.put(snapshot.content, base_hash, in_git)
+        return snapshot.content_hash
 
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
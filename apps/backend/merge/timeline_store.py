@@ -0,0 +1,211 @@
+"""
+Timeline Content Store
+======================
+
+Content-addressed storage for file snapshots referenced by timelines.
+
+Timeline events only record a blob hash; the text itself lives here,
+stored once no matter how many events or tasks reference it. Hashes are
+git blob ids, so content that already exists in the repository's object
+database is read back from git instead of being duplicated. Everything
+else is zlib-compressed, and when a related snapshot is known (the
+previous version of the same file) it is used as a preset dictionary,
+which turns small edits of large files into tiny delta objects.
+
+Object layout (under file-timelines/objects/<aa>/<rest>):
+- b"z" + zlib(content)
+- b"d" + <40-char base hash> + zlib(content, zdict=base)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import subprocess
+import tempfile
+import zlib
+from pathlib import Path
+
+from core.git_executable import get_isolated_git_env
+
+logger = logging.getLogger(__name__)
+
+MODULE = "merge.timeline_store"
+
+_FULL = b"z"
+_DELTA = b"d"
+
+# zlib only looks back this far, so a longer preset dictionary is wasted
+_ZDICT_SIZE = 32 * 1024
+
+
+def blob_hash(content: str) -> str:
+    """Return the git blob id for content (as git hash-object would)."""
+    data = content.encode("utf-8")
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data).hexdigest()
+
+
+class TimelineContentStore:
+    """
+    Stores file snapshots by git blob hash.
+
+    Reads check the local object directory first and fall back to the
+    git repository, so snapshots taken from commits cost nothing to keep.
+    """
+
+    def __init__(self, objects_dir: Path, repo_path: Path | None = None):
+        """
+        Initialize the content store.
+
+        Args:
+            objects_dir: Directory holding compressed objects
+            repo_path: Git repository to reuse blobs from (optional)
+        """
+        self.objects_dir = Path(objects_dir)
+        self.repo_path = Path(repo_path) if repo_path else None
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+
+    def put(
+        self,
+        content: str,
+        base_hash: str | None = None,
+        in_git: bool = False,
+    ) -> str:
+        """
+        Store content and return its hash.
+
+        Args:
+            content: File content to store
+            base_hash: Hash of a similar snapshot to delta against
+            in_git: Content was read from a commit, so git may already have it
+
+        Returns:
+            Git blob hash of the content
+        """
+        content_hash = blob_hash(content)
+        if self._object_path(content_hash).exists():
+            return content_hash
+        if in_git and self._git_has(content_hash):
+            return content_hash
+
+        data = content.encode("utf-8")
+        payload = _FULL + zlib.compress(data)
+
+        base_data = self._delta_base(base_hash) if base_hash else None
+        if base_data is not None:
+            compressor = zlib.compressobj(zdict=base_data[-_ZDICT_SIZE:])
+            delta = (
+                _DELTA
+                + base_hash.encode("ascii")
+                + compressor.compress(data)
+                + compressor.flush()
+            )
+            if len(delta) < len(payload):
+                payload = delta
+
+        self._write_object(content_hash, payload)
+        return content_hash
+
+    def get(self, content_hash: str) -> str | None:
+        """
+        Load content by hash.
+
+        Returns:
+            The content, or None if neither the store nor git has it
+        """
+        data = self._read_bytes(content_hash)
+        if data is None:
+            return None
+        return data.decode("utf-8", errors="replace")
+
+    def has(self, content_hash: str) -> bool:
+        """Check whether content can be loaded without git."""
+        return self._object_path(content_hash).exists()
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _object_path(self, content_hash: str) -> Path:
+        return self.objects_dir / content_hash[:2] / content_hash[2:]
+
+    def _read_bytes(self, content_hash: str) -> bytes | None:
+        object_path = self._object_path(content_hash)
+        try:
+            payload = object_path.read_bytes()
+        except FileNotFoundError:
+            return self._git_read(content_hash)
+
+        try:
+            kind = payload[:1]
+            if kind == _FULL:
+                return zlib.decompress(payload[1:])
+            if kind == _DELTA:
+                base_hash = payload[1:41].decode("ascii")
+                base_data = self._read_bytes(base_hash)
+                if base_data is None:
+                    logger.error(f"Missing delta base {base_hash} for {content_hash}")
+                    return None
+                decompressor = zlib.decompressobj(zdict=base_data[-_ZDICT_SIZE:])
+                return decompressor.decompress(payload[41:]) + decompressor.flush()
+        except (zlib.error, UnicodeDecodeError) as e:
+            logger.error(f"Corrupt timeline object {content_hash}: {e}")
+            return None
+
+        logger.error(f"Unknown timeline object format for {content_hash}")
+        return None
+
+    def _delta_base(self, base_hash: str) -> bytes | None:
+        """Load a delta base, refusing bases that are deltas themselves."""
+        object_path = self._object_path(base_hash)
+        if object_path.exists():
+            with open(object_path, "rb") as f:
+                if f.read(1) != _FULL:
+                    return None
+        return self._read_bytes(base_hash)
+
+    def _write_object(self, content_hash: str, payload: bytes) -> None:
+        object_path = self._object_path(content_hash)
+        object_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial object
+        fd, tmp_path = tempfile.mkstemp(dir=object_path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp_path, object_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def _git_has(self, content_hash: str) -> bool:
+        if not self.repo_path:
+            return False
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "-e", f"{content_hash}^{{blob}}"],
+                cwd=self.repo_path,
+                capture_output=True,
+                env=get_isolated_git_env(),
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
+    def _git_read(self, content_hash: str) -> bytes | None:
+        if not self.repo_path:
+            return None
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "blob", content_hash],
+                cwd=self.repo_path,
+                capture_output=True,
+                env=get_isolated_git_env(),
+            )
+            if result.returncode == 0:
+                return result.stdout
+            return None
+        except Exception:
+            return None
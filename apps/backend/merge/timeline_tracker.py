@@ -13,6 +13,7 @@ This service is the "brain" of the intent-aware merge system. It:
 from __future__ import annotations
 
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 
@@ -47,6 +48,9 @@ except ImportError:
 
 MODULE = "merge.timeline_tracker"
 
+# Parsed timelines kept in memory; the rest are loaded from disk on demand
+TIMELINE_CACHE_SIZE = 64
+
 
 class FileTimelineTracker:
     """
@@ -72,18 +76,18 @@ class FileTimelineTracker:
 
         # Initialize sub-components
         self.git = TimelineGitHelper(self.project_path)
-        self.persistence = TimelinePersistence(self.storage_path)
+        self.persistence = TimelinePersistence(self.storage_path, self.project_path)
 
-        # In-memory cache of timelines
-        self._timelines: dict[str, FileTimeline] = {}
+        # LRU cache of parsed timelines, most recently used last
+        self._timelines: OrderedDict[str, FileTimeline] = OrderedDict()
 
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Per-file metadata for every tracked file (see index_entry())
+        self._index = self.persistence.load_index()
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_indexed=len(self._index),
         )
 
     # =========================================================================
@@ -180,11 +184,10 @@ class FileTimelineTracker:
 
         for file_path in changed_files:
             # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
+            timeline = self._load_timeline(file_path)
+            if not timeline:
                 continue
 
-            timeline = self._timelines[file_path]
-
             # Get file content at this commit
             content = self.git.get_file_content_at_commit(file_path, commit_hash)
             if content is None:
@@ -232,10 +235,7 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"on_task_worktree_change: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
-        if not timeline:
-            # Create timeline if it doesn't exist
-            timeline = self._get_or_create_timeline(file_path)
+        timeline = self._get_or_create_timeline(file_path)
 
         task_view = timeline.get_task_view(task_id)
         if not task_view:
@@ -268,7 +268,7 @@ class FileTimelineTracker:
         task_files = self.get_files_for_task(task_id)
 
         for file_path in task_files:
-            timeline = self._timelines.get(file_path)
+            timeline = self._load_timeline(file_path)
             if not timeline:
                 continue
 
@@ -309,7 +309,7 @@ class FileTimelineTracker:
         task_files = self.get_files_for_task(task_id)
 
         for file_path in task_files:
-            timeline = self._timelines.get(file_path)
+            timeline = self._load_timeline(file_path)
             if not timeline:
                 continue
 
@@ -339,7 +339,7 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"get_merge_context: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
+        timeline = self._load_timeline(file_path)
         if not timeline:
             debug_warning(MODULE, f"No timeline found for {file_path}")
             return None
@@ -351,16 +351,20 @@ class FileTimelineTracker:
             )
             return None
 
+        # Snapshot content is stored by hash; load only what this merge needs
+        load_content = self.persistence.load_content
+
         # Get main evolution since task branched
         main_evolution = timeline.get_events_since_commit(
             task_view.branch_point.commit_hash
         )
+        for event in main_evolution:
+            load_content(event)
 
         # Get current main state
         current_main = timeline.get_current_main_state()
-        current_main_content = (
-            current_main.content if current_main else task_view.branch_point.content
-        )
+        current_main_content = load_content(current_main or task_view.branch_point)
+        load_content(task_view.branch_point)
         current_main_commit = (
             current_main.commit_hash
             if current_main
@@ -370,7 +374,7 @@ class FileTimelineTracker:
         # Get task's worktree content
         worktree_content = ""
         if task_view.worktree_state:
-            worktree_content = task_view.worktree_state.content
+            worktree_content = load_content(task_view.worktree_state)
         else:
             # Try to get from worktree path
             worktree_content = self.git.get_worktree_file_content(task_id, file_path)
@@ -422,11 +426,11 @@ class FileTimelineTracker:
         Returns:
             List of file paths
         """
-        files = []
-        for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
-                files.append(file_path)
-        return files
+        return [
+            file_path
+            for file_path, entry in self._index.items()
+            if task_id in entry["tasks"]
+        ]
 
     def get_pending_tasks_for_file(self, file_path: str) -> list[TaskFileView]:
         """
@@ -438,7 +442,14 @@ class FileTimelineTracker:
         Returns:
             List of TaskFileView objects
         """
-        timeline = self._timelines.get(file_path)
+        # The index rules out files with no active tasks without a disk read
+        entry = self._index.get(file_path)
+        if entry and not any(
+            task["status"] == "active" for task in entry["tasks"].values()
+        ):
+            return []
+
+        timeline = self._load_timeline(file_path)
         if not timeline:
             return []
         return timeline.get_active_tasks()
@@ -454,10 +465,10 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
-            task_view = timeline.get_task_view(task_id)
-            if task_view and task_view.status == "active":
-                drift[file_path] = task_view.commits_behind_main
+        for file_path, entry in self._index.items():
+            task = entry["tasks"].get(task_id)
+            if task and task["status"] == "active":
+                drift[file_path] = task["commits_behind_main"]
         return drift
 
     def has_timeline(self, file_path: str) -> bool:
@@ -470,7 +481,7 @@ class FileTimelineTracker:
         Returns:
             True if timeline exists
         """
-        return file_path in self._timelines
+        return file_path in self._index or file_path in self._timelines
 
     def get_timeline(self, file_path: str) -> FileTimeline | None:
         """
@@ -482,7 +493,17 @@ class FileTimelineTracker:
         Returns:
             FileTimeline object, or None if not found
         """
-        return self._timelines.get(file_path)
+        return self._load_timeline(file_path)
+
+    def get_tracked_files(self) -> dict[str, dict]:
+        """
+        Return index metadata for every tracked file.
+
+        Returns:
+            Dictionary mapping file_path to its index entry (tasks with
+            status and drift, last main event commit, main event count)
+        """
+        return dict(self._index)
 
     # =========================================================================
     # CAPTURE METHODS (for integration with existing code)
@@ -576,7 +597,7 @@ class FileTimelineTracker:
             )
             drift = self.git.count_commits_between(branch_point, actual_target)
             for file_path in changed_files:
-                timeline = self._timelines.get(file_path)
+                timeline = self._load_timeline(file_path)
                 if timeline:
                     task_view = timeline.get_task_view(task_id)
                     if task_view:
@@ -598,17 +619,43 @@ class FileTimelineTracker:
     # INTERNAL HELPERS
     # =========================================================================
 
+    def _load_timeline(self, file_path: str) -> FileTimeline | None:
+        """Get a timeline from the cache, loading it from disk if indexed."""
+        timeline = self._timelines.get(file_path)
+        if timeline is not None:
+            self._timelines.move_to_end(file_path)
+            return timeline
+
+        if file_path not in self._index:
+            return None
+
+        timeline = self.persistence.load_timeline(file_path)
+        if timeline is not None:
+            self._cache_timeline(file_path, timeline)
+        return timeline
+
+    def _cache_timeline(self, file_path: str, timeline: FileTimeline) -> None:
+        """Add a timeline to the LRU cache, evicting the least recently used."""
+        # Every change is persisted immediately, so evicted entries are clean
+        self._timelines[file_path] = timeline
+        self._timelines.move_to_end(file_path)
+        while len(self._timelines) > TIMELINE_CACHE_SIZE:
+            self._timelines.popitem(last=False)
+
     def _get_or_create_timeline(self, file_path: str) -> FileTimeline:
         """Get existing timeline or create new one."""
-        if file_path not in self._timelines:
-            self._timelines[file_path] = FileTimeline(file_path=file_path)
-        return self._timelines[file_path]
+        timeline = self._load_timeline(file_path)
+        if timeline is None:
+            timeline = FileTimeline(file_path=file_path)
+            self._cache_timeline(file_path, timeline)
+        return timeline
 
     def _persist_timeline(self, file_path: str) -> None:
-        """Save a single timeline to disk."""
+        """Save a single timeline to disk and refresh its index entry."""
         timeline = self._timelines.get(file_path)
         if not timeline:
             return
 
         self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
+        self._index[file_path] = self.persistence.index_entry(timeline)
+        self.persistence.update_index(self._index)
@@ -133,17 +133,16 @@ def cmd_list_files(args):
 
     print("\n=== Tracked Files ===\n")
 
-    # Access internal _timelines
-    if not tracker._timelines:
+    tracked_files = tracker.get_tracked_files()
+    if not tracked_files:
         print("No files currently tracked.")
         return
 
-    for file_path in sorted(tracker._timelines.keys()):
-        timeline = tracker._timelines[file_path]
+    for file_path, entry in sorted(tracked_files.items()):
         active_tasks = len(
-            [tv for tv in timeline.task_views.values() if tv.status == "active"]
+            [t for t in entry["tasks"].values() if t["status"] == "active"]
         )
-        main_events = len(timeline.main_branch_history)
+        main_events = entry["main_events"]
         print(f"  {file_path}: {active_tasks} active tasks, {main_events} main events")
 
 
@@ -9,6 +9,7 @@ commands should be allowed for safe autonomous development.
 
 Public API:
 - ProjectAnalyzer: Main analyzer class
+- ProjectInventory: Single-pass file listing shared by analyzers
 - SecurityProfile: Security profile data structure
 - TechnologyStack: Detected technologies
 - CustomScripts: Detected custom scripts
@@ -21,11 +22,13 @@ Public API:
 
 from .analyzer import ProjectAnalyzer
 from .command_registry import BASE_COMMANDS, VALIDATED_COMMANDS
+from .inventory import ProjectInventory
 from .models import CustomScripts, SecurityProfile, TechnologyStack
 
 __all__ = [
     # Main classes
     "ProjectAnalyzer",
+    "ProjectInventory",
     "SecurityProfile",
     "TechnologyStack",
     "CustomScripts",
@@ -24,6 +24,7 @@ from .command_registry import (
 )
 from .config_parser import ConfigParser
 from .framework_detector import FrameworkDetector
+from .inventory import ProjectInventory
 from .models import SecurityProfile
 from .stack_detector import StackDetector
 from .structure_analyzer import StructureAnalyzer
@@ -55,6 +56,8 @@ class ProjectAnalyzer:
         self.spec_dir = Path(spec_dir).resolve() if spec_dir else None
         self.profile = SecurityProfile()
         self.parser = ConfigParser(project_dir)
+        # Set for the duration of analyze() so every detector shares one walk
+        self.inventory: ProjectInventory | None = None
 
     def get_profile_path(self) -> Path:
         """Get the path where profile should be stored."""
@@ -139,6 +142,7 @@ class ProjectAnalyzer:
             "*.vbproj",  # VB.NET projects
         ]
 
+        inventory = self.inventory or ProjectInventory(self.project_dir)
         hasher = hashlib.md5(usedforsecurity=False)
         files_found = 0
 
@@ -154,7 +158,7 @@ class ProjectAnalyzer:
 
         # Check glob patterns for project files that can be anywhere
         for pattern in glob_patterns:
-            for filepath in self.project_dir.glob(f"**/{pattern}"):
+            for filepath in inventory.glob(f"**/{pattern}"):
                 try:
                     stat = filepath.stat()
                     rel_path = filepath.relative_to(self.project_dir)
@@ -180,7 +184,7 @@ class ProjectAnalyzer:
                 "*.java",
             ]
             for ext in source_exts:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
+                count = len(inventory.glob(f"**/{ext}"))
                 hasher.update(f"{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
@@ -230,6 +234,13 @@ class ProjectAnalyzer:
         Returns:
             SecurityProfile with all detected commands
         """
+        self.inventory = ProjectInventory(self.project_dir)
+        try:
+            return self._analyze(force)
+        finally:
+            self.inventory = None
+
+    def _analyze(self, force: bool) -> SecurityProfile:
         # Check for existing profile
         existing = self.load_profile()
         if existing and not force and not self.should_reanalyze(existing):
@@ -270,17 +281,17 @@ class ProjectAnalyzer:
 
     def _detect_stack(self) -> None:
         """Detect technology stack."""
-        detector = StackDetector(self.project_dir)
+        detector = StackDetector(self.project_dir, self.inventory)
         self.profile.detected_stack = detector.detect_all()
 
     def _detect_frameworks(self) -> None:
         """Detect frameworks from dependencies."""
-        detector = FrameworkDetector(self.project_dir)
+        detector = FrameworkDetector(self.project_dir, self.inventory)
         self.profile.detected_stack.frameworks = detector.detect_all()
 
     def _detect_structure(self) -> None:
         """Detect project structure and custom scripts."""
-        analyzer = StructureAnalyzer(self.project_dir)
+        analyzer = StructureAnalyzer(self.project_dir, self.inventory)
         scripts, script_commands, custom_commands = analyzer.analyze()
         self.profile.custom_scripts = scripts
         self.profile.script_commands = script_commands
@@ -10,20 +10,22 @@ import re
 from pathlib import Path
 
 from .config_parser import ConfigParser
+from .inventory import ProjectInventory
 
 
 class FrameworkDetector:
     """Detects frameworks from project dependencies."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: ProjectInventory | None = None):
         """
         Initialize framework detector.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file inventory (created on demand if omitted)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.frameworks = []
 
     def detect_all(self) -> list[str]:
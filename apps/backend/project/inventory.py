@@ -0,0 +1,335 @@
+"""
+Project File Inventory
+======================
+
+Single-pass listing of a project's files shared by all analyzers.
+
+The tree is walked once with os.scandir, pruning SKIP_DIRS and anything
+excluded by .gitignore files (root and nested). Files are bucketed by
+extension and basename so analyzers can answer ``**/*.py``-style queries
+without walking the filesystem again.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from pathlib import Path
+
+# Directories never worth descending into during analysis
+SKIP_DIRS = {
+    "node_modules",
+    ".git",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".env",
+    "env",
+    "dist",
+    "build",
+    ".next",
+    ".nuxt",
+    "target",
+    "vendor",
+    ".idea",
+    ".vscode",
+    ".pytest_cache",
+    ".mypy_cache",
+    "coverage",
+    ".coverage",
+    "htmlcov",
+    "eggs",
+    "*.egg-info",
+    ".turbo",
+    ".cache",
+    ".worktrees",  # Skip git worktrees directory
+    ".auto-claude",  # Skip auto-claude metadata directory
+}
+
+
+def _translate_glob(pattern: str) -> str:
+    """
+    Translate a path glob into a regular expression.
+
+    Supports ``**`` (any number of directories), ``*``/``?`` (within one path
+    segment), ``[...]`` character classes and ``{a,b}`` alternation.
+    """
+    i, n = 0, len(pattern)
+    out = []
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == n:
+            out.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end + 1
+        elif c == "{":
+            end = pattern.find("}", i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+            else:
+                options = pattern[i + 1 : end].split(",")
+                out.append("(?:" + "|".join(_translate_glob(o) for o in options) + ")")
+                i = end + 1
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+class _GitignoreRules:
+    """Patterns from one .gitignore file, relative to the directory containing it."""
+
+    def __init__(self, base: str, lines: list[str]):
+        self.base = base  # POSIX path relative to the inventory root ("" = root)
+        self.rules: list[tuple[re.Pattern, bool, bool, bool]] = []
+        for raw in lines:
+            line = raw.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+            anchored = "/" in line
+            line = line.lstrip("/")
+            regex = re.compile(_translate_glob(line) + r"\Z")
+            self.rules.append((regex, negate, dir_only, anchored))
+
+    def match(self, rel_path: str, is_dir: bool) -> bool | None:
+        """Return True/False if a rule decides the path, None if no rule matches."""
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1 :]
+        name = rel_path.rsplit("/", 1)[-1]
+
+        decision = None
+        for regex, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.match(rel_path if anchored else name):
+                decision = not negate
+        return decision
+
+
+class ProjectInventory:
+    """
+    One filesystem traversal of a project, queried by every analyzer.
+
+    The walk happens lazily on first query. Paths returned are absolute and
+    rooted at the resolved project directory, in walk order (files in a
+    directory before its subdirectories).
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        skip_dirs: set[str] | None = None,
+        use_gitignore: bool = True,
+    ):
+        """
+        Initialize inventory.
+
+        Args:
+            root: Root directory to inventory
+            skip_dirs: Directory names (or fnmatch patterns) to prune
+            use_gitignore: Whether to honour .gitignore files
+        """
+        self.root = Path(root).resolve()
+        self.skip_dirs = SKIP_DIRS if skip_dirs is None else skip_dirs
+        self.use_gitignore = use_gitignore
+        self._skip_names = {d for d in self.skip_dirs if not _has_magic(d)}
+        self._skip_patterns = [d for d in self.skip_dirs if _has_magic(d)]
+        self._files: list[str] | None = None
+        self._by_suffix: dict[str, list[str]] = {}
+        self._by_name: dict[str, list[str]] = {}
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def _is_skipped_dir(self, name: str) -> bool:
+        if name in self._skip_names:
+            return True
+        return any(fnmatch.fnmatch(name, p) for p in self._skip_patterns)
+
+    def _scan(self) -> None:
+        files: list[str] = []
+        by_suffix: dict[str, list[str]] = {}
+        by_name: dict[str, list[str]] = {}
+
+        def is_ignored(rules: list[_GitignoreRules], rel: str, is_dir: bool) -> bool:
+            ignored = False
+            for ruleset in rules:
+                decision = ruleset.match(rel, is_dir)
+                if decision is not None:
+                    ignored = decision
+            return ignored
+
+        def walk(directory: str, rel_dir: str, rules: list[_GitignoreRules]) -> None:
+            try:
+                with os.scandir(directory) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                return
+
+            if self.use_gitignore and any(e.name == ".gitignore" for e in entries):
+                try:
+                    with open(
+                        os.path.join(directory, ".gitignore"), encoding="utf-8"
+                    ) as f:
+                        rules = rules + [_GitignoreRules(rel_dir, f.readlines())]
+                except (OSError, UnicodeDecodeError):
+                    pass
+
+            subdirs = []
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    is_file = not is_dir and entry.is_file()
+                except OSError:
+                    continue
+
+                if is_dir:
+                    if self._is_skipped_dir(entry.name):
+                        continue
+                    if rules and is_ignored(rules, rel, True):
+                        continue
+                    subdirs.append((entry.path, rel))
+                elif is_file:
+                    if rules and is_ignored(rules, rel, False):
+                        continue
+                    files.append(rel)
+                    by_name.setdefault(entry.name, []).append(rel)
+                    suffix = os.path.splitext(entry.name)[1]
+                    if suffix:
+                        by_suffix.setdefault(suffix, []).append(rel)
+
+            for path, rel in subdirs:
+                walk(path, rel, rules)
+
+        walk(str(self.root), "", [])
+        self._files = files
+        self._by_suffix = by_suffix
+        self._by_name = by_name
+
+    def refresh(self) -> None:
+        """Re-walk the tree on the next query."""
+        self._files = None
+
+    def _ensure_scanned(self) -> None:
+        if self._files is None:
+            self._scan()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _prefix(self, under: Path | None) -> str | None:
+        """Relative POSIX prefix for ``under``, "" for the root, None if outside."""
+        if under is None:
+            return ""
+        try:
+            rel = Path(under).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return "" if rel == "." else rel
+
+    def covers(self, path: Path) -> bool:
+        """Whether ``path`` is inside this inventory's root."""
+        return self._prefix(path) is not None
+
+    def _select(self, candidates: list[str], under: Path | None) -> list[Path]:
+        prefix = self._prefix(under)
+        if prefix is None:
+            return []
+        if prefix:
+            start = prefix + "/"
+            candidates = [p for p in candidates if p.startswith(start)]
+        return [self.root / p for p in candidates]
+
+    @property
+    def files(self) -> list[Path]:
+        """All inventoried files."""
+        self._ensure_scanned()
+        return [self.root / p for p in self._files]
+
+    def with_suffix(self, *suffixes: str, under: Path | None = None) -> list[Path]:
+        """Files whose extension is one of ``suffixes`` (e.g. ".py")."""
+        self._ensure_scanned()
+        candidates = [p for s in suffixes for p in self._by_suffix.get(s, [])]
+        return self._select(candidates, under)
+
+    def named(self, *names: str, under: Path | None = None) -> list[Path]:
+        """Files whose basename is one of ``names``."""
+        self._ensure_scanned()
+        candidates = [p for name in names for p in self._by_name.get(name, [])]
+        return self._select(candidates, under)
+
+    def glob(self, pattern: str, under: Path | None = None) -> list[Path]:
+        """
+        Files matching a glob pattern relative to ``under`` (default: root).
+
+        Equivalent to ``Path(under).glob(pattern)`` for files, but answered
+        from the inventory. Simple basename patterns (``**/*.py``,
+        ``**/models.py``) are served from the extension/name buckets.
+        """
+        self._ensure_scanned()
+        prefix = self._prefix(under)
+        if prefix is None:
+            return []
+
+        last = pattern.rsplit("/", 1)[-1]
+        if not _has_magic(last):
+            candidates = self._by_name.get(last, [])
+        elif last.startswith("*.") and not _has_magic(last[2:]):
+            candidates = self._by_suffix.get(os.path.splitext(last)[1], [])
+        else:
+            candidates = self._files
+
+        regex = re.compile(_translate_glob(pattern) + r"\Z")
+        offset = len(prefix) + 1 if prefix else 0
+        start = prefix + "/" if prefix else ""
+        return [
+            self.root / p
+            for p in candidates
+            if p.startswith(start) and regex.match(p[offset:])
+        ]
+
+    def any(self, pattern: str, under: Path | None = None) -> bool:
+        """Whether any file matches ``pattern`` (see glob())."""
+        return bool(self.glob(pattern, under))
+
+
+def _has_magic(pattern: str) -> bool:
+    return any(c in pattern for c in "*?[{")
@@ -9,21 +9,23 @@ infrastructure tools, and cloud providers from project files.
 from pathlib import Path
 
 from .config_parser import ConfigParser
+from .inventory import ProjectInventory
 from .models import TechnologyStack
 
 
 class StackDetector:
     """Detects technology stack from project structure."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: ProjectInventory | None = None):
         """
         Initialize stack detector.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file inventory (created on demand if omitted)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.stack = TechnologyStack()
 
     def detect_all(self) -> TechnologyStack:
@@ -11,6 +11,7 @@ import re
 from pathlib import Path
 
 from .config_parser import ConfigParser
+from .inventory import ProjectInventory
 from .models import CustomScripts
 
 
@@ -19,15 +20,16 @@ class StructureAnalyzer:
 
     CUSTOM_ALLOWLIST_FILENAME = ".auto-claude-allowlist"
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, inventory: ProjectInventory | None = None):
         """
         Initialize structure analyzer.
 
         Args:
             project_dir: Root directory of the project
+            inventory: Shared file inventory (created on demand if omitted)
         """
         self.project_dir = Path(project_dir).resolve()
-        self.parser = ConfigParser(project_dir)
+        self.parser = ConfigParser(project_dir, inventory)
         self.custom_scripts = CustomScripts()
         self.custom_commands = set()
         self.script_commands = set()
@@ -14,6 +14,7 @@ This approach:
 
 import json
 import re
+import shlex
 from pathlib import Path
 
 # Worktree path patterns for detection
@@ -193,6 +194,7 @@ def generate_subtask_prompt(
     phase: dict,
     attempt_count: int = 0,
     recovery_hints: list[str] | None = None,
+    concurrent: bool = False,
 ) -> str:
     """
     Generate a minimal, focused prompt for implementing a single subtask.
@@ -204,6 +206,8 @@ def generate_subtask_prompt(
         phase: The phase containing this subtask
         attempt_count: Number of previous attempts (for retry context)
         recovery_hints: Hints from previous failed attempts
+        concurrent: Whether other subtasks run at the same time in the same
+            working directory (parallel builds)
 
     Returns:
         A focused prompt string (~100 lines instead of 900)
@@ -235,6 +239,17 @@ def generate_subtask_prompt(
 ## Description
 
 {description}
+""")
+
+    if concurrent:
+        sections.append("""## Parallel Build
+
+Other subtasks are being implemented at the same time, by other sessions in
+this same working directory.
+
+- Only create or modify the files listed for this subtask
+- Don't revert, reformat or stage changes you didn't make
+- Commit only your own files, by path
 """)
 
     # Recovery context if this is a retry
@@ -313,6 +328,26 @@ Verify:""")
         instructions = verification.get("instructions", "Manual verification required")
         sections.append(f"**Manual Verification:**\n{instructions}\n")
 
+    if concurrent:
+        # Sessions share one index, so commit by path: a plain commit would
+        # also take files another session has staged, under this message
+        own_files = " ".join(
+            shlex.quote(f) for f in [*files_to_modify, *files_to_create]
+        )
+        own_files = own_files or "<each file you created or modified>"
+        git_add = f"git add {own_files}"
+        commit_paths = f" -- {own_files}"
+        plan_update = (
+            "use the `update_subtask_status` tool to set this subtask's status "
+            'to "completed" (don\'t edit implementation_plan.json directly)'
+        )
+    else:
+        git_add = "git add ."
+        commit_paths = ""
+        plan_update = (
+            'set this subtask\'s status to "completed" in implementation_plan.json'
+        )
+
     # Instructions
     sections.append(f"""## Instructions
 
@@ -322,10 +357,10 @@ Verify:""")
 4. **Run verification** and fix any issues
 5. **Commit your changes:**
    ```bash
-   git add .
-   git commit -m "auto-claude: {subtask_id} - {description[:50]}"
+   {git_add}
+   git commit -m "auto-claude: {subtask_id} - {description[:50]}"{commit_paths}
    ```
-6. **Update the plan** - set this subtask's status to "completed" in implementation_plan.json
+6. **Update the plan** - {plan_update}
 
 ## Quality Checklist
 
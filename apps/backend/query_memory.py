@@ -8,12 +8,32 @@ Called from Node.js (Electron main process) via child_process.spawn().
 Usage:
     python query_memory.py get-status <db-path> <database>
     python query_memory.py get-memories <db-path> <database> [--limit N]
-    python query_memory.py search <db-path> <database> <query> [--limit N]
+    python query_memory.py search <db-path> <database> <query> [--limit N] [--group-id ID]
     python query_memory.py semantic-search <db-path> <database> <query> [--limit N]
     python query_memory.py get-entities <db-path> <database> [--limit N]
+    python query_memory.py serve [--socket PATH | --stdio] [--idle-timeout SECONDS]
 
 Output:
     JSON to stdout with structure: {"success": bool, "data": ..., "error": ...}
+
+Server mode:
+    `serve` keeps database connections and Graphiti clients open between
+    requests and answers line-delimited JSON-RPC 2.0, on a Unix socket (the
+    default) or stdin/stdout:
+
+        -> {"jsonrpc": "2.0", "id": 1, "method": "search",
+            "params": {"db_path": "...", "database": "...", "query": "auth"}}
+        <- {"jsonrpc": "2.0", "id": 1, "result": {"success": true, "data": ...}}
+
+    Methods are the subcommand names (plus "ping"); params are their
+    arguments. Requests are handled concurrently and responses may arrive out
+    of order. While a server is listening on the default socket, the other
+    subcommands forward to it instead of opening the database themselves.
+
+    The socket is only used when it belongs to the current user and sits in
+    a directory nobody else can write. semantic-search forwards the embedder
+    provider and model settings but not API keys, so start `serve` with the
+    provider credentials in its environment.
 """
 
 import argparse
@@ -21,7 +41,13 @@ import asyncio
 import json
 import os
 import re
+import socket
+import stat
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
@@ -79,6 +105,16 @@ def output_error(message: str):
     output_json(False, error=message)
 
 
+def make_result(success: bool, data=None, error: str = None) -> dict:
+    """Build the {"success", "data", "error"} result printed by output_json()."""
+    result = {"success": success}
+    if data is not None:
+        result["data"] = data
+    if error:
+        result["error"] = error
+    return result
+
+
 def get_db_connection(db_path: str, database: str):
     """Get a database connection."""
     try:
@@ -99,7 +135,7 @@ def get_db_connection(db_path: str, database: str):
         return None, str(e)
 
 
-def cmd_get_status(args):
+def cmd_get_status(args, connect=get_db_connection):
     """Get memory database status."""
     db_path = Path(args.db_path)
     database = args.database
@@ -107,7 +143,7 @@ def cmd_get_status(args):
     # Check if kuzu/LadybugDB is available
     db_backend = apply_monkeypatch()
     if not db_backend:
-        output_json(
+        return make_result(
             True,
             data={
                 "available": False,
@@ -118,7 +154,6 @@ def cmd_get_status(args):
                 "message": "Neither kuzu nor LadybugDB is installed",
             },
         )
-        return
 
     full_path = db_path / database
     db_exists = full_path.exists()
@@ -133,7 +168,7 @@ def cmd_get_status(args):
             databases.append(item.name)
 
     # Try to connect and verify
-    conn, error = get_db_connection(str(db_path), database)
+    conn, error = connect(str(db_path), database)
     connected = conn is not None
 
     if connected:
@@ -145,7 +180,7 @@ def cmd_get_status(args):
             connected = False
             error = str(e)
 
-    output_json(
+    return make_result(
         True,
         data={
             "available": True,
@@ -160,16 +195,14 @@ def cmd_get_status(args):
     )
 
 
-def cmd_get_memories(args):
+def cmd_get_memories(args, connect=get_db_connection):
     """Get episodic memories from the database."""
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return make_result(False, error="Neither kuzu nor LadybugDB is installed")
 
-    conn, error = get_db_connection(args.db_path, args.database)
+    conn, error = connect(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return make_result(False, error=error or "Failed to connect to database")
 
     try:
         limit = args.limit or 20
@@ -215,80 +248,70 @@ def cmd_get_memories(args):
 
             memories.append(memory)
 
-        output_json(True, data={"memories": memories, "count": len(memories)})
+        return make_result(True, data={"memories": memories, "count": len(memories)})
 
     except Exception as e:
         # Table might not exist yet
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0})
-        else:
-            output_error(f"Query failed: {e}")
+            return make_result(True, data={"memories": [], "count": 0})
+        return make_result(False, error=f"Query failed: {e}")
+
 
+def cmd_search(args, connect=get_db_connection):
+    """
+    Search memories by keyword.
 
-def cmd_search(args):
-    """Search memories by keyword."""
+    Matches are ranked with BM25 from a full-text index (kuzu FTS, or a
+    local index beside the database) rather than a CONTAINS scan.
+    """
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return make_result(False, error="Neither kuzu nor LadybugDB is installed")
 
-    conn, error = get_db_connection(args.db_path, args.database)
+    conn, error = connect(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return make_result(False, error=error or "Failed to connect to database")
 
     try:
-        limit = args.limit or 20
-        search_query = args.query.lower()
-
-        # Search in episodic nodes using CONTAINS with parameterized query
-        query = """
-            MATCH (e:Episodic)
-            WHERE toLower(e.name) CONTAINS $search_query
-               OR toLower(e.content) CONTAINS $search_query
-               OR toLower(e.source_description) CONTAINS $search_query
-            RETURN e.uuid as uuid, e.name as name, e.created_at as created_at,
-                   e.content as content, e.source_description as description,
-                   e.group_id as group_id
-            ORDER BY e.created_at DESC
-            LIMIT $limit
-        """
-
-        result = conn.execute(
-            query, parameters={"search_query": search_query, "limit": limit}
+        from integrations.graphiti.queries_pkg.keyword_index import search_episodes
+
+        rows = search_episodes(
+            conn,
+            Path(args.db_path) / args.database,
+            args.query,
+            limit=args.limit or 20,
+            group_id=getattr(args, "group_id", None),
         )
 
         # Process results without pandas
         memories = []
-        while result.has_next():
-            row = result.get_next()
-            # Row order: uuid, name, created_at, content, description, group_id
-            uuid_val = serialize_value(row[0]) if len(row) > 0 else None
-            name_val = serialize_value(row[1]) if len(row) > 1 else ""
-            created_at_val = serialize_value(row[2]) if len(row) > 2 else None
-            content_val = serialize_value(row[3]) if len(row) > 3 else ""
-            description_val = serialize_value(row[4]) if len(row) > 4 else ""
-            group_id_val = serialize_value(row[5]) if len(row) > 5 else ""
+        for row in rows:
+            uuid_val = serialize_value(row["uuid"])
+            name_val = serialize_value(row["name"]) or ""
+            created_at_val = serialize_value(row["created_at"])
+            content_val = serialize_value(row["content"]) or ""
+            description_val = serialize_value(row["source_description"]) or ""
+            group_id_val = serialize_value(row["group_id"]) or ""
 
             memory = {
                 "id": uuid_val or name_val or "unknown",
-                "name": name_val or "",
-                "type": infer_episode_type(name_val or "", content_val or ""),
+                "name": name_val,
+                "type": infer_episode_type(name_val, content_val),
                 "timestamp": created_at_val or datetime.now().isoformat(),
-                "content": content_val or description_val or name_val or "",
-                "description": description_val or "",
-                "group_id": group_id_val or "",
-                "score": 1.0,  # Keyword match score
+                "content": content_val or description_val or name_val,
+                "description": description_val,
+                "group_id": group_id_val,
+                "score": float(row["score"]),  # BM25 relevance
             }
 
-            session_num = extract_session_number(name_val or "")
+            session_num = extract_session_number(name_val)
             if session_num:
                 memory["session_number"] = session_num
 
             memories.append(memory)
 
-        output_json(
+        return make_result(
             True,
             data={"memories": memories, "count": len(memories), "query": args.query},
         )
@@ -297,12 +320,13 @@ def cmd_search(args):
         if "Episodic" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"memories": [], "count": 0, "query": args.query})
-        else:
-            output_error(f"Search failed: {e}")
+            return make_result(
+                True, data={"memories": [], "count": 0, "query": args.query}
+            )
+        return make_result(False, error=f"Search failed: {e}")
 
 
-def cmd_semantic_search(args):
+def cmd_semantic_search(args, connect=get_db_connection):
     """
     Perform semantic vector search using Graphiti embeddings.
 
@@ -316,62 +340,84 @@ def cmd_semantic_search(args):
 
     if not embedder_provider:
         # No embedder configured, fall back to keyword search
-        return cmd_search(args)
+        return cmd_search(args, connect)
 
     # Try semantic search
     try:
         result = asyncio.run(_async_semantic_search(args))
         if result.get("success"):
-            output_json(True, data=result.get("data"))
-        else:
-            # Semantic search failed, fall back to keyword search
-            return cmd_search(args)
+            return make_result(True, data=result.get("data"))
+        # Semantic search failed, fall back to keyword search
+        return cmd_search(args, connect)
     except Exception as e:
         # Any error, fall back to keyword search
         sys.stderr.write(f"Semantic search failed, falling back to keyword: {e}\n")
-        return cmd_search(args)
+        return cmd_search(args, connect)
+
 
+async def _create_graphiti_client(db_path: str, database: str):
+    """
+    Create and initialize a GraphitiClient for a database.
 
-async def _async_semantic_search(args):
-    """Async implementation of semantic search using GraphitiClient."""
+    Returns:
+        (client, None) on success, (None, error dict) otherwise
+    """
     if not apply_monkeypatch():
-        return {"success": False, "error": "LadybugDB not installed"}
+        return None, {"success": False, "error": "LadybugDB not installed"}
 
-    try:
-        # Add auto-claude to path for imports
-        auto_claude_dir = Path(__file__).parent
-        if str(auto_claude_dir) not in sys.path:
-            sys.path.insert(0, str(auto_claude_dir))
-
-        # Import Graphiti components
-        from integrations.graphiti.config import GraphitiConfig
-        from integrations.graphiti.queries_pkg.client import GraphitiClient
-
-        # Create config from environment
-        config = GraphitiConfig.from_env()
-
-        # Override database location from CLI args
-        # Note: We only override db_path/database for CLI-specified locations.
-        # The config.enabled flag is respected - if the user has disabled memory,
-        # this CLI tool should not be used. The caller (main()) routes to this
-        # function only when semantic-search command is explicitly requested.
-        config.db_path = args.db_path
-        config.database = args.database
-
-        # Validate embedder configuration using public API
-        validation_errors = config.get_validation_errors()
-        if validation_errors:
-            return {
-                "success": False,
-                "error": f"Embedder provider not properly configured: {'; '.join(validation_errors)}",
-            }
+    # Add auto-claude to path for imports
+    auto_claude_dir = Path(__file__).parent
+    if str(auto_claude_dir) not in sys.path:
+        sys.path.insert(0, str(auto_claude_dir))
+
+    # Import Graphiti components
+    from integrations.graphiti.config import GraphitiConfig
+    from integrations.graphiti.queries_pkg.client import GraphitiClient
+
+    # Create config from environment
+    config = GraphitiConfig.from_env()
+
+    # Override database location from CLI args
+    # Note: We only override db_path/database for CLI-specified locations.
+    # The config.enabled flag is respected - if the user has disabled memory,
+    # this CLI tool should not be used. The caller (main()) routes to this
+    # function only when semantic-search command is explicitly requested.
+    config.db_path = db_path
+    config.database = database
+
+    # Validate embedder configuration using public API
+    validation_errors = config.get_validation_errors()
+    if validation_errors:
+        return None, {
+            "success": False,
+            "error": f"Embedder provider not properly configured: {'; '.join(validation_errors)}",
+        }
+
+    # Initialize client
+    client = GraphitiClient(config)
+    initialized = await client.initialize()
 
-        # Initialize client
-        client = GraphitiClient(config)
-        initialized = await client.initialize()
+    if not initialized:
+        return None, {"success": False, "error": "Failed to initialize Graphiti client"}
 
-        if not initialized:
-            return {"success": False, "error": "Failed to initialize Graphiti client"}
+    return client, None
+
+
+async def _async_semantic_search(args, client=None):
+    """
+    Async implementation of semantic search using GraphitiClient.
+
+    Args:
+        args: Parsed arguments (db_path, database, query, limit)
+        client: Initialized GraphitiClient to reuse (left open); a new one
+            is created and closed if None
+    """
+    try:
+        owns_client = client is None
+        if owns_client:
+            client, error = await _create_graphiti_client(args.db_path, args.database)
+            if client is None:
+                return error
 
         try:
             # Perform semantic search using Graphiti
@@ -438,12 +484,13 @@ async def _async_semantic_search(args):
                     "count": len(memories),
                     "query": search_query,
                     "search_type": "semantic",
-                    "embedder": config.embedder_provider,
+                    "embedder": client.config.embedder_provider,
                 },
             }
 
         finally:
-            await client.close()
+            if owns_client:
+                await client.close()
 
     except ImportError as e:
         return {"success": False, "error": f"Missing dependencies: {e}"}
@@ -451,16 +498,14 @@ async def _async_semantic_search(args):
         return {"success": False, "error": f"Semantic search failed: {e}"}
 
 
-def cmd_get_entities(args):
+def cmd_get_entities(args, connect=get_db_connection):
     """Get entity memories (patterns, gotchas, etc.) from the database."""
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return make_result(False, error="Neither kuzu nor LadybugDB is installed")
 
-    conn, error = get_db_connection(args.db_path, args.database)
+    conn, error = connect(args.db_path, args.database)
     if not conn:
-        output_error(error or "Failed to connect to database")
-        return
+        return make_result(False, error=error or "Failed to connect to database")
 
     try:
         limit = args.limit or 20
@@ -498,18 +543,17 @@ def cmd_get_entities(args):
             }
             entities.append(entity)
 
-        output_json(True, data={"entities": entities, "count": len(entities)})
+        return make_result(True, data={"entities": entities, "count": len(entities)})
 
     except Exception as e:
         if "Entity" in str(e) and (
             "not exist" in str(e).lower() or "cannot" in str(e).lower()
         ):
-            output_json(True, data={"entities": [], "count": 0})
-        else:
-            output_error(f"Query failed: {e}")
+            return make_result(True, data={"entities": [], "count": 0})
+        return make_result(False, error=f"Query failed: {e}")
 
 
-def cmd_add_episode(args):
+def cmd_add_episode(args, connect=None):
     """
     Add a new episode to the memory database.
 
@@ -523,19 +567,15 @@ def cmd_add_episode(args):
         args.content: Episode content (JSON string)
         args.episode_type: Type of episode (session_insight, pattern, gotcha, task_outcome, pr_review)
         args.group_id: Optional group ID for namespacing
+        connect: Connection provider that creates missing databases; the
+            database is opened directly if None
     """
     if not apply_monkeypatch():
-        output_error("Neither kuzu nor LadybugDB is installed")
-        return
+        return make_result(False, error="Neither kuzu nor LadybugDB is installed")
 
     try:
         import uuid as uuid_module
 
-        try:
-            import kuzu
-        except ImportError:
-            import real_ladybug as kuzu
-
         # Parse content from JSON if provided
         content = args.content
         if content:
@@ -552,15 +592,25 @@ def cmd_add_episode(args):
         episode_uuid = str(uuid_module.uuid4())
         created_at = datetime.now().isoformat()
 
-        # Get database path - create directory if needed
-        full_path = Path(args.db_path) / args.database
-        if not full_path.exists():
-            # For new databases, create the parent directory
-            Path(args.db_path).mkdir(parents=True, exist_ok=True)
+        if connect is not None:
+            conn, error = connect(args.db_path, args.database)
+            if not conn:
+                return make_result(False, error=f"Failed to add episode: {error}")
+        else:
+            try:
+                import kuzu
+            except ImportError:
+                import real_ladybug as kuzu
 
-        # Open database (creates it if it doesn't exist)
-        db = kuzu.Database(str(full_path))
-        conn = kuzu.Connection(db)
+            # Get database path - create directory if needed
+            full_path = Path(args.db_path) / args.database
+            if not full_path.exists():
+                # For new databases, create the parent directory
+                Path(args.db_path).mkdir(parents=True, exist_ok=True)
+
+            # Open database (creates it if it doesn't exist)
+            db = kuzu.Database(str(full_path))
+            conn = kuzu.Connection(db)
 
         # Always try to create the Episodic table if it doesn't exist
         # This handles both new databases and existing databases without the table
@@ -604,7 +654,23 @@ def cmd_add_episode(args):
                 },
             )
 
-            output_json(
+            from integrations.graphiti.queries_pkg.keyword_index import (
+                index_episode,
+            )
+
+            index_episode(
+                Path(args.db_path) / args.database,
+                {
+                    "uuid": episode_uuid,
+                    "name": args.name,
+                    "content": content,
+                    "source_description": f"[{args.episode_type}] {args.name}",
+                    "group_id": args.group_id or "",
+                    "created_at": created_at,
+                },
+            )
+
+            return make_result(
                 True,
                 data={
                     "id": episode_uuid,
@@ -615,10 +681,10 @@ def cmd_add_episode(args):
             )
 
         except Exception as e:
-            output_error(f"Failed to insert episode: {e}")
+            return make_result(False, error=f"Failed to insert episode: {e}")
 
     except Exception as e:
-        output_error(f"Failed to add episode: {e}")
+        return make_result(False, error=f"Failed to add episode: {e}")
 
 
 def infer_episode_type(name: str, content: str = "") -> str:
@@ -665,6 +731,600 @@ def extract_session_number(name: str) -> int | None:
     return None
 
 
+# =============================================================================
+# Server mode
+# =============================================================================
+
+# Close database handles and Graphiti clients unused for this long, so agent
+# sessions in other processes can open the database again
+SERVER_IDLE_TIMEOUT = 30.0
+SERVER_MAX_WORKERS = 4
+
+# Overrides the default socket location (for both server and clients)
+SOCKET_ENV_VAR = "AUTO_CLAUDE_MEMORY_SOCKET"
+
+# Requests can carry episode content, so allow long lines
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+# Embedder configuration forwarded with semantic-search, so the server uses
+# the caller's provider and model. Credentials are never sent: the server
+# uses the ones in its own environment.
+FORWARDED_ENV_PREFIXES = (
+    "GRAPHITI_",
+    "OPENAI_",
+    "ANTHROPIC_",
+    "AZURE_OPENAI_",
+    "GOOGLE_",
+    "OLLAMA_",
+    "OPENROUTER_",
+    "VOYAGE_",
+)
+SECRET_ENV_MARKERS = ("KEY", "TOKEN", "SECRET", "PASSWORD", "CREDENTIAL")
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+
+# method -> (required params, optional params with defaults)
+METHOD_PARAMS = {
+    "ping": ((), {}),
+    "get-status": (("db_path", "database"), {}),
+    "get-memories": (("db_path", "database"), {"limit": 20}),
+    "search": (
+        ("db_path", "database", "query"),
+        {"limit": 20, "group_id": None},
+    ),
+    "semantic-search": (
+        ("db_path", "database", "query"),
+        {"limit": 20, "env": None},
+    ),
+    "get-entities": (("db_path", "database"), {"limit": 20}),
+    "add-episode": (
+        ("db_path", "database", "name", "content"),
+        {"episode_type": "session_insight", "group_id": None},
+    ),
+}
+
+
+def default_socket_path() -> Path:
+    """
+    Per-user socket path used by `serve` and the forwarding subcommands.
+
+    The socket lives in a directory only the user can access:
+    $XDG_RUNTIME_DIR/auto-claude when set, otherwise ~/.auto-claude/run.
+    """
+    override = os.environ.get(SOCKET_ENV_VAR)
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "auto-claude" / "memory.sock"
+    return Path.home() / ".auto-claude" / "run" / "memory.sock"
+
+
+def _is_private_dir(path: Path) -> bool:
+    """Whether path is a real directory owned by us that nobody else can write."""
+    try:
+        info = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _is_own_socket(socket_path: Path) -> bool:
+    """
+    Whether socket_path is a socket created by this user in a private directory.
+
+    Checked before connecting, so requests never go to (and results are never
+    taken from) a socket another local user put in place.
+    """
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        info = os.lstat(socket_path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISSOCK(info.st_mode)
+        and info.st_uid == os.getuid()
+        and _is_private_dir(socket_path.parent)
+    )
+
+
+def _embedder_config(environ: dict) -> dict:
+    """Embedder settings from an environment, without any credentials."""
+    return {
+        key: value
+        for key, value in environ.items()
+        if key.startswith(FORWARDED_ENV_PREFIXES)
+        and not any(marker in key.upper() for marker in SECRET_ENV_MARKERS)
+    }
+
+
+@contextmanager
+def _patched_environ(overrides: dict | None):
+    """Temporarily apply environment overrides (restored on exit)."""
+    saved = {key: os.environ.get(key) for key in overrides or {}}
+    os.environ.update(overrides or {})
+    try:
+        yield
+    finally:
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class _DatabaseHandle:
+    """An open database plus idle connections for reuse."""
+
+    def __init__(self, kuzu, db):
+        self.kuzu = kuzu
+        self.db = db
+        self.idle_connections: list = []
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+    def close(self) -> None:
+        for conn in self.idle_connections:
+            if hasattr(conn, "close"):
+                conn.close()
+        self.idle_connections.clear()
+        if hasattr(self.db, "close"):
+            self.db.close()
+
+
+class _GraphitiEntry:
+    def __init__(self, client):
+        self.client = client
+        self.in_use = 0
+        self.last_used = time.monotonic()
+
+
+class MemoryServer:
+    """
+    Long-lived query_memory process.
+
+    Command handlers run in a small thread pool with pooled connections
+    (one database per path, one connection per concurrent query); Graphiti
+    clients are kept per database and embedder configuration. Anything idle
+    for `idle_timeout` seconds is closed, and a database is never held open
+    by both a raw handle and a Graphiti client at once.
+
+    Usage:
+        server = MemoryServer()
+        asyncio.run(server.serve(default_socket_path()))  # or serve(None) for stdio
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = SERVER_IDLE_TIMEOUT,
+        max_workers: int = SERVER_MAX_WORKERS,
+    ):
+        self.idle_timeout = idle_timeout
+        self.backend = apply_monkeypatch()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="memory-query"
+        )
+        # Guards _databases and every handle's pool and counters
+        self._db_lock = threading.Lock()
+        self._databases: dict[tuple[str, str], _DatabaseHandle] = {}
+        # kuzu allows one write transaction at a time
+        self._write_lock = threading.Lock()
+        self._graphiti: dict[tuple, _GraphitiEntry] = {}
+        self._graphiti_lock: asyncio.Lock | None = None
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    async def handle_line(self, line: bytes | str) -> dict | None:
+        """
+        Handle one JSON-RPC request line.
+
+        Returns:
+            The response, or None for notifications (requests without an id)
+        """
+        try:
+            request = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return _rpc_error(None, PARSE_ERROR, f"Parse error: {e}")
+
+        if not isinstance(request, dict) or not isinstance(request.get("method"), str):
+            return _rpc_error(None, INVALID_REQUEST, "Invalid request")
+
+        request_id = request.get("id")
+        method = request["method"]
+        params = request.get("params") or {}
+
+        if method not in METHOD_PARAMS:
+            return _rpc_error(request_id, METHOD_NOT_FOUND, f"Unknown method: {method}")
+
+        required, optional = METHOD_PARAMS[method]
+        if not isinstance(params, dict):
+            return _rpc_error(request_id, INVALID_PARAMS, "params must be an object")
+        missing = [name for name in required if name not in params]
+        unknown = set(params) - set(required) - set(optional)
+        if missing or unknown:
+            problems = [f"missing {', '.join(missing)}"] if missing else []
+            if unknown:
+                problems.append(f"unknown {', '.join(sorted(unknown))}")
+            return _rpc_error(request_id, INVALID_PARAMS, "; ".join(problems))
+
+        try:
+            result = await self.call(method, {**optional, **params})
+        except Exception as e:
+            result = make_result(False, error=f"{method} failed: {e}")
+
+        if "id" not in request:
+            return None
+        return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+    async def call(self, method: str, params: dict) -> dict:
+        """Run a method with validated params and return its result dict."""
+        if method == "ping":
+            return make_result(True, data={"pid": os.getpid(), "backend": self.backend})
+
+        args = argparse.Namespace(command=method, **params)
+        if method == "semantic-search":
+            return await self._semantic_search(args)
+
+        await self._close_idle_graphiti(args.db_path, args.database)
+        return await self._run(COMMANDS[method], args, create=method == "add-episode")
+
+    async def _run(self, handler, args, create: bool = False) -> dict:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, self._run_sync, handler, args, create
+        )
+
+    def _run_sync(self, handler, args, create: bool) -> dict:
+        """Run a command handler in a worker thread with pooled connections."""
+        checked_out = []
+
+        def connect(db_path: str, database: str):
+            handle, conn, error = self._checkout(db_path, database, create)
+            if handle is not None:
+                checked_out.append((handle, conn))
+            return conn, error
+
+        try:
+            if create:
+                with self._write_lock:
+                    return handler(args, connect=connect)
+            return handler(args, connect=connect)
+        finally:
+            for handle, conn in checked_out:
+                self._checkin(handle, conn)
+
+    # -------------------------------------------------------------------------
+    # Database handles
+    # -------------------------------------------------------------------------
+
+    def _checkout(self, db_path: str, database: str, create: bool):
+        """
+        Borrow a connection, opening the database on first use.
+
+        Returns:
+            (handle, connection, None) or (None, None, error message)
+        """
+        key = (str(Path(db_path)), database)
+        with self._db_lock:
+            handle = self._databases.get(key)
+            if handle is None:
+                full_path = Path(db_path) / database
+                if not full_path.exists():
+                    if not create:
+                        return None, None, f"Database not found at {full_path}"
+                    Path(db_path).mkdir(parents=True, exist_ok=True)
+                try:
+                    try:
+                        import kuzu
+                    except ImportError:
+                        import real_ladybug as kuzu
+                    handle = _DatabaseHandle(kuzu, kuzu.Database(str(full_path)))
+                except Exception as e:
+                    return None, None, str(e)
+                self._databases[key] = handle
+            handle.in_use += 1
+            conn = handle.idle_connections.pop() if handle.idle_connections else None
+
+        if conn is None:
+            try:
+                conn = handle.kuzu.Connection(handle.db)
+            except Exception as e:
+                self._checkin(handle, None)
+                return None, None, str(e)
+        return handle, conn, None
+
+    def _checkin(self, handle: _DatabaseHandle, conn) -> None:
+        with self._db_lock:
+            if conn is not None:
+                handle.idle_connections.append(conn)
+            handle.in_use -= 1
+            handle.last_used = time.monotonic()
+
+    def _close_idle_handles(self, key: tuple[str, str] | None = None) -> None:
+        """Close database handles with no queries running (older than the
+        idle timeout, or for `key` regardless of age)."""
+        now = time.monotonic()
+        closing = []
+        with self._db_lock:
+            for handle_key, handle in list(self._databases.items()):
+                if handle.in_use:
+                    continue
+                if handle_key == key or now - handle.last_used >= self.idle_timeout:
+                    closing.append(self._databases.pop(handle_key))
+        for handle in closing:
+            try:
+                handle.close()
+            except Exception as e:
+                sys.stderr.write(f"Error closing database: {e}\n")
+
+    # -------------------------------------------------------------------------
+    # Graphiti clients
+    # -------------------------------------------------------------------------
+
+    async def _semantic_search(self, args) -> dict:
+        env = _embedder_config(args.env or {})
+        provider = env.get("GRAPHITI_EMBEDDER_PROVIDER") or os.environ.get(
+            "GRAPHITI_EMBEDDER_PROVIDER", ""
+        )
+        if not provider:
+            # No embedder configured, fall back to keyword search
+            return await self._run(cmd_search, args)
+
+        key = (str(Path(args.db_path)), args.database, tuple(sorted(env.items())))
+        try:
+            entry = await self._graphiti_client(key, args, env)
+        except Exception as e:
+            entry = None
+            sys.stderr.write(f"Graphiti initialization failed: {e}\n")
+
+        result = None
+        if entry is not None:
+            entry.in_use += 1
+            try:
+                result = await _async_semantic_search(args, client=entry.client)
+            except Exception as e:
+                sys.stderr.write(
+                    f"Semantic search failed, falling back to keyword: {e}\n"
+                )
+            finally:
+                entry.in_use -= 1
+                entry.last_used = time.monotonic()
+
+        if result and result.get("success"):
+            return make_result(True, data=result.get("data"))
+        return await self._run(cmd_search, args)
+
+    async def _graphiti_client(self, key: tuple, args, env: dict):
+        if self._graphiti_lock is None:
+            self._graphiti_lock = asyncio.Lock()
+        async with self._graphiti_lock:
+            entry = self._graphiti.get(key)
+            if entry is not None:
+                return entry
+
+            # The Graphiti driver opens the database itself
+            self._close_idle_handles(key[:2])
+            with _patched_environ(env):
+                client, _ = await _create_graphiti_client(args.db_path, args.database)
+            if client is None:
+                return None
+            entry = self._graphiti[key] = _GraphitiEntry(client)
+            return entry
+
+    async def _close_idle_graphiti(
+        self, db_path: str | None = None, database: str | None = None
+    ) -> None:
+        """Close Graphiti clients with no searches running (older than the
+        idle timeout, or for the given database regardless of age)."""
+        db_key = (str(Path(db_path)), database) if db_path else None
+        now = time.monotonic()
+        for key, entry in list(self._graphiti.items()):
+            if entry.in_use:
+                continue
+            if key[:2] == db_key or now - entry.last_used >= self.idle_timeout:
+                del self._graphiti[key]
+                await entry.client.close()
+
+    async def _reap_idle(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 2, 0.1))
+            await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._close_idle_handles
+            )
+            await self._close_idle_graphiti()
+
+    async def close(self) -> None:
+        """Close every client and database handle."""
+        for entry in list(self._graphiti.values()):
+            await entry.client.close()
+        self._graphiti.clear()
+        with self._db_lock:
+            handles = list(self._databases.values())
+            self._databases.clear()
+        for handle in handles:
+            handle.close()
+        self._executor.shutdown(wait=False)
+
+    # -------------------------------------------------------------------------
+    # Transports
+    # -------------------------------------------------------------------------
+
+    async def serve(self, socket_path: Path | None = None) -> None:
+        """Serve on a Unix socket, or on stdin/stdout if socket_path is None."""
+        reaper = asyncio.create_task(self._reap_idle())
+        try:
+            if socket_path is None:
+                await self._serve_stdio()
+            else:
+                await self._serve_unix(Path(socket_path))
+        finally:
+            reaper.cancel()
+            await self.close()
+
+    async def serve_stream(self, readline, write_line) -> None:
+        """
+        Answer requests from one stream until EOF.
+
+        Args:
+            readline: Coroutine function returning the next line (b"" at EOF)
+            write_line: Coroutine function writing one response line
+        """
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+
+        async def respond(line: bytes) -> None:
+            response = await self.handle_line(line)
+            if response is not None:
+                async with write_lock:
+                    await write_line(json.dumps(response, default=str))
+
+        while True:
+            line = await readline()
+            if not line:
+                break
+            if not line.strip():
+                continue
+            task = asyncio.create_task(respond(line))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _serve_stdio(self) -> None:
+        loop = asyncio.get_running_loop()
+        stdin = sys.stdin.buffer
+
+        async def readline() -> bytes:
+            # A dedicated thread: stdin pipes can't be awaited portably
+            return await loop.run_in_executor(None, stdin.readline, MAX_REQUEST_BYTES)
+
+        async def write_line(text: str) -> None:
+            sys.stdout.write(text + "\n")
+            sys.stdout.flush()
+
+        await self.serve_stream(readline, write_line)
+
+    async def _serve_unix(self, socket_path: Path) -> None:
+        socket_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if not _is_private_dir(socket_path.parent):
+            raise RuntimeError(
+                f"Socket directory {socket_path.parent} must be owned by the "
+                "current user and not writable by others"
+            )
+        if socket_path.exists():
+            if _socket_accepts(socket_path):
+                raise RuntimeError(
+                    f"A memory server is already running on {socket_path}"
+                )
+            socket_path.unlink()
+
+        async def on_connect(reader, writer) -> None:
+            async def write_line(text: str) -> None:
+                writer.write(text.encode("utf-8") + b"\n")
+                await writer.drain()
+
+            try:
+                await self.serve_stream(reader.readline, write_line)
+            except (ConnectionError, ValueError):
+                pass  # Client went away or sent an over-long line
+            finally:
+                writer.close()
+
+        server = await asyncio.start_unix_server(
+            on_connect, path=str(socket_path), limit=MAX_REQUEST_BYTES
+        )
+        os.chmod(socket_path, 0o600)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            socket_path.unlink(missing_ok=True)
+
+
+def _rpc_error(request_id, code: int, message: str) -> dict:
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
+def _socket_accepts(socket_path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+        return True
+    except OSError:
+        return False
+
+
+def forward_to_server(
+    method: str, params: dict, socket_path: Path | None = None, timeout: float = 60.0
+) -> dict | None:
+    """
+    Send one request to a running memory server.
+
+    Returns:
+        The command result, or None if no server answered (the caller then
+        runs the command itself)
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    socket_path = socket_path or default_socket_path()
+    if not _is_own_socket(socket_path):
+        return None
+
+    request = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            chunks = []
+            while True:
+                chunk = sock.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        response = json.loads(b"".join(chunks))
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(response, dict) or "result" not in response:
+        return None
+    return response["result"]
+
+
+def _request_params(args) -> dict:
+    params = {k: v for k, v in vars(args).items() if k != "command"}
+    if args.command == "semantic-search":
+        params["env"] = _embedder_config(os.environ)
+    return params
+
+
+COMMANDS = {
+    "get-status": cmd_get_status,
+    "get-memories": cmd_get_memories,
+    "search": cmd_search,
+    "semantic-search": cmd_semantic_search,
+    "get-entities": cmd_get_entities,
+    "add-episode": cmd_add_episode,
+}
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Query LadybugDB memory database for auto-claude-ui"
@@ -692,6 +1352,9 @@ def main():
     search_parser.add_argument("database", help="Database name")
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--limit", type=int, default=20, help="Maximum results")
+    search_parser.add_argument(
+        "--group-id", dest="group_id", help="Only search this group's memories"
+    )
 
     # semantic-search command
     semantic_parser = subparsers.add_parser(
@@ -734,6 +1397,24 @@ def main():
         "--group-id", dest="group_id", help="Optional group ID for namespacing"
     )
 
+    # serve command (long-lived JSON-RPC server)
+    serve_parser = subparsers.add_parser(
+        "serve", help="Keep connections warm and answer JSON-RPC requests"
+    )
+    transport = serve_parser.add_mutually_exclusive_group()
+    transport.add_argument(
+        "--socket", help=f"Unix socket path (default: {default_socket_path()})"
+    )
+    transport.add_argument(
+        "--stdio", action="store_true", help="Read requests from stdin instead"
+    )
+    serve_parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=SERVER_IDLE_TIMEOUT,
+        help="Seconds before idle database connections are closed",
+    )
+
     args = parser.parse_args()
 
     if not args.command:
@@ -741,21 +1422,26 @@ def main():
         output_error("No command specified")
         return
 
-    # Route to command handler
-    commands = {
-        "get-status": cmd_get_status,
-        "get-memories": cmd_get_memories,
-        "search": cmd_search,
-        "semantic-search": cmd_semantic_search,
-        "get-entities": cmd_get_entities,
-        "add-episode": cmd_add_episode,
-    }
+    if args.command == "serve":
+        server = MemoryServer(idle_timeout=args.idle_timeout)
+        socket_path = None if args.stdio else Path(args.socket or default_socket_path())
+        try:
+            asyncio.run(server.serve(socket_path))
+        except KeyboardInterrupt:
+            pass
+        return
 
-    handler = commands.get(args.command)
-    if handler:
-        handler(args)
-    else:
+    # Route to command handler
+    handler = COMMANDS.get(args.command)
+    if not handler:
         output_error(f"Unknown command: {args.command}")
+        return
+
+    # Prefer a running server; fall back to answering in this process
+    result = forward_to_server(args.command, _request_params(args))
+    if result is None:
+        result = handler(args)
+    output_json(result["success"], data=result.get("data"), error=result.get("error"))
 
 
 if __name__ == "__main__":
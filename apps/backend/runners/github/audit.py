@@ -11,12 +11,14 @@ Features:
 - Actor tracking (user/bot/automation)
 - Duration and token usage tracking
 - Log rotation with configurable retention
+- Sidecar index per log segment for fast filtered queries
 """
 
 from __future__ import annotations
 
 import json
 import logging
+import os
 import time
 import uuid
 from contextlib import contextmanager
@@ -29,6 +31,12 @@ from typing import Any
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# Sidecar index file suffix (audit_<date>.jsonl -> audit_<date>.jsonl.idx)
+INDEX_SUFFIX = ".idx"
+
+# Entry fields with posting lists in the segment index
+INDEXED_FIELDS = ("correlation_id", "action", "repo", "pr_number", "issue_number")
+
 
 class AuditAction(str, Enum):
     """Types of auditable actions."""
@@ -161,6 +169,115 @@ class AuditEntry:
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), default=str)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditEntry:
+        return cls(
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            correlation_id=data["correlation_id"],
+            action=AuditAction(data["action"]),
+            actor_type=ActorType(data["actor_type"]),
+            actor_id=data.get("actor_id"),
+            repo=data.get("repo"),
+            pr_number=data.get("pr_number"),
+            issue_number=data.get("issue_number"),
+            result=data["result"],
+            duration_ms=data.get("duration_ms"),
+            error=data.get("error"),
+            details=data.get("details", {}),
+            token_usage=data.get("token_usage"),
+        )
+
+
+@dataclass
+class AuditSegmentIndex:
+    """
+    Sidecar index for one audit log segment.
+
+    Maps indexed field values to the byte offsets of matching lines and
+    records the segment's timestamp range. Segments only grow, so the index
+    is extended from the last indexed size instead of being rebuilt.
+    """
+
+    inode: int = 0
+    size: int = 0
+    min_ts: float | None = None
+    max_ts: float | None = None
+    offsets: list[int] = field(default_factory=list)
+    postings: dict[str, dict[str, list[int]]] = field(default_factory=dict)
+
+    @staticmethod
+    def path_for(log_file: Path) -> Path:
+        return log_file.with_name(log_file.name + INDEX_SUFFIX)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "inode": self.inode,
+            "size": self.size,
+            "min_ts": self.min_ts,
+            "max_ts": self.max_ts,
+            "offsets": self.offsets,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> AuditSegmentIndex:
+        return cls(
+            inode=data.get("inode", 0),
+            size=data["size"],
+            min_ts=data.get("min_ts"),
+            max_ts=data.get("max_ts"),
+            offsets=data["offsets"],
+            postings=data["postings"],
+        )
+
+    def extend(self, log_file: Path) -> bool:
+        """
+        Index lines appended since the last update.
+
+        A trailing line without a newline is still being written and is
+        left for the next update.
+
+        Returns:
+            True if the index changed
+        """
+        offset = self.size
+        with open(log_file, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                start, offset = offset, offset + len(line)
+                try:
+                    data = json.loads(line)
+                    self._add(start, data)
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+        changed = offset != self.size
+        self.size = offset
+        return changed
+
+    def candidates(self, filters: dict[str, Any]) -> list[int]:
+        """Offsets of lines matching every filter, in file order."""
+        matches: set[int] | None = None
+        for name, value in filters.items():
+            postings = self.postings.get(name, {}).get(str(value), [])
+            matches = set(postings) if matches is None else matches & set(postings)
+            if not matches:
+                return []
+        return self.offsets if matches is None else sorted(matches)
+
+    def _add(self, offset: int, data: dict[str, Any]) -> None:
+        ts = datetime.fromisoformat(data["timestamp"]).timestamp()
+        self.min_ts = ts if self.min_ts is None else min(self.min_ts, ts)
+        self.max_ts = ts if self.max_ts is None else max(self.max_ts, ts)
+        self.offsets.append(offset)
+        for name in INDEXED_FIELDS:
+            value = data.get(name)
+            if value is not None:
+                values = self.postings.setdefault(name, {})
+                values.setdefault(str(value), []).append(offset)
+
 
 class AuditLogger:
     """
@@ -214,6 +331,9 @@ class AuditLogger:
         self.max_file_size_mb = max_file_size_mb
         self.enabled = enabled
 
+        # Segment indexes already loaded by this process
+        self._segment_indexes: dict[Path, AuditSegmentIndex] = {}
+
         if enabled:
             self.log_dir.mkdir(parents=True, exist_ok=True)
             self._current_log_file: Path | None = None
@@ -254,6 +374,10 @@ class AuditLogger:
                 timestamp = datetime.now(timezone.utc).strftime("%H%M%S")
                 rotated = log_file.with_suffix(f".{timestamp}.jsonl")
                 log_file.rename(rotated)
+                index_file = AuditSegmentIndex.path_for(log_file)
+                if index_file.exists():
+                    index_file.rename(AuditSegmentIndex.path_for(rotated))
+                self._segment_indexes.pop(log_file, None)
                 logger.info(f"Rotated audit log to {rotated}")
 
         self._current_log_file = log_file
@@ -270,6 +394,8 @@ class AuditLogger:
         for log_file in self.log_dir.glob("audit_*.jsonl"):
             if log_file.stat().st_mtime < cutoff:
                 log_file.unlink()
+                AuditSegmentIndex.path_for(log_file).unlink(missing_ok=True)
+                self._segment_indexes.pop(log_file, None)
                 logger.info(f"Deleted old audit log: {log_file}")
 
     def generate_correlation_id(self) -> str:
@@ -581,56 +707,49 @@ class AuditLogger:
         if not self.enabled or not self.log_dir.exists():
             return []
 
+        filters: dict[str, Any] = {}
+        if correlation_id:
+            filters["correlation_id"] = correlation_id
+        if action:
+            filters["action"] = action.value
+        if repo:
+            filters["repo"] = repo
+        if pr_number:
+            filters["pr_number"] = pr_number
+        if issue_number:
+            filters["issue_number"] = issue_number
+
         results = []
 
         for log_file in sorted(self.log_dir.glob("audit_*.jsonl"), reverse=True):
             try:
-                with open(log_file, encoding="utf-8") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-
+                index = self._get_segment_index(log_file)
+                # Skip segments that end before the requested window
+                if since and index.max_ts is not None:
+                    if index.max_ts < since.timestamp():
+                        continue
+
+                offsets = index.candidates(filters)
+                if not offsets:
+                    continue
+
+                with open(log_file, "rb") as f:
+                    for offset in offsets:
+                        f.seek(offset)
                         try:
-                            data = json.loads(line)
-                        except json.JSONDecodeError:
+                            data = json.loads(f.readline())
+                        except ValueError:
                             continue
 
-                        # Apply filters
-                        if (
-                            correlation_id
-                            and data.get("correlation_id") != correlation_id
-                        ):
-                            continue
-                        if action and data.get("action") != action.value:
-                            continue
-                        if repo and data.get("repo") != repo:
-                            continue
-                        if pr_number and data.get("pr_number") != pr_number:
-                            continue
-                        if issue_number and data.get("issue_number") != issue_number:
+                        # Index keys are strings; confirm the actual values
+                        if any(data.get(k) != v for k, v in filters.items()):
                             continue
                         if since:
                             entry_time = datetime.fromisoformat(data["timestamp"])
                             if entry_time < since:
                                 continue
 
-                        # Reconstruct entry
-                        entry = AuditEntry(
-                            timestamp=datetime.fromisoformat(data["timestamp"]),
-                            correlation_id=data["correlation_id"],
-                            action=AuditAction(data["action"]),
-                            actor_type=ActorType(data["actor_type"]),
-                            actor_id=data.get("actor_id"),
-                            repo=data.get("repo"),
-                            pr_number=data.get("pr_number"),
-                            issue_number=data.get("issue_number"),
-                            result=data["result"],
-                            duration_ms=data.get("duration_ms"),
-                            error=data.get("error"),
-                            details=data.get("details", {}),
-                            token_usage=data.get("token_usage"),
-                        )
-                        results.append(entry)
+                        results.append(AuditEntry.from_dict(data))
 
                         if len(results) >= limit:
                             return results
@@ -640,6 +759,39 @@ class AuditLogger:
 
         return results
 
+    def _get_segment_index(self, log_file: Path) -> AuditSegmentIndex:
+        """
+        Load a segment's sidecar index, indexing any lines appended since.
+
+        The index is rebuilt if the segment was replaced (e.g. the active
+        file was rotated and a new one started under the same name).
+        """
+        stat = log_file.stat()
+        index = self._segment_indexes.get(log_file)
+        index_file = AuditSegmentIndex.path_for(log_file)
+
+        if index is None and index_file.exists():
+            try:
+                with open(index_file, encoding="utf-8") as f:
+                    index = AuditSegmentIndex.from_dict(json.load(f))
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Rebuilding audit index {index_file}: {e}")
+
+        if index is None or index.inode != stat.st_ino or index.size > stat.st_size:
+            index = AuditSegmentIndex(inode=stat.st_ino)
+
+        if index.size < stat.st_size and index.extend(log_file):
+            try:
+                tmp_file = index_file.with_suffix(".tmp")
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(index.to_dict(), f, separators=(",", ":"))
+                os.replace(tmp_file, index_file)
+            except OSError as e:
+                logger.warning(f"Could not write audit index {index_file}: {e}")
+
+        self._segment_indexes[log_file] = index
+        return index
+
     def get_operation_history(self, correlation_id: str) -> list[AuditEntry]:
         """Get all entries for a specific operation by correlation ID."""
         return self.query_logs(correlation_id=correlation_id, limit=1000)
@@ -50,9 +50,9 @@ from core.gh_executable import get_gh_executable
 logger = logging.getLogger(__name__)
 
 try:
-    from .file_lock import FileLock, atomic_write
+    from .state_store import KIND_BOT_DETECTION, get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import FileLock, atomic_write
+    from state_store import KIND_BOT_DETECTION, get_state_store
 
 
 @dataclass
@@ -86,25 +86,16 @@ class BotDetectionState:
         )
 
     def save(self, state_dir: Path) -> None:
-        """Save state to disk with file locking for concurrent safety."""
-        state_dir.mkdir(parents=True, exist_ok=True)
-        state_file = state_dir / "bot_detection_state.json"
-
-        # Use file locking to prevent concurrent write corruption
-        with FileLock(state_file, timeout=5.0, exclusive=True):
-            with atomic_write(state_file) as f:
-                json.dump(self.to_dict(), f, indent=2)
+        """Save state to the state store (one transactional row write)."""
+        get_state_store(state_dir).put(KIND_BOT_DETECTION, "", 0, self.to_dict())
 
     @classmethod
     def load(cls, state_dir: Path) -> BotDetectionState:
-        """Load state from disk."""
-        state_file = state_dir / "bot_detection_state.json"
-
-        if not state_file.exists():
+        """Load state from the state store."""
+        data = get_state_store(state_dir).get(KIND_BOT_DETECTION, "", 0)
+        if data is None:
             return cls()
-
-        with open(state_file, encoding="utf-8") as f:
-            return cls.from_dict(json.load(f))
+        return cls.from_dict(data)
 
 
 class BotDetector:
@@ -7,7 +7,7 @@ Manages data retention, archival, and cleanup for the GitHub automation system.
 Features:
 - Configurable retention periods by state
 - Automatic archival of old records
-- Index pruning on startup
+- Pruning state store records whose files are gone
 - GDPR-compliant deletion (full purge)
 - Storage usage metrics
 
@@ -32,6 +32,7 @@ CLI:
 from __future__ import annotations
 
 import json
+import sqlite3
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
@@ -39,6 +40,7 @@ from pathlib import Path
 from typing import Any
 
 from .purge_strategy import PurgeResult, PurgeStrategy
+from .state_store import STATE_DB_NAME, get_state_store
 from .storage_metrics import StorageMetrics, StorageMetricsCalculator
 
 
@@ -229,8 +231,8 @@ class DataCleaner:
                 except Exception as e:
                     result.errors.append(f"Error processing {file_path}: {e}")
 
-        # Prune indexes
-        await self._prune_indexes(dry_run, result)
+        # Prune state store records of deleted or archived files
+        self._prune_state_store(dry_run, result)
 
         # Clean up audit logs
         await self._clean_audit_logs(now, older_than_days, dry_run, result)
@@ -333,55 +335,16 @@ class DataCleaner:
         # Remove original
         file_path.unlink()
 
-    async def _prune_indexes(
-        self,
-        dry_run: bool,
-        result: CleanupResult,
-    ) -> None:
-        """Prune stale entries from index files."""
-        index_files = [
-            self.state_dir / "pr" / "index.json",
-            self.state_dir / "issues" / "index.json",
-            self.state_dir / "autofix" / "index.json",
-        ]
-
-        for index_path in index_files:
-            if not index_path.exists():
-                continue
-
-            try:
-                with open(index_path, encoding="utf-8") as f:
-                    index_data = json.load(f)
-
-                if not isinstance(index_data, dict):
-                    continue
-
-                items = index_data.get("items", {})
-                if not isinstance(items, dict):
-                    continue
-
-                pruned = 0
-                to_remove = []
-
-                for key, entry in items.items():
-                    # Check if referenced file exists
-                    file_path = entry.get("file_path") or entry.get("path")
-                    if file_path:
-                        if not Path(file_path).exists():
-                            to_remove.append(key)
-                            pruned += 1
-
-                if to_remove and not dry_run:
-                    for key in to_remove:
-                        del items[key]
-
-                    with open(index_path, "w", encoding="utf-8") as f:
-                        json.dump(index_data, f, indent=2)
-
-                result.pruned_index_entries += pruned
-
-            except (OSError, json.JSONDecodeError, UnicodeDecodeError, KeyError):
-                result.errors.append(f"Error pruning index: {index_path}")
+    def _prune_state_store(self, dry_run: bool, result: CleanupResult) -> None:
+        """Prune state store records whose JSON files were removed."""
+        if not (self.state_dir / STATE_DB_NAME).exists():
+            return
+        try:
+            result.pruned_index_entries += get_state_store(
+                self.state_dir
+            ).prune_json_records(dry_run=dry_run)
+        except sqlite3.Error as e:
+            result.errors.append(f"Error pruning state store: {e}")
 
     async def _clean_audit_logs(
         self,
@@ -483,6 +446,8 @@ class DataCleaner:
         """
         Convert PurgeResult to CleanupResult.
 
+        The state store's copies of purged files are dropped as well.
+
         Args:
             purge_result: PurgeResult from PurgeStrategy
 
@@ -496,6 +461,7 @@ class DataCleaner:
             started_at=purge_result.started_at,
             completed_at=purge_result.completed_at,
         )
+        self._prune_state_store(dry_run=False, result=cleanup_result)
         return cleanup_result
 
     def get_retention_summary(self) -> dict[str, Any]:
@@ -26,12 +26,14 @@ from typing import TYPE_CHECKING
 
 try:
     from .gh_client import GHClient, PRTooLargeError
+    from .git_batch import GitBatchError, GitBatchReader, split_diff_by_file
     from .services.io_utils import safe_print
 except (ImportError, ValueError, SystemError):
     # Import from core.io_utils directly to avoid circular import with services package
     # (services/__init__.py imports pr_review_engine which imports context_gatherer)
     from core.io_utils import safe_print
     from gh_client import GHClient, PRTooLargeError
+    from git_batch import GitBatchError, GitBatchReader, split_diff_by_file
 
 # Validation patterns for git refs and paths (defense-in-depth)
 # These patterns allow common valid characters while rejecting potentially dangerous ones
@@ -52,6 +54,12 @@ CONFIG_FILE_NAMES = [
     "vite.config.ts",
 ]
 
+# Concurrent git subprocesses when batched object/diff access is unavailable
+MAX_CONCURRENT_GIT_FALLBACK = 8
+
+# Paths per batched `git diff` invocation (keeps argv well under OS limits)
+DIFF_PATHS_PER_CALL = 500
+
 
 def _validate_git_ref(ref: str) -> bool:
     """
@@ -444,9 +452,24 @@ class PRContextGatherer:
         - Current content (HEAD of PR branch)
         - Base content (before changes)
         - Diff patch
+
+        Contents for every file at both refs come from one cat-file batch
+        and patches from one multi-path git diff.
         """
         changed_files = []
         files = pr_data.get("files", [])
+        if not files:
+            return changed_files
+
+        # Use commit SHAs if available (works for fork PRs), fallback to branch names
+        head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
+        base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
+        paths = [file_info["path"] for file_info in files]
+
+        contents = await self._read_file_contents(
+            [(path, head_ref) for path in paths] + [(path, base_ref) for path in paths]
+        )
+        patches = await self._get_file_patches(paths, base_ref, head_ref)
 
         for file_info in files:
             path = file_info["path"]
@@ -456,18 +479,9 @@ class PRContextGatherer:
 
             safe_print(f"[Context]   Processing {path} ({status})...")
 
-            # Use commit SHAs if available (works for fork PRs), fallback to branch names
-            head_ref = pr_data.get("headRefOid") or pr_data["headRefName"]
-            base_ref = pr_data.get("baseRefOid") or pr_data["baseRefName"]
-
-            # Get current content (from PR head commit)
-            content = await self._read_file_content(path, head_ref)
-
-            # Get base content (from base commit)
-            base_content = await self._read_file_content(path, base_ref)
-
-            # Get the patch for this specific file
-            patch = await self._get_file_patch(path, base_ref, head_ref)
+            content = contents.get((path, head_ref), "")
+            base_content = contents.get((path, base_ref), "")
+            patch = patches.get(path, "")
 
             changed_files.append(
                 ChangedFile(
@@ -497,6 +511,66 @@ class PRContextGatherer:
         else:
             return status_lower
 
+    async def _read_file_contents(
+        self, requests: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], str]:
+        """
+        Read many files at many refs through one cat-file batch process.
+
+        Falls back to bounded concurrent `git show` calls if the batch
+        process cannot be used.
+
+        Args:
+            requests: (path, ref) pairs to read
+
+        Returns:
+            Dict mapping (path, ref) to content; empty string if the file
+            doesn't exist at that ref or the request was rejected
+        """
+        contents: dict[tuple[str, str], str] = {}
+        valid: list[tuple[str, str]] = []
+        for path, ref in dict.fromkeys(requests):
+            # Validate inputs to prevent command injection
+            if not _validate_file_path(path):
+                safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
+                contents[(path, ref)] = ""
+            elif not _validate_git_ref(ref):
+                safe_print(f"[Context] Invalid git ref rejected: {ref[:50]}...")
+                contents[(path, ref)] = ""
+            else:
+                valid.append((path, ref))
+
+        if not valid:
+            return contents
+
+        try:
+            async with GitBatchReader(self.project_dir) as reader:
+                blobs = await asyncio.wait_for(
+                    reader.read_many([f"{ref}:{path}" for path, ref in valid]),
+                    timeout=60.0,
+                )
+        except (GitBatchError, OSError, ValueError, asyncio.TimeoutError) as e:
+            safe_print(f"[Context] Batched file read failed ({e}), reading per file")
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_GIT_FALLBACK)
+
+            async def read_one(path: str, ref: str) -> str:
+                async with semaphore:
+                    return await self._read_file_content(path, ref)
+
+            results = await asyncio.gather(
+                *(read_one(path, ref) for path, ref in valid)
+            )
+            contents.update(zip(valid, results))
+            return contents
+
+        for key, blob in zip(valid, blobs):
+            try:
+                contents[key] = blob.decode("utf-8") if blob is not None else ""
+            except UnicodeDecodeError:
+                safe_print(f"[Context] Skipping non-UTF-8 content of {key[0]}")
+                contents[key] = ""
+        return contents
+
     async def _read_file_content(self, path: str, ref: str) -> str:
         """
         Read file content from a specific git ref.
@@ -540,6 +614,72 @@ class PRContextGatherer:
             safe_print(f"[Context] Error reading {path} from {ref}: {e}")
             return ""
 
+    async def _get_file_patches(
+        self, paths: list[str], base_ref: str, head_ref: str
+    ) -> dict[str, str]:
+        """
+        Get diff patches for many files from a single git diff.
+
+        Falls back to bounded concurrent per-file diffs if the combined
+        diff fails.
+
+        Args:
+            paths: File paths relative to repo root
+            base_ref: Base branch ref
+            head_ref: Head branch ref
+
+        Returns:
+            Dict mapping path to its unified diff patch
+        """
+        if not _validate_git_ref(base_ref) or not _validate_git_ref(head_ref):
+            safe_print(
+                f"[Context] Invalid diff refs rejected: {base_ref[:50]}...{head_ref[:50]}",
+                flush=True,
+            )
+            return {}
+
+        valid_paths = []
+        for path in dict.fromkeys(paths):
+            if _validate_file_path(path):
+                valid_paths.append(path)
+            else:
+                safe_print(f"[Context] Invalid file path rejected: {path[:50]}...")
+
+        patches: dict[str, str] = {}
+        try:
+            for i in range(0, len(valid_paths), DIFF_PATHS_PER_CALL):
+                chunk = valid_paths[i : i + DIFF_PATHS_PER_CALL]
+                proc = await asyncio.create_subprocess_exec(
+                    "git",
+                    "diff",
+                    # Per-path semantics: a rename shows as delete + add
+                    "--no-renames",
+                    f"{base_ref}...{head_ref}",
+                    "--",
+                    *chunk,
+                    cwd=self.project_dir,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                stdout, stderr = await asyncio.wait_for(
+                    proc.communicate(), timeout=30.0
+                )
+                if proc.returncode != 0:
+                    raise GitBatchError(stderr.decode("utf-8", errors="replace"))
+                patches.update(split_diff_by_file(stdout.decode("utf-8")))
+            return patches
+        except (GitBatchError, OSError, UnicodeDecodeError, asyncio.TimeoutError) as e:
+            safe_print(f"[Context] Combined diff failed ({e}), diffing per file")
+
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GIT_FALLBACK)
+
+        async def patch_one(path: str) -> str:
+            async with semaphore:
+                return await self._get_file_patch(path, base_ref, head_ref)
+
+        results = await asyncio.gather(*(patch_one(path) for path in valid_paths))
+        return dict(zip(valid_paths, results))
+
     async def _get_file_patch(self, path: str, base_ref: str, head_ref: str) -> str:
         """
         Get the diff patch for a specific file using git diff.
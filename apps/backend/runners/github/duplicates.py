@@ -5,22 +5,36 @@ Semantic Duplicate Detection
 Uses embeddings-based similarity to detect duplicate issues:
 - Replaces simple word overlap with semantic similarity
 - Integrates with OpenAI/Voyage AI embeddings
-- Caches embeddings with TTL
+- Caches embeddings with TTL in an append-only float32 file
+- Batches provider requests and runs them concurrently under a rate limit
 - Extracts entities (error codes, file paths, function names)
 - Provides similarity breakdown by component
+- Scores candidates in one batched pass over a float32 embedding matrix
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
+import os
 import re
+from array import array
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
+try:
+    from .embedding_index import EmbeddingIndex, cosine_similarity
+    from .file_lock import FileLock
+    from .rate_limiter import TokenBucket
+except (ImportError, ValueError, SystemError):
+    from embedding_index import EmbeddingIndex, cosine_similarity
+    from file_lock import FileLock
+    from rate_limiter import TokenBucket
+
 logger = logging.getLogger(__name__)
 
 # Thresholds for duplicate detection
@@ -28,6 +42,17 @@ DUPLICATE_THRESHOLD = 0.85  # Cosine similarity for "definitely duplicate"
 SIMILAR_THRESHOLD = 0.70  # Cosine similarity for "potentially related"
 EMBEDDING_CACHE_TTL_HOURS = 24
 
+# Provider request shaping
+EMBEDDING_BATCH_SIZE = 64  # Texts per provider request
+MAX_CONCURRENT_EMBEDDING_REQUESTS = 4
+EMBEDDING_REQUESTS_PER_SECOND = 5.0
+
+# Rewrite the binary cache once this many superseded rows have piled up
+CACHE_COMPACT_MIN_STALE = 256
+
+# Title/body embeddings memoized per detector (oldest dropped first)
+MAX_MEMOIZED_TEXTS = 1024
+
 
 @dataclass
 class EntityExtraction:
@@ -220,6 +245,7 @@ class EmbeddingProvider:
         self.provider = provider
         self.api_key = api_key
         self.model = model or self._default_model()
+        self._local_model = None
 
     def _default_model(self) -> str:
         defaults = {
@@ -231,32 +257,40 @@ class EmbeddingProvider:
 
     async def get_embedding(self, text: str) -> list[float]:
         """Get embedding for text."""
+        return (await self.get_embeddings([text]))[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings for several texts in a single provider request."""
+        if not texts:
+            return []
+        texts = [text[:8000] for text in texts]  # Limit input
         if self.provider == "openai":
-            return await self._openai_embedding(text)
+            return await self._openai_embeddings(texts)
         elif self.provider == "voyage":
-            return await self._voyage_embedding(text)
+            return await self._voyage_embeddings(texts)
         else:
-            return await self._local_embedding(text)
+            return await self._local_embeddings(texts)
 
-    async def _openai_embedding(self, text: str) -> list[float]:
-        """Get embedding from OpenAI."""
+    async def _openai_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from OpenAI."""
         try:
             import openai
 
             client = openai.AsyncOpenAI(api_key=self.api_key)
             response = await client.embeddings.create(
                 model=self.model,
-                input=text[:8000],  # Limit input
+                input=texts,
             )
-            return response.data[0].embedding
+            items = sorted(response.data, key=lambda d: d.index)
+            return [item.embedding for item in items]
         except Exception as e:
             logger.error(f"OpenAI embedding error: {e}")
             raise Exception(
                 f"OpenAI embeddings required but failed: {e}. Configure OPENAI_API_KEY or use 'local' provider."
             )
 
-    async def _voyage_embedding(self, text: str) -> list[float]:
-        """Get embedding from Voyage AI."""
+    async def _voyage_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from Voyage AI."""
         try:
             import httpx
 
@@ -266,25 +300,27 @@ class EmbeddingProvider:
                     headers={"Authorization": f"Bearer {self.api_key}"},
                     json={
                         "model": self.model,
-                        "input": text[:8000],
+                        "input": texts,
                     },
                 )
                 data = response.json()
-                return data["data"][0]["embedding"]
+                items = sorted(data["data"], key=lambda d: d["index"])
+                return [item["embedding"] for item in items]
         except Exception as e:
             logger.error(f"Voyage embedding error: {e}")
             raise Exception(
                 f"Voyage embeddings required but failed: {e}. Configure VOYAGE_API_KEY or use 'local' provider."
             )
 
-    async def _local_embedding(self, text: str) -> list[float]:
-        """Get embedding from local model."""
+    async def _local_embeddings(self, texts: list[str]) -> list[list[float]]:
+        """Get embeddings from local model."""
         try:
-            from sentence_transformers import SentenceTransformer
+            if self._local_model is None:
+                from sentence_transformers import SentenceTransformer
 
-            model = SentenceTransformer(self.model)
-            embedding = model.encode(text[:8000])
-            return embedding.tolist()
+                self._local_model = SentenceTransformer(self.model)
+            embeddings = self._local_model.encode(texts)
+            return embeddings.tolist()
         except Exception as e:
             logger.error(f"Local embedding error: {e}")
             raise Exception(
@@ -319,12 +355,27 @@ class DuplicateDetector:
         duplicate_threshold: float = DUPLICATE_THRESHOLD,
         similar_threshold: float = SIMILAR_THRESHOLD,
         cache_ttl_hours: int = EMBEDDING_CACHE_TTL_HOURS,
+        approximate_search: bool = False,
     ):
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.duplicate_threshold = duplicate_threshold
         self.similar_threshold = similar_threshold
         self.cache_ttl_hours = cache_ttl_hours
+        self.approximate_search = approximate_search
+
+        # Per-repo similarity index, reused while the candidate set is unchanged
+        self._indexes: dict[str, tuple[tuple, EmbeddingIndex]] = {}
+        # Per-repo embedding caches, and title/body embeddings memoized up to
+        # MAX_MEMOIZED_TEXTS
+        self._caches: dict[str, dict[int, CachedEmbedding]] = {}
+        # Per-repo offset of each cached issue's row in the .f32 file
+        self._offsets: dict[str, dict[int, int]] = {}
+        self._texts: dict[str, list[float]] = {}
+        self._request_bucket = TokenBucket(
+            capacity=MAX_CONCURRENT_EMBEDDING_REQUESTS * 2,
+            refill_rate=EMBEDDING_REQUESTS_PER_SECOND,
+        )
 
         self.embedding_provider = EmbeddingProvider(
             provider=embedding_provider,
@@ -333,40 +384,227 @@ class DuplicateDetector:
         self.entity_extractor = EntityExtractor()
 
     def _get_cache_file(self, repo: str) -> Path:
+        """Legacy JSON cache file (migrated to the binary cache on load)."""
         safe_name = repo.replace("/", "_")
         return self.cache_dir / f"{safe_name}_embeddings.json"
 
+    def _get_cache_paths(self, repo: str) -> tuple[Path, Path]:
+        """Binary cache files: (float32 vectors, JSONL row index)."""
+        safe_name = repo.replace("/", "_")
+        return (
+            self.cache_dir / f"{safe_name}_embeddings.f32",
+            self.cache_dir / f"{safe_name}_embeddings.idx.jsonl",
+        )
+
     def _content_hash(self, title: str, body: str) -> str:
         """Generate hash of issue content."""
         content = f"{title}\n{body}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
     def _load_cache(self, repo: str) -> dict[int, CachedEmbedding]:
-        """Load embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        if not cache_file.exists():
-            return {}
+        """Load embedding cache for a repo (once per detector)."""
+        if repo in self._caches:
+            return self._caches[repo]
+
+        vectors_file, index_file = self._get_cache_paths(repo)
+        legacy_file = self._get_cache_file(repo)
+        cache: dict[int, CachedEmbedding] = {}
+
+        if index_file.exists():
+            # Held across the read and any compaction, so rows appended by
+            # another process in between aren't dropped
+            with FileLock(vectors_file, timeout=5.0):
+                cache, offsets, stale = self._read_binary_cache(
+                    vectors_file, index_file
+                )
+                self._offsets[repo] = offsets
+                if stale >= max(CACHE_COMPACT_MIN_STALE, len(cache)):
+                    self._save_cache(repo, cache)
+        elif legacy_file.exists():
+            with open(legacy_file, encoding="utf-8") as f:
+                data = json.load(f)
+            for item in data.get("embeddings", []):
+                embedding = CachedEmbedding.from_dict(item)
+                if not embedding.is_expired():
+                    cache[embedding.issue_number] = embedding
+            with FileLock(vectors_file, timeout=5.0):
+                self._save_cache(repo, cache)
+            legacy_file.unlink()
+
+        self._caches[repo] = cache
+        return cache
+
+    def _read_binary_cache(
+        self, vectors_file: Path, index_file: Path
+    ) -> tuple[dict[int, CachedEmbedding], dict[int, int], int]:
+        """
+        Read the binary cache.
+
+        Later index lines supersede earlier ones for the same issue. Lines
+        pointing past the end of the vector file (an interrupted append)
+        are ignored.
 
-        with open(cache_file, encoding="utf-8") as f:
-            data = json.load(f)
+        Returns:
+            (live entries, their row offsets, number of superseded or
+            expired rows)
+        """
+        vectors = array("f")
+        if vectors_file.exists():
+            vectors.frombytes(vectors_file.read_bytes())
+
+        entries: dict[int, dict[str, Any]] = {}
+        total = 0
+        with open(index_file, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry["offset"] + entry["dim"] > len(vectors):
+                    continue
+                entries[entry["issue_number"]] = entry
+                total += 1
 
         cache = {}
-        for item in data.get("embeddings", []):
-            embedding = CachedEmbedding.from_dict(item)
+        offsets = {}
+        for number, entry in entries.items():
+            offset = entry["offset"]
+            embedding = CachedEmbedding(
+                issue_number=number,
+                content_hash=entry["content_hash"],
+                embedding=vectors[offset : offset + entry["dim"]].tolist(),
+                created_at=entry["created_at"],
+                expires_at=entry["expires_at"],
+            )
             if not embedding.is_expired():
-                cache[embedding.issue_number] = embedding
-
-        return cache
+                cache[number] = embedding
+                offsets[number] = offset
+        return cache, offsets, total - len(cache)
+
+    def _append_cache(self, repo: str, embeddings: list[CachedEmbedding]) -> None:
+        """Append new embeddings to the binary cache without rewriting it."""
+        if not embeddings:
+            return
+        vectors_file, index_file = self._get_cache_paths(repo)
+
+        # Offsets come from the file size, so another process must not
+        # append (or compact) between reading it and writing the index
+        with FileLock(vectors_file, timeout=5.0):
+            offset = vectors_file.stat().st_size // 4 if vectors_file.exists() else 0
+
+            lines = []
+            rows = array("f")
+            offsets = {}
+            for embedding in embeddings:
+                offsets[embedding.issue_number] = offset + len(rows)
+                lines.append(self._index_line(embedding, offset + len(rows)))
+                rows.extend(embedding.embedding)
+
+            # Vectors first, so the index never points at missing rows
+            with open(vectors_file, "ab") as f:
+                rows.tofile(f)
+            with open(index_file, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        self._offsets.setdefault(repo, {}).update(offsets)
 
     def _save_cache(self, repo: str, cache: dict[int, CachedEmbedding]) -> None:
-        """Save embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        data = {
-            "embeddings": [e.to_dict() for e in cache.values()],
-            "last_updated": datetime.now(timezone.utc).isoformat(),
+        """
+        Rewrite the binary cache for a repo, dropping superseded rows.
+
+        Callers hold the cache file's FileLock.
+        """
+        vectors_file, index_file = self._get_cache_paths(repo)
+        lines = []
+        rows = array("f")
+        offsets = {}
+        for embedding in cache.values():
+            offsets[embedding.issue_number] = len(rows)
+            lines.append(self._index_line(embedding, len(rows)))
+            rows.extend(embedding.embedding)
+
+        vectors_tmp = vectors_file.with_suffix(".tmp")
+        index_tmp = index_file.with_suffix(".tmp")
+        with open(vectors_tmp, "wb") as f:
+            rows.tofile(f)
+        with open(index_tmp, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+
+        # Without an index the vectors are ignored, so swap it in last
+        index_file.unlink(missing_ok=True)
+        os.replace(vectors_tmp, vectors_file)
+        os.replace(index_tmp, index_file)
+        self._offsets[repo] = offsets
+
+    @staticmethod
+    def _index_line(embedding: CachedEmbedding, offset: int) -> str:
+        entry = {
+            "issue_number": embedding.issue_number,
+            "content_hash": embedding.content_hash,
+            "offset": offset,
+            "dim": len(embedding.embedding),
+            "created_at": embedding.created_at,
+            "expires_at": embedding.expires_at,
+        }
+        return json.dumps(entry) + "\n"
+
+    def _new_cache_entry(
+        self, issue_number: int, content_hash: str, embedding: list[float]
+    ) -> CachedEmbedding:
+        now = datetime.now(timezone.utc)
+        return CachedEmbedding(
+            issue_number=issue_number,
+            content_hash=content_hash,
+            embedding=embedding,
+            created_at=now.isoformat(),
+            expires_at=(now + timedelta(hours=self.cache_ttl_hours)).isoformat(),
+        )
+
+    async def _embed_batches(self, texts: list[str]) -> list[list[float] | None]:
+        """
+        Embed texts in provider-sized batches, several requests at a time.
+
+        Returns:
+            One embedding per text; None where the batch request failed
+        """
+        results: list[list[float] | None] = [None] * len(texts)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_EMBEDDING_REQUESTS)
+
+        async def run_batch(start: int) -> None:
+            batch = texts[start : start + EMBEDDING_BATCH_SIZE]
+            async with semaphore:
+                await self._request_bucket.acquire()
+                try:
+                    embeddings = await self.embedding_provider.get_embeddings(batch)
+                except Exception as e:
+                    logger.error(f"Error computing {len(batch)} embeddings: {e}")
+                    return
+            results[start : start + len(embeddings)] = embeddings
+
+        starts = range(0, len(texts), EMBEDDING_BATCH_SIZE)
+        await asyncio.gather(*(run_batch(start) for start in starts))
+        return results
+
+    async def _embed_texts(self, texts: list[str]) -> list[list[float]]:
+        """
+        Embed arbitrary texts (titles, bodies), memoized per detector.
+
+        Raises:
+            Exception: If any embedding could not be computed
+        """
+        keys = [hashlib.sha256(text.encode()).hexdigest() for text in texts]
+        pending = {
+            key: text for key, text in zip(keys, texts) if key not in self._texts
         }
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        if pending:
+            embeddings = await self.embedding_provider.get_embeddings(
+                list(pending.values())
+            )
+            self._texts.update(zip(pending, embeddings))
+        results = [self._texts[key] for key in keys]
+        # Dicts keep insertion order, so the first keys are the oldest
+        while len(self._texts) > MAX_MEMOIZED_TEXTS:
+            del self._texts[next(iter(self._texts))]
+        return results
 
     async def get_embedding(
         self,
@@ -390,31 +628,135 @@ class DuplicateDetector:
         embedding = await self.embedding_provider.get_embedding(content)
 
         # Cache it
-        now = datetime.now(timezone.utc)
-        cache[issue_number] = CachedEmbedding(
-            issue_number=issue_number,
-            content_hash=content_hash,
-            embedding=embedding,
-            created_at=now.isoformat(),
-            expires_at=(now + timedelta(hours=self.cache_ttl_hours)).isoformat(),
-        )
-        self._save_cache(repo, cache)
+        entry = self._new_cache_entry(issue_number, content_hash, embedding)
+        cache[issue_number] = entry
+        self._append_cache(repo, [entry])
 
         return embedding
 
-    def cosine_similarity(self, a: list[float], b: list[float]) -> float:
-        """Calculate cosine similarity between two embeddings."""
-        if len(a) != len(b):
-            return 0.0
+    async def _get_embeddings(
+        self,
+        repo: str,
+        issues: list[dict[str, Any]],
+    ) -> dict[int, list[float]]:
+        """
+        Get embeddings for many issues, batching every cache miss.
+
+        Issues whose embedding fails are logged and left out.
+        """
+        cache = self._load_cache(repo)
+        embeddings: dict[int, list[float]] = {}
+        misses: dict[int, tuple[str, str]] = {}
+
+        for issue in issues:
+            number = issue["number"]
+            title = issue.get("title", "")
+            body = issue.get("body", "")
+            content_hash = self._content_hash(title, body)
+
+            cached = cache.get(number)
+            if (
+                cached
+                and cached.content_hash == content_hash
+                and not cached.is_expired()
+            ):
+                embeddings[number] = cached.embedding
+            else:
+                misses[number] = (content_hash, f"{title}\n\n{body}")
+
+        if not misses:
+            return embeddings
+
+        computed = await self._embed_batches([text for _, text in misses.values()])
+
+        new_entries = []
+        for (number, (content_hash, _)), embedding in zip(misses.items(), computed):
+            if embedding is None:
+                continue
+            entry = self._new_cache_entry(number, content_hash, embedding)
+            cache[number] = entry
+            new_entries.append(entry)
+            embeddings[number] = embedding
+
+        self._append_cache(repo, new_entries)
+        return embeddings
 
-        dot_product = sum(x * y for x, y in zip(a, b))
-        magnitude_a = sum(x * x for x in a) ** 0.5
-        magnitude_b = sum(x * x for x in b) ** 0.5
+    def _get_index(
+        self,
+        repo: str,
+        issues: list[dict[str, Any]],
+        embeddings: dict[int, list[float]],
+    ) -> EmbeddingIndex:
+        """Build (or reuse) the similarity index over the given issues."""
+        signature = tuple(
+            (
+                issue["number"],
+                self._content_hash(issue.get("title", ""), issue.get("body", "")),
+            )
+            for issue in issues
+            if issue["number"] in embeddings
+        )
+        cached = self._indexes.get(repo)
+        if cached and cached[0] == signature:
+            return cached[1]
+
+        index = self._load_index(repo, signature)
+        if index is None:
+            index = EmbeddingIndex(approximate=self.approximate_search)
+            for number, _ in signature:
+                index.add(number, embeddings[number])
+        self._indexes[repo] = (signature, index)
+        return index
+
+    def _load_index(
+        self, repo: str, signature: tuple[tuple[int, str], ...]
+    ) -> EmbeddingIndex | None:
+        """
+        Index the issues' rows straight from the binary cache file.
 
-        if magnitude_a == 0 or magnitude_b == 0:
-            return 0.0
+        The file is memory-mapped rather than rebuilt from the cached lists.
 
-        return dot_product / (magnitude_a * magnitude_b)
+        Returns:
+            None if some issue has no usable row in the file
+        """
+        if not signature:
+            return None
+        cache = self._caches.get(repo, {})
+        offsets = self._offsets.get(repo, {})
+        first = cache.get(signature[0][0])
+        dim = len(first.embedding) if first else 0
+        rows = []
+        for number, content_hash in signature:
+            cached = cache.get(number)
+            offset = offsets.get(number)
+            if (
+                dim == 0
+                or cached is None
+                or cached.content_hash != content_hash
+                or len(cached.embedding) != dim
+                or offset is None
+                or offset % dim
+            ):
+                return None
+            rows.append(offset // dim)
+
+        vectors_file, _ = self._get_cache_paths(repo)
+        try:
+            return EmbeddingIndex.load(
+                vectors_file,
+                keys=[number for number, _ in signature],
+                dim=dim,
+                approximate=self.approximate_search,
+                rows=rows,
+                normalized=False,
+            )
+        except (OSError, ValueError, IndexError) as e:
+            logger.warning(f"Could not map embedding cache for {repo}: {e}")
+            return None
+
+    def cosine_similarity(self, a: list[float], b: list[float]) -> float:
+        """Calculate cosine similarity between two embeddings."""
+        return cosine_similarity(a, b)
 
     async def compare_issues(
         self,
@@ -440,22 +782,19 @@ class DuplicateDetector:
         # Calculate embedding similarity
         overall_score = self.cosine_similarity(embed_a, embed_b)
 
-        # Get title-only embeddings
-        title_embed_a = await self.embedding_provider.get_embedding(
-            issue_a.get("title", "")
-        )
-        title_embed_b = await self.embedding_provider.get_embedding(
-            issue_b.get("title", "")
-        )
-        title_score = self.cosine_similarity(title_embed_a, title_embed_b)
-
-        # Get body-only score (if bodies exist)
+        # Title and body embeddings, fetched together in one request
         body_a = issue_a.get("body", "")
         body_b = issue_b.get("body", "")
+        texts = [issue_a.get("title", ""), issue_b.get("title", "")]
+        if body_a and body_b:
+            texts += [body_a, body_b]
+        part_embeds = await self._embed_texts(texts)
+
+        title_score = self.cosine_similarity(part_embeds[0], part_embeds[1])
+
+        # Get body-only score (if bodies exist)
         if body_a and body_b:
-            body_embed_a = await self.embedding_provider.get_embedding(body_a)
-            body_embed_b = await self.embedding_provider.get_embedding(body_b)
-            body_score = self.cosine_similarity(body_embed_a, body_embed_b)
+            body_score = self.cosine_similarity(part_embeds[2], part_embeds[3])
         else:
             body_score = 0.0
 
@@ -547,14 +886,35 @@ class DuplicateDetector:
             "title": title,
             "body": body,
         }
+        candidates = {
+            issue["number"]: issue
+            for issue in open_issues
+            if issue.get("number") != issue_number
+        }
 
-        results = []
-        for issue in open_issues:
-            if issue.get("number") == issue_number:
-                continue
+        try:
+            embeddings = await self._get_embeddings(
+                repo, [target_issue, *candidates.values()]
+            )
+        except Exception as e:
+            logger.error(f"Error comparing issues: {e}")
+            return []
+        if issue_number not in embeddings:
+            return []
+
+        # Score every candidate in one pass; only the best matches get the
+        # full per-component comparison
+        index = self._get_index(repo, list(candidates.values()), embeddings)
+        matches = index.search(
+            embeddings[issue_number], k=limit, min_score=self.similar_threshold
+        )
 
+        results = []
+        for number, _ in matches:
             try:
-                result = await self.compare_issues(repo, target_issue, issue)
+                result = await self.compare_issues(
+                    repo, target_issue, candidates[number]
+                )
                 if result.is_similar:
                     results.append(result)
             except Exception as e:
@@ -579,23 +939,13 @@ class DuplicateDetector:
         Returns:
             Number of embeddings computed
         """
-        count = 0
-        for issue in issues:
-            try:
-                await self.get_embedding(
-                    repo,
-                    issue["number"],
-                    issue.get("title", ""),
-                    issue.get("body", ""),
-                )
-                count += 1
-            except Exception as e:
-                logger.error(f"Error computing embedding for #{issue['number']}: {e}")
-
-        return count
+        embeddings = await self._get_embeddings(repo, issues)
+        return len(embeddings)
 
     def clear_cache(self, repo: str) -> None:
         """Clear embedding cache for a repo."""
-        cache_file = self._get_cache_file(repo)
-        if cache_file.exists():
-            cache_file.unlink()
+        self._caches.pop(repo, None)
+        self._offsets.pop(repo, None)
+        self._indexes.pop(repo, None)
+        for cache_file in (self._get_cache_file(repo), *self._get_cache_paths(repo)):
+            cache_file.unlink(missing_ok=True)
@@ -0,0 +1,298 @@
+"""
+Embedding Index
+===============
+
+Contiguous float32 storage and batched similarity search for issue
+embeddings, used by DuplicateDetector.
+
+Vectors are L2-normalized on insert, so cosine similarity against every
+stored embedding is one matrix-vector product. NumPy is used when it is
+installed (including memory-mapping saved or cached rows); otherwise the rows
+live in a single ``array('f')`` buffer and are scored in pure Python.
+
+For large collections an optional random-hyperplane LSH index narrows
+top-k queries to a candidate set before exact re-ranking.
+"""
+
+from __future__ import annotations
+
+import math
+import operator
+from array import array
+from pathlib import Path
+
+try:
+    import numpy as np  # type: ignore
+except ImportError:  # pragma: no cover
+    np = None
+
+# Collections smaller than this are always searched exactly
+ANN_MIN_SIZE = 2000
+
+# LSH shape: more tables raise recall, more bits shrink buckets
+ANN_TABLES = 8
+ANN_BITS = 12
+
+
+def _normalize(vector: list[float]) -> list[float]:
+    norm = math.sqrt(math.fsum(x * x for x in vector))
+    if norm == 0:
+        return [0.0] * len(vector)
+    return [x / norm for x in vector]
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    """Cosine similarity of two vectors (0.0 on length mismatch or zero norm)."""
+    if len(a) != len(b):
+        return 0.0
+
+    if np is not None:
+        va = np.asarray(a, dtype=np.float64)
+        vb = np.asarray(b, dtype=np.float64)
+        magnitude = float(np.linalg.norm(va) * np.linalg.norm(vb))
+        return float(va @ vb) / magnitude if magnitude else 0.0
+
+    dot_product = sum(map(operator.mul, a, b))
+    magnitude = math.sqrt(sum(map(operator.mul, a, a)) * sum(map(operator.mul, b, b)))
+    return dot_product / magnitude if magnitude else 0.0
+
+
+class EmbeddingIndex:
+    """
+    Normalized embeddings stored row-major in one float32 buffer.
+
+    Usage:
+        index = EmbeddingIndex()
+        index.add(101, embedding)
+        matches = index.search(query, k=5, min_score=0.7)  # [(101, 0.93)]
+    """
+
+    def __init__(self, dim: int | None = None, approximate: bool = False):
+        """
+        Initialize an empty index.
+
+        Args:
+            dim: Embedding dimension (taken from the first vector if None)
+            approximate: Use the LSH index for top-k search on large
+                collections (requires NumPy)
+        """
+        self.dim = dim
+        self.approximate = approximate and np is not None
+        self.keys: list[int] = []
+        self._rows = array("f")
+        self._matrix = None  # NumPy view of _rows, rebuilt lazily
+        self._scale = None  # Per-row 1/norm for rows loaded unnormalized
+        self._lsh = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: int, vector: list[float]) -> bool:
+        """
+        Append a vector.
+
+        Returns:
+            False if the vector's dimension doesn't match the index
+        """
+        if self.dim is None:
+            self.dim = len(vector)
+        if len(vector) != self.dim:
+            return False
+
+        rows = self._writable_rows()
+        # Drop the NumPy view first; a buffer with live views can't grow
+        self._matrix = None
+        self._lsh = None
+        rows.extend(_normalize(vector))
+        self.keys.append(key)
+        return True
+
+    def scores(self, query: list[float]) -> list[float]:
+        """
+        Cosine similarity of the query against every stored vector.
+
+        Returns:
+            Scores in insertion order (all 0.0 on dimension mismatch)
+        """
+        if not self.keys:
+            return []
+        if len(query) != self.dim:
+            return [0.0] * len(self.keys)
+
+        q = _normalize(query)
+        if np is not None:
+            scores = self._as_matrix() @ np.asarray(q, dtype=np.float32)
+            if self._scale is not None:
+                scores *= self._scale
+            return scores.tolist()
+
+        rows = self._writable_rows()
+        dim = self.dim
+        return [
+            sum(map(operator.mul, rows[i * dim : (i + 1) * dim], q))
+            for i in range(len(self.keys))
+        ]
+
+    def search(
+        self,
+        query: list[float],
+        k: int,
+        min_score: float = -1.0,
+        exclude: set[int] | None = None,
+    ) -> list[tuple[int, float]]:
+        """
+        Return the k most similar keys.
+
+        Args:
+            query: Query embedding
+            k: Maximum number of results
+            min_score: Drop results scoring below this
+            exclude: Keys to skip (e.g. the query's own issue)
+
+        Returns:
+            (key, score) pairs, best first
+        """
+        if not self.keys or k <= 0 or len(query) != self.dim:
+            return []
+
+        candidates = None
+        if self.approximate and len(self.keys) >= ANN_MIN_SIZE:
+            candidates = self._lsh_candidates(query)
+
+        if candidates is not None:
+            q = np.asarray(_normalize(query), dtype=np.float32)
+            candidate_scores = self._as_matrix()[candidates] @ q
+            if self._scale is not None:
+                candidate_scores *= self._scale[candidates]
+            scored = zip(candidates.tolist(), candidate_scores.tolist())
+        else:
+            scored = enumerate(self.scores(query))
+
+        results = [
+            (self.keys[row], score)
+            for row, score in scored
+            if score >= min_score and not (exclude and self.keys[row] in exclude)
+        ]
+        results.sort(key=lambda item: item[1], reverse=True)
+        return results[:k]
+
+    def save(self, path: Path) -> None:
+        """Write the vectors as raw float32 rows."""
+        with open(path, "wb") as f:
+            self._writable_rows().tofile(f)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        keys: list[int],
+        dim: int,
+        approximate: bool = False,
+        rows: list[int] | None = None,
+        normalized: bool = True,
+    ) -> EmbeddingIndex:
+        """
+        Load float32 rows from a file, memory-mapping it when NumPy is present.
+
+        Args:
+            path: File of raw float32 rows (e.g. written by save())
+            keys: Key for each loaded row
+            dim: Embedding dimension
+            approximate: See __init__
+            rows: Row number in the file for each key (default: the first
+                len(keys) rows, in order)
+            normalized: False if the rows aren't unit length, e.g. the
+                provider embeddings in DuplicateDetector's cache file
+
+        Raises:
+            IndexError: If a row lies past the end of the file
+        """
+        index = cls(dim=dim, approximate=approximate)
+        index.keys = list(keys)
+        if rows is None:
+            rows = list(range(len(keys)))
+
+        if np is not None:
+            row_count = path.stat().st_size // (4 * dim)
+            matrix = np.memmap(path, dtype=np.float32, mode="r", shape=(row_count, dim))
+            if rows == list(range(len(keys))):
+                index._matrix = matrix[: len(keys)]
+                if len(index._matrix) < len(keys):
+                    raise IndexError("row out of range")
+            else:
+                # Gather the selected rows out of the mapping
+                index._matrix = matrix[np.asarray(rows, dtype=np.int64)]
+            if not normalized:
+                norms = np.linalg.norm(index._matrix, axis=1)
+                index._scale = np.divide(
+                    1.0, norms, out=np.zeros_like(norms), where=norms > 0
+                )
+            index._rows = None
+        else:
+            stored = array("f")
+            with open(path, "rb") as f:
+                stored.frombytes(f.read())
+            for row in rows:
+                vector = stored[row * dim : (row + 1) * dim]
+                if len(vector) < dim:
+                    raise IndexError("row out of range")
+                index._rows.extend(vector if normalized else _normalize(vector))
+        return index
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _writable_rows(self) -> array:
+        """Return the row buffer, copying out of a memory-mapped load."""
+        if self._rows is None:
+            matrix = self._matrix
+            if self._scale is not None:
+                matrix = matrix * self._scale[:, None]
+            self._rows = array("f")
+            self._rows.frombytes(
+                np.ascontiguousarray(matrix, dtype=np.float32).tobytes()
+            )
+            self._matrix = None
+            self._scale = None
+        return self._rows
+
+    def _as_matrix(self):
+        if self._matrix is None:
+            self._matrix = np.frombuffer(self._rows, dtype=np.float32).reshape(
+                len(self.keys), self.dim
+            )
+        return self._matrix
+
+    def _lsh_candidates(self, query: list[float]):
+        """Rows sharing an LSH bucket with the query in any table."""
+        if self._lsh is None:
+            self._build_lsh()
+        planes, weights, tables = self._lsh
+
+        q = np.asarray(query, dtype=np.float32)
+        codes = ((planes @ q) > 0).astype(np.int64) @ weights
+        rows = [tables[t].get(int(code)) for t, code in enumerate(codes)]
+        rows = [r for r in rows if r is not None]
+        if not rows:
+            return None
+        return np.unique(np.concatenate(rows))
+
+    def _build_lsh(self) -> None:
+        rng = np.random.default_rng(0)
+        planes = rng.standard_normal((ANN_TABLES, ANN_BITS, self.dim)).astype(
+            np.float32
+        )
+        weights = 1 << np.arange(ANN_BITS, dtype=np.int64)
+
+        matrix = self._as_matrix()
+        tables = []
+        for table_planes in planes:
+            # Sign of each hyperplane projection -> one bucket code per row
+            codes = ((matrix @ table_planes.T) > 0).astype(np.int64) @ weights
+            order = np.argsort(codes, kind="stable")
+            sorted_codes = codes[order]
+            starts = np.flatnonzero(np.r_[True, np.diff(sorted_codes) != 0])
+            groups = np.split(order, starts[1:])
+            tables.append({int(sorted_codes[s]): g for s, g in zip(starts, groups)})
+        self._lsh = (planes, weights, tables)
@@ -16,6 +16,10 @@ Example Usage:
     async with locked_write("path/to/file.json", timeout=5.0) as f:
         json.dump(data, f)
 
+Async acquisitions queue behind other coroutines in the same process on an
+in-process wait list, so flock() is taken once and handed from holder to
+holder; only contention with other processes is polled. Per-file wait
+times and holder counts are available from get_lock_stats().
 """
 
 from __future__ import annotations
@@ -24,10 +28,14 @@ import asyncio
 import json
 import os
 import tempfile
+import threading
 import time
 import warnings
+import weakref
+from collections import deque
 from collections.abc import Callable
 from contextlib import asynccontextmanager, contextmanager
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
@@ -44,6 +52,10 @@ try:
 except ImportError:  # pragma: no cover
     msvcrt = None
 
+# Backoff (seconds) for async waiters polling a lock held by another process
+_POLL_INITIAL = 0.001
+_POLL_MAX = 0.05
+
 
 def _try_lock(fd: int, exclusive: bool) -> None:
     if _IS_WINDOWS:
@@ -136,6 +148,7 @@ class FileLock:
         self.exclusive = exclusive
         self._lock_file: Path | None = None
         self._fd: int | None = None
+        self._async_lock: _AsyncFileLock | None = None
 
     def _get_lock_file(self) -> Path:
         """Get lock file path (separate .lock file)."""
@@ -200,17 +213,280 @@ class FileLock:
         return False
 
     async def __aenter__(self):
-        """Async context manager entry."""
-        # Run blocking lock acquisition in thread pool
-        await asyncio.get_running_loop().run_in_executor(None, self._acquire_lock)
+        """Async context manager entry (waits on the event loop, not a thread)."""
+        lock = _get_async_lock(self.filepath, self._get_lock_file())
+        await lock.acquire(self.exclusive, self.timeout)
+        self._async_lock = lock
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await asyncio.get_running_loop().run_in_executor(None, self._release_lock)
+        if self._async_lock is not None:
+            self._async_lock.release()
+            self._async_lock = None
         return False
 
 
+@dataclass
+class LockStats:
+    """Contention counters for one locked file (async acquisitions)."""
+
+    acquisitions: int = 0
+    contended: int = 0  # Acquisitions that had to wait
+    timeouts: int = 0
+    flock_acquisitions: int = 0  # Times the OS lock was actually taken
+    handoffs: int = 0  # Releases passed straight to an in-process waiter
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    holders: int = 0
+    waiters: int = 0
+
+    @property
+    def avg_wait(self) -> float:
+        if self.acquisitions == 0:
+            return 0.0
+        return self.total_wait / self.acquisitions
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "avg_wait": self.avg_wait}
+
+
+# Locks are per event loop: futures can't be shared across loops, and
+# coroutines on different loops still exclude each other through flock()
+_registry_lock = threading.Lock()
+_async_locks: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, _AsyncFileLock]
+] = weakref.WeakKeyDictionary()
+_lock_stats: dict[str, LockStats] = {}
+
+
+def get_lock_stats() -> dict[str, dict[str, Any]]:
+    """
+    Contention metrics for every file locked asynchronously in this process.
+
+    Returns:
+        Mapping of file path to LockStats.to_dict()
+    """
+    with _registry_lock:
+        return {path: stats.to_dict() for path, stats in _lock_stats.items()}
+
+
+def reset_lock_stats() -> None:
+    """Clear contention metrics (current holders and waiters are kept)."""
+    with _registry_lock:
+        for stats in _lock_stats.values():
+            stats.__init__(holders=stats.holders, waiters=stats.waiters)
+
+
+def _get_async_lock(filepath: Path, lock_file: Path) -> _AsyncFileLock:
+    key = os.path.abspath(filepath)
+    loop = asyncio.get_running_loop()
+    with _registry_lock:
+        locks = _async_locks.setdefault(loop, {})
+        lock = locks.get(key)
+        if lock is None:
+            stats = _lock_stats.setdefault(key, LockStats())
+            lock = locks[key] = _AsyncFileLock(key, lock_file, stats, locks)
+        return lock
+
+
+class _AsyncFileLock:
+    """
+    In-process coordination for one lock file on one event loop.
+
+    The first coroutine takes the OS lock; later ones wait on futures and
+    are granted the lock directly when the holder releases it (or join it,
+    for shared locks), so flock() is only released once nobody in this
+    process is waiting.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        lock_file: Path,
+        stats: LockStats,
+        registry: dict[str, _AsyncFileLock],
+    ):
+        self.key = key
+        self.lock_file = lock_file
+        self.stats = stats
+        self._registry = registry
+        self._fd: int | None = None
+        self._exclusive: bool | None = None  # Mode of the held flock
+        self._holders = 0
+        self._acquiring = False  # A waiter is taking the flock
+        self._waiters: deque[tuple[asyncio.Future, bool]] = deque()
+
+    async def acquire(self, exclusive: bool, timeout: float) -> None:
+        start = time.monotonic()
+        deadline = start + timeout
+        contended = False
+
+        if not exclusive and self._exclusive is False and not self._waiters:
+            # Join the shared lock already held by this process
+            self._grant(None)
+            self._record_wait(start, contended)
+            return
+
+        if self._holders or self._waiters or self._acquiring:
+            contended = True
+            if await self._wait(exclusive, deadline, timeout):
+                self._record_wait(start, contended)
+                return
+            # Woken to take the flock ourselves
+        else:
+            self._acquiring = True
+
+        try:
+            await self._lock_os(exclusive, deadline, timeout)
+        except BaseException:
+            self._acquiring = False
+            self._wake()
+            raise
+        self._acquiring = False
+        self._grant(None)
+        self._record_wait(start, contended)
+
+    def release(self) -> None:
+        self._holders -= 1
+        self.stats.holders -= 1
+        if self._holders == 0:
+            self._wake()
+
+    async def _wait(self, exclusive: bool, deadline: float, timeout: float) -> bool:
+        """
+        Queue behind in-process holders.
+
+        Returns:
+            True if the lock was handed over, False if this waiter should
+            take the flock itself
+        """
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, exclusive)
+        self._waiters.append(entry)
+        self.stats.waiters += 1
+        try:
+            await asyncio.wait({future}, timeout=max(0.0, deadline - time.monotonic()))
+        except BaseException:
+            self._abandon(entry)
+            raise
+
+        if not future.done():
+            self._abandon(entry)
+            self.stats.timeouts += 1
+            raise FileLockTimeout(
+                f"Failed to acquire lock on {self.key} within {timeout}s"
+            )
+        return future.result()
+
+    def _abandon(self, entry: tuple[asyncio.Future, bool]) -> None:
+        """Drop a waiter that timed out or was cancelled."""
+        future, _ = entry
+        if not future.done():
+            future.cancel()
+            self._waiters.remove(entry)
+            self.stats.waiters -= 1
+        elif future.result():
+            # Granted just as we gave up; pass it on
+            self.release()
+        else:
+            self._acquiring = False
+            self._wake()
+
+    async def _lock_os(self, exclusive: bool, deadline: float, timeout: float) -> None:
+        """Take flock(), polling with backoff while another process holds it."""
+        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(self.lock_file), os.O_CREAT | os.O_RDWR)
+        delay = _POLL_INITIAL
+        try:
+            while True:
+                try:
+                    _try_lock(fd, exclusive)
+                    break
+                except (BlockingIOError, OSError):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.stats.timeouts += 1
+                        raise FileLockTimeout(
+                            f"Failed to acquire lock on {self.key} within {timeout}s"
+                        )
+                    await asyncio.sleep(min(delay, remaining))
+                    delay = min(delay * 2, _POLL_MAX)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        self._fd = fd
+        self._exclusive = exclusive
+        self.stats.flock_acquisitions += 1
+
+    def _grant(self, future: asyncio.Future | None) -> None:
+        self._holders += 1
+        self.stats.holders += 1
+        if future is not None:
+            future.set_result(True)
+
+    def _record_wait(self, start: float, contended: bool) -> None:
+        wait = time.monotonic() - start
+        self.stats.acquisitions += 1
+        self.stats.total_wait += wait
+        self.stats.max_wait = max(self.stats.max_wait, wait)
+        if contended:
+            self.stats.contended += 1
+
+    def _wake(self) -> None:
+        """Pass the lock to the next waiter once there are no holders."""
+        if self._holders or self._acquiring:
+            return
+
+        while self._waiters and self._waiters[0][0].done():
+            self._waiters.popleft()
+            self.stats.waiters -= 1
+
+        if not self._waiters:
+            self._unlock_os()
+            if self._registry.get(self.key) is self:
+                with _registry_lock:
+                    del self._registry[self.key]
+            return
+
+        future, exclusive = self._waiters[0]
+        if self._fd is not None and exclusive == self._exclusive:
+            # Hand the held flock over: one writer, or every leading reader
+            while self._waiters and self._waiters[0][1] == exclusive:
+                future, _ = self._waiters.popleft()
+                self.stats.waiters -= 1
+                self.stats.handoffs += 1
+                self._grant(future)
+                if exclusive:
+                    break
+            return
+
+        # Different mode: drop our flock and let the waiter take it afresh
+        self._unlock_os()
+        self._waiters.popleft()
+        self.stats.waiters -= 1
+        self._acquiring = True
+        future.set_result(False)
+
+    def _unlock_os(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            _unlock(self._fd)
+            os.close(self._fd)
+        except Exception:
+            pass  # Best effort cleanup
+        finally:
+            self._fd = None
+            self._exclusive = None
+
+        try:
+            self.lock_file.unlink()
+        except Exception:
+            pass  # Best effort cleanup
+
+
 @contextmanager
 def atomic_write(filepath: str | Path, mode: str = "w", encoding: str = "utf-8"):
     """
@@ -0,0 +1,141 @@
+"""
+Batched Git Object Access
+=========================
+
+Reads many blobs through a single long-lived ``git cat-file --batch``
+process and splits one multi-path ``git diff`` into per-file patches, so
+gathering context for a large PR costs a couple of process round-trips
+instead of several subprocesses per changed file.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+
+class GitBatchError(Exception):
+    """Raised when the cat-file batch process fails or misbehaves."""
+
+
+class GitBatchReader:
+    """
+    Async wrapper around ``git cat-file --batch``.
+
+    Usage:
+        async with GitBatchReader(project_dir) as reader:
+            blobs = await reader.read_many(["HEAD:README.md", "main:setup.py"])
+    """
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = Path(project_dir)
+        self._proc: asyncio.subprocess.Process | None = None
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> GitBatchReader:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """Start the cat-file process."""
+        self._proc = await asyncio.create_subprocess_exec(
+            "git",
+            "cat-file",
+            "--batch",
+            cwd=self.project_dir,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+
+    async def close(self) -> None:
+        """Stop the cat-file process."""
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        try:
+            proc.stdin.close()
+            await asyncio.wait_for(proc.wait(), timeout=5.0)
+        except (asyncio.TimeoutError, OSError):
+            proc.kill()
+            await proc.wait()
+
+    async def read_many(self, object_names: list[str]) -> list[bytes | None]:
+        """
+        Read several objects in one pipelined exchange.
+
+        Args:
+            object_names: Object names such as "<ref>:<path>"; must not
+                contain newlines
+
+        Returns:
+            Object contents in request order; None for missing objects
+        """
+        if self._proc is None:
+            raise GitBatchError("cat-file process is not running")
+        if not object_names:
+            return []
+
+        async with self._lock:
+            request = "".join(f"{name}\n" for name in object_names).encode("utf-8")
+            # Write and read concurrently so a full stdout pipe can't stall stdin
+            _, results = await asyncio.gather(
+                self._write(request),
+                self._read_responses(len(object_names)),
+            )
+            return results
+
+    async def _write(self, request: bytes) -> None:
+        self._proc.stdin.write(request)
+        await self._proc.stdin.drain()
+
+    async def _read_responses(self, count: int) -> list[bytes | None]:
+        stdout = self._proc.stdout
+        results: list[bytes | None] = []
+        for _ in range(count):
+            header = await stdout.readline()
+            if not header:
+                raise GitBatchError("cat-file process exited unexpectedly")
+
+            parts = header.split()
+            if len(parts) == 3:
+                size = int(parts[2])
+                # Content is followed by a single LF
+                data = await stdout.readexactly(size + 1)
+                results.append(data[:-1])
+            elif parts and parts[-1] in (b"missing", b"ambiguous"):
+                results.append(None)
+            else:
+                raise GitBatchError(f"Unexpected cat-file header: {header!r}")
+        return results
+
+
+def split_diff_by_file(diff: str) -> dict[str, str]:
+    """
+    Split a multi-file unified diff into per-file patches.
+
+    Expects output from ``git diff --no-renames``, so each section's old and
+    new paths are the same.
+
+    Returns:
+        Dict mapping file path to that file's patch (including its header)
+    """
+    patches: dict[str, str] = {}
+    current_path: str | None = None
+    current: list[str] = []
+
+    for line in diff.splitlines(keepends=True):
+        if line.startswith("diff --git "):
+            if current_path is not None:
+                patches[current_path] = "".join(current)
+            current_path = line.rstrip("\n").rpartition(" b/")[2]
+            current = []
+        if current_path is not None:
+            current.append(line)
+
+    if current_path is not None:
+        patches[current_path] = "".join(current)
+    return patches
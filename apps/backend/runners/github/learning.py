@@ -32,6 +32,15 @@ from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .file_lock import FileLock, atomic_write
+except (ImportError, ValueError, SystemError):
+    from file_lock import FileLock, atomic_write
+
+# Compact an outcome log once superseded lines reach this count (or the
+# number of live outcomes, whichever is larger)
+OUTCOMES_COMPACT_MIN_STALE = 256
+
 
 class PredictionType(str, Enum):
     """Types of predictions the system makes."""
@@ -255,10 +264,95 @@ class LearningPattern:
         }
 
 
+@dataclass
+class _AccuracyBucket:
+    """Running accuracy counters for one (day, prediction type) slice."""
+
+    total: int = 0
+    correct: int = 0
+    incorrect: int = 0
+    pending: int = 0
+    merge_count: int = 0
+    merge_seconds: float = 0.0
+
+    def add(self, outcome: ReviewOutcome, sign: int = 1) -> None:
+        """Count an outcome in (sign=1) or back out (sign=-1)."""
+        self.total += sign
+        if not outcome.is_complete:
+            self.pending += sign
+            return
+
+        was_correct = outcome.was_correct
+        if was_correct is True:
+            self.correct += sign
+        elif was_correct is False:
+            self.incorrect += sign
+
+        if outcome.actual_outcome == OutcomeType.MERGED and outcome.time_to_outcome:
+            self.merge_count += sign
+            self.merge_seconds += sign * outcome.time_to_outcome.total_seconds()
+
+    def merge(self, other: _AccuracyBucket) -> None:
+        self.total += other.total
+        self.correct += other.correct
+        self.incorrect += other.incorrect
+        self.pending += other.pending
+        self.merge_count += other.merge_count
+        self.merge_seconds += other.merge_seconds
+
+
+def _day_key(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).date().isoformat()
+
+
+@dataclass
+class _RepoOutcomes:
+    """Outcomes loaded from one repo's event log, plus rolling aggregates."""
+
+    outcomes: dict[str, ReviewOutcome] = field(default_factory=dict)
+    # (created day, prediction type) -> counters, kept in step with outcomes
+    buckets: dict[tuple[str, str], _AccuracyBucket] = field(default_factory=dict)
+    by_day: dict[str, set[str]] = field(default_factory=dict)
+    lines: int = 0  # Event lines in the log file
+
+    @property
+    def stale(self) -> int:
+        return self.lines - len(self.outcomes)
+
+    def put(self, outcome: ReviewOutcome) -> None:
+        previous = self.outcomes.get(outcome.review_id)
+        if previous is not None:
+            self.remove(previous)
+
+        self.outcomes[outcome.review_id] = outcome
+        day = _day_key(outcome.created_at)
+        key = (day, outcome.prediction.value)
+        self.buckets.setdefault(key, _AccuracyBucket()).add(outcome)
+        self.by_day.setdefault(day, set()).add(outcome.review_id)
+
+    def remove(self, outcome: ReviewOutcome) -> None:
+        del self.outcomes[outcome.review_id]
+        day = _day_key(outcome.created_at)
+        key = (day, outcome.prediction.value)
+        bucket = self.buckets[key]
+        bucket.add(outcome, sign=-1)
+        if bucket.total == 0:
+            del self.buckets[key]
+        self.by_day[day].discard(outcome.review_id)
+        if not self.by_day[day]:
+            del self.by_day[day]
+
+
 class LearningTracker:
     """
     Tracks predictions and outcomes to enable learning.
 
+    Each repo has an append-only event log (one outcome snapshot per line,
+    later lines superseding earlier ones) that is compacted once superseded
+    lines outnumber live outcomes. Logs are read the first time a repo is
+    queried, and accuracy counters are kept per (day, prediction type) so
+    get_accuracy() doesn't walk every outcome.
+
     Usage:
         tracker = LearningTracker(state_dir=Path(".auto-claude/github"))
 
@@ -288,42 +382,100 @@ class LearningTracker:
         self.learning_dir = state_dir / "learning"
         self.learning_dir.mkdir(parents=True, exist_ok=True)
 
-        self._outcomes: dict[str, ReviewOutcome] = {}
-        self._load_outcomes()
+        # Keyed by file-safe repo name, filled on first access
+        self._repos: dict[str, _RepoOutcomes] = {}
 
-    def _get_outcomes_file(self, repo: str) -> Path:
-        safe_name = repo.replace("/", "_")
+    @staticmethod
+    def _safe_name(repo: str) -> str:
+        return repo.replace("/", "_")
+
+    def _get_outcomes_file(self, safe_name: str) -> Path:
+        """Append-only outcome event log for a repo."""
+        return self.learning_dir / f"{safe_name}_outcomes.jsonl"
+
+    def _get_legacy_file(self, safe_name: str) -> Path:
         return self.learning_dir / f"{safe_name}_outcomes.json"
 
-    def _load_outcomes(self) -> None:
-        """Load all outcomes from disk."""
-        for file in self.learning_dir.glob("*_outcomes.json"):
+    def _load_repo(self, safe_name: str) -> _RepoOutcomes:
+        """Load a repo's outcomes (once per tracker), migrating the JSON file."""
+        if safe_name in self._repos:
+            return self._repos[safe_name]
+
+        state = _RepoOutcomes()
+        events_file = self._get_outcomes_file(safe_name)
+        legacy_file = self._get_legacy_file(safe_name)
+
+        if events_file.exists():
+            damaged = False
+            with open(events_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        outcome = ReviewOutcome.from_dict(json.loads(line))
+                    except (json.JSONDecodeError, KeyError, ValueError):
+                        # e.g. a partial line from an interrupted append
+                        damaged = True
+                        continue
+                    state.put(outcome)
+                    state.lines += 1
+            if damaged or state.stale >= max(
+                OUTCOMES_COMPACT_MIN_STALE, len(state.outcomes)
+            ):
+                self._compact(safe_name, state)
+        elif legacy_file.exists():
             try:
-                with open(file, encoding="utf-8") as f:
-                    data = json.load(f)
-                    for item in data.get("outcomes", []):
-                        outcome = ReviewOutcome.from_dict(item)
-                        self._outcomes[outcome.review_id] = outcome
-            except (json.JSONDecodeError, KeyError):
-                continue
+                with open(legacy_file, encoding="utf-8") as f:
+                    items = json.load(f).get("outcomes", [])
+            except json.JSONDecodeError:
+                items = []
+            for item in items:
+                try:
+                    state.put(ReviewOutcome.from_dict(item))
+                except (KeyError, ValueError):
+                    continue
+            self._compact(safe_name, state)
+            legacy_file.unlink()
+
+        self._repos[safe_name] = state
+        return state
+
+    def _repo_states(self, repo: str | None) -> list[_RepoOutcomes]:
+        """Loaded outcome sets for one repo, or every repo on disk."""
+        if repo:
+            return [self._load_repo(self._safe_name(repo))]
 
-    def _save_outcomes(self, repo: str) -> None:
-        """Save outcomes for a repo to disk with file locking for concurrency safety."""
-        from .file_lock import FileLock, atomic_write
+        names = set(self._repos)
+        for pattern in ("*_outcomes.jsonl", "*_outcomes.json"):
+            for file in self.learning_dir.glob(pattern):
+                names.add(file.stem.removesuffix("_outcomes"))
+        return [self._load_repo(name) for name in sorted(names)]
 
-        file = self._get_outcomes_file(repo)
-        repo_outcomes = [o for o in self._outcomes.values() if o.repo == repo]
+    def _iter_outcomes(self, repo: str | None = None):
+        for state in self._repo_states(repo):
+            yield from state.outcomes.values()
 
-        data = {
-            "repo": repo,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "outcomes": [o.to_dict() for o in repo_outcomes],
-        }
+    def _append_outcome(self, repo: str, outcome: ReviewOutcome) -> None:
+        """Append one outcome snapshot to the repo's event log."""
+        safe_name = self._safe_name(repo)
+        state = self._load_repo(safe_name)
+        file = self._get_outcomes_file(safe_name)
+
+        # The lock keeps appends from landing in a file being compacted
+        with FileLock(file, timeout=5.0):
+            with open(file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(outcome.to_dict()) + "\n")
+        state.lines += 1
+
+        if state.stale >= max(OUTCOMES_COMPACT_MIN_STALE, len(state.outcomes)):
+            self._compact(safe_name, state)
 
-        # Use file locking and atomic write for safe concurrent access
+    def _compact(self, safe_name: str, state: _RepoOutcomes) -> None:
+        """Rewrite a repo's event log with one line per live outcome."""
+        file = self._get_outcomes_file(safe_name)
         with FileLock(file, timeout=5.0):
             with atomic_write(file) as f:
-                json.dump(data, f, indent=2)
+                for outcome in state.outcomes.values():
+                    f.write(json.dumps(outcome.to_dict()) + "\n")
+        state.lines = len(state.outcomes)
 
     def record_prediction(
         self,
@@ -366,8 +518,8 @@ class LearningTracker:
             categories=categories or [],
         )
 
-        self._outcomes[review_id] = outcome
-        self._save_outcomes(repo)
+        self._load_repo(self._safe_name(repo)).put(outcome)
+        self._append_outcome(repo, outcome)
 
         return outcome
 
@@ -392,27 +544,26 @@ class LearningTracker:
         Returns:
             Updated ReviewOutcome or None if not found
         """
-        if review_id not in self._outcomes:
+        state = self._load_repo(self._safe_name(repo))
+        review_outcome = state.outcomes.get(review_id)
+        if review_outcome is None:
             return None
 
-        review_outcome = self._outcomes[review_id]
+        # Back the old values out of the aggregates before updating in place
+        state.remove(review_outcome)
         review_outcome.actual_outcome = outcome
         review_outcome.time_to_outcome = time_to_outcome
         review_outcome.author_response = author_response
         review_outcome.outcome_recorded_at = datetime.now(timezone.utc)
+        state.put(review_outcome)
 
-        self._save_outcomes(repo)
+        self._append_outcome(repo, review_outcome)
 
         return review_outcome
 
     def get_pending_outcomes(self, repo: str | None = None) -> list[ReviewOutcome]:
         """Get predictions that don't have outcomes yet."""
-        pending = []
-        for outcome in self._outcomes.values():
-            if not outcome.is_complete:
-                if repo is None or outcome.repo == repo:
-                    pending.append(outcome)
-        return pending
+        return [o for o in self._iter_outcomes(repo) if not o.is_complete]
 
     def get_accuracy(
         self,
@@ -431,48 +582,49 @@ class LearningTracker:
         Returns:
             AccuracyStats with aggregated metrics
         """
-        stats = AccuracyStats()
-        merge_times = []
-
-        for outcome in self._outcomes.values():
-            # Apply filters
-            if repo and outcome.repo != repo:
-                continue
-            if since and outcome.created_at < since:
-                continue
-            if prediction_type and outcome.prediction != prediction_type:
-                continue
+        type_filter = prediction_type.value if prediction_type else None
+        since_day = _day_key(since) if since else None
+        by_type: dict[str, _AccuracyBucket] = {}
+
+        for state in self._repo_states(repo):
+            for (day, type_key), bucket in state.buckets.items():
+                if type_filter and type_key != type_filter:
+                    continue
+                # The day `since` falls on is filtered per outcome below
+                if since_day and day <= since_day:
+                    continue
+                by_type.setdefault(type_key, _AccuracyBucket()).merge(bucket)
+
+            for review_id in state.by_day.get(since_day, ()):
+                outcome = state.outcomes[review_id]
+                if outcome.created_at < since:
+                    continue
+                if type_filter and outcome.prediction.value != type_filter:
+                    continue
+                by_type.setdefault(outcome.prediction.value, _AccuracyBucket()).add(
+                    outcome
+                )
 
-            stats.total_predictions += 1
-
-            # Track by type
-            type_key = outcome.prediction.value
-            if type_key not in stats.by_type:
-                stats.by_type[type_key] = {"total": 0, "correct": 0, "incorrect": 0}
-            stats.by_type[type_key]["total"] += 1
-
-            if outcome.is_complete:
-                was_correct = outcome.was_correct
-                if was_correct is True:
-                    stats.correct_predictions += 1
-                    stats.by_type[type_key]["correct"] += 1
-                elif was_correct is False:
-                    stats.incorrect_predictions += 1
-                    stats.by_type[type_key]["incorrect"] += 1
-
-                # Track merge times
-                if (
-                    outcome.actual_outcome == OutcomeType.MERGED
-                    and outcome.time_to_outcome
-                ):
-                    merge_times.append(outcome.time_to_outcome)
-            else:
-                stats.pending_outcomes += 1
+        stats = AccuracyStats()
+        totals = _AccuracyBucket()
+        for type_key, bucket in by_type.items():
+            totals.merge(bucket)
+            stats.by_type[type_key] = {
+                "total": bucket.total,
+                "correct": bucket.correct,
+                "incorrect": bucket.incorrect,
+            }
+
+        stats.total_predictions = totals.total
+        stats.correct_predictions = totals.correct
+        stats.incorrect_predictions = totals.incorrect
+        stats.pending_outcomes = totals.pending
 
         # Calculate average merge time
-        if merge_times:
-            avg_seconds = sum(t.total_seconds() for t in merge_times) / len(merge_times)
-            stats.avg_time_to_merge = timedelta(seconds=avg_seconds)
+        if totals.merge_count:
+            stats.avg_time_to_merge = timedelta(
+                seconds=totals.merge_seconds / totals.merge_count
+            )
 
         return stats
 
@@ -482,11 +634,7 @@ class LearningTracker:
         limit: int = 50,
     ) -> list[ReviewOutcome]:
         """Get recent outcomes, most recent first."""
-        outcomes = list(self._outcomes.values())
-
-        if repo:
-            outcomes = [o for o in outcomes if o.repo == repo]
-
+        outcomes = list(self._iter_outcomes(repo))
         outcomes.sort(key=lambda o: o.created_at, reverse=True)
         return outcomes[:limit]
 
@@ -506,7 +654,7 @@ class LearningTracker:
 
         # Pattern: Accuracy by file type
         by_file_type: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in self._iter_outcomes():
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -538,7 +686,7 @@ class LearningTracker:
 
         # Pattern: Accuracy by category
         by_category: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in self._iter_outcomes():
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -570,7 +718,7 @@ class LearningTracker:
 
         # Pattern: Accuracy by change size
         by_size: dict[str, dict[str, int]] = {}
-        for outcome in self._outcomes.values():
+        for outcome in self._iter_outcomes():
             if not outcome.is_complete or outcome.was_correct is None:
                 continue
 
@@ -9,17 +9,23 @@ Prevents conflicting operations:
 - Blocks auto-fix if triage = spam/duplicate
 - Requires triage before auto-fix
 - Auto-generated PRs must pass AI review before human notification
+
+Lifecycles are stored in the SQLite state store (state_store.py).
 """
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+try:
+    from .state_store import KIND_LIFECYCLE, get_state_store
+except (ImportError, ValueError, SystemError):
+    from state_store import KIND_LIFECYCLE, get_state_store
+
 
 class IssueLifecycleState(str, Enum):
     """Unified issue lifecycle states."""
@@ -396,21 +402,13 @@ class LifecycleManager:
 
     def __init__(self, state_dir: Path):
         self.state_dir = state_dir
-        self.lifecycle_dir = state_dir / "lifecycle"
-        self.lifecycle_dir.mkdir(parents=True, exist_ok=True)
-
-    def _get_file(self, repo: str, issue_number: int) -> Path:
-        safe_repo = repo.replace("/", "_")
-        return self.lifecycle_dir / f"{safe_repo}_{issue_number}.json"
+        self.store = get_state_store(state_dir)
 
     def get(self, repo: str, issue_number: int) -> IssueLifecycle | None:
         """Get lifecycle for an issue."""
-        file = self._get_file(repo, issue_number)
-        if not file.exists():
+        data = self.store.get(KIND_LIFECYCLE, repo, issue_number)
+        if data is None:
             return None
-
-        with open(file, encoding="utf-8") as f:
-            data = json.load(f)
         return IssueLifecycle.from_dict(data)
 
     def get_or_create(self, repo: str, issue_number: int) -> IssueLifecycle:
@@ -425,9 +423,14 @@ class LifecycleManager:
 
     def save(self, lifecycle: IssueLifecycle) -> None:
         """Save lifecycle state."""
-        file = self._get_file(lifecycle.repo, lifecycle.issue_number)
-        with open(file, "w", encoding="utf-8") as f:
-            json.dump(lifecycle.to_dict(), f, indent=2)
+        self.store.put(
+            KIND_LIFECYCLE,
+            lifecycle.repo,
+            lifecycle.issue_number,
+            lifecycle.to_dict(),
+            state=lifecycle.current_state.value,
+            updated_at=lifecycle.updated_at,
+        )
 
     def transition(
         self,
@@ -505,27 +508,9 @@ class LifecycleManager:
         state: IssueLifecycleState,
     ) -> list[IssueLifecycle]:
         """Get all issues in a specific state."""
-        results = []
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file, encoding="utf-8") as f:
-                data = json.load(f)
-                lifecycle = IssueLifecycle.from_dict(data)
-                if lifecycle.current_state == state:
-                    results.append(lifecycle)
-
-        return results
+        records = self.store.query(KIND_LIFECYCLE, repo=repo, states=[state.value])
+        return [IssueLifecycle.from_dict(data) for data in records]
 
     def get_summary(self, repo: str) -> dict[str, int]:
         """Get count of issues by state."""
-        counts: dict[str, int] = {}
-        safe_repo = repo.replace("/", "_")
-
-        for file in self.lifecycle_dir.glob(f"{safe_repo}_*.json"):
-            with open(file, encoding="utf-8") as f:
-                data = json.load(f)
-                state = data.get("current_state", "new")
-                counts[state] = counts.get(state, 0) + 1
-
-        return counts
+        return self.store.count_by_state(KIND_LIFECYCLE, repo=repo)
@@ -6,6 +6,7 @@ Data structures for GitHub automation features.
 Stored in .auto-claude/github/pr/ and .auto-claude/github/issues/
 
 All save() operations use file locking to prevent corruption in concurrent scenarios.
+Saved entities are also indexed in the SQLite state store (state_store.py).
 """
 
 from __future__ import annotations
@@ -17,9 +18,11 @@ from enum import Enum
 from pathlib import Path
 
 try:
-    from .file_lock import locked_json_update, locked_json_write
+    from .file_lock import locked_json_write
+    from .state_store import KIND_AUTOFIX, KIND_PR_REVIEW, KIND_TRIAGE, get_state_store
 except (ImportError, ValueError, SystemError):
-    from file_lock import locked_json_update, locked_json_write
+    from file_lock import locked_json_write
+    from state_store import KIND_AUTOFIX, KIND_PR_REVIEW, KIND_TRIAGE, get_state_store
 
 
 class ReviewSeverity(str, Enum):
@@ -655,48 +658,11 @@ class PRReviewResult:
         review_file = pr_dir / f"review_{self.pr_number}.json"
 
         # Atomic locked write
-        await locked_json_write(review_file, self.to_dict(), timeout=5.0)
+        data = self.to_dict()
+        await locked_json_write(review_file, data, timeout=5.0)
 
-        # Update index with locking
-        await self._update_index(pr_dir)
-
-    async def _update_index(self, pr_dir: Path) -> None:
-        """Update the PR review index with file locking."""
-        index_file = pr_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {"reviews": [], "last_updated": None}
-
-            # Update or add entry
-            reviews = current_data.get("reviews", [])
-            existing = next(
-                (r for r in reviews if r["pr_number"] == self.pr_number), None
-            )
-
-            entry = {
-                "pr_number": self.pr_number,
-                "repo": self.repo,
-                "overall_status": self.overall_status,
-                "findings_count": len(self.findings),
-                "reviewed_at": self.reviewed_at,
-            }
-
-            if existing:
-                reviews = [
-                    entry if r["pr_number"] == self.pr_number else r for r in reviews
-                ]
-            else:
-                reviews.append(entry)
-
-            current_data["reviews"] = reviews
-            current_data["last_updated"] = datetime.now().isoformat()
-
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # Index in the state store
+        get_state_store(github_dir).record_file(KIND_PR_REVIEW, data, review_file)
 
     @classmethod
     def load(cls, github_dir: Path, pr_number: int) -> PRReviewResult | None:
@@ -809,7 +775,11 @@ class TriageResult:
         triage_file = issues_dir / f"triage_{self.issue_number}.json"
 
         # Atomic locked write
-        await locked_json_write(triage_file, self.to_dict(), timeout=5.0)
+        data = self.to_dict()
+        await locked_json_write(triage_file, data, timeout=5.0)
+
+        # Index in the state store
+        get_state_store(github_dir).record_file(KIND_TRIAGE, data, triage_file)
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> TriageResult | None:
@@ -896,54 +866,11 @@ class AutoFixState:
         autofix_file = issues_dir / f"autofix_{self.issue_number}.json"
 
         # Atomic locked write
-        await locked_json_write(autofix_file, self.to_dict(), timeout=5.0)
-
-        # Update index with locking
-        await self._update_index(issues_dir)
-
-    async def _update_index(self, issues_dir: Path) -> None:
-        """Update the issues index with auto-fix queue using file locking."""
-        index_file = issues_dir / "index.json"
-
-        def update_index(current_data):
-            """Update function for atomic index update."""
-            if current_data is None:
-                current_data = {
-                    "triaged": [],
-                    "auto_fix_queue": [],
-                    "last_updated": None,
-                }
-
-            # Update auto-fix queue
-            queue = current_data.get("auto_fix_queue", [])
-            existing = next(
-                (q for q in queue if q["issue_number"] == self.issue_number), None
-            )
-
-            entry = {
-                "issue_number": self.issue_number,
-                "repo": self.repo,
-                "status": self.status.value,
-                "spec_id": self.spec_id,
-                "pr_number": self.pr_number,
-                "updated_at": self.updated_at,
-            }
-
-            if existing:
-                queue = [
-                    entry if q["issue_number"] == self.issue_number else q
-                    for q in queue
-                ]
-            else:
-                queue.append(entry)
-
-            current_data["auto_fix_queue"] = queue
-            current_data["last_updated"] = datetime.now().isoformat()
+        data = self.to_dict()
+        await locked_json_write(autofix_file, data, timeout=5.0)
 
-            return current_data
-
-        # Atomic locked update
-        await locked_json_update(index_file, update_index, timeout=5.0)
+        # Index in the state store
+        get_state_store(github_dir).record_file(KIND_AUTOFIX, data, autofix_file)
 
     @classmethod
     def load(cls, github_dir: Path, issue_number: int) -> AutoFixState | None:
@@ -955,6 +882,28 @@ class AutoFixState:
         with open(autofix_file, encoding="utf-8") as f:
             return cls.from_dict(json.load(f))
 
+    @classmethod
+    def load_all(
+        cls,
+        github_dir: Path,
+        statuses: list[AutoFixStatus] | None = None,
+    ) -> list[AutoFixState]:
+        """
+        Load auto-fix states from the state store, newest update first.
+
+        Args:
+            github_dir: .auto-claude/github directory
+            statuses: Only states with one of these statuses
+        """
+        store = get_state_store(github_dir)
+        # Pick up files written or edited outside this process
+        store.sync_json_files(KIND_AUTOFIX)
+        records = store.query(
+            KIND_AUTOFIX,
+            states=[s.value for s in statuses] if statuses is not None else None,
+        )
+        return [cls.from_dict(data) for data in records]
+
 
 @dataclass
 class GitHubRunnerConfig:
@@ -7,7 +7,6 @@ Handles automatic issue fixing workflow including permissions and state manageme
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 try:
@@ -152,20 +151,7 @@ class AutoFixProcessor:
 
     async def get_queue(self) -> list[AutoFixState]:
         """Get all issues in the auto-fix queue."""
-        issues_dir = self.github_dir / "issues"
-        if not issues_dir.exists():
-            return []
-
-        queue = []
-        for f in issues_dir.glob("autofix_*.json"):
-            try:
-                issue_number = int(f.stem.replace("autofix_", ""))
-                state = AutoFixState.load(self.github_dir, issue_number)
-                if state:
-                    queue.append(state)
-            except (ValueError, json.JSONDecodeError):
-                continue
-
+        queue = AutoFixState.load_all(self.github_dir)
         return sorted(queue, key=lambda s: s.created_at, reverse=True)
 
     async def check_labeled_issues(
@@ -7,7 +7,6 @@ Handles batch processing of similar issues.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 
 try:
@@ -101,22 +100,17 @@ class BatchProcessor:
             self._report_progress("batching", 20, "Computing similarity matrix...")
 
             # Get already-processed issue numbers
-            existing_states = []
-            issues_dir = self.github_dir / "issues"
-            if issues_dir.exists():
-                for f in issues_dir.glob("autofix_*.json"):
-                    try:
-                        issue_num = int(f.stem.replace("autofix_", ""))
-                        state = AutoFixState.load(self.github_dir, issue_num)
-                        if state and state.status not in [
-                            AutoFixStatus.FAILED,
-                            AutoFixStatus.COMPLETED,
-                        ]:
-                            existing_states.append(issue_num)
-                    except (ValueError, json.JSONDecodeError):
-                        continue
-
-            exclude_issues = set(existing_states)
+            active_statuses = [
+                status
+                for status in AutoFixStatus
+                if status not in (AutoFixStatus.FAILED, AutoFixStatus.COMPLETED)
+            ]
+            exclude_issues = {
+                state.issue_number
+                for state in AutoFixState.load_all(
+                    self.github_dir, statuses=active_statuses
+                )
+            }
 
             self._report_progress(
                 "batching", 40, "Clustering and validating batches with AI..."
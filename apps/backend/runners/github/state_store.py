@@ -0,0 +1,488 @@
+"""
+GitHub Automation State Store
+=============================
+
+Embedded SQLite store (WAL mode) for GitHub automation state, kept in
+.auto-claude/github/state.db.
+
+Every record is a row keyed by (kind, repo, number) with indexed state and
+timestamp columns, so saving updates a single row and state queries are
+index lookups instead of directory scans.
+
+PR reviews, triage results and auto-fix states keep their per-entity JSON
+files because the desktop app reads and edits them. The store mirrors those
+files and, when queried, re-parses only the ones whose mtime changed.
+Lifecycle and bot-detection state live in the store alone.
+
+Usage:
+    store = get_state_store(github_dir)
+    store.put(KIND_LIFECYCLE, "owner/repo", 123, data, state="triaged")
+    building = store.query(KIND_LIFECYCLE, repo="owner/repo", states=["building"])
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_DB_NAME = "state.db"
+
+# Pre-store files moved under archive/ once migrated (or no longer written)
+LEGACY_STATE_FILES = (
+    "bot_detection_state.json",
+    "pr/index.json",
+    "issues/index.json",
+)
+LEGACY_STATE_GLOBS = ("lifecycle/*.json",)
+
+KIND_PR_REVIEW = "pr_review"
+KIND_TRIAGE = "triage"
+KIND_AUTOFIX = "autofix"
+KIND_LIFECYCLE = "lifecycle"
+KIND_BOT_DETECTION = "bot_detection"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    kind TEXT NOT NULL,
+    repo TEXT NOT NULL,
+    number INTEGER NOT NULL,
+    state TEXT,
+    updated_at TEXT,
+    source_mtime_ns INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (kind, repo, number)
+);
+CREATE INDEX IF NOT EXISTS idx_records_state ON records (kind, repo, state);
+CREATE INDEX IF NOT EXISTS idx_records_number ON records (kind, number);
+CREATE INDEX IF NOT EXISTS idx_records_updated ON records (kind, updated_at);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+@dataclass(frozen=True)
+class JsonMirror:
+    """Layout of an entity kind that is also stored as one JSON file each."""
+
+    subdir: str
+    prefix: str
+    number_field: str
+    state_field: str
+    updated_field: str
+
+
+JSON_MIRRORS: dict[str, JsonMirror] = {
+    KIND_PR_REVIEW: JsonMirror(
+        subdir="pr",
+        prefix="review_",
+        number_field="pr_number",
+        state_field="overall_status",
+        updated_field="reviewed_at",
+    ),
+    KIND_TRIAGE: JsonMirror(
+        subdir="issues",
+        prefix="triage_",
+        number_field="issue_number",
+        state_field="category",
+        updated_field="triaged_at",
+    ),
+    KIND_AUTOFIX: JsonMirror(
+        subdir="issues",
+        prefix="autofix_",
+        number_field="issue_number",
+        state_field="status",
+        updated_field="updated_at",
+    ),
+}
+
+
+class StateStore:
+    """
+    SQLite-backed records for one .auto-claude/github directory.
+
+    A single connection is shared by all threads of a process and
+    serialized with a lock; other processes coordinate through SQLite.
+    """
+
+    def __init__(self, github_dir: Path):
+        self.github_dir = Path(github_dir)
+        self.github_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.github_dir / STATE_DB_NAME
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(
+            self.db_path, timeout=10.0, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # =========================================================================
+    # RECORDS
+    # =========================================================================
+
+    def put(
+        self,
+        kind: str,
+        repo: str,
+        number: int,
+        data: dict[str, Any],
+        state: str | None = None,
+        updated_at: str | None = None,
+    ) -> None:
+        """Insert or replace a record."""
+        with self._lock, self._conn:
+            self._upsert(kind, repo, number, data, state, updated_at, None)
+
+    def get(self, kind: str, repo: str, number: int) -> dict[str, Any] | None:
+        """Return a record's data, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM records WHERE kind = ? AND repo = ? AND number = ?",
+                (kind, repo, number),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        kind: str,
+        repo: str | None = None,
+        states: Iterable[str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Return records of a kind, most recently updated first.
+
+        Args:
+            kind: Record kind (KIND_*)
+            repo: Only records for this repo
+            states: Only records in one of these states
+        """
+        sql = "SELECT data FROM records WHERE kind = ?"
+        params: list[Any] = [kind]
+        if repo is not None:
+            sql += " AND repo = ?"
+            params.append(repo)
+        if states is not None:
+            states = list(states)
+            sql += f" AND state IN ({', '.join('?' * len(states))})"
+            params.extend(states)
+        sql += " ORDER BY updated_at DESC"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count_by_state(self, kind: str, repo: str | None = None) -> dict[str, int]:
+        """Count records of a kind per state."""
+        sql = "SELECT state, COUNT(*) FROM records WHERE kind = ?"
+        params: list[Any] = [kind]
+        if repo is not None:
+            sql += " AND repo = ?"
+            params.append(repo)
+        sql += " GROUP BY state"
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return dict(rows)
+
+    def prune_json_records(self, dry_run: bool = False) -> int:
+        """
+        Drop mirrored records whose JSON file no longer exists.
+
+        Returns:
+            Number of records dropped (or that would be, with dry_run)
+        """
+        pruned = 0
+        with self._lock:
+            for kind, mirror in JSON_MIRRORS.items():
+                directory = self.github_dir / mirror.subdir
+                missing = [
+                    (kind, number)
+                    for (number,) in self._conn.execute(
+                        "SELECT number FROM records WHERE kind = ?", (kind,)
+                    ).fetchall()
+                    if not (directory / f"{mirror.prefix}{number}.json").exists()
+                ]
+                if missing and not dry_run:
+                    with self._conn:
+                        self._conn.executemany(
+                            "DELETE FROM records WHERE kind = ? AND number = ?",
+                            missing,
+                        )
+                pruned += len(missing)
+        return pruned
+
+    def delete(self, kind: str, repo: str, number: int) -> None:
+        """Remove a record if present."""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM records WHERE kind = ? AND repo = ? AND number = ?",
+                (kind, repo, number),
+            )
+
+    # =========================================================================
+    # JSON-MIRRORED ENTITIES
+    # =========================================================================
+
+    def record_file(self, kind: str, data: dict[str, Any], path: Path) -> None:
+        """Index an entity just written to its JSON file."""
+        mirror = JSON_MIRRORS[kind]
+        with self._lock, self._conn:
+            self._put_mirrored(kind, mirror, data, path.stat().st_mtime_ns)
+
+    def sync_json_files(self, kind: str) -> int:
+        """
+        Bring mirrored records in line with their JSON files.
+
+        Only files whose mtime differs from the recorded one are parsed;
+        records whose file is gone are dropped.
+
+        Returns:
+            Number of records added, updated or removed
+        """
+        mirror = JSON_MIRRORS[kind]
+        directory = self.github_dir / mirror.subdir
+        on_disk: dict[int, tuple[Path, int]] = {}
+        if directory.exists():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not (name.startswith(mirror.prefix) and name.endswith(".json")):
+                        continue
+                    try:
+                        number = int(name[len(mirror.prefix) : -len(".json")])
+                        on_disk[number] = (Path(entry.path), entry.stat().st_mtime_ns)
+                    except (ValueError, OSError):
+                        continue
+
+        with self._lock:
+            known = dict(
+                self._conn.execute(
+                    "SELECT number, source_mtime_ns FROM records WHERE kind = ?",
+                    (kind,),
+                ).fetchall()
+            )
+
+            changes = 0
+            with self._conn:
+                for number in known.keys() - on_disk.keys():
+                    self._conn.execute(
+                        "DELETE FROM records WHERE kind = ? AND number = ?",
+                        (kind, number),
+                    )
+                    changes += 1
+
+                for number, (path, mtime_ns) in on_disk.items():
+                    if known.get(number) == mtime_ns:
+                        continue
+                    try:
+                        with open(path, encoding="utf-8") as f:
+                            data = json.load(f)
+                    except (OSError, json.JSONDecodeError) as e:
+                        logger.warning(f"Skipping unreadable state file {path}: {e}")
+                        continue
+                    self._put_mirrored(kind, mirror, data, mtime_ns)
+                    changes += 1
+        return changes
+
+    # =========================================================================
+    # MIGRATION
+    # =========================================================================
+
+    def migrate_from_json(self) -> dict[str, int]:
+        """
+        Import the JSON-file layout used before the store existed.
+
+        Runs once per store (tracked in the meta table). Records already in
+        the store are never overwritten by older files. Afterwards the
+        lifecycle and bot-detection files, and the index.json files the
+        store replaced, are moved under archive/.
+
+        Returns:
+            Number of records imported per kind
+        """
+        with self._lock:
+            if self._get_meta("json_migrated"):
+                return {}
+
+            counts = {kind: self.sync_json_files(kind) for kind in JSON_MIRRORS}
+
+            with self._conn:
+                counts[KIND_LIFECYCLE] = self._import_lifecycle_files()
+                counts[KIND_BOT_DETECTION] = self._import_bot_detection_file()
+                self._set_meta("json_migrated", "1")
+
+        self._archive_legacy_files()
+        if any(counts.values()):
+            logger.info(f"Migrated GitHub state into {self.db_path}: {counts}")
+        return counts
+
+    def _archive_legacy_files(self) -> None:
+        paths = [self.github_dir / name for name in LEGACY_STATE_FILES]
+        for pattern in LEGACY_STATE_GLOBS:
+            paths.extend(self.github_dir.glob(pattern))
+
+        archive_dir = self.github_dir / "archive"
+        for path in paths:
+            if not path.is_file():
+                continue
+            target = archive_dir / path.relative_to(self.github_dir)
+            try:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(path, target)
+            except OSError as e:
+                logger.warning(f"Could not archive migrated state file {path}: {e}")
+
+        lifecycle_dir = self.github_dir / "lifecycle"
+        try:
+            lifecycle_dir.rmdir()
+        except OSError:
+            pass  # Missing, or holds files we didn't migrate
+
+    def _import_lifecycle_files(self) -> int:
+        lifecycle_dir = self.github_dir / "lifecycle"
+        if not lifecycle_dir.exists():
+            return 0
+
+        count = 0
+        for path in lifecycle_dir.glob("*.json"):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    data = json.load(f)
+                self._insert_if_missing(
+                    KIND_LIFECYCLE,
+                    data["repo"],
+                    data["issue_number"],
+                    data,
+                    data.get("current_state", "new"),
+                    data.get("updated_at"),
+                )
+                count += 1
+            except (OSError, json.JSONDecodeError, KeyError) as e:
+                logger.warning(f"Skipping unreadable lifecycle file {path}: {e}")
+        return count
+
+    def _import_bot_detection_file(self) -> int:
+        path = self.github_dir / "bot_detection_state.json"
+        if not path.exists():
+            return 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Skipping unreadable bot detection state {path}: {e}")
+            return 0
+        self._insert_if_missing(KIND_BOT_DETECTION, "", 0, data, None, None)
+        return 1
+
+    # =========================================================================
+    # INTERNAL HELPERS
+    # =========================================================================
+
+    def _put_mirrored(
+        self, kind: str, mirror: JsonMirror, data: dict[str, Any], mtime_ns: int
+    ) -> None:
+        number = data[mirror.number_field]
+        # Files are keyed by number alone; drop any row filed under another repo
+        self._conn.execute(
+            "DELETE FROM records WHERE kind = ? AND number = ? AND repo != ?",
+            (kind, number, data.get("repo", "")),
+        )
+        self._upsert(
+            kind,
+            data.get("repo", ""),
+            number,
+            data,
+            data.get(mirror.state_field),
+            data.get(mirror.updated_field),
+            mtime_ns,
+        )
+
+    def _upsert(
+        self,
+        kind: str,
+        repo: str,
+        number: int,
+        data: dict[str, Any],
+        state: str | None,
+        updated_at: str | None,
+        source_mtime_ns: int | None,
+    ) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO records
+                (kind, repo, number, state, updated_at, source_mtime_ns, data)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (kind, repo, number) DO UPDATE SET
+                state = excluded.state,
+                updated_at = excluded.updated_at,
+                source_mtime_ns = excluded.source_mtime_ns,
+                data = excluded.data
+            """,
+            (kind, repo, number, state, updated_at, source_mtime_ns, json.dumps(data)),
+        )
+
+    def _insert_if_missing(
+        self,
+        kind: str,
+        repo: str,
+        number: int,
+        data: dict[str, Any],
+        state: str | None,
+        updated_at: str | None,
+    ) -> None:
+        self._conn.execute(
+            """
+            INSERT OR IGNORE INTO records
+                (kind, repo, number, state, updated_at, data)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (kind, repo, number, state, updated_at, json.dumps(data)),
+        )
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
+
+
+_stores: dict[Path, StateStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_state_store(github_dir: Path) -> StateStore:
+    """
+    Return the shared store for a .auto-claude/github directory.
+
+    The first call for a directory migrates any JSON-file state into it.
+    """
+    key = Path(github_dir).resolve()
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None or not store.db_path.exists():
+            if store is not None:
+                store.close()
+            store = StateStore(key)
+            store.migrate_from_json()
+            _stores[key] = store
+        return store
@@ -2,16 +2,25 @@
 GitLab API Client
 =================
 
-Client for GitLab API operations.
+Clients for GitLab API operations.
 Uses direct API calls with PRIVATE-TOKEN authentication.
+
+GitLabClient makes blocking calls; AsyncGitLabClient is for event-loop
+code and pools keep-alive connections.
 """
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
+import threading
 import time
 import urllib.parse
 import urllib.request
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
@@ -71,6 +80,29 @@ def validate_endpoint(endpoint: str) -> None:
         )
 
 
+def retry_after_seconds(retry_after: str | None, attempt: int) -> int:
+    """Seconds to wait before retrying a rate-limited (429) request."""
+    # Default to exponential backoff: 1s, 2s, 4s
+    wait_time = 2**attempt
+
+    # Check for Retry-After header (can be integer seconds or HTTP-date)
+    if retry_after:
+        try:
+            # Try parsing as integer seconds first
+            wait_time = int(retry_after)
+        except ValueError:
+            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+                now = datetime.now(timezone.utc)
+                delta = (retry_date - now).total_seconds()
+                wait_time = max(1, int(delta))  # At least 1 second
+            except (ValueError, TypeError):
+                # Parsing failed, keep exponential backoff default
+                pass
+    return wait_time
+
+
 class GitLabClient:
     """Client for GitLab API operations."""
 
@@ -139,25 +171,9 @@ class GitLabClient:
 
                 # Handle rate limit (429) with exponential backoff
                 if e.code == 429:
-                    # Default to exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-
-                    # Check for Retry-After header (can be integer seconds or HTTP-date)
-                    retry_after = e.headers.get("Retry-After")
-                    if retry_after:
-                        try:
-                            # Try parsing as integer seconds first
-                            wait_time = int(retry_after)
-                        except ValueError:
-                            # Try parsing as HTTP-date (e.g., "Wed, 21 Oct 2015 07:28:00 GMT")
-                            try:
-                                retry_date = parsedate_to_datetime(retry_after)
-                                now = datetime.now(timezone.utc)
-                                delta = (retry_date - now).total_seconds()
-                                wait_time = max(1, int(delta))  # At least 1 second
-                            except (ValueError, TypeError):
-                                # Parsing failed, keep exponential backoff default
-                                pass
+                    wait_time = retry_after_seconds(
+                        e.headers.get("Retry-After"), attempt
+                    )
 
                     if attempt < max_retries - 1:
                         print(
@@ -245,6 +261,321 @@ class GitLabClient:
         )
 
 
+class GitLabAPIError(Exception):
+    """GitLab returned an error status."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+
+
+# Concurrent requests (and pooled keep-alive connections) per async client
+DEFAULT_MAX_CONNECTIONS = 8
+
+# GET responses remembered for conditional (If-None-Match) requests
+DEFAULT_ETAG_CACHE_SIZE = 256
+
+# Errors on a reused keep-alive connection that mean the server closed it
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to one GitLab host, shared across threads."""
+
+    def __init__(self, base_url: str, timeout: float):
+        parts = urllib.parse.urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname or ""
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.timeout = timeout
+        self._idle: list[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused)."""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        if self.https:
+            conn = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        else:
+            conn = http.client.HTTPConnection(
+                self.host, self.port, timeout=self.timeout
+            )
+        return conn, False
+
+    def release(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if not reusable:
+            conn.close()
+            return
+        with self._lock:
+            self._idle.append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+class AsyncGitLabClient:
+    """
+    Async client for GitLab API operations.
+
+    Requests run on a small worker pool over keep-alive connections, so
+    they don't block the event loop, independent fetches run concurrently
+    and TLS handshakes are paid once per connection. GET responses carry
+    their ETag into an LRU cache and are revalidated with If-None-Match
+    (a 304 reuses the cached body). List endpoints can be streamed page by
+    page with paginate().
+
+    Usage:
+        async with AsyncGitLabClient(project_dir, config) as client:
+            mr, commits = await asyncio.gather(
+                client.get_mr(123), client.get_mr_commits(123)
+            )
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        config: GitLabConfig,
+        default_timeout: float = 30.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        etag_cache_size: int = DEFAULT_ETAG_CACHE_SIZE,
+    ):
+        self.project_dir = Path(project_dir)
+        self.config = config
+        self.default_timeout = default_timeout
+        self.max_connections = max_connections
+        self.etag_cache_size = etag_cache_size
+        self._pool = _ConnectionPool(config.instance_url, default_timeout)
+        self._executor: ThreadPoolExecutor | None = None
+        # path -> (etag, body, response headers)
+        self._etags: OrderedDict[str, tuple[str, bytes, dict[str, str]]] = OrderedDict()
+        self._etags_lock = threading.Lock()
+
+    async def __aenter__(self) -> AsyncGitLabClient:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close pooled connections and stop the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pool.close()
+
+    def _api_path(self, endpoint: str) -> str:
+        """Build the request path (host-relative) for an endpoint."""
+        if not endpoint.startswith("/"):
+            endpoint = f"/{endpoint}"
+        return f"{self._pool.base_path}/api/v4{endpoint}"
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Send one request on a pooled connection (blocking)."""
+        for attempt in range(2):
+            conn, reused = self._pool.acquire()
+            try:
+                conn.request(method, path, body=body, headers=headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_CONNECTION_ERRORS:
+                conn.close()
+                # The server dropped an idle connection; retry on a new one
+                if reused and attempt == 0:
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            self._pool.release(conn, reusable=not response.will_close)
+            response_headers = {k.lower(): v for k, v in response.getheaders()}
+            return response.status, response_headers, data
+        raise AssertionError("unreachable")
+
+    async def _request(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | None = None,
+        max_retries: int = 3,
+    ) -> tuple[Any, dict[str, str]]:
+        """Make an API request; returns (parsed body, response headers)."""
+        validate_endpoint(endpoint)
+        path = self._api_path(endpoint)
+        headers = {
+            "PRIVATE-TOKEN": self.config.token,
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        body = json.dumps(data).encode("utf-8") if data else None
+
+        cached = None
+        if method == "GET":
+            with self._etags_lock:
+                cached = self._etags.get(path)
+                if cached is not None:
+                    self._etags.move_to_end(path)
+                    headers["If-None-Match"] = cached[0]
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections, thread_name_prefix="gitlab-api"
+            )
+        loop = asyncio.get_running_loop()
+
+        for attempt in range(max_retries):
+            status, response_headers, response_body = await loop.run_in_executor(
+                self._executor, self._send, method, path, body, headers
+            )
+
+            if status == 304 and cached is not None:
+                return self._decode(cached[1]), cached[2]
+
+            if status == 429 and attempt < max_retries - 1:
+                wait_time = retry_after_seconds(
+                    response_headers.get("retry-after"), attempt
+                )
+                print(
+                    f"[GitLab] Rate limited (429). Retrying in {wait_time}s "
+                    f"(attempt {attempt + 1}/{max_retries})...",
+                    flush=True,
+                )
+                await asyncio.sleep(wait_time)
+                continue
+
+            if status >= 400:
+                error_body = response_body.decode("utf-8", "replace")
+                raise GitLabAPIError(status, f"GitLab API error {status}: {error_body}")
+
+            if status == 204 or not response_body:
+                return None, response_headers
+
+            etag = response_headers.get("etag")
+            if method == "GET" and etag:
+                with self._etags_lock:
+                    self._etags[path] = (etag, response_body, response_headers)
+                    self._etags.move_to_end(path)
+                    while len(self._etags) > self.etag_cache_size:
+                        self._etags.popitem(last=False)
+            return self._decode(response_body), response_headers
+
+        raise GitLabAPIError(429, f"GitLab API error after {max_retries} retries")
+
+    @staticmethod
+    def _decode(body: bytes) -> Any:
+        # Cached bodies are decoded again so callers never share one object
+        return json.loads(body.decode("utf-8"))
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        method: str = "GET",
+        data: dict | None = None,
+        max_retries: int = 3,
+    ) -> Any:
+        """Make an API request to GitLab and return the parsed body."""
+        result, _ = await self._request(endpoint, method, data, max_retries)
+        return result
+
+    async def paginate(self, endpoint: str, per_page: int = 100) -> AsyncIterator[Any]:
+        """
+        Yield the items of a list endpoint, fetching one page at a time.
+
+        Follows GitLab's X-Next-Page header until the last page.
+        """
+        separator = "&" if "?" in endpoint else "?"
+        page: str | None = "1"
+        while page:
+            items, headers = await self._request(
+                f"{endpoint}{separator}per_page={per_page}&page={page}"
+            )
+            for item in items or []:
+                yield item
+            page = headers.get("x-next-page") or None
+
+    def _project_endpoint(self, suffix: str) -> str:
+        encoded_project = encode_project_path(self.config.project)
+        return f"/projects/{encoded_project}{suffix}"
+
+    async def get_mr(self, mr_iid: int) -> dict:
+        """Get MR details."""
+        return await self._fetch(self._project_endpoint(f"/merge_requests/{mr_iid}"))
+
+    async def get_mr_changes(self, mr_iid: int) -> dict:
+        """Get MR changes (diff)."""
+        return await self._fetch(
+            self._project_endpoint(f"/merge_requests/{mr_iid}/changes")
+        )
+
+    async def get_mr_diff(self, mr_iid: int) -> str:
+        """Get the full diff for an MR."""
+        changes = await self.get_mr_changes(mr_iid)
+        diffs = []
+        for change in changes.get("changes", []):
+            diff = change.get("diff", "")
+            if diff:
+                diffs.append(diff)
+        return "\n".join(diffs)
+
+    async def get_mr_commits(self, mr_iid: int) -> list[dict]:
+        """Get all commits for an MR (every page)."""
+        endpoint = self._project_endpoint(f"/merge_requests/{mr_iid}/commits")
+        return [commit async for commit in self.paginate(endpoint)]
+
+    async def get_current_user(self) -> dict:
+        """Get current authenticated user."""
+        return await self._fetch("/user")
+
+    async def post_mr_note(self, mr_iid: int, body: str) -> dict:
+        """Post a note (comment) to an MR."""
+        return await self._fetch(
+            self._project_endpoint(f"/merge_requests/{mr_iid}/notes"),
+            method="POST",
+            data={"body": body},
+        )
+
+    async def approve_mr(self, mr_iid: int) -> dict:
+        """Approve an MR."""
+        return await self._fetch(
+            self._project_endpoint(f"/merge_requests/{mr_iid}/approve"),
+            method="POST",
+        )
+
+    async def merge_mr(self, mr_iid: int, squash: bool = False) -> dict:
+        """Merge an MR."""
+        return await self._fetch(
+            self._project_endpoint(f"/merge_requests/{mr_iid}/merge"),
+            method="PUT",
+            data={"squash": True} if squash else None,
+        )
+
+    async def assign_mr(self, mr_iid: int, user_ids: list[int]) -> dict:
+        """Assign users to an MR."""
+        return await self._fetch(
+            self._project_endpoint(f"/merge_requests/{mr_iid}"),
+            method="PUT",
+            data={"assignee_ids": user_ids},
+        )
+
+
 def load_gitlab_config(project_dir: Path) -> GitLabConfig | None:
     """Load GitLab config from project's .auto-claude/gitlab/config.json."""
     config_path = project_dir / ".auto-claude" / "gitlab" / "config.json"
@@ -9,6 +9,7 @@ Main coordinator for GitLab automation workflows:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import traceback
 import urllib.error
@@ -17,7 +18,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 try:
-    from .glab_client import GitLabClient, GitLabConfig
+    from .glab_client import AsyncGitLabClient, GitLabAPIError, GitLabConfig
     from .models import (
         GitLabRunnerConfig,
         MergeVerdict,
@@ -27,7 +28,7 @@ try:
     from .services import MRReviewEngine
 except ImportError:
     # Fallback for direct script execution (not as a module)
-    from glab_client import GitLabClient, GitLabConfig
+    from glab_client import AsyncGitLabClient, GitLabAPIError, GitLabConfig
     from models import (
         GitLabRunnerConfig,
         MergeVerdict,
@@ -94,7 +95,7 @@ class GitLabOrchestrator:
         )
 
         # Initialize client
-        self.client = GitLabClient(
+        self.client = AsyncGitLabClient(
             project_dir=self.project_dir,
             config=self.gitlab_config,
         )
@@ -134,14 +135,12 @@ class GitLabOrchestrator:
         """Gather context for an MR."""
         safe_print(f"[GitLab] Fetching MR !{mr_iid} data...")
 
-        # Get MR details
-        mr_data = self.client.get_mr(mr_iid)
-
-        # Get changes
-        changes_data = self.client.get_mr_changes(mr_iid)
-
-        # Get commits
-        commits = self.client.get_mr_commits(mr_iid)
+        # MR details, changes and commits are independent; fetch them together
+        mr_data, changes_data, commits = await asyncio.gather(
+            self.client.get_mr(mr_iid),
+            self.client.get_mr_changes(mr_iid),
+            self.client.get_mr_commits(mr_iid),
+        )
 
         # Build diff from changes
         diffs = []
@@ -264,7 +263,7 @@ class GitLabOrchestrator:
 
             return result
 
-        except urllib.error.HTTPError as e:
+        except (urllib.error.HTTPError, GitLabAPIError) as e:
             error_msg = f"GitLab API error {e.code}"
             if e.code == 401:
                 error_msg = "GitLab authentication failed. Check your token."
@@ -324,6 +323,11 @@ class GitLabOrchestrator:
             result.save(self.gitlab_dir)
             return result
 
+        finally:
+            # Release the client's worker threads and keep-alive connections;
+            # it reconnects on demand if this orchestrator reviews again
+            self.client.close()
+
     async def followup_review_mr(self, mr_iid: int) -> MRReviewResult:
         """
         Perform a follow-up review of an MR.
@@ -459,7 +463,7 @@ class GitLabOrchestrator:
 
             return result
 
-        except urllib.error.HTTPError as e:
+        except (urllib.error.HTTPError, GitLabAPIError) as e:
             error_msg = f"GitLab API error {e.code}"
             if e.code == 401:
                 error_msg = "GitLab authentication failed. Check your token."
@@ -515,3 +519,6 @@ class GitLabOrchestrator:
             )
             result.save(self.gitlab_dir)
             return result
+
+        finally:
+            self.client.close()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Task Log Storage Benchmark
+==========================
+
+Measures the per-entry cost of LogStorage.add_entry() as a log grows, for the
+legacy write-through mode (full task_logs.json rewrite per entry) and the
+append-only journal mode.
+
+The journal mode should report a roughly flat per-entry cost across buckets,
+while the legacy mode grows linearly with the number of stored entries.
+
+Usage:
+    cd apps/backend
+    python scripts/benchmark_task_logs.py
+    python scripts/benchmark_task_logs.py --entries 10000 --bucket 2000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the backend directory to the path so we can import modules
+SCRIPT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = SCRIPT_DIR.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from task_logger.models import LogEntry, LogEntryType, LogPhase
+from task_logger.storage import LogStorage, load_task_logs
+
+
+def _make_entry(i: int) -> LogEntry:
+    """Create a representative tool_end entry with some detail text."""
+    return LogEntry(
+        timestamp="2026-01-01T00:00:00+00:00",
+        type=LogEntryType.TOOL_END.value,
+        content=f"[Read] Done: src/module_{i}.py",
+        phase=LogPhase.CODING.value,
+        tool_name="Read",
+        subtask_id="subtask-1",
+        session=1,
+        detail="line of file content\n" * 20,
+        collapsed=True,
+    )
+
+
+def run(journal: bool, entries: int, bucket: int) -> list[float]:
+    """
+    Add ``entries`` log entries and return the mean cost per entry (µs) per bucket.
+    """
+    bucket_costs: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = LogStorage(Path(tmp), journal=journal)
+        start = time.perf_counter()
+        for i in range(1, entries + 1):
+            storage.add_entry(_make_entry(i))
+            if i % bucket == 0:
+                elapsed = time.perf_counter() - start
+                bucket_costs.append(elapsed / bucket * 1_000_000)
+                start = time.perf_counter()
+        storage.flush()
+
+        logs = load_task_logs(Path(tmp))
+        stored = len(logs["phases"][LogPhase.CODING.value]["entries"])
+        if stored != entries:
+            raise RuntimeError(f"expected {entries} entries, found {stored}")
+    return bucket_costs
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark task log storage per-entry cost"
+    )
+    parser.add_argument("--entries", type=int, default=5000)
+    parser.add_argument("--bucket", type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"Adding {args.entries} entries, reporting mean cost per {args.bucket}\n")
+    results = {
+        "legacy": run(False, args.entries, args.bucket),
+        "journal": run(True, args.entries, args.bucket),
+    }
+
+    print(f"{'entries':>10}  {'legacy µs/entry':>16}  {'journal µs/entry':>17}")
+    for i, (legacy, journal) in enumerate(
+        zip(results["legacy"], results["journal"]), start=1
+    ):
+        print(f"{i * args.bucket:>10}  {legacy:>16.1f}  {journal:>17.1f}")
+
+    print()
+    for mode, costs in results.items():
+        growth = costs[-1] / costs[0] if costs and costs[0] else 0.0
+        print(f"{mode}: last/first bucket cost ratio = {growth:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
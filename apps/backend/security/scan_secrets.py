@@ -7,7 +7,8 @@ Scans staged git files for potential secrets before commit.
 Designed to prevent accidental exposure of API keys, tokens, and credentials.
 
 Usage:
-    python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
+    python scan_secrets.py [--staged-only] [--all-files] [--path PATH] [--jobs N]
+                           [--no-cache]
 
 Exit codes:
     0 - No secrets detected
@@ -16,9 +17,14 @@ Exit codes:
 """
 
 import argparse
+import bisect
+import hashlib
+import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -145,6 +151,61 @@ ALL_PATTERNS = (
     GENERIC_PATTERNS + SERVICE_PATTERNS + PRIVATE_KEY_PATTERNS + DATABASE_PATTERNS
 )
 
+# Lowercase literals, one of which every match of the named pattern contains.
+# A pattern is skipped for files containing none of them; an empty tuple means
+# the pattern has no usable literal and always runs. Every entry in
+# ALL_PATTERNS must be listed here.
+PATTERN_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "Generic API key assignment": ("api", "secret"),
+    "Generic access token": ("token",),
+    "Password assignment": ("pass", "pwd"),
+    "Secret assignment": ("secret",),
+    "Bearer token": ("bearer",),
+    "Potential base64-encoded secret": (),
+    "OpenAI/Anthropic-style API key": ("sk-",),
+    "Anthropic API key": ("sk-ant-",),
+    "OpenAI project API key": ("sk-proj-",),
+    "AWS Access Key ID": ("akia",),
+    "AWS Secret Access Key": ("aws_secret",),
+    "Google API Key": ("aiza",),
+    "Google Service Account JSON": ("service_account",),
+    "GitHub Personal Access Token": ("ghp_",),
+    "GitHub Fine-grained PAT": ("github_pat_",),
+    "GitHub OAuth Token": ("gho_",),
+    "GitHub App Installation Token": ("ghs_",),
+    "GitHub Refresh Token": ("ghr_",),
+    "Stripe Live Secret Key": ("sk_live_",),
+    "Stripe Test Secret Key": ("sk_test_",),
+    "Stripe Live Publishable Key": ("pk_live_",),
+    "Stripe Restricted Key": ("rk_live_",),
+    "Slack Token": ("xox",),
+    "Slack Webhook URL": ("hooks.slack.com/services/",),
+    "Discord Bot Token": (".",),
+    "Discord Webhook URL": ("/api/webhooks/",),
+    "Twilio API Key": ("sk",),
+    "Twilio Account SID": ("ac",),
+    "SendGrid API Key": ("sg.",),
+    "Mailchimp API Key": ("-us",),
+    "NPM Access Token": ("npm_",),
+    "PyPI API Token": ("pypi-",),
+    "Supabase/JWT Token": ("eyjhbgcioijiuzi1niisinr5cci6ikpxvcj9.",),
+    "Linear API Key": ("lin_api_",),
+    "Potential Vercel Token": ("_",),
+    "Heroku API Key / UUID": ("-",),
+    "Doppler Service Token": ("dp.pt.",),
+    "RSA Private Key": ("-----begin",),
+    "OpenSSH Private Key": ("-----begin",),
+    "DSA Private Key": ("-----begin",),
+    "EC Private Key": ("-----begin",),
+    "PGP Private Key": ("-----begin",),
+    "Certificate (may contain private key)": ("-----begin",),
+    "MongoDB Connection String with credentials": ("mongodb",),
+    "PostgreSQL Connection String with credentials": ("postgres",),
+    "MySQL Connection String with credentials": ("mysql://",),
+    "Redis Connection String with credentials": ("redis://",),
+    "RabbitMQ Connection String with credentials": ("amqp://",),
+}
+
 
 # =============================================================================
 # DATA CLASSES
@@ -251,6 +312,47 @@ FALSE_POSITIVE_PATTERNS = [
 ]
 
 
+# =============================================================================
+# COMPILED MATCHERS
+# =============================================================================
+#
+# Patterns are compiled once at import time. scan_content() runs each pattern
+# over the whole file in a single C-level pass (instead of once per line),
+# skipping patterns whose PATTERN_KEYWORDS do not occur in the file at all.
+# Separate passes are kept rather than one big alternation: patterns overlap
+# (e.g. "sk-" and "sk-ant-"), and an alternation both drops those findings and
+# is slower in CPython's re than per-pattern literal-prefix searches.
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, str]],
+) -> list[tuple[re.Pattern, str, tuple[str, ...]]]:
+    """Compile (pattern, name) pairs with their keywords, skipping invalid regexes."""
+    compiled = []
+    for pattern, pattern_name in patterns:
+        try:
+            regex = re.compile(pattern, re.IGNORECASE)
+        except re.error:
+            continue
+        compiled.append((regex, pattern_name, PATTERN_KEYWORDS.get(pattern_name, ())))
+    return compiled
+
+
+COMPILED_PATTERNS = _compile_patterns(ALL_PATTERNS)
+
+# Line boundaries exactly as recognized by str.splitlines()
+_LINE_BREAK_RE = re.compile(r"\r\n|[\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029]")
+
+_FALSE_POSITIVE_RE = re.compile("|".join(FALSE_POSITIVE_PATTERNS))
+_TYPE_HINT_RE = re.compile(r"^[a-z_]+:\s*str\s*$", re.IGNORECASE)
+_LONG_KEY_RE = re.compile(r"[a-zA-Z0-9_-]{40,}")
+_DEFAULT_IGNORE_RE = re.compile("|".join(DEFAULT_IGNORE_PATTERNS))
+
+# Below this many files, process pool start-up costs more than it saves
+PARALLEL_MIN_FILES = 64
+MAX_SCAN_WORKERS = 8
+
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -278,16 +380,13 @@ def load_secretsignore(project_dir: Path) -> list[str]:
 
 def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
     """Check if a file should be skipped based on ignore patterns."""
-    path = Path(file_path)
-
     # Check binary extensions
-    if path.suffix.lower() in BINARY_EXTENSIONS:
+    if os.path.splitext(file_path)[1].lower() in BINARY_EXTENSIONS:
         return True
 
     # Check default ignore patterns
-    for pattern in DEFAULT_IGNORE_PATTERNS:
-        if re.search(pattern, file_path):
-            return True
+    if _DEFAULT_IGNORE_RE.search(file_path):
+        return True
 
     # Check custom ignore patterns
     for pattern in custom_ignores:
@@ -297,19 +396,17 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
     return False
 
 
-def is_false_positive(line: str, matched_text: str) -> bool:
-    """Check if a match is likely a false positive."""
-    line_lower = line.lower()
-
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, line_lower):
-            return True
+def _is_false_positive_line(line: str) -> bool:
+    """Line-level false positive checks (independent of the matched text)."""
+    if _FALSE_POSITIVE_RE.search(line.lower()):
+        return True
 
     # Check if it's just a variable name or type hint
-    if re.match(r"^[a-z_]+:\s*str\s*$", line.strip(), re.IGNORECASE):
-        return True
+    return bool(_TYPE_HINT_RE.match(line.strip()))
+
 
-    # Check if it's in a comment
+def _is_comment_false_positive(line: str, matched_text: str) -> bool:
+    """Matches in comments are ignored unless they look like a real long key."""
     stripped = line.strip()
     if (
         stripped.startswith("#")
@@ -317,12 +414,18 @@ def is_false_positive(line: str, matched_text: str) -> bool:
         or stripped.startswith("*")
     ):
         # But still flag if there's an actual long key-like string
-        if not re.search(r"[a-zA-Z0-9_-]{40,}", matched_text):
+        if not _LONG_KEY_RE.search(matched_text):
             return True
-
     return False
 
 
+def is_false_positive(line: str, matched_text: str) -> bool:
+    """Check if a match is likely a false positive."""
+    return _is_false_positive_line(line) or _is_comment_false_positive(
+        line, matched_text
+    )
+
+
 def mask_secret(text: str, visible_chars: int = 8) -> str:
     """Mask a secret, showing only first few characters."""
     if len(text) <= visible_chars:
@@ -330,33 +433,108 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
     return text[:visible_chars] + "***"
 
 
+class _LineTable:
+    """
+    Maps offsets in a file to the line numbering used by str.splitlines().
+
+    Built on first use, so files without any hit never pay for it.
+    """
+
+    def __init__(self, content: str):
+        self._content = content
+        self._starts: list[int] | None = None
+        self._ends: list[int] = []
+
+    def _build(self) -> list[int]:
+        if self._starts is None:
+            starts, ends = [0], []
+            for boundary in _LINE_BREAK_RE.finditer(self._content):
+                ends.append(boundary.start())
+                starts.append(boundary.end())
+            if starts[-1] < len(self._content):
+                ends.append(len(self._content))
+            else:
+                # splitlines() yields no empty line after a trailing line break
+                starts.pop()
+            self._starts, self._ends = starts, ends
+        return self._starts
+
+    def __len__(self) -> int:
+        return len(self._build())
+
+    def index_of(self, offset: int) -> int:
+        return bisect.bisect_right(self._build(), offset) - 1
+
+    def span(self, index: int) -> tuple[int, int]:
+        return self._build()[index], self._ends[index]
+
+
+def _find_pattern_hits(
+    content: str, pattern: re.Pattern, lines: _LineTable
+) -> list[tuple[int, re.Match]]:
+    """
+    All (line_index, match) hits of one pattern, as a per-line scan would find.
+
+    The whole file is scanned in one pass. If any match spans a line break the
+    pattern is re-run line by line (pos/endpos bound the match to one line
+    without slicing), since matches are defined per line.
+    """
+    hits = []
+    for match in pattern.finditer(content):
+        if _LINE_BREAK_RE.search(match.group(0)):
+            return [
+                (index, line_match)
+                for index in range(len(lines))
+                for line_match in pattern.finditer(content, *lines.span(index))
+            ]
+        hits.append((lines.index_of(match.start()), match))
+    return hits
+
+
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
     """Scan file content for potential secrets."""
+    # Keyword prefilter: most patterns cannot match most files. Only exact for
+    # ASCII text (IGNORECASE also folds a few non-ASCII letters onto ASCII).
+    lowered = content.lower() if content.isascii() else None
+    lines = _LineTable(content)
+    hits = []
+
+    for order, (pattern, pattern_name, keywords) in enumerate(COMPILED_PATTERNS):
+        if (
+            keywords
+            and lowered is not None
+            and not any(keyword in lowered for keyword in keywords)
+        ):
+            continue
+        for line_index, match in _find_pattern_hits(content, pattern, lines):
+            hits.append((line_index, order, match.start(), pattern_name, match))
+
+    # Report in the order of a line-by-line, pattern-by-pattern scan
+    hits.sort(key=lambda hit: hit[:3])
+
     matches = []
-    lines = content.splitlines()
-
-    for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
-                    )
-            except re.error:
-                # Invalid regex, skip
-                continue
+    line_false_positive: dict[int, bool] = {}
+    for line_index, _, _, pattern_name, match in hits:
+        line = content[slice(*lines.span(line_index))]
+        matched_text = match.group(0)
+
+        # Skip false positives
+        if line_index not in line_false_positive:
+            line_false_positive[line_index] = _is_false_positive_line(line)
+        if line_false_positive[line_index] or _is_comment_false_positive(
+            line, matched_text
+        ):
+            continue
+
+        matches.append(
+            SecretMatch(
+                file_path=file_path,
+                line_number=line_index + 1,
+                pattern_name=pattern_name,
+                matched_text=matched_text,
+                line_content=line.strip()[:100],  # Truncate long lines
+            )
+        )
 
     return matches
 
@@ -376,11 +554,12 @@ def get_staged_files() -> list[str]:
         return []
 
 
-def get_all_tracked_files() -> list[str]:
-    """Get all tracked files in the repository."""
+def get_all_tracked_files(project_dir: Path | None = None) -> list[str]:
+    """Get all tracked files in the repository (relative to project_dir or cwd)."""
     try:
         result = subprocess.run(
             ["git", "ls-files"],
+            cwd=project_dir,
             capture_output=True,
             text=True,
             check=True,
@@ -391,35 +570,278 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+# =============================================================================
+# INCREMENTAL SCAN CACHE
+# =============================================================================
+
+SCAN_CACHE_FILE = "secret_scan_cache.txt"
+
+# Bump when scan semantics change in ways the pattern lists do not capture
+SCAN_ENGINE_VERSION = 1
+
+# Past this many entries the cache is rewritten with only the blobs just seen
+SCAN_CACHE_MAX_ENTRIES = 200_000
+
+
+def pattern_set_version() -> str:
+    """Fingerprint of everything that decides whether a blob has findings."""
+    fingerprint = repr(
+        (
+            SCAN_ENGINE_VERSION,
+            ALL_PATTERNS,
+            sorted(PATTERN_KEYWORDS.items()),
+            FALSE_POSITIVE_PATTERNS,
+        )
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()[:16]
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Git's object id for a blob with the given content."""
+    header = b"blob %d\0" % len(data)
+    return hashlib.sha1(header + data, usedforsecurity=False).hexdigest()
+
+
+def get_index_blob_shas(project_dir: Path) -> dict[str, str]:
+    """
+    Map tracked paths to their index blob SHA, for files whose working tree
+    copy still matches the index (so the SHA describes what would be read).
+
+    Paths are relative to project_dir, like get_all_tracked_files(). Returns
+    an empty dict outside a git repository.
+    """
+    try:
+        staged = subprocess.run(
+            ["git", "ls-files", "-s", "-z"],
+            cwd=project_dir,
+            capture_output=True,
+            check=True,
+        )
+        modified = subprocess.run(
+            ["git", "ls-files", "-m", "-z"],
+            cwd=project_dir,
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    dirty = set(os.fsdecode(modified.stdout).split("\0"))
+    shas = {}
+    for record in os.fsdecode(staged.stdout).split("\0"):
+        meta, _, path = record.partition("\t")
+        fields = meta.split(" ")
+        if len(fields) != 3 or path in dirty:
+            continue
+        mode, sha, stage = fields
+        # Skip conflicted entries, symlinks and submodules: their index blob
+        # is not the content that reading the path returns
+        if stage == "0" and mode.startswith("100"):
+            shas[path] = sha
+    return shas
+
+
+class SecretScanCache:
+    """
+    Git blob SHAs known to have no findings under the current pattern set.
+
+    Only clean verdicts are cached, so the file never contains secret
+    material; blobs with findings are simply rescanned. The file starts with
+    a pattern-set version header (a mismatch discards it) followed by one
+    SHA per line, appended to as new clean blobs are seen.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.version = pattern_set_version()
+        self._clean: set[str] = set()
+        self._new: list[str] = []
+        self._rewrite = True
+        self._load()
+
+    @classmethod
+    def for_project(cls, project_dir: Path) -> "SecretScanCache | None":
+        """
+        Cache for a project, stored under its .auto-claude/ directory.
+
+        Returns None if the project has no .auto-claude/ directory: the cache
+        never creates it, since only initialized projects have it gitignored.
+        """
+        auto_claude_dir = project_dir / ".auto-claude"
+        if not auto_claude_dir.is_dir():
+            return None
+        return cls(auto_claude_dir / SCAN_CACHE_FILE)
+
+    def _header(self) -> str:
+        return f"# secret-scan-cache {self.version}"
+
+    def _load(self) -> None:
+        try:
+            text = self.path.read_text(encoding="ascii")
+        except (OSError, UnicodeDecodeError):
+            return
+        header, _, body = text.partition("\n")
+        if header != self._header():
+            return
+        # Ignore a torn trailing line from an interrupted append
+        self._clean = {sha for sha in body.split() if len(sha) == 40}
+        self._rewrite = False
+
+    def __len__(self) -> int:
+        return len(self._clean)
+
+    def is_clean(self, sha: str) -> bool:
+        return sha in self._clean
+
+    def add_clean(self, sha: str) -> None:
+        if sha not in self._clean:
+            self._clean.add(sha)
+            self._new.append(sha)
+
+    def save(self, seen: set[str] | None = None) -> None:
+        """
+        Persist new entries.
+
+        Args:
+            seen: Blob SHAs of every file in the current scan; once the cache
+                exceeds SCAN_CACHE_MAX_ENTRIES it is rewritten with only these
+        """
+        if seen is not None and len(self._clean) > SCAN_CACHE_MAX_ENTRIES:
+            self._clean &= seen
+            self._rewrite = True
+        if not self._rewrite and not self._new:
+            return
+
+        try:
+            if self._rewrite:
+                tmp_path = self.path.with_suffix(".tmp")
+                with open(tmp_path, "w", encoding="ascii") as f:
+                    f.write(self._header() + "\n")
+                    f.writelines(f"{sha}\n" for sha in sorted(self._clean))
+                os.replace(tmp_path, self.path)
+                self._rewrite = False
+            else:
+                with open(self.path, "a", encoding="ascii") as f:
+                    f.write("".join(f"{sha}\n" for sha in self._new))
+            self._new = []
+        except OSError:
+            # The cache is an optimization; a failed write just means a rescan
+            pass
+
+
+# =============================================================================
+# FILE SCANNING
+# =============================================================================
+
+
+def _scan_file(
+    full_path: Path, file_path: str, sha: str | None
+) -> tuple[str | None, list[SecretMatch]]:
+    """
+    Read and scan one file; unreadable files and directories yield nothing.
+
+    Returns the file's blob SHA (``sha`` if known, else computed from the
+    content read) and its matches.
+    """
+    try:
+        data = full_path.read_bytes()
+    except OSError:
+        # Skip files that can't be read (missing, directories, permissions)
+        return None, []
+    if sha is None:
+        sha = git_blob_sha(data)
+    content = data.decode("utf-8", errors="ignore")
+    return sha, scan_content(content, file_path)
+
+
+def _scan_file_batch(
+    batch: list[tuple[Path, str, str | None]],
+) -> list[tuple[str | None, list[SecretMatch]]]:
+    """Process pool worker: scan a batch of (full_path, file_path, sha)."""
+    return [_scan_file(*target) for target in batch]
+
+
+def _default_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, MAX_SCAN_WORKERS))
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    workers: int | None = None,
+    use_cache: bool = True,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Files whose git blob was already found clean (see SecretScanCache) are
+    skipped without being read, so rescanning an unchanged tree is cheap.
+
+    Args:
+        files: File paths relative to project_dir
+        project_dir: Directory the paths are relative to (default: cwd)
+        workers: Worker processes to use; None picks one per CPU (capped at
+            MAX_SCAN_WORKERS) when there are at least PARALLEL_MIN_FILES
+            files, 1 scans in-process
+        use_cache: Consult and update the project's scan cache
+
+    Returns:
+        Matches in the order of ``files``
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
-    all_matches = []
+    cache = SecretScanCache.for_project(project_dir) if use_cache else None
+    index_shas = get_index_blob_shas(project_dir) if cache is not None else {}
 
+    seen: set[str] = set()
+    targets = []
     for file_path in files:
         # Skip files based on ignore patterns
         if should_skip_file(file_path, custom_ignores):
             continue
+        sha = index_shas.get(file_path)
+        if sha is not None:
+            seen.add(sha)
+            if cache.is_clean(sha):
+                continue
+        targets.append((project_dir / file_path, file_path, sha))
+
+    results = None
+    if workers is None:
+        workers = _default_workers() if len(targets) >= PARALLEL_MIN_FILES else 1
+
+    if workers > 1 and len(targets) > 1:
+        # Contiguous batches keep results in input order and amortize pickling
+        batch_size = max(1, -(-len(targets) // (workers * 4)))
+        batches = [
+            targets[i : i + batch_size] for i in range(0, len(targets), batch_size)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = [
+                    result
+                    for batch_results in pool.map(_scan_file_batch, batches)
+                    for result in batch_results
+                ]
+        except (OSError, BrokenProcessPool):
+            # No process support (sandbox, resource limits): scan in-process
+            pass
+
+    if results is None:
+        results = _scan_file_batch(targets)
 
-        full_path = project_dir / file_path
-
-        # Skip if file doesn't exist or is a directory
-        if not full_path.exists() or full_path.is_dir():
-            continue
+    all_matches = []
+    for sha, matches in results:
+        all_matches.extend(matches)
+        if cache is not None and sha is not None:
+            seen.add(sha)
+            if not matches:
+                cache.add_clean(sha)
 
-        try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
-            continue
+    if cache is not None:
+        cache.save(seen)
 
     return all_matches
 
@@ -514,6 +936,18 @@ def main() -> int:
     parser.add_argument(
         "--quiet", "-q", action="store_true", help="Only output if secrets are found"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Rescan every file instead of skipping blobs already found clean",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help="Worker processes to scan with (default: one per CPU for large scans)",
+    )
 
     args = parser.parse_args()
 
@@ -545,7 +979,9 @@ def main() -> int:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
     # Scan files
-    matches = scan_files(files, project_dir)
+    matches = scan_files(
+        files, project_dir, workers=args.jobs, use_cache=not args.no_cache
+    )
 
     # Output results
     if args.json:
@@ -2,6 +2,9 @@
 Main TaskLogger class for logging task execution.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -32,21 +35,44 @@ class TaskLogger:
 
     LOG_FILE = "task_logs.json"
 
-    def __init__(self, spec_dir: Path, emit_markers: bool = True):
+    def __init__(self, spec_dir: Path, emit_markers: bool = True, journal: bool = True):
         """
         Initialize the task logger.
 
         Args:
             spec_dir: Path to the spec directory
             emit_markers: Whether to emit streaming markers to stdout
+            journal: Whether to use the append-only journal for storage
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
         self.emit_markers = emit_markers
         self.current_phase: LogPhase | None = None
-        self.current_session: int | None = None
-        self.current_subtask: str | None = None
-        self.storage = LogStorage(spec_dir)
+        self._session: int | None = None
+        self._subtask: str | None = None
+        # (subtask, session) for the current asyncio task, see session_context()
+        self._context: ContextVar[tuple[str | None, int | None] | None] = ContextVar(
+            "task_logger_context", default=None
+        )
+        self.storage = LogStorage(spec_dir, journal=journal)
+
+    @property
+    def current_session(self) -> int | None:
+        context = self._context.get()
+        return context[1] if context else self._session
+
+    @current_session.setter
+    def current_session(self, session: int | None) -> None:
+        self._session = session
+
+    @property
+    def current_subtask(self) -> str | None:
+        context = self._context.get()
+        return context[0] if context else self._subtask
+
+    @current_subtask.setter
+    def current_subtask(self, subtask_id: str | None) -> None:
+        self._subtask = subtask_id
 
     @property
     def _data(self) -> dict:
@@ -120,6 +146,20 @@ class TaskLogger:
         """Set the current subtask being processed."""
         self.current_subtask = subtask_id
 
+    @contextmanager
+    def session_context(self, subtask_id: str | None, session: int) -> Iterator[None]:
+        """
+        Attribute entries to a subtask and session within the current asyncio task.
+
+        Sessions running side by side each log under their own subtask and
+        session, instead of whichever was set last.
+        """
+        token = self._context.set((subtask_id, session))
+        try:
+            yield
+        finally:
+            self._context.reset(token)
+
     def start_phase(self, phase: LogPhase, message: str | None = None) -> None:
         """
         Start a new phase, auto-closing any stale active phases.
@@ -553,6 +593,11 @@ class TaskLogger:
         """Get logs for a specific phase."""
         return self.storage.get_phase_data(phase.value)
 
+    def flush(self) -> None:
+        """Write any journaled entries through to task_logs.json."""
+        self.storage.flush()
+
     def clear(self) -> None:
         """Clear all logs (useful for testing)."""
-        self.storage = LogStorage(self.spec_dir)
+        self.storage.flush()
+        self.storage = LogStorage(self.spec_dir, journal=self.storage.journal)
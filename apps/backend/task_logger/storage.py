@@ -1,43 +1,176 @@
 """
 Storage functionality for task logs.
+
+Logs are persisted in two files inside the spec directory:
+
+- ``task_logs.json``: the compacted snapshot read by the UI and load_task_logs()
+- ``task_logs.journal.jsonl``: an append-only journal with one JSON record per
+  entry or phase transition written since the last compaction
+
+Appending a journal line costs the same no matter how large the log is, so
+long sessions no longer rewrite the whole snapshot for every log line. The
+journal is folded back into the snapshot periodically (see LogStorage).
 """
 
 import json
 import os
 import sys
 import tempfile
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
 from .models import LogEntry, LogPhase
 
+# Journal record operations
+OP_ENTRY = "entry"
+OP_PHASE_STATUS = "phase_status"
+OP_PHASE_STARTED = "phase_started"
+OP_SPEC_ID = "spec_id"
+
+
+def _new_phase(phase_key: str, timestamp: str) -> dict:
+    """Create the structure for a phase that was not pre-declared."""
+    return {
+        "phase": phase_key,
+        "status": "active",
+        "started_at": timestamp,
+        "completed_at": None,
+        "entries": [],
+    }
+
+
+def _apply_record(data: dict, record: dict) -> None:
+    """
+    Apply a single journal record to a logs dictionary in place.
+
+    Args:
+        data: Logs dictionary in the task_logs.json shape
+        record: Journal record produced by LogStorage
+    """
+    op = record.get("op")
+    timestamp = record.get("ts")
+    phases = data.setdefault("phases", {})
+
+    if op == OP_ENTRY:
+        entry = record.get("entry") or {}
+        phase_key = entry.get("phase")
+        if phase_key not in phases:
+            phases[phase_key] = _new_phase(phase_key, timestamp)
+        phases[phase_key]["entries"].append(entry)
+    elif op == OP_PHASE_STATUS:
+        phase_key = record.get("phase")
+        if phase_key in phases:
+            phases[phase_key]["status"] = record.get("status")
+            if record.get("completed_at"):
+                phases[phase_key]["completed_at"] = record["completed_at"]
+    elif op == OP_PHASE_STARTED:
+        phase_key = record.get("phase")
+        if phase_key in phases:
+            phases[phase_key]["started_at"] = record.get("started_at")
+    elif op == OP_SPEC_ID:
+        data["spec_id"] = record.get("spec_id")
+
+    if timestamp:
+        data["updated_at"] = timestamp
+    if "seq" in record:
+        data["journal_seq"] = record["seq"]
+
+
+def _replay_journal(data: dict, journal_file: Path) -> None:
+    """
+    Apply journal records newer than the snapshot to a logs dictionary.
+
+    Records whose sequence number is already covered by the snapshot's
+    ``journal_seq`` are skipped, so a crash between writing the snapshot and
+    truncating the journal never duplicates entries. A torn final line (from a
+    crash mid-append) is ignored.
+
+    Args:
+        data: Logs dictionary loaded from the snapshot
+        journal_file: Path to the journal file
+    """
+    if not journal_file.exists():
+        return
+
+    applied_seq = data.get("journal_seq", 0)
+    try:
+        with open(journal_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("seq", 0) <= applied_seq:
+                    continue
+                _apply_record(data, record)
+                applied_seq = record.get("seq", applied_seq)
+    except (OSError, UnicodeDecodeError):
+        pass
+
 
 class LogStorage:
-    """Handles persistent storage of task logs."""
+    """
+    Handles persistent storage of task logs.
+
+    In journal mode (the default) every change is appended to the journal and
+    the snapshot is only rewritten when:
+
+    - it is still small (below COMPACT_MIN_BYTES), so short logs stay
+      immediately visible in task_logs.json exactly as before
+    - the journal has grown to COMPACT_RATIO of the snapshot size, which keeps
+      the amortized cost per entry constant
+    - COMPACT_DELAY_SECONDS after the first uncompacted change, so the UI
+      never lags more than about one poll interval behind
+    - save() is called explicitly (e.g. at phase end)
+    """
 
     LOG_FILE = "task_logs.json"
+    JOURNAL_FILE = "task_logs.journal.jsonl"
 
-    def __init__(self, spec_dir: Path):
+    # Snapshots smaller than this are rewritten on every change
+    COMPACT_MIN_BYTES = 64 * 1024
+    # Compact once the journal reaches this fraction of the snapshot size
+    COMPACT_RATIO = 0.5
+    # Maximum delay before pending journal records are folded into the snapshot
+    COMPACT_DELAY_SECONDS = 1.0
+
+    def __init__(self, spec_dir: Path, journal: bool = True):
         """
         Initialize log storage.
 
         Args:
             spec_dir: Path to the spec directory
+            journal: Whether to append changes to the journal instead of
+                rewriting task_logs.json on every entry
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
+        self.journal_file = self.spec_dir / self.JOURNAL_FILE
+        self.journal = journal
+        self._lock = threading.RLock()  # Protects _data, journal state and timer
+        self._compact_timer: threading.Timer | None = None
+        self._snapshot_bytes = 0
+        self._journal_bytes = 0
         self._data: dict = self._load_or_create()
+        self._seq: int = self._data.get("journal_seq", 0)
 
     def _load_or_create(self) -> dict:
-        """Load existing logs or create new structure."""
+        """Load existing logs (replaying any journal) or create new structure."""
         if self.log_file.exists():
             try:
                 with open(self.log_file, encoding="utf-8") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._snapshot_bytes = self.log_file.stat().st_size
+                _replay_journal(data, self.journal_file)
+                return data
             except (OSError, json.JSONDecodeError, UnicodeDecodeError):
                 pass
 
-        return {
+        data = {
             "spec_id": self.spec_dir.name,
             "created_at": self._timestamp(),
             "updated_at": self._timestamp(),
@@ -65,10 +198,27 @@ class LogStorage:
                 },
             },
         }
+        # Recover entries journaled before the snapshot was first written
+        _replay_journal(data, self.journal_file)
+        return data
 
     def save(self) -> None:
         """Save logs to file atomically to prevent corruption from concurrent reads."""
+        with self._lock:
+            self._cancel_compaction()
+            self._write_snapshot()
+
+    def flush(self) -> None:
+        """Fold any pending journal records into task_logs.json."""
+        with self._lock:
+            if self._journal_bytes or self._compact_timer is not None:
+                self.save()
+
+    def _write_snapshot(self) -> None:
+        """Write the full snapshot and truncate the journal. Caller holds the lock."""
         self._data["updated_at"] = self._timestamp()
+        if self.journal:
+            self._data["journal_seq"] = self._seq
         try:
             self.spec_dir.mkdir(parents=True, exist_ok=True)
             # Write to temp file first, then atomic rename to prevent corruption
@@ -81,11 +231,17 @@ class LogStorage:
                     json.dump(self._data, f, indent=2, ensure_ascii=False)
                 # Atomic rename (on POSIX systems, rename is atomic)
                 os.replace(tmp_path, self.log_file)
+                self._snapshot_bytes = os.path.getsize(self.log_file)
             except Exception:
                 # Clean up temp file on failure
                 if os.path.exists(tmp_path):
                     os.unlink(tmp_path)
                 raise
+            # The snapshot now covers every journaled record (journal_seq),
+            # so the journal can be truncated
+            if self._journal_bytes or self.journal_file.exists():
+                self.journal_file.unlink(missing_ok=True)
+                self._journal_bytes = 0
         except OSError as e:
             print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
 
@@ -93,6 +249,76 @@ class LogStorage:
         """Get current timestamp in ISO format."""
         return datetime.now(timezone.utc).isoformat()
 
+    def _record(self, record: dict, persist: bool = True) -> None:
+        """
+        Apply a change to the in-memory logs and persist it.
+
+        In journal mode the record is appended to the journal and the snapshot
+        is compacted according to the class-level policy. In legacy mode the
+        full snapshot is rewritten when ``persist`` is set.
+
+        Args:
+            record: Journal record (without seq/ts, which are filled in here)
+            persist: Whether the change should be written to task_logs.json
+                right away when the snapshot is small (phase bookkeeping is
+                deferred until the entry that follows it)
+        """
+        with self._lock:
+            record["ts"] = self._timestamp()
+            if self.journal:
+                self._seq += 1
+                record["seq"] = self._seq
+            _apply_record(self._data, record)
+
+            if not self.journal:
+                if persist:
+                    self._write_snapshot()
+                return
+
+            if persist and self._snapshot_bytes < self.COMPACT_MIN_BYTES:
+                self._cancel_compaction()
+                self._write_snapshot()
+                return
+
+            if not self._append_journal(record):
+                # Journal unavailable - fall back to a full snapshot write
+                self._cancel_compaction()
+                self._write_snapshot()
+                return
+
+            if self._journal_bytes >= self._snapshot_bytes * self.COMPACT_RATIO:
+                self._cancel_compaction()
+                self._write_snapshot()
+            else:
+                self._schedule_compaction()
+
+    def _append_journal(self, record: dict) -> bool:
+        """Append one record to the journal. Returns False if the write failed."""
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        try:
+            self.spec_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_file, "a", encoding="utf-8") as f:
+                f.write(line)
+            self._journal_bytes += len(line.encode("utf-8"))
+            return True
+        except OSError as e:
+            print(f"Warning: Failed to append task log journal: {e}", file=sys.stderr)
+            return False
+
+    def _schedule_compaction(self) -> None:
+        """Schedule a compaction unless one is already pending. Caller holds the lock."""
+        if self._compact_timer is not None:
+            return
+        # Non-daemon so pending records are still compacted at interpreter exit
+        self._compact_timer = threading.Timer(self.COMPACT_DELAY_SECONDS, self.flush)
+        self._compact_timer.start()
+
+    def _cancel_compaction(self) -> None:
+        """Cancel any pending compaction. Caller holds the lock."""
+        if self._compact_timer is not None:
+            self._compact_timer.cancel()
+            self._compact_timer = None
+
     def add_entry(self, entry: LogEntry) -> None:
         """
         Add an entry to the specified phase.
@@ -100,19 +326,7 @@ class LogStorage:
         Args:
             entry: The log entry to add
         """
-        phase_key = entry.phase
-        if phase_key not in self._data["phases"]:
-            # Create phase if it doesn't exist
-            self._data["phases"][phase_key] = {
-                "phase": phase_key,
-                "status": "active",
-                "started_at": self._timestamp(),
-                "completed_at": None,
-                "entries": [],
-            }
-
-        self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+        self._record({"op": OP_ENTRY, "entry": entry.to_dict()})
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: str | None = None
@@ -126,9 +340,15 @@ class LogStorage:
             completed_at: Optional completion timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["status"] = status
-            if completed_at:
-                self._data["phases"][phase]["completed_at"] = completed_at
+            self._record(
+                {
+                    "op": OP_PHASE_STATUS,
+                    "phase": phase,
+                    "status": status,
+                    "completed_at": completed_at,
+                },
+                persist=False,
+            )
 
     def set_phase_started(self, phase: str, started_at: str) -> None:
         """
@@ -139,7 +359,10 @@ class LogStorage:
             started_at: Start timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["started_at"] = started_at
+            self._record(
+                {"op": OP_PHASE_STARTED, "phase": phase, "started_at": started_at},
+                persist=False,
+            )
 
     def get_data(self) -> dict:
         """Get all log data."""
@@ -156,13 +379,16 @@ class LogStorage:
         Args:
             new_spec_id: New spec ID
         """
-        self._data["spec_id"] = new_spec_id
+        self._record({"op": OP_SPEC_ID, "spec_id": new_spec_id}, persist=False)
 
 
 def load_task_logs(spec_dir: Path) -> dict | None:
     """
     Load task logs from a spec directory.
 
+    Any journal records not yet compacted into task_logs.json are applied, so
+    the result always reflects the latest logged state.
+
     Args:
         spec_dir: Path to the spec directory
 
@@ -175,10 +401,13 @@ def load_task_logs(spec_dir: Path) -> dict | None:
 
     try:
         with open(log_file, encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except (OSError, json.JSONDecodeError, UnicodeDecodeError):
         return None
 
+    _replay_journal(data, spec_dir / LogStorage.JOURNAL_FILE)
+    return data
+
 
 def get_active_phase(spec_dir: Path) -> str | None:
     """
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Tests for Batch Runs
+====================
+
+Tests the --batch-run executor against a stand-in run.py script.
+
+Covers:
+- Selecting approved, unfinished specs in priority order
+- Concurrency limit across builds
+- Holding back new builds after a rate_limit_paused marker
+- Sharing the resolved auth token, and reporting failed builds
+"""
+
+import asyncio
+import importlib
+import json
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+# cli.utils exits at import time without python-dotenv
+pytest.importorskip("dotenv")
+
+from review import ReviewState
+
+FAKE_RUN_SCRIPT = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    spec = sys.argv[sys.argv.index("--spec") + 1]
+    record = os.environ["BATCH_TEST_RECORD"]
+
+    def log(event, **data):
+        with open(record, "a") as f:
+            f.write(json.dumps({"spec": spec, "event": event, "t": time.time(),
+                                **data}) + "\\n")
+
+    def phase(name, message="", **extra):
+        payload = {"phase": name, "message": message, **extra}
+        print("__EXEC_PHASE__:" + json.dumps(payload), flush=True)
+
+    log("start", args=sys.argv[1:], token=os.environ.get("CLAUDE_CODE_OAUTH_TOKEN"))
+    phase("coding", "Working")
+    print("regular output line", flush=True)
+    if spec.endswith("limited"):
+        phase("rate_limit_paused", "Rate limit", reset_timestamp=time.time() + 1)
+    time.sleep(0.3)
+    log("end")
+    if spec.endswith("broken"):
+        sys.exit(3)
+    phase("complete", "Done")
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def batch():
+    """
+    cli.batch_commands, removed from sys.modules again afterwards.
+
+    Importing it runs cli/__init__, which loads the real progress and qa
+    modules that later test modules replace with mocks.
+    """
+    saved = dict(sys.modules)
+    yield importlib.import_module("cli.batch_commands")
+    for name in set(sys.modules) - set(saved):
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+def _spec(batch, name: str, priority: int = 5):
+    return batch.BatchSpec(priority, name, Path(name))
+
+
+def _records(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _started(out: str) -> list[str]:
+    """Spec names in the order the runner reported starting them."""
+    return [
+        line.split("[", 1)[1].split("]", 1)[0]
+        for line in out.splitlines()
+        if "] starting (priority" in line
+    ]
+
+
+@pytest.fixture
+def fake_run(temp_dir: Path, monkeypatch):
+    script = temp_dir / "fake_run.py"
+    script.write_text(FAKE_RUN_SCRIPT)
+    record = temp_dir / "record.jsonl"
+    monkeypatch.setenv("BATCH_TEST_RECORD", str(record))
+    return script, record
+
+
+def _runner(batch, temp_dir: Path, fake_run, specs, **kwargs):
+    script, _ = fake_run
+    return batch.BatchRunner(temp_dir, specs, run_script=script, **kwargs)
+
+
+class TestCollectBatchSpecs:
+    """Tests for collect_batch_specs()."""
+
+    def test_ready_specs_in_priority_order(self, batch, temp_dir: Path):
+        specs_dir = temp_dir / ".auto-claude" / "specs"
+
+        def make(name, priority=None, spec=True, approved=True, done=False):
+            spec_dir = specs_dir / name
+            spec_dir.mkdir(parents=True)
+            if priority is not None:
+                (spec_dir / "requirements.json").write_text(
+                    json.dumps({"priority": priority})
+                )
+            if spec:
+                (spec_dir / "spec.md").write_text(f"# {name}\n")
+            if approved:
+                ReviewState().approve(spec_dir, approved_by="test")
+            if done:
+                plan = {"phases": [{"subtasks": [{"status": "completed"}]}]}
+                (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+        make("001-default")
+        make("002-urgent", priority=1)
+        make("003-later", priority=9)
+        make("004-no-spec", spec=False)
+        make("005-unapproved", approved=False)
+        make("006-done", done=True)
+
+        names = [s.name for s in batch.collect_batch_specs(temp_dir)]
+        assert names == ["002-urgent", "001-default", "003-later"]
+
+        forced = [s.name for s in batch.collect_batch_specs(temp_dir, force=True)]
+        assert forced == ["002-urgent", "001-default", "005-unapproved", "003-later"]
+
+
+class TestBatchRunner:
+    """Tests for BatchRunner.run()."""
+
+    def test_priority_order_and_concurrency(
+        self, batch, temp_dir: Path, fake_run, capsys
+    ):
+        specs = [
+            _spec(batch, "c", 5),
+            _spec(batch, "a", 1),
+            _spec(batch, "d", 7),
+            _spec(batch, "b", 3),
+        ]
+        runner = _runner(batch, temp_dir, fake_run, specs, max_concurrent=2)
+
+        results = asyncio.run(runner.run())
+
+        assert results == {"a": 0, "b": 0, "c": 0, "d": 0}
+        assert _started(capsys.readouterr().out) == ["a", "b", "c", "d"]
+        records = _records(fake_run[1])
+
+        active, peak = 0, 0
+        for record in sorted(records, key=lambda r: r["t"]):
+            active += 1 if record["event"] == "start" else -1
+            peak = max(peak, active)
+        assert peak == 2
+
+        log = (temp_dir / ".auto-claude" / "batch" / "a.log").read_text()
+        assert "regular output line" in log
+
+    def test_rate_limit_holds_back_new_builds(self, batch, temp_dir: Path, fake_run):
+        specs = [_spec(batch, "1-limited", 1), _spec(batch, "2-next", 2)]
+        runner = _runner(batch, temp_dir, fake_run, specs, max_concurrent=1)
+
+        asyncio.run(runner.run())
+
+        records = {(r["spec"], r["event"]): r["t"] for r in _records(fake_run[1])}
+        gap = records[("2-next", "start")] - records[("1-limited", "start")]
+        assert gap >= 1.0
+        assert not (temp_dir / ".auto-claude" / "batch" / "RATE_LIMIT_PAUSE").exists()
+
+    def test_shared_token_args_and_failures(
+        self, batch, temp_dir: Path, fake_run, capsys
+    ):
+        specs = [_spec(batch, "ok"), _spec(batch, "x-broken")]
+        runner = _runner(
+            batch,
+            temp_dir,
+            fake_run,
+            specs,
+            max_concurrent=2,
+            build_args=["--model", "opus"],
+            env={**os.environ, "CLAUDE_CODE_OAUTH_TOKEN": "shared-token"},
+        )
+
+        start = time.monotonic()
+        results = asyncio.run(runner.run())
+
+        assert time.monotonic() - start < 2.0
+        assert results == {"ok": 0, "x-broken": 3}
+        for record in _records(fake_run[1]):
+            if record["event"] == "start":
+                assert record["token"] == "shared-token"
+                assert "--isolated" in record["args"]
+                assert "--auto-continue" in record["args"]
+                assert record["args"][-2:] == ["--model", "opus"]
+
+        out = capsys.readouterr().out
+        assert "[ok] coding: Working" in out
+        assert "[x-broken] failed (exit 3)" in out
+        assert "regular output line" not in out
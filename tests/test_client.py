@@ -7,8 +7,10 @@ Tests the client.py and simple_client.py module functionality including:
 - Token validation before SDK initialization
 - Encrypted token rejection
 - Client creation with valid tokens
+- Project index snapshot caching
 """
 
+import json
 import os
 from unittest.mock import MagicMock, patch
 
@@ -593,3 +595,81 @@ class TestSimpleClientAPIProfileAuthentication:
 
             # Verify SDK client was created successfully
             assert client is mock_sdk_client
+
+
+class TestProjectIndexCache:
+    """Tests for the shared project index snapshot."""
+
+    @pytest.fixture(autouse=True)
+    def clean_cache(self):
+        from core.client import invalidate_project_cache
+
+        invalidate_project_cache()
+        zeroed = {"hits": 0, "misses": 0, "invalidations": 0, "load_time_ms": 0.0}
+        with patch.dict("core.client._CACHE_STATS", zeroed):
+            yield
+        invalidate_project_cache()
+
+    @staticmethod
+    def _write_index(project_dir, services):
+        index_file = project_dir / ".auto-claude" / "project_index.json"
+        index_file.parent.mkdir(exist_ok=True)
+        index_file.write_text(json.dumps({"services": services}))
+        return index_file
+
+    @staticmethod
+    def _bump_mtime(path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_hits_share_read_only_snapshot(self, tmp_path):
+        """Repeat calls return the same frozen objects without reloading."""
+        from core.client import _get_cached_project_data, get_project_cache_stats
+
+        self._write_index(tmp_path, {"web": {"dependencies": ["electron"]}})
+
+        first_index, first_caps = _get_cached_project_data(tmp_path)
+        second_index, second_caps = _get_cached_project_data(tmp_path)
+
+        assert second_index is first_index
+        assert second_caps is first_caps
+        assert first_caps["is_electron"] is True
+        with pytest.raises(TypeError):
+            first_caps["is_electron"] = False
+        with pytest.raises(TypeError):
+            first_index["services"]["web"]["dependencies"][0] = "vue"
+        stats = get_project_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_index_change_reloads(self, tmp_path):
+        """Rewriting project_index.json is picked up on the next call."""
+        from core.client import _get_cached_project_data, get_project_cache_stats
+
+        index_file = self._write_index(tmp_path, {"web": {"framework": "react"}})
+        _, caps = _get_cached_project_data(tmp_path)
+        assert caps["is_nextjs"] is False
+
+        self._write_index(tmp_path, {"web": {"framework": "nextjs"}})
+        self._bump_mtime(index_file)
+        _, caps = _get_cached_project_data(tmp_path)
+
+        assert caps["is_nextjs"] is True
+        assert get_project_cache_stats()["invalidations"] == 1
+
+    def test_service_manifest_change_invalidates(self, tmp_path):
+        """Touching a manifest in an indexed service directory reloads."""
+        from core.client import _get_cached_project_data, get_project_cache_stats
+
+        service_dir = tmp_path / "frontend"
+        service_dir.mkdir()
+        manifest = service_dir / "package.json"
+        manifest.write_text("{}")
+        self._write_index(tmp_path, {"frontend": {"path": str(service_dir)}})
+
+        _get_cached_project_data(tmp_path)
+        _get_cached_project_data(tmp_path)
+        self._bump_mtime(manifest)
+        _get_cached_project_data(tmp_path)
+
+        stats = get_project_cache_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
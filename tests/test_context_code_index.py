@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent code index used by context building.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add apps/backend directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from context.code_index import CodeIndex
+from context.pattern_discovery import PatternDiscoverer
+from context.search import CodeSearcher
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Small project with a service directory and a skipped directory."""
+    service = tmp_path / "backend"
+    (service / "api").mkdir(parents=True)
+    (service / "api" / "retry.py").write_text(
+        "import time\n"
+        "\n"
+        "def retry_request(proxy):\n"
+        "    # Retry when the proxy fails\n"
+        "    for attempt in range(3):\n"
+        "        autoretry = proxy.retry()\n"
+        "    return autoretry\n"
+    )
+    (service / "api" / "proxy.py").write_text("class Proxy:\n    pass\n")
+    (service / "README.md").write_text("retry retry retry\n")
+    (service / "node_modules").mkdir()
+    (service / "node_modules" / "lib.js").write_text("retry();\n")
+    return tmp_path
+
+
+def _as_tuples(matches):
+    return [
+        (m.path, m.relevance_score, m.reason, m.matching_lines) for m in matches
+    ]
+
+
+class TestCodeIndex:
+    """Tests for CodeIndex lookups and incremental refresh."""
+
+    def test_lookup_counts_substring_occurrences(self, project):
+        index = CodeIndex(project)
+        hits = index.lookup("retry", "backend")
+
+        assert set(hits) == {"backend/api/retry.py"}
+        hit = hits["backend/api/retry.py"]
+        assert hit.count == project.joinpath("backend/api/retry.py").read_text().lower().count("retry")
+        assert hit.lines == [3, 4, 6]
+
+    def test_index_matches_scanning_search(self, project):
+        keywords = ["retry", "proxy", "attempt"]
+        scanned = CodeSearcher(project).search_service(
+            project / "backend", "backend", keywords
+        )
+        indexed = CodeSearcher(project, CodeIndex(project)).search_service(
+            project / "backend", "backend", keywords
+        )
+
+        assert _as_tuples(indexed) == _as_tuples(scanned)
+
+    def test_refresh_picks_up_changes(self, project):
+        CodeIndex(project).refresh()
+
+        changed = project / "backend" / "api" / "proxy.py"
+        changed.write_text("class Proxy:\n    def retry(self):\n        pass\n")
+        os.utime(changed, ns=(1, 1))
+        (project / "backend" / "api" / "retry.py").unlink()
+
+        hits = CodeIndex(project).lookup("retry")
+        assert set(hits) == {"backend/api/proxy.py"}
+        assert hits["backend/api/proxy.py"].lines == [2]
+
+    def test_unsupported_keywords_fall_back_to_scan(self, project):
+        searcher = CodeSearcher(project, CodeIndex(project))
+        matches = searcher.search_service(project / "backend", "backend", ["proxy.retry"])
+
+        assert [m.path for m in matches] == [str(Path("backend/api/retry.py"))]
+
+    def test_pattern_discovery_uses_index(self, project):
+        keywords = ["retry", "attempt"]
+        searcher = CodeSearcher(project)
+        references = searcher.search_service(project / "backend", "backend", keywords)
+
+        scanned = PatternDiscoverer(project).discover_patterns(references, keywords)
+        indexed = PatternDiscoverer(project, CodeIndex(project)).discover_patterns(
+            references, keywords
+        )
+
+        assert indexed == scanned
+        assert set(indexed) == {"retry_pattern", "attempt_pattern"}
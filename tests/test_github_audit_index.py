@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for Indexed Audit Log Queries
+===================================
+
+Tests the per-segment sidecar index behind AuditLogger.query_logs().
+
+Covers:
+- Filtered queries matching a full scan
+- Incremental indexing of the active segment
+- Skipping segments outside the `since` window
+- Rotation moving the index with its segment
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from audit import ActorType, AuditAction, AuditLogger, AuditSegmentIndex
+
+
+def _log_pr_activity(audit: AuditLogger, pr_number: int, repo: str = "owner/repo"):
+    ctx = audit.start_operation(
+        actor_type=ActorType.AUTOMATION, repo=repo, pr_number=pr_number
+    )
+    audit.log(ctx, AuditAction.PR_REVIEW_STARTED)
+    audit.log(ctx, AuditAction.PR_REVIEW_COMPLETED, token_usage={"input_tokens": 10})
+    return ctx
+
+
+class TestIndexedQueries:
+    """Tests for query_logs() through the segment index."""
+
+    def test_filters_match_entries(self, temp_dir: Path):
+        """Indexed lookups return the same entries a full scan would."""
+        audit = AuditLogger(log_dir=temp_dir)
+        ctx = _log_pr_activity(audit, 1)
+        _log_pr_activity(audit, 2)
+        _log_pr_activity(audit, 1, repo="other/repo")
+
+        by_pr = audit.query_logs(repo="owner/repo", pr_number=1)
+        completed = audit.query_logs(action=AuditAction.PR_REVIEW_COMPLETED)
+        history = audit.get_operation_history(ctx.correlation_id)
+
+        assert [(e.pr_number, e.action) for e in by_pr] == [
+            (1, AuditAction.PR_REVIEW_STARTED),
+            (1, AuditAction.PR_REVIEW_COMPLETED),
+        ]
+        assert len(completed) == 3
+        assert [e.correlation_id for e in history] == [ctx.correlation_id] * 2
+        assert audit.query_logs(pr_number=99) == []
+        assert audit.get_statistics()["total_input_tokens"] == 30
+
+    def test_index_extended_incrementally(self, temp_dir: Path):
+        """New lines are indexed from the previous size, not re-read."""
+        audit = AuditLogger(log_dir=temp_dir)
+        _log_pr_activity(audit, 1)
+        assert len(audit.query_logs()) == 2
+
+        log_file = audit._get_log_file_path()
+        indexed_size = audit._segment_indexes[log_file].size
+        _log_pr_activity(audit, 2)
+
+        seeks = []
+        original_extend = AuditSegmentIndex.extend
+
+        def tracking_extend(index, path):
+            seeks.append(index.size)
+            return original_extend(index, path)
+
+        with patch.object(AuditSegmentIndex, "extend", tracking_extend):
+            entries = audit.query_logs(pr_number=2)
+
+        assert seeks == [indexed_size]
+        assert len(entries) == 2
+        sidecar = json.loads(AuditSegmentIndex.path_for(log_file).read_text())
+        assert sidecar["size"] == log_file.stat().st_size
+
+    def test_sidecar_reused_by_new_logger(self, temp_dir: Path):
+        """A fresh logger loads the sidecar instead of reindexing."""
+        _log_pr_activity(AuditLogger(log_dir=temp_dir), 1)
+        AuditLogger(log_dir=temp_dir).query_logs()
+
+        with patch.object(AuditSegmentIndex, "extend") as extend:
+            entries = AuditLogger(log_dir=temp_dir).query_logs(pr_number=1)
+
+        extend.assert_not_called()
+        assert len(entries) == 2
+
+    def test_partial_line_left_for_later(self, temp_dir: Path):
+        """A line still being written is neither returned nor skipped."""
+        audit = AuditLogger(log_dir=temp_dir)
+        _log_pr_activity(audit, 1)
+        log_file = audit._get_log_file_path()
+        line = log_file.read_text().splitlines()[0]
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line[:20])
+
+        assert len(audit.query_logs()) == 2
+
+        with open(log_file, "a", encoding="utf-8") as f:
+            f.write(line[20:] + "\n")
+
+        assert len(audit.query_logs()) == 3
+
+
+class TestSegments:
+    """Tests for segment skipping and rotation."""
+
+    def test_since_skips_old_segments(self, temp_dir: Path):
+        """Segments ending before `since` are not opened."""
+        old = temp_dir / "audit_2000-01-01.jsonl"
+        audit = AuditLogger(log_dir=temp_dir)
+        ctx = audit.start_operation(actor_type=ActorType.SYSTEM, pr_number=5)
+        entry = audit.log(ctx, AuditAction.PR_REVIEW_STARTED)
+        entry.timestamp = datetime(2000, 1, 1, tzinfo=timezone.utc)
+        old.write_text(entry.to_json() + "\n")
+
+        assert len(audit.query_logs(pr_number=5)) == 2
+
+        opened = []
+        original_open = open
+
+        def tracking_open(path, *args, **kwargs):
+            opened.append(Path(path).name)
+            return original_open(path, *args, **kwargs)
+
+        since = datetime.now(timezone.utc) - timedelta(hours=1)
+        with patch("builtins.open", tracking_open):
+            entries = audit.query_logs(pr_number=5, since=since)
+
+        assert len(entries) == 1
+        assert old.name not in opened
+
+    def test_rotation_moves_index(self, temp_dir: Path):
+        """A rotated segment keeps its index; the new active file starts fresh."""
+        audit = AuditLogger(log_dir=temp_dir)
+        _log_pr_activity(audit, 1)
+        audit.query_logs()
+
+        audit.max_file_size_mb = 0
+        audit._rotate_if_needed()
+        audit.max_file_size_mb = 100
+        _log_pr_activity(audit, 2)
+
+        rotated = [
+            p for p in temp_dir.glob("audit_*.jsonl") if p != audit._get_log_file_path()
+        ]
+        assert len(rotated) == 1
+        assert AuditSegmentIndex.path_for(rotated[0]).exists()
+        assert [e.pr_number for e in audit.query_logs(pr_number=2)] == [2, 2]
+        assert len(audit.query_logs(pr_number=1)) == 2
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Tests for Batched Embeddings and the Binary Embedding Cache
+===========================================================
+
+Tests how DuplicateDetector computes and stores issue embeddings.
+
+Covers:
+- Cache misses embedded in provider-sized batches, concurrently
+- Append-only float32 cache shared across detector instances
+- Migration of the legacy JSON cache
+- Compaction of superseded rows
+- Concurrent appends from several detectors keeping offsets consistent
+- Title/body embeddings requested together in compare_issues()
+- A bounded title/body embedding memo
+"""
+
+import asyncio
+import json
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import duplicates
+from duplicates import DuplicateDetector
+
+REPO = "owner/repo"
+
+
+class BatchProvider:
+    """Records each batch request; embeddings derive from text length."""
+
+    def __init__(self, delay: float = 0.0):
+        self.batches: list[list[str]] = []
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_embedding(self, text: str) -> list[float]:
+        return (await self.get_embeddings([text]))[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return [[float(len(text)), 1.0, 0.5] for text in texts]
+
+
+def _issues(count: int, start: int = 1) -> list[dict]:
+    return [
+        {"number": n, "title": f"Issue {n}", "body": "x" * n}
+        for n in range(start, start + count)
+    ]
+
+
+def _detector(temp_dir: Path, provider: BatchProvider) -> DuplicateDetector:
+    detector = DuplicateDetector(cache_dir=temp_dir)
+    detector.embedding_provider = provider
+    return detector
+
+
+class TestBatchedEmbeddings:
+    """Tests for batching and concurrency of provider requests."""
+
+    def test_misses_batched_and_concurrent(self, temp_dir: Path):
+        """Misses are split into batches that run in parallel."""
+        provider = BatchProvider(delay=0.01)
+        detector = _detector(temp_dir, provider)
+
+        with patch.object(duplicates, "EMBEDDING_BATCH_SIZE", 4):
+            count = asyncio.run(detector.precompute_embeddings(REPO, _issues(10)))
+
+        assert count == 10
+        assert [len(batch) for batch in provider.batches] == [4, 4, 2]
+        assert provider.max_in_flight > 1
+
+    def test_failed_batch_skipped(self, temp_dir: Path):
+        """A failing batch drops only its own issues."""
+        provider = BatchProvider()
+        original = provider.get_embeddings
+
+        async def flaky(texts):
+            if "Issue 1\n" in texts[0]:
+                raise RuntimeError("provider down")
+            return await original(texts)
+
+        provider.get_embeddings = flaky
+        detector = _detector(temp_dir, provider)
+
+        with patch.object(duplicates, "EMBEDDING_BATCH_SIZE", 2):
+            embeddings = asyncio.run(detector._get_embeddings(REPO, _issues(4)))
+
+        assert sorted(embeddings) == [3, 4]
+
+    def test_compare_issues_single_part_request(self, temp_dir: Path):
+        """Title and body embeddings for a pair come from one request."""
+        provider = BatchProvider()
+        detector = _detector(temp_dir, provider)
+        issue_a, issue_b = _issues(2)
+
+        async def run():
+            await detector._get_embeddings(REPO, [issue_a, issue_b])
+            provider.batches.clear()
+            await detector.compare_issues(REPO, issue_a, issue_b)
+            await detector.compare_issues(REPO, issue_a, issue_b)
+
+        asyncio.run(run())
+
+        assert provider.batches == [["Issue 1", "Issue 2", "x", "xx"]]
+
+    def test_text_memo_bounded(self, temp_dir: Path):
+        """Only the most recent title/body embeddings stay memoized."""
+        provider = BatchProvider()
+        detector = _detector(temp_dir, provider)
+
+        with patch.object(duplicates, "MAX_MEMOIZED_TEXTS", 2):
+            first = asyncio.run(detector._embed_texts(["a", "bb", "ccc"]))
+            asyncio.run(detector._embed_texts(["ccc"]))
+
+        assert first == [[1.0, 1.0, 0.5], [2.0, 1.0, 0.5], [3.0, 1.0, 0.5]]
+        assert len(detector._texts) == 2
+        assert len(provider.batches) == 1
+
+
+class TestBinaryCache:
+    """Tests for the append-only float32 cache."""
+
+    def test_concurrent_appends_keep_offsets(self, temp_dir: Path):
+        """Detectors appending at once never record another row's offset."""
+        detectors = [_detector(temp_dir, BatchProvider()) for _ in range(4)]
+
+        def append(worker: int, detector: DuplicateDetector) -> None:
+            for i in range(25):
+                number = worker * 100 + i
+                entry = detector._new_cache_entry(number, "h", [float(number)] * 3)
+                detector._append_cache(REPO, [entry])
+
+        threads = [
+            threading.Thread(target=append, args=(worker, detector))
+            for worker, detector in enumerate(detectors)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        cache = _detector(temp_dir, BatchProvider())._load_cache(REPO)
+        assert len(cache) == 100
+        assert all(e.embedding == [float(n)] * 3 for n, e in cache.items())
+
+    def test_appends_and_reloads(self, temp_dir: Path):
+        """New embeddings are appended and visible to a fresh detector."""
+        detector = _detector(temp_dir, BatchProvider())
+        asyncio.run(detector._get_embeddings(REPO, _issues(3)))
+        vectors_file, index_file = detector._get_cache_paths(REPO)
+        size = vectors_file.stat().st_size
+
+        asyncio.run(detector._get_embeddings(REPO, _issues(2, start=4)))
+
+        assert size == 3 * 3 * 4
+        assert vectors_file.stat().st_size == 5 * 3 * 4
+        assert len(index_file.read_text().splitlines()) == 5
+
+        provider = BatchProvider()
+        reloaded = _detector(temp_dir, provider)
+        embeddings = asyncio.run(reloaded._get_embeddings(REPO, _issues(5)))
+
+        assert provider.batches == []
+        assert embeddings[4] == [float(len("Issue 4\n\nxxxx")), 1.0, 0.5]
+
+    def test_changed_issue_supersedes_row(self, temp_dir: Path):
+        """Edited issues get a new row; the latest one wins on load."""
+        detector = _detector(temp_dir, BatchProvider())
+        asyncio.run(detector._get_embeddings(REPO, _issues(1)))
+        edited = [{"number": 1, "title": "Renamed", "body": ""}]
+        asyncio.run(detector._get_embeddings(REPO, edited))
+
+        reloaded = _detector(temp_dir, BatchProvider())
+        cache = reloaded._load_cache(REPO)
+
+        assert cache[1].embedding == [float(len("Renamed\n\n")), 1.0, 0.5]
+
+    def test_compaction(self, temp_dir: Path):
+        """Superseded rows are dropped once they outnumber live ones."""
+        detector = _detector(temp_dir, BatchProvider())
+        for title in ("a", "b", "c"):
+            issue = [{"number": 1, "title": title, "body": ""}]
+            asyncio.run(detector._get_embeddings(REPO, issue))
+
+        with patch.object(duplicates, "CACHE_COMPACT_MIN_STALE", 1):
+            cache = _detector(temp_dir, BatchProvider())._load_cache(REPO)
+
+        vectors_file, index_file = detector._get_cache_paths(REPO)
+        assert list(cache) == [1]
+        assert vectors_file.stat().st_size == 3 * 4
+        assert len(index_file.read_text().splitlines()) == 1
+
+    def test_truncated_append_ignored(self, temp_dir: Path):
+        """Index lines pointing past the vector file are skipped."""
+        detector = _detector(temp_dir, BatchProvider())
+        asyncio.run(detector._get_embeddings(REPO, _issues(2)))
+        vectors_file, _ = detector._get_cache_paths(REPO)
+        vectors_file.write_bytes(vectors_file.read_bytes()[:-4])
+
+        cache = _detector(temp_dir, BatchProvider())._load_cache(REPO)
+
+        assert list(cache) == [1]
+
+    def test_legacy_json_migrated(self, temp_dir: Path):
+        """A JSON cache from older versions is converted and removed."""
+        now = datetime.now(timezone.utc)
+        legacy = temp_dir / "owner_repo_embeddings.json"
+        legacy.write_text(
+            json.dumps(
+                {
+                    "embeddings": [
+                        {
+                            "issue_number": 7,
+                            "content_hash": "abc",
+                            "embedding": [0.5, 0.25],
+                            "created_at": now.isoformat(),
+                            "expires_at": (now + timedelta(hours=1)).isoformat(),
+                        }
+                    ]
+                }
+            )
+        )
+
+        detector = _detector(temp_dir, BatchProvider())
+        cache = detector._load_cache(REPO)
+
+        assert cache[7].embedding == [0.5, 0.25]
+        assert not legacy.exists()
+        assert all(path.exists() for path in detector._get_cache_paths(REPO))
+
+    def test_clear_cache(self, temp_dir: Path):
+        """Clearing removes the cache files and in-memory state."""
+        detector = _detector(temp_dir, BatchProvider())
+        asyncio.run(detector._get_embeddings(REPO, _issues(2)))
+
+        detector.clear_cache(REPO)
+
+        assert not any(path.exists() for path in detector._get_cache_paths(REPO))
+        assert detector._load_cache(REPO) == {}
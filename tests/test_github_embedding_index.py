@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for Vectorized Duplicate Detection
+========================================
+
+Tests the embedding index behind DuplicateDetector.find_duplicates().
+
+Covers:
+- Exact top-k search with NumPy and in pure Python
+- Approximate (LSH) search on large collections
+- Saving and memory-mapping the embedding matrix
+- Building find_duplicates()' index from the binary embedding cache
+- find_duplicates() only running full comparisons for top candidates
+"""
+
+import asyncio
+import random
+import sys
+from array import array
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import embedding_index
+from duplicates import DuplicateDetector
+from embedding_index import EmbeddingIndex, cosine_similarity
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request):
+    """Run a test with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+        yield request.param
+    else:
+        with patch.object(embedding_index, "np", None):
+            yield request.param
+
+
+def _random_vectors(count: int, dim: int, seed: int = 1) -> list[list[float]]:
+    rng = random.Random(seed)
+    return [[rng.gauss(0, 1) for _ in range(dim)] for _ in range(count)]
+
+
+class TestEmbeddingIndex:
+    """Tests for EmbeddingIndex."""
+
+    def test_search_matches_pairwise_cosine(self, backend):
+        """Top-k results agree with scoring each pair individually."""
+        vectors = _random_vectors(50, 16)
+        index = EmbeddingIndex()
+        for key, vector in enumerate(vectors):
+            index.add(key, vector)
+
+        query = vectors[7]
+        expected = sorted(
+            ((key, cosine_similarity(query, v)) for key, v in enumerate(vectors)),
+            key=lambda item: item[1],
+            reverse=True,
+        )[1:4]
+
+        results = index.search(query, k=3, exclude={7})
+
+        assert [key for key, _ in results] == [key for key, _ in expected]
+        for (_, score), (_, want) in zip(results, expected):
+            assert score == pytest.approx(want, abs=1e-5)
+
+    def test_min_score_and_dimension_mismatch(self, backend):
+        """Low scores are dropped and mismatched vectors are rejected."""
+        index = EmbeddingIndex()
+        index.add(1, [1.0, 0.0])
+        index.add(2, [0.0, 1.0])
+
+        assert not index.add(3, [1.0, 0.0, 0.0])
+        assert index.search([1.0, 0.1], k=5, min_score=0.5) == [
+            (1, pytest.approx(0.995, abs=1e-3))
+        ]
+        assert index.search([1.0, 0.0, 0.0], k=5) == []
+
+    def test_save_and_load(self, backend, temp_dir: Path):
+        """Saved rows load back (memory-mapped with NumPy) and stay appendable."""
+        vectors = _random_vectors(10, 8)
+        index = EmbeddingIndex()
+        for key, vector in enumerate(vectors, start=100):
+            index.add(key, vector)
+        index.save(temp_dir / "embeddings.f32")
+
+        loaded = EmbeddingIndex.load(
+            temp_dir / "embeddings.f32", keys=index.keys, dim=8
+        )
+        loaded.add(200, vectors[3])
+
+        assert loaded.search(vectors[3], k=2) == [
+            (103, pytest.approx(1.0, abs=1e-5)),
+            (200, pytest.approx(1.0, abs=1e-5)),
+        ]
+
+    def test_load_selected_unnormalized_rows(self, backend, temp_dir: Path):
+        """Rows picked out of a file of raw vectors score by cosine."""
+        vectors = _random_vectors(6, 4)
+        path = temp_dir / "raw.f32"
+        path.write_bytes(array("f", [x for v in vectors for x in v]).tobytes())
+
+        loaded = EmbeddingIndex.load(
+            path, keys=[10, 30, 50], dim=4, rows=[1, 3, 5], normalized=False
+        )
+
+        assert loaded.scores(vectors[3]) == [
+            pytest.approx(cosine_similarity(vectors[3], vectors[row]), abs=1e-5)
+            for row in (1, 3, 5)
+        ]
+        loaded.add(60, vectors[0])
+        assert loaded.search(vectors[3], k=1) == [(30, pytest.approx(1.0, abs=1e-5))]
+        with pytest.raises(IndexError):
+            EmbeddingIndex.load(path, keys=[1], dim=4, rows=[6], normalized=False)
+
+    def test_approximate_search_finds_near_duplicates(self):
+        """LSH candidates include vectors close to the query."""
+        pytest.importorskip("numpy")
+        vectors = _random_vectors(300, 32)
+        with patch.object(embedding_index, "ANN_MIN_SIZE", 100):
+            index = EmbeddingIndex(approximate=True)
+            for key, vector in enumerate(vectors):
+                index.add(key, vector)
+
+            query = [x + 0.01 for x in vectors[42]]
+            results = index.search(query, k=1)
+
+        assert index._lsh is not None
+        assert results[0][0] == 42
+
+
+class FakeProvider:
+    """Deterministic embeddings keyed on the first word of the text."""
+
+    AXES = {"login": 0, "crash": 1, "docs": 2}
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_embedding(self, text: str) -> list[float]:
+        return (await self.get_embeddings([text]))[0]
+
+    async def get_embeddings(self, texts: list[str]) -> list[list[float]]:
+        self.calls += len(texts)
+        vectors = []
+        for text in texts:
+            vector = [0.01, 0.01, 0.01]
+            word = text.split()[0].lower() if text.split() else ""
+            if word in self.AXES:
+                vector[self.AXES[word]] = 1.0
+            vectors.append(vector)
+        return vectors
+
+
+class TestFindDuplicates:
+    """Tests for DuplicateDetector.find_duplicates()."""
+
+    def test_only_top_candidates_compared(self, temp_dir: Path):
+        """Full comparisons run only for issues above the similarity threshold."""
+        detector = DuplicateDetector(cache_dir=temp_dir)
+        detector.embedding_provider = FakeProvider()
+        open_issues = [
+            {"number": 1, "title": "Login fails", "body": ""},
+            {"number": 2, "title": "Crash on start", "body": ""},
+            {"number": 3, "title": "Docs typo", "body": ""},
+            {"number": 4, "title": "Login broken", "body": ""},
+        ]
+        compared = []
+        original = detector.compare_issues
+
+        async def tracking_compare(repo, issue_a, issue_b):
+            compared.append(issue_b["number"])
+            return await original(repo, issue_a, issue_b)
+
+        detector.compare_issues = tracking_compare
+
+        results = asyncio.run(
+            detector.find_duplicates(
+                repo="owner/repo",
+                issue_number=1,
+                title="Login fails",
+                body="",
+                open_issues=open_issues,
+            )
+        )
+
+        assert compared == [4]
+        assert [r.issue_b for r in results] == [4]
+
+    def test_index_reused_and_cache_saved_once(self, temp_dir: Path):
+        """Repeat lookups reuse cached embeddings and the built index."""
+        detector = DuplicateDetector(cache_dir=temp_dir)
+        provider = FakeProvider()
+        detector.embedding_provider = provider
+        issues = [
+            {"number": n, "title": f"{word} issue", "body": ""}
+            for n, word in enumerate(["login", "crash", "docs"], start=1)
+        ]
+
+        async def run():
+            embeddings = await detector._get_embeddings("owner/repo", issues)
+            first = detector._get_index("owner/repo", issues, embeddings)
+            embeddings = await detector._get_embeddings("owner/repo", issues)
+            second = detector._get_index("owner/repo", issues, embeddings)
+            return first, second
+
+        with patch.object(
+            DuplicateDetector,
+            "_append_cache",
+            autospec=True,
+            side_effect=DuplicateDetector._append_cache,
+        ) as save:
+            first, second = asyncio.run(run())
+
+        assert provider.calls == 3
+        assert save.call_count == 1
+        assert first is second
+
+    def test_index_mapped_from_embedding_cache(self, temp_dir: Path):
+        """The index reads cached rows from the .f32 file, not the lists."""
+        issues = [
+            {"number": n, "title": f"{word} issue", "body": ""}
+            for n, word in enumerate(["login", "crash", "docs", "login"], start=1)
+        ]
+
+        async def get_index(detector):
+            embeddings = await detector._get_embeddings("owner/repo", issues)
+            return detector._get_index("owner/repo", issues[1:], embeddings)
+
+        first = DuplicateDetector(cache_dir=temp_dir)
+        first.embedding_provider = FakeProvider()
+        asyncio.run(get_index(first))
+
+        # A fresh detector, as in the next CLI run, loads the cache from disk
+        detector = DuplicateDetector(cache_dir=temp_dir)
+        detector.embedding_provider = FakeProvider()
+        with patch.object(
+            EmbeddingIndex, "load", wraps=EmbeddingIndex.load
+        ) as load, patch.object(EmbeddingIndex, "add") as add:
+            index = asyncio.run(get_index(detector))
+
+        assert load.call_args.kwargs["rows"] == [1, 2, 3]
+        add.assert_not_called()
+        assert detector.embedding_provider.calls == 0
+        assert index.keys == [2, 3, 4]
+        assert index.search([1.0, 0.0, 0.0], k=1) == [
+            (4, pytest.approx(cosine_similarity([1.0, 0.0, 0.0], [1.0, 0.01, 0.01])))
+        ]
+
+    def test_index_built_in_memory_without_cache_rows(self, temp_dir: Path):
+        """Issues missing from the cache file fall back to an in-memory index."""
+        detector = DuplicateDetector(cache_dir=temp_dir)
+        issues = [{"number": 1, "title": "Login", "body": ""}]
+
+        index = detector._get_index("owner/repo", issues, {1: [1.0, 0.0, 0.0]})
+
+        assert index.keys == [1]
+        assert index.search([1.0, 0.0, 0.0], k=1) == [(1, pytest.approx(1.0))]
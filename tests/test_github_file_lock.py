@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for Async File Locking
+============================
+
+Tests the in-process coordination behind `async with FileLock(...)`.
+
+Covers:
+- Mutual exclusion with a single flock() per run of holders
+- Shared locks joining each other
+- Timeouts against in-process holders and other processes
+- Contention metrics
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import file_lock
+from file_lock import (
+    FileLock,
+    FileLockTimeout,
+    get_lock_stats,
+    locked_json_read,
+    locked_json_update,
+    locked_json_write,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_stats():
+    file_lock.reset_lock_stats()
+    yield
+
+
+def _stats(path: Path) -> dict:
+    return get_lock_stats()[str(path.absolute())]
+
+
+class TestAsyncFileLock:
+    """Tests for FileLock's async context manager."""
+
+    def test_exclusive_holders_serialized(self, temp_dir: Path):
+        """Concurrent updates all apply, with the flock handed between them."""
+        target = temp_dir / "counter.json"
+
+        def increment(data):
+            data["count"] += 1
+            return data
+
+        async def run():
+            await locked_json_write(target, {"count": 0})
+            await asyncio.gather(
+                *[locked_json_update(target, increment) for _ in range(20)]
+            )
+            return await locked_json_read(target)
+
+        with patch.object(
+            file_lock, "_try_lock", wraps=file_lock._try_lock
+        ) as try_lock:
+            result = asyncio.run(run())
+
+        assert result == {"count": 20}
+        # write, one flock for the whole batch of updates, read
+        assert try_lock.call_count == 3
+        stats = _stats(target)
+        assert stats["acquisitions"] == 22
+        assert stats["handoffs"] == 19
+        assert stats["holders"] == 0 and stats["waiters"] == 0
+        assert not (temp_dir / "counter.json.lock").exists()
+
+    def test_inside_holder_never_overlaps(self, temp_dir: Path):
+        """At most one exclusive holder runs at a time."""
+        target = temp_dir / "state.json"
+        active = []
+        peak = []
+
+        async def hold():
+            async with FileLock(target):
+                active.append(1)
+                peak.append(len(active))
+                await asyncio.sleep(0.001)
+                active.pop()
+
+        async def run():
+            await asyncio.gather(*[hold() for _ in range(10)])
+
+        asyncio.run(run())
+
+        assert max(peak) == 1
+        assert _stats(target)["contended"] == 9
+
+    def test_shared_locks_join(self, temp_dir: Path):
+        """Readers share one flock; a writer waits for all of them."""
+        target = temp_dir / "shared.json"
+        order = []
+
+        async def reader(name):
+            async with FileLock(target, exclusive=False):
+                order.append(f"{name}+")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}-")
+
+        async def writer():
+            await asyncio.sleep(0.001)
+            async with FileLock(target):
+                order.append("w")
+
+        async def run():
+            await asyncio.gather(reader("a"), reader("b"), writer())
+
+        asyncio.run(run())
+
+        assert order[:2] == ["a+", "b+"]
+        assert order[-1] == "w"
+        assert _stats(target)["flock_acquisitions"] == 2
+
+    def test_timeout_behind_in_process_holder(self, temp_dir: Path):
+        """A waiter gives up at its timeout and leaves the queue."""
+        target = temp_dir / "slow.json"
+
+        async def run():
+            async with FileLock(target):
+                with pytest.raises(FileLockTimeout):
+                    async with FileLock(target, timeout=0.05):
+                        pass
+            async with FileLock(target, timeout=0.05):
+                pass
+
+        asyncio.run(run())
+
+        stats = _stats(target)
+        assert stats["timeouts"] == 1
+        assert stats["waiters"] == 0
+        assert stats["max_wait"] < 0.05
+
+    def test_timeout_against_other_holder(self, temp_dir: Path):
+        """A flock held outside the event loop is polled until the deadline."""
+        target = temp_dir / "external.json"
+        target.write_text(json.dumps({}))
+
+        async def run():
+            with pytest.raises(FileLockTimeout):
+                async with FileLock(target, timeout=0.1):
+                    pass
+
+        with FileLock(target):
+            asyncio.run(run())
+
+        assert _stats(target)["timeouts"] == 1
+
+    def test_cancelled_waiter_passes_lock_on(self, temp_dir: Path):
+        """Cancelling a queued waiter doesn't strand the next one."""
+        target = temp_dir / "cancel.json"
+
+        async def run():
+            release = asyncio.Event()
+
+            async def holder():
+                async with FileLock(target):
+                    await release.wait()
+
+            async def waiter():
+                async with FileLock(target):
+                    return "acquired"
+
+            first = asyncio.create_task(holder())
+            await asyncio.sleep(0)
+            cancelled = asyncio.create_task(waiter())
+            last = asyncio.create_task(waiter())
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            release.set()
+            await first
+            return await asyncio.wait_for(last, timeout=1.0)
+
+        assert asyncio.run(run()) == "acquired"
+        assert _stats(target)["holders"] == 0
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for Batched Git Access in PR Context Gathering
+====================================================
+
+Tests that changed-file contents and patches are fetched with a single
+cat-file batch and a single git diff.
+
+Covers:
+- Pipelined reads through GitBatchReader
+- Splitting a multi-file diff into per-file patches
+- _fetch_changed_files() output matching per-file git commands
+- Fallback to per-file reads when the batch process is unavailable
+"""
+
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from context_gatherer import PRContextGatherer
+from git_batch import GitBatchReader, split_diff_by_file
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+@pytest.fixture
+def pr_repo(temp_git_repo: Path) -> tuple[Path, str, str]:
+    """A repo with a feature branch modifying, adding and deleting files."""
+    (temp_git_repo / "src").mkdir()
+    (temp_git_repo / "src" / "app.py").write_text("def app():\n    return 1\n")
+    (temp_git_repo / "old.txt").write_text("old\n")
+    _git(temp_git_repo, "add", ".")
+    _git(temp_git_repo, "commit", "-m", "base")
+    base_sha = _git(temp_git_repo, "rev-parse", "HEAD").strip()
+
+    _git(temp_git_repo, "checkout", "-b", "feature")
+    (temp_git_repo / "src" / "app.py").write_text("def app():\n    return 2\n")
+    (temp_git_repo / "src" / "new.py").write_text("NEW = True\n")
+    (temp_git_repo / "old.txt").unlink()
+    _git(temp_git_repo, "add", "-A")
+    _git(temp_git_repo, "commit", "-m", "feature")
+    head_sha = _git(temp_git_repo, "rev-parse", "HEAD").strip()
+    return temp_git_repo, base_sha, head_sha
+
+
+def _pr_data(base_sha: str, head_sha: str) -> dict:
+    return {
+        "headRefOid": head_sha,
+        "baseRefOid": base_sha,
+        "headRefName": "feature",
+        "baseRefName": "main",
+        "files": [
+            {"path": "src/app.py", "status": "modified"},
+            {"path": "src/new.py", "status": "added"},
+            {"path": "old.txt", "status": "removed"},
+        ],
+    }
+
+
+class TestGitBatchReader:
+    """Tests for the cat-file batch reader."""
+
+    def test_reads_objects_in_order(self, pr_repo):
+        """Objects come back in request order, None for missing ones."""
+        repo, base_sha, head_sha = pr_repo
+
+        async def read():
+            async with GitBatchReader(repo) as reader:
+                return await reader.read_many(
+                    [f"{head_sha}:src/app.py", f"{head_sha}:old.txt", "HEAD:README.md"]
+                )
+
+        assert asyncio.run(read()) == [
+            b"def app():\n    return 2\n",
+            None,
+            b"# Test Project\n",
+        ]
+
+    def test_split_diff_by_file(self, pr_repo):
+        """A multi-file diff splits into the same patches as per-file diffs."""
+        repo, base_sha, head_sha = pr_repo
+        diff = _git(repo, "diff", "--no-renames", f"{base_sha}...{head_sha}")
+
+        patches = split_diff_by_file(diff)
+
+        assert set(patches) == {"src/app.py", "src/new.py", "old.txt"}
+        assert patches["src/app.py"] == _git(
+            repo, "diff", f"{base_sha}...{head_sha}", "--", "src/app.py"
+        )
+
+
+class TestFetchChangedFiles:
+    """Tests for PRContextGatherer._fetch_changed_files()."""
+
+    def _gather(self, repo: Path, pr_data: dict):
+        with patch("context_gatherer.GHClient"):
+            gatherer = PRContextGatherer(repo, pr_number=1)
+        return asyncio.run(gatherer._fetch_changed_files(pr_data))
+
+    def test_contents_and_patches(self, pr_repo):
+        """Every file gets head content, base content and its own patch."""
+        repo, base_sha, head_sha = pr_repo
+
+        files = {f.path: f for f in self._gather(repo, _pr_data(base_sha, head_sha))}
+
+        assert files["src/app.py"].content == "def app():\n    return 2\n"
+        assert files["src/app.py"].base_content == "def app():\n    return 1\n"
+        assert "+    return 2" in files["src/app.py"].patch
+        assert files["src/new.py"].base_content == ""
+        assert files["old.txt"].content == ""
+        assert files["old.txt"].patch.startswith("diff --git a/old.txt b/old.txt")
+
+    def test_falls_back_without_batch_process(self, pr_repo):
+        """Per-file reads are used if cat-file --batch cannot start."""
+        repo, base_sha, head_sha = pr_repo
+
+        with patch.object(GitBatchReader, "start", side_effect=OSError("no git")):
+            files = self._gather(repo, _pr_data(base_sha, head_sha))
+
+        assert files[0].content == "def app():\n    return 2\n"
+        assert files[0].base_content == "def app():\n    return 1\n"
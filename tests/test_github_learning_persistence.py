@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for LearningTracker Persistence
+=====================================
+
+Tests the append-only outcome log and rolling accuracy aggregates.
+
+Covers:
+- Appending one line per recorded event
+- Lazy per-repo loading and compaction of superseded lines
+- Migration of the per-repo JSON outcome files
+- Aggregated accuracy matching a per-outcome scan
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+import learning
+from learning import LearningTracker, OutcomeType, PredictionType, ReviewOutcome
+
+
+def _outcomes_file(state_dir: Path, name: str = "owner_repo") -> Path:
+    return state_dir / "learning" / f"{name}_outcomes.jsonl"
+
+
+class TestOutcomeLog:
+    """Tests for the per-repo event log."""
+
+    def test_events_appended(self, temp_dir: Path):
+        """Each prediction or outcome adds one line; nothing is rewritten."""
+        tracker = LearningTracker(temp_dir)
+        tracker.record_prediction(
+            "owner/repo", "r1", PredictionType.REVIEW_APPROVE, pr_number=1
+        )
+        tracker.record_prediction(
+            "owner/repo", "r2", PredictionType.REVIEW_APPROVE, pr_number=2
+        )
+        tracker.record_outcome("owner/repo", "r1", OutcomeType.MERGED)
+
+        lines = _outcomes_file(temp_dir).read_text().splitlines()
+
+        assert [json.loads(line)["review_id"] for line in lines] == ["r1", "r2", "r1"]
+        assert json.loads(lines[-1])["actual_outcome"] == "merged"
+
+        reloaded = LearningTracker(temp_dir)
+        assert [o.review_id for o in reloaded.get_pending_outcomes("owner/repo")] == [
+            "r2"
+        ]
+
+    def test_repos_loaded_lazily(self, temp_dir: Path):
+        """Only the queried repo's log is read."""
+        tracker = LearningTracker(temp_dir)
+        tracker.record_prediction("owner/repo", "r1", PredictionType.TRIAGE_SPAM)
+        tracker.record_prediction("other/repo", "r2", PredictionType.TRIAGE_SPAM)
+
+        reloaded = LearningTracker(temp_dir)
+        assert reloaded._repos == {}
+
+        reloaded.record_outcome("owner/repo", "r1", OutcomeType.CLOSED)
+
+        assert list(reloaded._repos) == ["owner_repo"]
+        assert reloaded.get_accuracy().total_predictions == 2
+        assert set(reloaded._repos) == {"owner_repo", "other_repo"}
+
+    def test_superseded_lines_compacted(self, temp_dir: Path):
+        """The log is rewritten once superseded lines outnumber live ones."""
+        tracker = LearningTracker(temp_dir)
+        with patch.object(learning, "OUTCOMES_COMPACT_MIN_STALE", 3):
+            for review_id in ("r1", "r2"):
+                tracker.record_prediction(
+                    "owner/repo", review_id, PredictionType.REVIEW_APPROVE
+                )
+            tracker.record_outcome("owner/repo", "r1", OutcomeType.MERGED)
+            tracker.record_outcome("owner/repo", "r1", OutcomeType.CLOSED)
+            assert len(_outcomes_file(temp_dir).read_text().splitlines()) == 4
+
+            tracker.record_outcome("owner/repo", "r2", OutcomeType.MERGED)
+
+        lines = _outcomes_file(temp_dir).read_text().splitlines()
+        assert [json.loads(line)["actual_outcome"] for line in lines] == [
+            "closed",
+            "merged",
+        ]
+
+    def test_partial_line_dropped(self, temp_dir: Path):
+        """A truncated trailing line is skipped and compacted away."""
+        tracker = LearningTracker(temp_dir)
+        tracker.record_prediction("owner/repo", "r1", PredictionType.TRIAGE_BUG)
+        with open(_outcomes_file(temp_dir), "a", encoding="utf-8") as f:
+            f.write('{"review_id": "r2", "re')
+
+        reloaded = LearningTracker(temp_dir)
+        reloaded.record_prediction("owner/repo", "r3", PredictionType.TRIAGE_BUG)
+
+        lines = _outcomes_file(temp_dir).read_text().splitlines()
+        assert [json.loads(line)["review_id"] for line in lines] == ["r1", "r3"]
+
+    def test_legacy_json_migrated(self, temp_dir: Path):
+        """A per-repo JSON outcome file is converted to the event log."""
+        learning_dir = temp_dir / "learning"
+        learning_dir.mkdir()
+        legacy = ReviewOutcome(
+            review_id="old",
+            repo="owner/repo",
+            pr_number=3,
+            prediction=PredictionType.REVIEW_APPROVE,
+            findings_count=0,
+            high_severity_count=0,
+        )
+        (learning_dir / "owner_repo_outcomes.json").write_text(
+            json.dumps({"repo": "owner/repo", "outcomes": [legacy.to_dict()]})
+        )
+
+        tracker = LearningTracker(temp_dir)
+
+        assert [o.review_id for o in tracker.get_recent_outcomes()] == ["old"]
+        assert not (learning_dir / "owner_repo_outcomes.json").exists()
+        assert _outcomes_file(temp_dir).exists()
+
+
+class TestAccuracyAggregates:
+    """get_accuracy() from rolling counters."""
+
+    @staticmethod
+    def _scan(outcomes, since=None, prediction_type=None):
+        selected = [
+            o
+            for o in outcomes
+            if (since is None or o.created_at >= since)
+            and (prediction_type is None or o.prediction == prediction_type)
+        ]
+        return (
+            len(selected),
+            sum(1 for o in selected if o.was_correct is True),
+            sum(1 for o in selected if o.was_correct is False),
+            sum(1 for o in selected if not o.is_complete),
+        )
+
+    def test_matches_full_scan(self, temp_dir: Path):
+        """Totals agree with filtering every outcome, including `since` cuts."""
+        tracker = LearningTracker(temp_dir)
+        now = datetime.now(timezone.utc)
+        predictions = [PredictionType.REVIEW_APPROVE, PredictionType.TRIAGE_SPAM]
+        results = [OutcomeType.MERGED, OutcomeType.OVERRIDDEN, None]
+        outcomes = []
+        for i in range(30):
+            recorded = tracker.record_prediction(
+                "owner/repo", f"r{i}", predictions[i % 2], pr_number=i
+            )
+            # Re-date before the outcome so the aggregates see the change
+            state = tracker._repos["owner_repo"]
+            state.remove(recorded)
+            recorded.created_at = now - timedelta(hours=7 * i)
+            state.put(recorded)
+            if results[i % 3]:
+                tracker.record_outcome(
+                    "owner/repo",
+                    f"r{i}",
+                    results[i % 3],
+                    time_to_outcome=timedelta(hours=i),
+                )
+            outcomes.append(recorded)
+
+        for since in (None, now - timedelta(days=2, hours=5)):
+            for prediction_type in (None, PredictionType.TRIAGE_SPAM):
+                stats = tracker.get_accuracy(
+                    since=since, prediction_type=prediction_type
+                )
+                assert (
+                    stats.total_predictions,
+                    stats.correct_predictions,
+                    stats.incorrect_predictions,
+                    stats.pending_outcomes,
+                ) == self._scan(outcomes, since, prediction_type)
+
+        merged = [
+            o.time_to_outcome.total_seconds()
+            for o in outcomes
+            if o.actual_outcome == OutcomeType.MERGED and o.time_to_outcome
+        ]
+        assert tracker.get_accuracy().avg_time_to_merge == timedelta(
+            seconds=sum(merged) / len(merged)
+        )
+
+    def test_outcome_update_moves_counts(self, temp_dir: Path):
+        """Recording an outcome moves a prediction out of pending."""
+        tracker = LearningTracker(temp_dir)
+        tracker.record_prediction("owner/repo", "r1", PredictionType.REVIEW_APPROVE)
+        assert tracker.get_accuracy("owner/repo").pending_outcomes == 1
+
+        tracker.record_outcome("owner/repo", "r1", OutcomeType.MERGED)
+        stats = tracker.get_accuracy("owner/repo")
+
+        assert stats.pending_outcomes == 0
+        assert stats.correct_predictions == 1
+        assert stats.by_type == {
+            "review_approve": {"total": 1, "correct": 1, "incorrect": 0}
+        }
+        assert tracker.record_outcome("other/repo", "r1", OutcomeType.MERGED) is None
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub Automation State Store
+===========================================
+
+Tests the SQLite store behind GitHub automation save/load APIs.
+
+Covers:
+- Reviews and auto-fix states indexed on save
+- Picking up JSON files written or edited by the desktop app
+- Lifecycle queries answered from the store
+- One-shot migration of the JSON-file layout, archiving migrated files
+- Pruning records whose JSON file was removed
+"""
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_github_dir = _backend_dir / "runners" / "github"
+if str(_github_dir) not in sys.path:
+    sys.path.insert(0, str(_github_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from bot_detection import BotDetectionState
+from lifecycle import IssueLifecycle, IssueLifecycleState, LifecycleManager
+from models import AutoFixState, AutoFixStatus, PRReviewResult
+from state_store import KIND_AUTOFIX, KIND_LIFECYCLE, KIND_PR_REVIEW, get_state_store
+
+
+class TestEntitySaves:
+    """Entities keep their JSON files and are indexed in the store."""
+
+    def test_review_save_indexes_record(self, temp_dir: Path):
+        """Saving a review writes its file and a store row, not index.json."""
+        review = PRReviewResult(pr_number=42, repo="owner/repo", success=True)
+
+        asyncio.run(review.save(temp_dir))
+
+        assert (temp_dir / "pr" / "review_42.json").exists()
+        assert not (temp_dir / "pr" / "index.json").exists()
+        record = get_state_store(temp_dir).get(KIND_PR_REVIEW, "owner/repo", 42)
+        assert record["pr_number"] == 42
+        assert PRReviewResult.load(temp_dir, 42).repo == "owner/repo"
+
+    def test_autofix_queue_from_store(self, temp_dir: Path):
+        """load_all() filters by status through the store."""
+        for number, status in [(1, AutoFixStatus.PENDING), (2, AutoFixStatus.FAILED)]:
+            state = AutoFixState(
+                issue_number=number,
+                issue_url=f"https://github.com/owner/repo/issues/{number}",
+                repo="owner/repo",
+                status=status,
+            )
+            asyncio.run(state.save(temp_dir))
+
+        pending = AutoFixState.load_all(temp_dir, statuses=[AutoFixStatus.PENDING])
+
+        assert [s.issue_number for s in pending] == [1]
+        assert len(AutoFixState.load_all(temp_dir)) == 2
+
+    def test_prune_records_of_removed_files(self, temp_dir: Path):
+        """Records whose file cleanup deleted are dropped (counted on dry runs)."""
+        for number in (1, 2):
+            review = PRReviewResult(pr_number=number, repo="owner/repo", success=True)
+            asyncio.run(review.save(temp_dir))
+        (temp_dir / "pr" / "review_1.json").unlink()
+        store = get_state_store(temp_dir)
+
+        assert store.prune_json_records(dry_run=True) == 1
+        assert store.get(KIND_PR_REVIEW, "owner/repo", 1) is not None
+        assert store.prune_json_records() == 1
+        assert store.get(KIND_PR_REVIEW, "owner/repo", 1) is None
+        assert store.get(KIND_PR_REVIEW, "owner/repo", 2) is not None
+        assert store.prune_json_records() == 0
+
+    def test_external_file_changes_synced(self, temp_dir: Path):
+        """Files created, edited or removed by other writers are picked up."""
+        issues_dir = temp_dir / "issues"
+        issues_dir.mkdir()
+        external = issues_dir / "autofix_7.json"
+        external.write_text(
+            json.dumps({"issue_number": 7, "repo": "owner/repo", "status": "pending"})
+        )
+
+        assert [s.status for s in AutoFixState.load_all(temp_dir)] == [
+            AutoFixStatus.PENDING
+        ]
+
+        external.write_text(
+            json.dumps(
+                {"issue_number": 7, "repo": "owner/repo", "status": "creating_spec"}
+            )
+        )
+        stat = external.stat()
+        os.utime(external, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert [s.status for s in AutoFixState.load_all(temp_dir)] == [
+            AutoFixStatus.CREATING_SPEC
+        ]
+
+        external.unlink()
+
+        assert AutoFixState.load_all(temp_dir) == []
+        assert get_state_store(temp_dir).query(KIND_AUTOFIX) == []
+
+
+class TestLifecycleStore:
+    """LifecycleManager queries without directory scans."""
+
+    def test_state_queries(self, temp_dir: Path):
+        """get_all_in_state() and get_summary() read indexed rows."""
+        manager = LifecycleManager(temp_dir)
+        for number in (1, 2, 3):
+            manager.get_or_create("owner/repo", number)
+        manager.get_or_create("other/repo", 1)
+        manager.transition("owner/repo", 2, IssueLifecycleState.TRIAGING, "bot")
+
+        triaging = manager.get_all_in_state("owner/repo", IssueLifecycleState.TRIAGING)
+
+        assert [lc.issue_number for lc in triaging] == [2]
+        assert manager.get_summary("owner/repo") == {"new": 2, "triaging": 1}
+        assert not (temp_dir / "lifecycle").exists()
+
+    def test_persists_across_managers(self, temp_dir: Path):
+        """A new manager sees state saved by an earlier one."""
+        LifecycleManager(temp_dir).transition(
+            "owner/repo", 5, IssueLifecycleState.TRIAGING, "bot"
+        )
+
+        lifecycle = LifecycleManager(temp_dir).get("owner/repo", 5)
+
+        assert lifecycle.current_state == IssueLifecycleState.TRIAGING
+
+
+class TestMigration:
+    """Tests for importing the JSON-file layout."""
+
+    def test_json_layout_imported_once(self, temp_dir: Path):
+        """Lifecycle, bot-detection and entity files move into the store."""
+        (temp_dir / "lifecycle").mkdir()
+        legacy = IssueLifecycle(issue_number=9, repo="owner/repo")
+        (temp_dir / "lifecycle" / "owner_repo_9.json").write_text(
+            json.dumps(legacy.to_dict())
+        )
+        (temp_dir / "bot_detection_state.json").write_text(
+            json.dumps({"reviewed_commits": {"3": ["abc"]}})
+        )
+        (temp_dir / "pr").mkdir()
+        (temp_dir / "pr" / "index.json").write_text(json.dumps({"items": {}}))
+        (temp_dir / "pr" / "review_3.json").write_text(
+            json.dumps(
+                PRReviewResult(pr_number=3, repo="owner/repo", success=True).to_dict()
+            )
+        )
+
+        store = get_state_store(temp_dir)
+
+        assert store.get(KIND_LIFECYCLE, "owner/repo", 9)["issue_number"] == 9
+        assert store.get(KIND_PR_REVIEW, "owner/repo", 3)["success"] is True
+        assert BotDetectionState.load(temp_dir).reviewed_commits == {"3": ["abc"]}
+        assert LifecycleManager(temp_dir).get_summary("owner/repo") == {"new": 1}
+        assert store.migrate_from_json() == {}
+
+        # Migrated and superseded files are archived, entity files stay
+        assert not (temp_dir / "lifecycle").exists()
+        assert not (temp_dir / "bot_detection_state.json").exists()
+        assert not (temp_dir / "pr" / "index.json").exists()
+        assert (temp_dir / "pr" / "review_3.json").exists()
+        archive = temp_dir / "archive"
+        assert (archive / "lifecycle" / "owner_repo_9.json").exists()
+        assert (archive / "bot_detection_state.json").exists()
+        assert (archive / "pr" / "index.json").exists()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Tests for the Async GitLab Client
+=================================
+
+Tests AsyncGitLabClient against a local stand-in GitLab API server.
+
+Covers:
+- Keep-alive connections reused across requests
+- Independent fetches running concurrently
+- Streaming paginated lists via X-Next-Page
+- ETag revalidation with If-None-Match
+- Rate-limit retries and error statuses
+- GitLabOrchestrator closing its client after each review
+"""
+
+import asyncio
+import importlib
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+# Add the backend directory to path
+_backend_dir = Path(__file__).parent.parent / "apps" / "backend"
+_gitlab_dir = _backend_dir / "runners" / "gitlab"
+if str(_gitlab_dir) not in sys.path:
+    sys.path.insert(0, str(_gitlab_dir))
+if str(_backend_dir) not in sys.path:
+    sys.path.insert(0, str(_backend_dir))
+
+from glab_client import AsyncGitLabClient, GitLabAPIError, GitLabConfig
+
+MR_PATH = "/api/v4/projects/group%2Fapp/merge_requests/7"
+COMMITS = [{"id": f"c{i}"} for i in range(5)]
+
+
+class FakeGitLab:
+    """Records requests and connections made to the stand-in server."""
+
+    def __init__(self):
+        self.requests = []
+        self.connections = 0
+        self.delay = 0.0
+        self.rate_limited = 0
+        self.lock = threading.Lock()
+
+    def respond(self, handler) -> tuple[int, dict, object]:
+        parts = urlsplit(handler.path)
+        query = parse_qs(parts.query)
+        with self.lock:
+            self.requests.append((handler.command, handler.path, dict(handler.headers)))
+            if self.rate_limited:
+                self.rate_limited -= 1
+                return 429, {"Retry-After": "0"}, {"message": "slow down"}
+        if handler.headers.get("PRIVATE-TOKEN") != "token":
+            return 401, {}, {"message": "401 Unauthorized"}
+        time.sleep(self.delay)
+
+        if parts.path == MR_PATH:
+            if handler.headers.get("If-None-Match") == '"v1"':
+                return 304, {"ETag": '"v1"'}, None
+            return 200, {"ETag": '"v1"'}, {"iid": 7, "title": "Add login"}
+        if parts.path == f"{MR_PATH}/changes":
+            return 200, {}, {"changes": [{"diff": "+a"}, {"diff": ""}]}
+        if parts.path == f"{MR_PATH}/commits":
+            page = int(query["page"][0])
+            per_page = int(query["per_page"][0])
+            items = COMMITS[(page - 1) * per_page : page * per_page]
+            has_next = page * per_page < len(COMMITS)
+            return 200, {"X-Next-Page": str(page + 1) if has_next else ""}, items
+        if parts.path == f"{MR_PATH}/approve":
+            return 204, {}, None
+        return 404, {}, {"message": "404 Not Found"}
+
+
+@pytest.fixture
+def gitlab():
+    fake = FakeGitLab()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            with fake.lock:
+                fake.connections += 1
+
+        def _reply(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            self.rfile.read(length)
+            status, headers, body = fake.respond(self)
+            data = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.url = f"http://127.0.0.1:{server.server_port}"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+def _client(gitlab, token="token", **kwargs) -> AsyncGitLabClient:
+    config = GitLabConfig(token=token, project="group/app", instance_url=gitlab.url)
+    return AsyncGitLabClient(Path("."), config, **kwargs)
+
+
+def _run(gitlab, body, **kwargs):
+    async def run():
+        async with _client(gitlab, **kwargs) as client:
+            return await body(client)
+
+    return asyncio.run(run())
+
+
+class TestConnections:
+    """Tests for pooled keep-alive connections and concurrency."""
+
+    def test_sequential_requests_share_a_connection(self, gitlab):
+        """Requests made one after another reuse one connection."""
+
+        async def requests(client):
+            return [await client.get_mr_diff(7) for _ in range(5)]
+
+        assert _run(gitlab, requests) == ["+a"] * 5
+        assert len(gitlab.requests) == 5
+        assert gitlab.connections == 1
+
+    def test_independent_fetches_run_concurrently(self, gitlab):
+        """Gathered fetches overlap instead of queueing behind each other."""
+        gitlab.delay = 0.3
+
+        async def body(client):
+            start = time.monotonic()
+            results = await asyncio.gather(
+                client.get_mr(7),
+                client.get_mr_changes(7),
+                client.get_mr_diff(7),
+            )
+            return results, time.monotonic() - start
+
+        (mr, changes, diff), elapsed = _run(gitlab, body)
+
+        assert mr["title"] == "Add login"
+        assert len(changes["changes"]) == 2
+        assert diff == "+a"
+        assert elapsed < 0.8
+
+
+class TestResponses:
+    """Tests for pagination, ETags, retries and errors."""
+
+    def test_pagination_streams_every_page(self, gitlab):
+        """paginate() follows X-Next-Page; get_mr_commits() collects all pages."""
+
+        async def body(client):
+            endpoint = "/projects/group%2Fapp/merge_requests/7/commits"
+            streamed = [c["id"] async for c in client.paginate(endpoint, per_page=2)]
+            return streamed, await client.get_mr_commits(7)
+
+        streamed, commits = _run(gitlab, body)
+
+        assert streamed == [c["id"] for c in COMMITS]
+        assert commits == COMMITS
+        pages = [path for _, path, _ in gitlab.requests if "per_page=2" in path]
+        assert len(pages) == 3
+
+    def test_etag_revalidation(self, gitlab):
+        """A repeated GET sends If-None-Match and reuses the cached body."""
+
+        async def body(client):
+            first = await client.get_mr(7)
+            first["title"] = "changed by caller"
+            return await client.get_mr(7)
+
+        assert _run(gitlab, body) == {"iid": 7, "title": "Add login"}
+        assert "If-None-Match" not in gitlab.requests[0][2]
+        assert gitlab.requests[1][2]["If-None-Match"] == '"v1"'
+
+    def test_rate_limit_retried(self, gitlab):
+        """429 responses are retried after Retry-After."""
+        gitlab.rate_limited = 2
+
+        assert _run(gitlab, lambda client: client.get_mr(7))["iid"] == 7
+        assert len(gitlab.requests) == 3
+
+    def test_errors_and_empty_responses(self, gitlab):
+        """Error statuses raise GitLabAPIError; 204 returns None."""
+        assert _run(gitlab, lambda client: client.approve_mr(7)) is None
+
+        with pytest.raises(GitLabAPIError) as missing:
+            _run(gitlab, lambda client: client.get_mr(8))
+        assert missing.value.code == 404
+
+        with pytest.raises(GitLabAPIError) as unauthorized:
+            _run(gitlab, lambda client: client.get_mr(7), token="wrong")
+        assert unauthorized.value.code == 401
+
+        with pytest.raises(ValueError):
+            _run(gitlab, lambda client: client._fetch("/../admin"))
+
+
+@pytest.fixture
+def gitlab_orchestrator(monkeypatch):
+    """
+    The gitlab runner's orchestrator module, imported as a script would.
+
+    The github runner has modules of the same names (models, services,
+    orchestrator), so they are swapped out of sys.modules meanwhile.
+    """
+    saved = dict(sys.modules)
+    for name in list(sys.modules):
+        if name.split(".")[0] in ("models", "services", "orchestrator"):
+            del sys.modules[name]
+    monkeypatch.syspath_prepend(str(_gitlab_dir))
+    yield importlib.import_module("orchestrator")
+    for name in set(sys.modules) - set(saved):
+        del sys.modules[name]
+    sys.modules.update(saved)
+
+
+class TestOrchestratorClient:
+    """Tests for the client owned by GitLabOrchestrator."""
+
+    def test_client_closed_after_each_review(
+        self, gitlab, gitlab_orchestrator, temp_dir: Path
+    ):
+        """Reviews release the client's threads and connections when done."""
+        config = gitlab_orchestrator.GitLabRunnerConfig(
+            token="token", project="group/app", instance_url=gitlab.url
+        )
+        orchestrator = gitlab_orchestrator.GitLabOrchestrator(temp_dir, config)
+
+        async def fail_review(context):
+            raise RuntimeError("no model in tests")
+
+        orchestrator.review_engine.run_review = fail_review
+
+        connections = []
+        for _ in range(2):
+            result = asyncio.run(orchestrator.review_mr(7))
+
+            assert not result.success
+            assert "no model in tests" in result.error
+            assert orchestrator.client._executor is None
+            assert orchestrator.client._pool._idle == []
+            connections.append(gitlab.connections)
+
+        # The second review reconnected instead of reusing closed connections
+        assert connections[1] > connections[0] > 0
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Tests for Pooled Graphiti Memory Writes
+=======================================
+
+Tests the per-process GraphitiMemory pool used by memory save helpers.
+
+Covers:
+- One initialization shared by queued writes for the same key
+- Separate memories per (project, spec, group mode)
+- The default project directory sharing the explicit one's memory
+- Failed writes and unavailable memory resolving to False
+- Idle memories closed and reopened on demand
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from memory import codebase_map, graphiti_helpers, patterns
+from memory.graphiti_helpers import GraphitiMemoryPool
+
+
+class FakeMemory:
+    """Records saves made through the pool."""
+
+    def __init__(self, spec_dir, group_id_mode):
+        self.spec_dir = spec_dir
+        self.group_id_mode = group_id_mode
+        self.saved = []
+        self.closed = False
+
+    async def save_gotcha(self, text):
+        self.saved.append(("gotcha", text))
+        return True
+
+    async def save_pattern(self, text):
+        if text == "boom":
+            raise RuntimeError("write failed")
+        self.saved.append(("pattern", text))
+        return True
+
+    async def save_codebase_discoveries(self, discoveries):
+        self.saved.append(("discoveries", discoveries))
+        return True
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def memories():
+    """Patch memory creation and collect every instance opened."""
+    opened = []
+
+    async def fake_get_graphiti_memory(spec_dir, project_dir=None, mode=None):
+        memory = FakeMemory(spec_dir, mode)
+        opened.append(memory)
+        return memory
+
+    with patch.object(
+        graphiti_helpers, "get_graphiti_memory", fake_get_graphiti_memory
+    ):
+        yield opened
+
+
+@pytest.fixture
+def pool():
+    pool = GraphitiMemoryPool()
+    yield pool
+    pool.close(timeout=5)
+
+
+class TestPooledWrites:
+    """Tests for GraphitiMemoryPool.submit() and write()."""
+
+    def test_writes_share_one_memory(self, temp_dir: Path, memories, pool):
+        """Queued writes run in order on a single initialized memory."""
+        futures = [
+            pool.submit(temp_dir, temp_dir, "save_gotcha", f"gotcha {i}")
+            for i in range(20)
+        ]
+
+        assert [f.result(timeout=5) for f in futures] == [True] * 20
+        assert len(memories) == 1
+        assert memories[0].saved == [("gotcha", f"gotcha {i}") for i in range(20)]
+
+        pool.close(timeout=5)
+        assert memories[0].closed
+
+    def test_keys_get_separate_memories(self, temp_dir: Path, memories, pool):
+        """Spec directory and group mode select the pooled memory."""
+        other_spec = temp_dir / "other"
+        other_spec.mkdir()
+
+        pool.submit(temp_dir, temp_dir, "save_gotcha", "a").result(timeout=5)
+        pool.submit(other_spec, temp_dir, "save_gotcha", "b").result(timeout=5)
+        pool.submit(
+            temp_dir, temp_dir, "save_gotcha", "c", group_id_mode="spec"
+        ).result(timeout=5)
+        pool.submit(temp_dir, temp_dir, "save_gotcha", "d").result(timeout=5)
+
+        assert [m.saved for m in memories] == [
+            [("gotcha", "a"), ("gotcha", "d")],
+            [("gotcha", "b")],
+            [("gotcha", "c")],
+        ]
+        assert [m.group_id_mode for m in memories] == ["project", "project", "spec"]
+
+    def test_default_project_dir_shares_memory(self, temp_dir: Path, memories, pool):
+        """Passing None resolves to the same key as the spec's project root."""
+        spec_dir = temp_dir / ".auto-claude" / "specs" / "001-feature"
+        spec_dir.mkdir(parents=True)
+
+        pool.submit(spec_dir, None, "save_gotcha", "a").result(timeout=5)
+        pool.submit(spec_dir, spec_dir.parent.parent, "save_gotcha", "b").result(
+            timeout=5
+        )
+
+        assert [m.saved for m in memories] == [[("gotcha", "a"), ("gotcha", "b")]]
+
+    def test_failures_resolve_false(self, temp_dir: Path, memories, pool):
+        """A failing save doesn't stop later writes for the same key."""
+        failed = pool.submit(temp_dir, None, "save_pattern", "boom")
+        saved = pool.submit(temp_dir, None, "save_pattern", "ok")
+
+        assert failed.result(timeout=5) is False
+        assert saved.result(timeout=5) is True
+        assert memories[0].saved == [("pattern", "ok")]
+
+    def test_unavailable_memory(self, temp_dir: Path, pool):
+        """Without Graphiti the writes report False."""
+
+        async def unavailable(*args):
+            return None
+
+        with patch.object(graphiti_helpers, "get_graphiti_memory", unavailable):
+            result = pool.submit(temp_dir, None, "save_gotcha", "x").result(timeout=5)
+
+        assert result is False
+
+    def test_async_callers(self, temp_dir: Path, memories, pool):
+        """write() can be awaited from another event loop."""
+
+        async def run():
+            return await asyncio.gather(
+                pool.write(temp_dir, temp_dir, "save_pattern", "p1"),
+                pool.write(temp_dir, temp_dir, "save_pattern", "p2"),
+            )
+
+        assert asyncio.run(run()) == [True, True]
+        assert len(memories) == 1
+
+    def test_idle_memory_closed(self, temp_dir: Path, memories):
+        """A memory without writes is closed and reopened for the next one."""
+        pool = GraphitiMemoryPool(idle_timeout=0.01)
+        try:
+            pool.submit(temp_dir, None, "save_gotcha", "a").result(timeout=5)
+            for _ in range(200):
+                if memories[0].closed:
+                    break
+                time.sleep(0.01)
+            pool.submit(temp_dir, None, "save_gotcha", "b").result(timeout=5)
+        finally:
+            pool.close(timeout=5)
+
+        assert memories[0].closed
+        assert len(memories) == 2
+
+
+class TestPatternSaves:
+    """append_gotcha()/append_pattern() queue graph writes."""
+
+    def test_append_gotcha_uses_pool(self, temp_dir: Path, memories, pool):
+        """The file is written and the graph save queued on the shared pool."""
+        with (
+            patch.object(patterns, "is_graphiti_memory_enabled", return_value=True),
+            patch.object(patterns, "get_memory_pool", return_value=pool),
+        ):
+            patterns.append_gotcha(temp_dir, "Close files")
+            patterns.append_pattern(temp_dir, "Use pathlib")
+
+        pool.close(timeout=5)
+
+        assert patterns.load_gotchas(temp_dir) == ["Close files"]
+        assert memories[0].saved == [
+            ("gotcha", "Close files"),
+            ("pattern", "Use pathlib"),
+        ]
+
+    def test_codebase_map_uses_pool(self, temp_dir: Path, memories, pool):
+        """update_codebase_map() queues discoveries instead of opening a memory."""
+        discoveries = {"src/app.py": "Entry point"}
+        with (
+            patch.object(
+                codebase_map, "is_graphiti_memory_enabled", return_value=True
+            ),
+            patch.object(codebase_map, "get_memory_pool", return_value=pool),
+        ):
+            codebase_map.update_codebase_map(temp_dir, discoveries)
+
+        pool.close(timeout=5)
+
+        assert codebase_map.load_codebase_map(temp_dir) == discoveries
+        assert memories[0].saved == [("discoveries", discoveries)]
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Tests for the Linear GraphQL Client
+===================================
+
+Tests direct Linear updates against a local stand-in GraphQL server.
+
+Covers:
+- Coalescing queued updates per issue into one batched mutation
+- Partial and transport failures handed to the agent fallback
+- Delayed flushes on a running event loop
+- Applied-update callbacks, and task status saved only once applied
+- The updater's transition helpers using the API instead of agents
+"""
+
+import asyncio
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from integrations.linear import updater
+from integrations.linear.client import (
+    IssueUpdate,
+    LinearGraphQLClient,
+    LinearOutbox,
+)
+
+STATES = {"Todo": "s-todo", "In Progress": "s-progress", "In Review": "s-review"}
+
+
+class FakeLinear:
+    """Minimal stand-in for the Linear GraphQL API."""
+
+    def __init__(self):
+        self.requests = []
+        self.issue_states = {}
+        self.comments = {}
+        self.reject = set()
+        self.reject_status = set()
+
+    def handle(self, query: str, variables: dict) -> dict:
+        self.requests.append((query, variables))
+        if "teams" in query:
+            return {"data": {"teams": {"nodes": [{"id": "team-1", "key": "VAL"}]}}}
+        if "issueCreate" in query:
+            issue = {"id": "uuid-1", "identifier": "VAL-1", "team": {"id": "team-1"}}
+            return {"data": {"issueCreate": {"success": True, "issue": issue}}}
+        if "TeamStates" in query:
+            nodes = [{"id": v, "name": k} for k, v in STATES.items()]
+            return {"data": {"team": {"states": {"nodes": nodes}}}}
+        if "IssueTeam" in query:
+            return {"data": {"issue": {"team": {"id": "team-1"}}}}
+
+        data, errors = {}, []
+        for alias, mutation, index in re.findall(
+            r"(\w+): (issueUpdate|commentCreate)\(.*?\$issue(\d+)", query
+        ):
+            issue_id = variables[f"issue{index}"]
+            if issue_id in self.reject or (
+                mutation == "issueUpdate" and issue_id in self.reject_status
+            ):
+                data[alias] = None
+                errors.append({"message": "Entity not found", "path": [alias]})
+            elif mutation == "issueUpdate":
+                self.issue_states[issue_id] = variables[f"state{index}"]
+                data[alias] = {"success": True}
+            else:
+                self.comments.setdefault(issue_id, []).append(variables[f"body{index}"])
+                data[alias] = {"success": True}
+        return {"data": data, "errors": errors} if errors else {"data": data}
+
+
+@pytest.fixture
+def linear():
+    fake = FakeLinear()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers["Content-Length"])
+            request = json.loads(self.rfile.read(length))
+            body = json.dumps(fake.handle(request["query"], request["variables"]))
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.end_headers()
+            self.wfile.write(body.encode())
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    fake.url = f"http://127.0.0.1:{server.server_port}/graphql"
+    yield fake
+    server.shutdown()
+    server.server_close()
+
+
+class TestOutbox:
+    """Tests for LinearOutbox batching."""
+
+    def test_updates_coalesced_per_issue(self, linear):
+        """Pending updates for several issues go out in one request."""
+        outbox = LinearOutbox(LinearGraphQLClient("key", url=linear.url))
+        outbox.add(IssueUpdate("VAL-1", team_id="team-1", status="In Progress"))
+        outbox.add(IssueUpdate("VAL-1", comments=["Started"]))
+        outbox.add(IssueUpdate("VAL-1", status="In Review"))
+        outbox.add(IssueUpdate("VAL-1", comments=["QA started"]))
+        outbox.add(IssueUpdate("VAL-2", comments=["Completed 1 (1/3)"]))
+
+        assert outbox.pending == 2
+        assert asyncio.run(outbox.flush()) is True
+
+        mutations = [q for q, _ in linear.requests if "LinearOutboxFlush" in q]
+        assert len(mutations) == 1
+        assert linear.issue_states == {"VAL-1": "s-review"}
+        assert linear.comments == {
+            "VAL-1": ["Started\n\nQA started"],
+            "VAL-2": ["Completed 1 (1/3)"],
+        }
+        assert outbox.pending == 0
+
+    def test_failures_go_to_fallback(self, linear):
+        """Only the updates the API rejected are retried through the fallback."""
+        fallback = AsyncMock(return_value=True)
+        outbox = LinearOutbox(
+            LinearGraphQLClient("key", url=linear.url), fallback=fallback
+        )
+        linear.reject.add("VAL-9")
+        outbox.add(IssueUpdate("VAL-1", comments=["ok"]))
+        outbox.add(IssueUpdate("VAL-9", comments=["lost"]))
+        outbox.add(IssueUpdate("VAL-3", team_id="team-1", status="Archived"))
+
+        assert asyncio.run(outbox.flush()) is True
+
+        retried = [call.args[0].issue_id for call in fallback.await_args_list]
+        assert retried == ["VAL-3", "VAL-9"]
+        assert linear.comments == {"VAL-1": ["ok"]}
+
+    def test_fallback_gets_only_unapplied_parts(self, linear):
+        """A comment already posted isn't posted again by the fallback."""
+        fallback = AsyncMock(return_value=True)
+        outbox = LinearOutbox(
+            LinearGraphQLClient("key", url=linear.url), fallback=fallback
+        )
+        linear.reject_status.add("VAL-1")
+        outbox.add(IssueUpdate("VAL-1", "team-1", "In Review", comments=["QA"]))
+        outbox.add(IssueUpdate("VAL-2", "team-1", "Archived", comments=["Done"]))
+
+        assert asyncio.run(outbox.flush()) is True
+
+        retried = [call.args[0] for call in fallback.await_args_list]
+        assert retried == [
+            IssueUpdate("VAL-2", "team-1", "Archived"),
+            IssueUpdate("VAL-1", "team-1", "In Review"),
+        ]
+        assert linear.comments == {"VAL-1": ["QA"], "VAL-2": ["Done"]}
+
+    def test_on_applied_called_for_applied_updates(self, linear):
+        """Callbacks see the merged update, and only if it was applied."""
+        fallback = AsyncMock(return_value=False)
+        outbox = LinearOutbox(
+            LinearGraphQLClient("key", url=linear.url), fallback=fallback
+        )
+        linear.reject.add("VAL-9")
+        applied = []
+
+        def record(update):
+            applied.append((update.issue_id, update.status))
+
+        outbox.add(IssueUpdate("VAL-1", "team-1", "In Progress", on_applied=[record]))
+        outbox.add(IssueUpdate("VAL-1", status="In Review", on_applied=[record]))
+        outbox.add(IssueUpdate("VAL-9", comments=["lost"], on_applied=[record]))
+
+        assert asyncio.run(outbox.flush()) is False
+        assert applied == [("VAL-1", "In Review"), ("VAL-1", "In Review")]
+
+    def test_unreachable_api(self):
+        """Transport errors send every update to the fallback."""
+        fallback = AsyncMock(return_value=False)
+        client = LinearGraphQLClient("key", url="http://127.0.0.1:9/graphql")
+        outbox = LinearOutbox(client, fallback=fallback)
+        outbox.add(IssueUpdate("VAL-1", comments=["a"]))
+
+        assert asyncio.run(outbox.flush()) is False
+        assert fallback.await_count == 1
+
+    def test_delayed_flush(self, linear):
+        """Updates queued on a running loop are sent after the delay."""
+        outbox = LinearOutbox(
+            LinearGraphQLClient("key", url=linear.url), flush_delay=0.01
+        )
+
+        async def run():
+            outbox.add(IssueUpdate("VAL-1", comments=["one"]))
+            outbox.add(IssueUpdate("VAL-1", comments=["two"]))
+            for _ in range(100):
+                await asyncio.sleep(0.01)
+                if linear.comments:
+                    break
+
+        asyncio.run(run())
+
+        assert linear.comments == {"VAL-1": ["one\n\ntwo"]}
+
+
+class TestUpdater:
+    """Tests for the updater's transition helpers."""
+
+    @pytest.fixture(autouse=True)
+    def _env(self, linear, monkeypatch):
+        monkeypatch.setenv("LINEAR_API_KEY", "key")
+        monkeypatch.setenv("LINEAR_API_URL", linear.url)
+        monkeypatch.delenv("LINEAR_TEAM_ID", raising=False)
+        monkeypatch.setattr(updater, "_outbox", None)
+        with patch.object(updater, "_run_linear_agent") as agent:
+            yield
+        agent.assert_not_called()
+
+    def test_build_transitions_without_agents(self, linear, temp_dir: Path):
+        """Task creation, status changes and comments use the API."""
+
+        async def run():
+            state = await updater.create_linear_task(temp_dir, "Add login")
+            await updater.linear_task_started(temp_dir)
+            for i in range(1, 4):
+                await updater.linear_subtask_completed(temp_dir, f"st-{i}", i, 3)
+            await updater.linear_build_complete(temp_dir)
+            return state
+
+        state = asyncio.run(run())
+
+        assert state.task_id == "VAL-1"
+        assert updater.LinearTaskState.load(temp_dir).status == "In Progress"
+        assert linear.issue_states == {"VAL-1": "s-progress"}
+        assert len(linear.comments["VAL-1"]) == 2
+        assert linear.comments["VAL-1"][1].startswith("Completed st-1 (1/3")
+        flushes = [q for q, _ in linear.requests if "LinearOutboxFlush" in q]
+        assert len(flushes) == 2
+
+    def test_status_saved_only_once_applied(self, linear, temp_dir: Path):
+        """A status Linear never got isn't recorded, so the next call resends it."""
+
+        async def run():
+            await updater.create_linear_task(temp_dir, "Add login")
+            linear.reject.add("VAL-1")
+            assert await updater.linear_task_started(temp_dir) is False
+            assert updater.LinearTaskState.load(temp_dir).status == "Todo"
+
+            linear.reject.clear()
+            assert await updater.linear_task_started(temp_dir) is True
+
+        with patch.object(
+            updater, "_apply_update_with_agent", AsyncMock(return_value=False)
+        ):
+            asyncio.run(run())
+
+        assert updater.LinearTaskState.load(temp_dir).status == "In Progress"
+        assert linear.issue_states == {"VAL-1": "s-progress"}
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Tests for the Memory Keyword Index
+==================================
+
+Tests the full-text index behind `query_memory.py search`.
+
+Covers:
+- BM25 ranking and group_id filtering in the local FTS5 index
+- Writers updating an existing index only
+- kuzu FTS used when available, with the index created on first use
+- Falling back to the local index and rebuilding it when it falls behind
+- Remembering per database that kuzu FTS is unavailable, without INSTALL
+"""
+
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+
+import query_memory
+from integrations.graphiti.queries_pkg import keyword_index
+from integrations.graphiti.queries_pkg.keyword_index import (
+    EpisodeKeywordIndex,
+    get_keyword_index,
+    index_episode,
+    keyword_index_path,
+    match_expression,
+    search_episodes,
+)
+
+
+def _episode(uuid, name, content, group_id="project"):
+    return {
+        "uuid": uuid,
+        "name": name,
+        "content": content,
+        "source_description": f"[pattern] {name}",
+        "group_id": group_id,
+        "created_at": "2024-01-01T00:00:00",
+    }
+
+
+EPISODES = [
+    _episode("e1", "pattern_auth", "Use the auth middleware for auth tokens"),
+    _episode("e2", "gotcha_cache", "Cache keys must include the auth scope"),
+    _episode("e3", "session_001_spec", "Refactored the database layer"),
+    _episode("e4", "pattern_other", "auth handled upstream", group_id="other"),
+]
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def has_next(self):
+        return bool(self._rows)
+
+    def get_next(self):
+        return self._rows.pop(0)
+
+
+class FakeGraph:
+    """kuzu connection stand-in, optionally with the FTS extension."""
+
+    def __init__(self, episodes, fts=False):
+        self.episodes = list(episodes)
+        self.fts = fts
+        self.fts_index = False
+        self.queries = []
+
+    def execute(self, query, parameters=None):
+        self.queries.append(query)
+        if "QUERY_FTS_INDEX" in query:
+            if not self.fts_index:
+                raise RuntimeError("Table Episodic doesn't have an index")
+            return FakeResult(
+                [
+                    (e["uuid"], e["name"], e["content"], "", "", None, 2.5)
+                    for e in self.episodes
+                    if parameters["query"] in e["content"]
+                ]
+            )
+        if "CREATE_FTS_INDEX" in query:
+            if not self.fts:
+                raise RuntimeError("Catalog exception: function not found")
+            self.fts_index = True
+            return FakeResult([])
+        if "count(e)" in query:
+            return FakeResult([(len(self.episodes),)])
+        if "MATCH (e:Episodic)" in query:
+            return FakeResult(
+                [
+                    tuple(e[f] for f in keyword_index.EPISODE_FIELDS)
+                    for e in self.episodes
+                ]
+            )
+        return FakeResult([])
+
+
+@pytest.fixture
+def index(temp_dir: Path):
+    index = EpisodeKeywordIndex(temp_dir / "memory.keywords.db")
+    index.add(EPISODES)
+    yield index
+    index.close()
+
+
+class TestLocalIndex:
+    """Tests for EpisodeKeywordIndex."""
+
+    def test_bm25_ranking(self, index):
+        """Repeated terms rank higher; non-matching episodes are left out."""
+        results = index.search("auth")
+
+        assert results[0]["uuid"] == "e1"
+        assert {r["uuid"] for r in results} == {"e1", "e2", "e4"}
+        assert results[0]["score"] > results[-1]["score"] > 0
+
+    def test_group_filter_and_prefix_terms(self, index):
+        """group_id limits results; words match as prefixes."""
+        assert [r["uuid"] for r in index.search("auth", group_id="other")] == ["e4"]
+        assert [r["uuid"] for r in index.search("refactor datab")] == ["e3"]
+        assert index.search("!!!") == []
+        assert match_expression('say "hi" hi') == '"say"* OR "hi"*'
+
+    def test_updates_replace_by_uuid(self, index):
+        """Re-adding an episode replaces its text in the index."""
+        index.add([_episode("e3", "session_001_spec", "Now about webhooks")])
+
+        assert index.count() == 4
+        assert index.search("database") == []
+        assert [r["uuid"] for r in index.search("webhooks")] == ["e3"]
+
+        index.rebuild(EPISODES[:1])
+        assert index.count() == 1
+        assert [r["uuid"] for r in index.search("auth")] == ["e1"]
+
+    def test_index_episode_only_updates_existing(self, temp_dir: Path):
+        """Writers don't create an index for databases that lack one."""
+        database = temp_dir / "memory"
+
+        assert index_episode(database, EPISODES[0]) is False
+        assert not keyword_index_path(database).exists()
+
+        get_keyword_index(keyword_index_path(database))
+        assert index_episode(database, EPISODES[0]) is True
+        assert get_keyword_index(keyword_index_path(database)).count() == 1
+
+
+class TestSearchEpisodes:
+    """Tests for choosing between kuzu FTS and the local index."""
+
+    def test_kuzu_fts_created_on_first_use(self, temp_dir: Path):
+        """The FTS index is created once, then queried directly."""
+        graph = FakeGraph(EPISODES, fts=True)
+
+        first = search_episodes(graph, temp_dir / "memory", "middleware")
+        second = search_episodes(graph, temp_dir / "memory", "middleware")
+
+        assert [r["uuid"] for r in first] == [r["uuid"] for r in second] == ["e1"]
+        assert sum("CREATE_FTS_INDEX" in q for q in graph.queries) == 1
+        assert not keyword_index_path(temp_dir / "memory").exists()
+
+    def test_local_index_synced_by_count(self, temp_dir: Path):
+        """Without FTS the local index is rebuilt only when it falls behind."""
+        graph = FakeGraph(EPISODES[:2])
+        database = temp_dir / "memory"
+
+        assert len(search_episodes(graph, database, "auth")) == 2
+
+        graph.episodes.append(EPISODES[2])
+        index_episode(database, EPISODES[2])
+        graph.queries.clear()
+        assert [r["uuid"] for r in search_episodes(graph, database, "layer")] == [
+            "e3"
+        ]
+        assert not any("RETURN e.uuid" in q and "FTS" not in q for q in graph.queries)
+
+        # Written without updating the index: picked up by a rebuild
+        graph.episodes.append(EPISODES[3])
+        results = search_episodes(graph, database, "upstream", group_id="other")
+        assert [r["uuid"] for r in results] == ["e4"]
+
+
+    def test_unavailable_fts_remembered(self, temp_dir: Path):
+        """Later searches skip kuzu FTS, and the extension is never installed."""
+        database = temp_dir / "memory"
+        graph = FakeGraph(EPISODES)
+
+        assert len(search_episodes(graph, database, "auth")) == 3
+        assert any("QUERY_FTS_INDEX" in q for q in graph.queries)
+
+        # A fresh CLI process with a new connection to the same database
+        for index in keyword_index._indexes.values():
+            index.close()
+        keyword_index._indexes.clear()
+        graph = FakeGraph(EPISODES)
+
+        assert len(search_episodes(graph, database, "auth")) == 3
+        assert not any("FTS" in q or "EXTENSION" in q for q in graph.queries)
+
+    def test_fts_never_installed(self, temp_dir: Path):
+        """Searches load an installed extension but never run INSTALL."""
+        graph = FakeGraph(EPISODES, fts=True)
+
+        search_episodes(graph, temp_dir / "memory", "middleware")
+
+        assert "LOAD EXTENSION fts" in graph.queries
+        assert not any("INSTALL" in q for q in graph.queries)
+
+
+class TestSearchCommand:
+    """Tests for cmd_search() results."""
+
+    def test_results_ranked_with_scores(self, temp_dir: Path, monkeypatch):
+        """The command returns BM25 scores and honours --group-id."""
+        monkeypatch.setattr(query_memory, "apply_monkeypatch", lambda: "kuzu")
+        graph = FakeGraph(EPISODES)
+        args = Namespace(
+            db_path=str(temp_dir),
+            database="memory",
+            query="auth",
+            limit=10,
+            group_id="project",
+        )
+
+        result = query_memory.cmd_search(args, connect=lambda *_: (graph, None))
+
+        memories = result["data"]["memories"]
+        assert result["success"] is True
+        assert [m["id"] for m in memories] == ["e1", "e2"]
+        assert memories[0]["type"] == "pattern"
+        assert memories[0]["score"] > memories[1]["score"]
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Tests for AI Resolution Caching and Concurrency
+===============================================
+
+Tests the persistent AI response cache and concurrent resolution.
+
+Covers:
+- Reusing responses for identical conflicts, across resolver instances
+- Cache keys covering the conflict context, namespace and prompt version
+- Unparseable responses never cached
+- Cache hit rate and tokens saved in AIResolver.stats
+- Merging different files concurrently under a limit, even inside an event loop
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge import (
+    ChangeType,
+    ConflictRegion,
+    ConflictSeverity,
+    MergeDecision,
+    MergeOrchestrator,
+    MergeStrategy,
+    SemanticChange,
+    TaskSnapshot,
+)
+from merge.ai_resolver import AIResolver, ResolutionCache
+from merge.ai_resolver import cache as cache_module
+
+RESPONSE = "```python\ndef main():\n    return 42\n```"
+
+
+class CountingAI:
+    """AI stand-in that counts calls and tracks how many overlap."""
+
+    def __init__(self, response=RESPONSE, delay=0.0):
+        self.response = response
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, system: str, user: str) -> str:
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        return self.response
+
+
+def _conflict(file_path="app.py", location="function:main"):
+    return ConflictRegion(
+        file_path=file_path,
+        location=location,
+        tasks_involved=["task-001", "task-002"],
+        change_types=[ChangeType.MODIFY_FUNCTION, ChangeType.MODIFY_FUNCTION],
+        severity=ConflictSeverity.HIGH,
+        can_auto_merge=False,
+        merge_strategy=MergeStrategy.AI_REQUIRED,
+    )
+
+
+def _snapshots(body="return 1"):
+    return [
+        TaskSnapshot(
+            task_id=task_id,
+            task_intent=f"Change main in {task_id}",
+            started_at=datetime.now(),
+            semantic_changes=[
+                SemanticChange(
+                    change_type=ChangeType.MODIFY_FUNCTION,
+                    target="main",
+                    location="function:main",
+                    line_start=1,
+                    line_end=2,
+                    content_after=f"def main():\n    {body}  # {task_id}",
+                )
+            ],
+        )
+        for task_id in ("task-001", "task-002")
+    ]
+
+
+class TestResolutionCache:
+    """Tests for cached AI resolutions."""
+
+    def test_identical_conflict_reuses_response(self, temp_dir: Path):
+        ai = CountingAI()
+        resolver = AIResolver(ai, cache=ResolutionCache(temp_dir))
+
+        first = resolver.resolve_conflict(_conflict(), "def main(): pass", _snapshots())
+        second = resolver.resolve_conflict(
+            _conflict(), "def main(): pass", _snapshots()
+        )
+
+        assert ai.calls == 1
+        assert first.decision == second.decision == MergeDecision.AI_MERGED
+        assert second.merged_content == first.merged_content
+        assert second.ai_calls_made == 0
+        assert "(cached)" in second.explanation
+
+        stats = resolver.stats
+        assert stats["calls_made"] == 1
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["cache_hit_rate"] == 0.5
+        assert stats["estimated_tokens_saved"] == stats["estimated_tokens_used"] > 0
+
+        # A new resolver (e.g. the next merge preview) reads the entry from disk
+        ai_again = CountingAI()
+        fresh = AIResolver(ai_again, cache=ResolutionCache(temp_dir))
+        result = fresh.resolve_conflict(_conflict(), "def main(): pass", _snapshots())
+        assert result.success
+        assert ai_again.calls == 0
+
+    def test_key_covers_context_namespace_and_version(self, temp_dir, monkeypatch):
+        cache = ResolutionCache(temp_dir, namespace="model-a")
+        key = cache.key("system", "prompt")
+
+        assert key == ResolutionCache(temp_dir, namespace="model-a").key(
+            "system", "prompt"
+        )
+        assert key != cache.key("system", "prompt with other task changes")
+        assert key != ResolutionCache(temp_dir, namespace="model-b").key(
+            "system", "prompt"
+        )
+        monkeypatch.setattr(cache_module, "PROMPT_VERSION", 999)
+        assert key != cache.key("system", "prompt")
+
+    def test_changed_context_and_bad_responses_call_ai(self, temp_dir: Path):
+        ai = CountingAI(response="I cannot merge this.")
+        resolver = AIResolver(ai, cache=ResolutionCache(temp_dir))
+
+        for _ in range(2):
+            result = resolver.resolve_conflict(_conflict(), "", _snapshots())
+            assert result.decision == MergeDecision.NEEDS_HUMAN_REVIEW
+        assert ai.calls == 2
+        assert list(temp_dir.glob("*.json")) == []
+
+        ai.response = RESPONSE
+        resolver.resolve_conflict(_conflict(), "", _snapshots())
+        resolver.resolve_conflict(_conflict(), "", _snapshots(body="return 2"))
+        assert ai.calls == 4
+
+    def test_entries_pruned_beyond_limit(self, temp_dir: Path):
+        cache = ResolutionCache(temp_dir, max_entries=3)
+        for i in range(5):
+            cache.put(cache.key("system", f"prompt {i}"), RESPONSE, 10)
+
+        assert len(list(temp_dir.glob("*.json"))) == 3
+        assert cache.get("missing") is None
+
+
+class TestConcurrentResolution:
+    """Tests for merging files concurrently in MergeOrchestrator.merge_tasks()."""
+
+    BASELINE = "def main():\n    return 0\n"
+
+    @staticmethod
+    def _orchestrator(temp_dir: Path, ai, **kwargs) -> MergeOrchestrator:
+        return MergeOrchestrator(
+            temp_dir, ai_resolver=AIResolver(ai, **kwargs), dry_run=True
+        )
+
+    @classmethod
+    def _file_inputs(cls, count):
+        # Edits to separate lines of main(): a MEDIUM conflict, sent to the AI
+        inputs = []
+        for i in range(count):
+            snapshots = _snapshots()
+            snapshots[1].semantic_changes[0].line_start = 3
+            snapshots[1].semantic_changes[0].line_end = 4
+            inputs.append((f"file_{i}.py", snapshots, cls.BASELINE))
+        return inputs
+
+    def test_files_merged_concurrently_under_limit(self, temp_dir: Path):
+        ai = CountingAI(delay=0.1)
+        orchestrator = self._orchestrator(temp_dir, ai, max_concurrency=3)
+        file_inputs = self._file_inputs(6)
+        progress = []
+
+        start = time.monotonic()
+        results = orchestrator._merge_files_concurrently(
+            file_inputs, lambda *args: progress.append(args)
+        )
+        elapsed = time.monotonic() - start
+
+        assert [r.file_path for r in results] == [f for f, _, _ in file_inputs]
+        assert all(r.decision == MergeDecision.AI_MERGED for r in results)
+        assert ai.calls == 6
+        assert ai.peak == 3
+        assert elapsed < 0.5
+        assert orchestrator.ai_resolver.stats["calls_made"] == 6
+        assert [p[1] for p in progress][-1] == 75
+        assert progress[-1][2] == "Merged file 6/6"
+
+    def test_matches_sequential_results(self, temp_dir: Path):
+        file_inputs = self._file_inputs(3)
+        sequential = [
+            self._orchestrator(temp_dir, CountingAI()).merge_pipeline.merge_file(
+                file_path, baseline, snapshots
+            )
+            for file_path, snapshots, baseline in file_inputs
+        ]
+
+        concurrent = self._orchestrator(
+            temp_dir, CountingAI(), max_concurrency=2
+        )._merge_files_concurrently(file_inputs, lambda *args: None)
+
+        assert [(r.file_path, r.decision, r.merged_content) for r in concurrent] == [
+            (r.file_path, r.decision, r.merged_content) for r in sequential
+        ]
+
+    def test_without_ai_merges_one_file_at_a_time(self, temp_dir: Path):
+        ai = CountingAI(delay=0.02)
+        orchestrator = MergeOrchestrator(
+            temp_dir,
+            enable_ai=False,
+            ai_resolver=AIResolver(ai, max_concurrency=4),
+            dry_run=True,
+        )
+
+        results = orchestrator._merge_files_concurrently(
+            self._file_inputs(3), lambda *args: None
+        )
+
+        assert len(results) == 3
+        assert ai.calls == 0
+
+    def test_callable_from_running_event_loop(self, temp_dir: Path):
+        orchestrator = self._orchestrator(temp_dir, CountingAI(), max_concurrency=2)
+
+        async def caller():
+            return orchestrator._merge_files_concurrently(
+                self._file_inputs(2), lambda *args: None
+            )
+
+        results = asyncio.run(caller())
+
+        assert [r.decision for r in results] == [MergeDecision.AI_MERGED] * 2
+
+    @pytest.mark.parametrize("cached", [False, True])
+    def test_shared_cache_under_concurrency(self, temp_dir: Path, cached):
+        cache_dir = temp_dir / "cache"
+        ai = CountingAI(delay=0.02)
+        orchestrator = MergeOrchestrator(
+            temp_dir,
+            ai_resolver=AIResolver(ai, cache=ResolutionCache(cache_dir)),
+            dry_run=True,
+        )
+        file_inputs = self._file_inputs(4)
+        if cached:
+            orchestrator._merge_files_concurrently(file_inputs, lambda *args: None)
+            ai.calls = 0
+
+        results = orchestrator._merge_files_concurrently(
+            file_inputs, lambda *args: None
+        )
+
+        assert all(r.success for r in results)
+        assert ai.calls == (0 if cached else 4)
+        assert len(list(cache_dir.glob("*.json"))) == 4
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Tests for the Diff3 Merge Engine
+================================
+
+Tests the line-level three-way merge used before any AI call.
+
+Covers:
+- Clean merges of non-overlapping edits
+- Conflict hunks for overlapping edits
+- Conflict dicts for the conflict-only prompt
+- Reassembly with AI resolutions
+- Integration with the workspace fast path
+"""
+
+from merge.diff3 import merge3
+from merge.prompts import build_conflict_only_prompt, extract_conflict_resolutions
+
+BASE = """import os
+
+
+def first():
+    return 1
+
+
+def second():
+    return 2
+
+
+def third():
+    return 3
+"""
+
+
+class TestCleanMerge:
+    """Tests for edits that do not overlap."""
+
+    def test_non_overlapping_edits_merge(self):
+        """Edits to different functions merge without conflicts."""
+        ours = BASE.replace("return 1", "return 10")
+        theirs = BASE.replace("return 3", "return 30")
+
+        result = merge3(BASE, ours, theirs)
+
+        assert result.is_clean
+        assert result.merged_content == BASE.replace("return 1", "return 10").replace(
+            "return 3", "return 30"
+        )
+
+    def test_insertions_on_both_sides(self):
+        """Additions at different places are both kept."""
+        ours = "import sys\n" + BASE
+        theirs = BASE + "\n\ndef fourth():\n    return 4\n"
+
+        result = merge3(BASE, ours, theirs)
+
+        assert result.is_clean
+        assert result.merged_content == "import sys\n" + theirs
+
+    def test_identical_change_on_both_sides(self):
+        """The same edit on both sides is taken once."""
+        changed = BASE.replace("return 2", "return 20")
+        result = merge3(BASE, changed + "# ours\n", changed)
+
+        assert result.is_clean
+        assert result.merged_content == changed + "# ours\n"
+
+    def test_deletion_and_edit_elsewhere(self):
+        """A deletion on one side merges with an edit on the other."""
+        ours = BASE.replace("def second():\n    return 2\n\n\n", "")
+        theirs = BASE.replace("return 3", "return 30")
+
+        result = merge3(BASE, ours, theirs)
+
+        assert result.is_clean
+        assert "def second" not in result.merged_content
+        assert "return 30" in result.merged_content
+
+    def test_missing_trailing_newline_preserved(self):
+        """Content without a final newline round-trips unchanged."""
+        base = "a\nb\nc"
+        result = merge3(base, "A\nb\nc", "a\nb\nC")
+
+        assert result.merged_content == "A\nb\nC"
+
+
+class TestConflicts:
+    """Tests for overlapping edits."""
+
+    def test_overlapping_edit_is_conflict(self):
+        """Both sides changing the same line yields one conflict hunk."""
+        ours = BASE.replace("return 2", "return 'ours'")
+        theirs = BASE.replace("return 2", "return 'theirs'")
+
+        result = merge3(BASE, ours, theirs)
+
+        assert not result.is_clean
+        assert result.merged_content is None
+        assert len(result.conflicts) == 1
+        hunk = result.conflicts[0]
+        assert hunk.base_lines == ["    return 2\n"]
+        assert hunk.ours_lines == ["    return 'ours'\n"]
+        assert hunk.theirs_lines == ["    return 'theirs'\n"]
+
+    def test_only_conflicting_hunks_reported(self):
+        """Clean hunks are merged even when another hunk conflicts."""
+        ours = BASE.replace("return 1", "return 10").replace("return 2", "return 'o'")
+        theirs = BASE.replace("return 3", "return 30").replace(
+            "return 2", "return 't'"
+        )
+
+        result = merge3(BASE, ours, theirs)
+
+        assert len(result.conflicts) == 1
+        merged = result.render({"CONFLICT_1": "    return 'both'"})
+        assert "return 10" in merged
+        assert "return 30" in merged
+        assert "return 'both'\n" in merged
+
+    def test_conflict_dicts_have_context(self):
+        """Conflict dicts carry base, both sides and surrounding context."""
+        ours = BASE.replace("return 2", "return 'o'")
+        theirs = BASE.replace("return 2", "return 't'")
+
+        conflicts = merge3(BASE, ours, theirs).conflict_dicts()
+
+        assert conflicts[0]["id"] == "CONFLICT_1"
+        assert conflicts[0]["base_lines"] == "    return 2"
+        assert conflicts[0]["main_lines"] == "    return 'o'"
+        assert conflicts[0]["worktree_lines"] == "    return 't'"
+        assert conflicts[0]["context_before"].endswith("def second():")
+        assert conflicts[0]["context_after"].endswith("def third():")
+        assert conflicts[0]["start_line"] == 9
+
+    def test_render_requires_every_resolution(self):
+        """Rendering fails when a conflict has no resolution."""
+        ours = BASE.replace("return 2", "return 'o'")
+        theirs = BASE.replace("return 2", "return 't'")
+
+        assert merge3(BASE, ours, theirs).render({}) is None
+
+    def test_round_trip_through_conflict_prompt(self):
+        """AI responses in the conflict-only format splice back in."""
+        ours = BASE.replace("return 2", "return 'o'")
+        theirs = BASE.replace("return 2", "return 't'")
+        result = merge3(BASE, ours, theirs)
+        conflicts = result.conflict_dicts()
+
+        prompt = build_conflict_only_prompt("a.py", conflicts, "spec", "python")
+        assert "COMMON ANCESTOR (BASE)" in prompt
+        assert "def first" not in prompt
+
+        response = "--- CONFLICT_1 RESOLVED ---\n```python\n    return 'ot'\n```\n"
+        resolutions = extract_conflict_resolutions(response, conflicts, "python")
+
+        assert result.render(resolutions) == BASE.replace("return 2", "return 'ot'")
+
+
+class TestWorkspaceFastPath:
+    """Tests for the no-AI merge path in core.workspace."""
+
+    def test_simple_merge_uses_diff3(self):
+        """Non-overlapping edits no longer need an AI merge."""
+        from core.workspace import _workspace_module
+
+        ours = BASE.replace("return 1", "return 10")
+        theirs = BASE.replace("return 3", "return 30")
+
+        success, merged = _workspace_module._try_simple_3way_merge(BASE, ours, theirs)
+
+        assert success
+        assert "return 10" in merged and "return 30" in merged
+
+    def test_simple_merge_reports_conflicts(self):
+        """Overlapping edits still fall through to AI."""
+        from core.workspace import _workspace_module
+
+        ours = BASE.replace("return 2", "return 'o'")
+        theirs = BASE.replace("return 2", "return 't'")
+
+        assert _workspace_module._try_simple_3way_merge(BASE, ours, theirs) == (
+            False,
+            None,
+        )
+
+    def test_simple_merge_rejects_invalid_syntax(self, tmp_path):
+        """A clean diff3 result that does not parse falls through to AI."""
+        from core.workspace import _workspace_module
+
+        base = "def first():\n    return 1\n\n\ndef second():\n    return 2\n"
+        ours = base.replace("def first():", "def first(:")
+        theirs = base.replace("return 2", "return 20")
+
+        assert _workspace_module._try_simple_3way_merge(base, ours, theirs)[0]
+        assert _workspace_module._try_simple_3way_merge(
+            base, ours, theirs, "app.py", tmp_path
+        ) == (False, None)
+        assert _workspace_module._try_simple_3way_merge(
+            base, ours, theirs, "notes.txt", tmp_path
+        )[0]
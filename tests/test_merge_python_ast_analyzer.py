@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+Tests for the Python AST Analyzer
+=================================
+
+Tests AST-based semantic analysis of Python changes in the merge pipeline.
+
+Covers:
+- Attributing changes to enclosing functions, classes and methods
+- Exact line spans from the syntax tree
+- Imports (per name, including try/except fallbacks)
+- Decorator and formatting-only classification
+- Parse caching by content hash and regex fallback for invalid code
+- Fewer false conflicts between tasks editing different methods
+- Applying analyzed changes through the merge pipeline
+"""
+
+import ast
+import sys
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "apps" / "backend"))
+
+from merge import (
+    ChangeType,
+    ConflictResolver,
+    MergeDecision,
+    MergePipeline,
+    TaskSnapshot,
+)
+from merge.semantic_analysis import python_analyzer
+from merge.semantic_analysis.python_analyzer import analyze_with_ast, parse_python
+
+BASE = '''"""Service module."""
+
+import os
+
+try:
+    from .helpers import load
+except ImportError:
+    from helpers import load
+
+TIMEOUT = 30
+
+
+class Service:
+    retries = 3
+
+    def start(self):
+        return load(os.getcwd())
+
+    def stop(self):
+        return None
+
+
+def main():
+    Service().start()
+'''
+
+
+def _changes(analysis):
+    return {(c.change_type, c.location) for c in analysis.changes}
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    python_analyzer.clear_parse_cache()
+    yield
+    python_analyzer.clear_parse_cache()
+
+
+class TestChangeAttribution:
+    """Tests for mapping changes to enclosing elements."""
+
+    def test_method_change_is_attributed_to_method(self):
+        after = BASE.replace("return None", "self.running = False\n        return None")
+
+        analysis = analyze_with_ast("service.py", BASE, after)
+
+        assert _changes(analysis) == {
+            (ChangeType.MODIFY_METHOD, "method:Service.stop")
+        }
+        change = analysis.changes[0]
+        assert change.target == "Service.stop"
+        assert (change.line_start, change.line_end) == (19, 21)
+        assert "self.running = False" in change.content_after
+        assert analysis.functions_modified == {"Service.stop"}
+        assert analysis.classes_modified == {"Service"}
+
+    def test_additions_removals_and_class_body(self):
+        after = (
+            BASE.replace("    retries = 3\n", "    retries = 5\n")
+            .replace("TIMEOUT = 30\n", "")
+            .replace(
+                "def main():",
+                "def helper():\n    return 1\n\n\ndef main():",
+            )
+        )
+        after = after.replace(
+            "    def stop(self):",
+            "    def restart(self):\n        self.stop()\n\n    def stop(self):",
+        )
+
+        changes = _changes(analyze_with_ast("service.py", BASE, after))
+
+        assert changes == {
+            (ChangeType.MODIFY_CLASS, "class:Service"),
+            (ChangeType.ADD_METHOD, "method:Service.restart"),
+            (ChangeType.ADD_FUNCTION, "function:helper"),
+            (ChangeType.REMOVE_VARIABLE, "variable:TIMEOUT"),
+        }
+
+    def test_imports_per_name_including_fallbacks(self):
+        after = BASE.replace(
+            "    from .helpers import load\n",
+            "    from .helpers import load, save\n",
+        ).replace("import os\n", "import os\nimport sys as system\n")
+
+        analysis = analyze_with_ast("service.py", BASE, after)
+
+        assert analysis.imports_added == {
+            "from .helpers import save",
+            "import sys as system",
+        }
+        assert {c.location for c in analysis.changes} == {"file_top"}
+
+    def test_module_level_code(self):
+        after = BASE + '\n\nif __name__ == "__main__":\n    main()\n'
+
+        analysis = analyze_with_ast("service.py", BASE, after)
+
+        assert _changes(analysis) == {(ChangeType.UNKNOWN, "module")}
+        change = analysis.changes[0]
+        assert (change.line_start, change.line_end) == (27, 28)
+
+
+class TestClassification:
+    """Tests for decorator and formatting-only changes."""
+
+    def test_decorator_added_and_removed(self):
+        decorated = BASE.replace("def main():", "@cached\n@logged\ndef main():")
+        one_less = BASE.replace("def main():", "@logged\ndef main():")
+
+        added = analyze_with_ast("service.py", BASE, decorated)
+        removed = analyze_with_ast("service.py", decorated, one_less)
+
+        assert _changes(added) == {(ChangeType.ADD_DECORATOR, "function:main")}
+        assert (added.changes[0].line_start, added.changes[0].line_end) == (23, 26)
+        assert _changes(removed) == {(ChangeType.REMOVE_DECORATOR, "function:main")}
+
+    def test_formatting_only(self):
+        after = BASE.replace(
+            "        return load(os.getcwd())",
+            "        # Load from the working directory\n"
+            "        return load(\n            os.getcwd()\n        )",
+        )
+
+        analysis = analyze_with_ast("service.py", BASE, after)
+
+        assert _changes(analysis) == {
+            (ChangeType.FORMATTING_ONLY, "method:Service.start")
+        }
+        assert analysis.total_lines_changed == 5
+
+
+class TestParsing:
+    """Tests for the parse cache and invalid code."""
+
+    def test_parsed_structure_cached_by_content(self):
+        with patch.object(python_analyzer.ast, "parse", wraps=ast.parse) as parse:
+            for i in range(3):
+                analyze_with_ast("service.py", BASE, BASE + f"\nX{i} = {i}\n")
+
+        # The shared baseline is parsed once
+        assert parse.call_count == 4
+        assert parse_python(BASE) is parse_python(BASE)
+
+    def test_invalid_python_falls_back_to_regex(self, semantic_analyzer):
+        broken = BASE + "\ndef half(:\n"
+
+        assert analyze_with_ast("service.py", BASE, broken) is None
+
+        analysis = semantic_analyzer.analyze_diff(
+            "service.py", BASE, broken.replace("import os", "import os, re")
+        )
+        assert analysis.changes
+
+
+class TestConflicts:
+    """Tests for conflicts between tasks editing the same file."""
+
+    def test_different_methods_do_not_conflict(
+        self, semantic_analyzer, conflict_detector
+    ):
+        task_a = BASE.replace("return None", "return False")
+        task_b = BASE.replace("os.getcwd()", "os.getcwd(), strict=True")
+
+        analyses = {
+            "task-a": semantic_analyzer.analyze_diff("service.py", BASE, task_a),
+            "task-b": semantic_analyzer.analyze_diff("service.py", BASE, task_b),
+        }
+
+        assert conflict_detector.detect_conflicts(analyses) == []
+
+    def test_same_method_conflicts(self, semantic_analyzer, conflict_detector):
+        task_a = BASE.replace("return None", "return False")
+        task_b = BASE.replace("return None", "return True")
+
+        analyses = {
+            "task-a": semantic_analyzer.analyze_diff("service.py", BASE, task_a),
+            "task-b": semantic_analyzer.analyze_diff("service.py", BASE, task_b),
+        }
+
+        conflicts = conflict_detector.detect_conflicts(analyses)
+        assert [c.location for c in conflicts] == ["method:Service.stop"]
+        assert not conflicts[0].can_auto_merge
+
+
+class TestApplyingChanges:
+    """Tests for merging analyzed changes back into the baseline."""
+
+    @pytest.fixture
+    def merge(self, semantic_analyzer, conflict_detector, auto_merger):
+        pipeline = MergePipeline(
+            conflict_detector, ConflictResolver(auto_merger, enable_ai=False)
+        )
+
+        def merge(*task_contents):
+            snapshots = [
+                TaskSnapshot(
+                    task_id=f"task-{i}",
+                    task_intent="",
+                    started_at=datetime.now(),
+                    content_hash_before="before",
+                    content_hash_after=f"after-{i}",
+                    semantic_changes=semantic_analyzer.analyze_diff(
+                        "service.py", BASE, content
+                    ).changes,
+                )
+                for i, content in enumerate(task_contents)
+            ]
+            return pipeline.merge_file("service.py", BASE, snapshots)
+
+        return merge
+
+    @pytest.mark.parametrize(
+        "old, new",
+        [
+            ("    retries = 3\n", "    retries = 10\n"),
+            ("class Service:\n", 'class Service:\n    """Runs the service."""\n\n'),
+            ("    def stop(self):", "    retries_max = 9\n\n    def stop(self):"),
+            ('"""Service module."""\n', '"""Service module, revised."""\n'),
+            ("return None", "return False"),
+        ],
+    )
+    def test_single_task_changes_are_applied(self, merge, old, new):
+        after = BASE.replace(old, new)
+
+        result = merge(after)
+
+        assert result.decision == MergeDecision.AUTO_MERGED
+        assert result.merged_content == after
+
+    def test_class_and_method_changes_in_one_task(self, merge):
+        after = BASE.replace("retries = 3", "retries = 5").replace(
+            "return None", "return False"
+        )
+
+        result = merge(after)
+
+        assert result.decision == MergeDecision.AUTO_MERGED
+        assert result.merged_content == after
+
+    @pytest.mark.parametrize(
+        "after",
+        [
+            BASE + '\n\nif __name__ == "__main__":\n    main()\n',
+            BASE.replace("from .helpers import load\n", "from .helpers import save\n"),
+        ],
+    )
+    def test_unplaceable_changes_use_worktree_version(self, merge, after):
+        result = merge(after)
+
+        assert result.decision == MergeDecision.DIRECT_COPY
+        assert result.merged_content is None
+
+    def test_class_and_method_changes_from_two_tasks(self, merge):
+        task_a = BASE.replace("retries = 3", "retries = 5")
+        task_b = BASE.replace("return None", "return False")
+
+        for order in ((task_a, task_b), (task_b, task_a)):
+            result = merge(*order)
+
+            assert result.decision == MergeDecision.AUTO_MERGED
+            assert "retries = 5" in result.merged_content
+            assert "return False" in result.merged_content
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Tests for Indexed Timeline Loading
+==================================
+
+Tests that FileTimelineTracker answers queries from the timeline index
+and only parses timeline files on demand.
+
+Covers:
+- Startup without reading timeline files
+- Task, drift and pending-task queries from the index
+- LRU eviction of parsed timelines
+- Upgrading indexes written as a bare file list
+"""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from merge import timeline_tracker
+from merge.timeline_persistence import TimelinePersistence
+from merge.timeline_tracker import FileTimelineTracker
+
+
+@pytest.fixture
+def tracked_repo(temp_git_repo: Path, make_commit) -> Path:
+    """A repo with two tracked files: one active task, one merged task."""
+    make_commit("src/app.py", "print('app')\n", "Add app")
+    tracker = FileTimelineTracker(temp_git_repo)
+    tracker.on_task_start("task-1", ["README.md", "src/app.py"])
+    tracker.on_task_start("task-2", ["src/app.py"])
+    commit = make_commit("src/app.py", "print('main')\n", "Main change")
+    tracker.on_main_branch_commit(commit)
+    tracker.on_task_abandoned("task-2")
+    return temp_git_repo
+
+
+class TestIndexQueries:
+    """Queries answered without parsing timeline files."""
+
+    def test_startup_reads_no_timelines(self, tracked_repo: Path):
+        """Creating a tracker only reads the index."""
+        with patch.object(TimelinePersistence, "load_timeline") as load:
+            tracker = FileTimelineTracker(tracked_repo)
+
+            assert tracker.has_timeline("src/app.py")
+            assert sorted(tracker.get_files_for_task("task-1")) == [
+                "README.md",
+                "src/app.py",
+            ]
+            assert tracker.get_task_drift("task-1") == {
+                "README.md": 0,
+                "src/app.py": 1,
+            }
+            assert tracker.get_task_drift("task-2") == {}
+            load.assert_not_called()
+
+    def test_index_records_metadata(self, tracked_repo: Path, make_commit):
+        """Index entries carry task status and the latest main commit."""
+        tracker = FileTimelineTracker(tracked_repo)
+        entry = tracker.get_tracked_files()["src/app.py"]
+
+        assert entry["tasks"]["task-1"]["status"] == "active"
+        assert entry["tasks"]["task-2"]["status"] == "abandoned"
+        assert entry["main_events"] == 1
+        assert entry["last_event_commit"] == (
+            tracker.get_timeline("src/app.py").main_branch_history[-1].commit_hash
+        )
+
+    def test_pending_tasks_skip_inactive_files(self, tracked_repo: Path):
+        """Files without active tasks are answered from the index alone."""
+        tracker = FileTimelineTracker(tracked_repo)
+        tracker.on_task_abandoned("task-1")
+
+        reloaded = FileTimelineTracker(tracked_repo)
+        with patch.object(TimelinePersistence, "load_timeline") as load:
+            assert reloaded.get_pending_tasks_for_file("src/app.py") == []
+            load.assert_not_called()
+
+    def test_pending_tasks_load_on_demand(self, tracked_repo: Path):
+        """Files with active tasks are parsed once and then cached."""
+        tracker = FileTimelineTracker(tracked_repo)
+
+        pending = tracker.get_pending_tasks_for_file("src/app.py")
+
+        assert [view.task_id for view in pending] == ["task-1"]
+        assert list(tracker._timelines) == ["src/app.py"]
+
+
+class TestTimelineCache:
+    """Tests for the LRU of parsed timelines."""
+
+    def test_least_recently_used_evicted(self, tracked_repo: Path):
+        """The cache never grows past its limit."""
+        with patch.object(timeline_tracker, "TIMELINE_CACHE_SIZE", 1):
+            tracker = FileTimelineTracker(tracked_repo)
+            tracker.get_timeline("README.md")
+            tracker.get_timeline("src/app.py")
+
+            assert list(tracker._timelines) == ["src/app.py"]
+            assert tracker.get_timeline("README.md").task_views["task-1"]
+
+    def test_legacy_index_upgraded(self, tracked_repo: Path):
+        """An index holding only a file list is rebuilt with metadata."""
+        index_path = tracked_repo / ".auto-claude" / "file-timelines" / "index.json"
+        index_path.write_text(json.dumps({"files": ["README.md", "src/app.py"]}))
+
+        tracker = FileTimelineTracker(tracked_repo)
+
+        assert tracker.get_task_drift("task-1") == {"README.md": 0, "src/app.py": 1}
+        assert isinstance(json.loads(index_path.read_text())["files"], dict)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for Timeline Content Storage
+==================================
+
+Tests the content-addressed store behind file timelines.
+
+Covers:
+- Blob hashing compatible with git
+- Compressed and delta-compressed objects
+- Reusing blobs from the git object database
+- Timeline files referencing content by hash
+- Lazy content loading for merge context
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+from merge.timeline_store import TimelineContentStore, blob_hash
+from merge.timeline_tracker import FileTimelineTracker
+
+
+class TestContentStore:
+    """Tests for TimelineContentStore."""
+
+    def test_blob_hash_matches_git(self, temp_git_repo: Path):
+        """Hashes are the git blob ids of the content."""
+        result = subprocess.run(
+            ["git", "hash-object", "README.md"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            text=True,
+        )
+        assert blob_hash("# Test Project\n") == result.stdout.strip()
+
+    def test_round_trip(self, temp_dir: Path):
+        """Stored content is returned unchanged and written once."""
+        store = TimelineContentStore(temp_dir / "objects")
+        content = "def main():\n    return 'héllo'\n" * 50
+
+        first = store.put(content)
+        second = store.put(content)
+
+        assert first == second
+        assert store.get(first) == content
+        assert len(list((temp_dir / "objects").rglob("*"))) == 2  # dir + object
+
+    def test_delta_against_base(self, temp_dir: Path):
+        """A small edit of a known snapshot is stored as a small delta."""
+        store = TimelineContentStore(temp_dir / "objects")
+        base = "".join(f"line {i}: {'x' * (i % 17)}\n" for i in range(2000))
+        edited = base.replace("line 1000:", "line one thousand:")
+
+        base_hash = store.put(base)
+        edited_hash = store.put(edited, base_hash=base_hash)
+
+        edited_object = store._object_path(edited_hash)
+        base_object = store._object_path(base_hash)
+        assert edited_object.read_bytes()[:1] == b"d"
+        assert edited_object.stat().st_size < base_object.stat().st_size
+        assert store.get(edited_hash) == edited
+
+    def test_reuses_git_blobs(self, temp_git_repo: Path, temp_dir: Path):
+        """Content already in git is not copied into the store."""
+        store = TimelineContentStore(temp_dir / "objects", temp_git_repo)
+
+        content_hash = store.put("# Test Project\n", in_git=True)
+
+        assert not store.has(content_hash)
+        assert store.get(content_hash) == "# Test Project\n"
+
+    def test_missing_content(self, temp_dir: Path):
+        """Unknown hashes return None."""
+        store = TimelineContentStore(temp_dir / "objects")
+        assert store.get("0" * 40) is None
+
+
+class TestTimelinePersistence:
+    """Tests for timelines stored through the content store."""
+
+    def test_timeline_files_store_hashes(self, temp_git_repo: Path):
+        """Timeline JSON references content by hash instead of inlining it."""
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-1", ["README.md"], task_intent="Docs")
+        tracker.on_task_worktree_change("task-1", "README.md", "# Changed\n")
+
+        timeline_file = tracker.persistence._get_timeline_file_path("README.md")
+        data = json.loads(timeline_file.read_text())
+        view = data["task_views"]["task-1"]
+
+        assert "content" not in view["branch_point"]
+        assert view["branch_point"]["content_hash"] == blob_hash("# Test Project\n")
+        assert view["worktree_state"]["content_hash"] == blob_hash("# Changed\n")
+
+    def test_content_loaded_lazily(self, temp_git_repo: Path, make_commit):
+        """Reloaded timelines fetch content only when building merge context."""
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-1", ["README.md"])
+        tracker.on_task_worktree_change("task-1", "README.md", "# Task\n")
+        commit = make_commit("README.md", "# Main\n", "Update readme")
+        tracker.on_main_branch_commit(commit)
+
+        reloaded = FileTimelineTracker(temp_git_repo)
+        timeline = reloaded.get_timeline("README.md")
+        assert timeline.main_branch_history[0].content is None
+
+        context = reloaded.get_merge_context("task-1", "README.md")
+
+        assert context.task_branch_point.content == "# Test Project\n"
+        assert context.current_main_content == "# Main\n"
+        assert context.task_worktree_content == "# Task\n"
+
+    def test_legacy_inline_content_still_loads(self, temp_git_repo: Path):
+        """Timelines written before the content store keep working."""
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-1", ["README.md"])
+        timeline_file = tracker.persistence._get_timeline_file_path("README.md")
+        data = tracker.get_timeline("README.md").to_dict()
+        for view in data["task_views"].values():
+            view["branch_point"].pop("content_hash")
+        timeline_file.write_text(json.dumps(data))
+
+        reloaded = FileTimelineTracker(temp_git_repo)
+        context = reloaded.get_merge_context("task-1", "README.md")
+
+        assert context.task_branch_point.content == "# Test Project\n"
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+Tests for the Parallel Subtask Scheduler
+========================================
+
+Tests how independent subtasks are dispatched to concurrent coder sessions.
+
+Covers:
+- Readiness from phase dependencies and parallel_safe phases
+- File-level conflicts between concurrently scheduled subtasks
+- Worker limits, session limits and stopping on session errors
+- Locked read-modify-write updates of implementation_plan.json
+- Prompt instructions for sessions sharing a working directory
+- Per-session log attribution and commit ranges for concurrent sessions
+"""
+
+import asyncio
+import json
+import subprocess
+import threading
+from pathlib import Path
+
+import pytest
+
+from agents.scheduler import (
+    SubtaskScheduler,
+    get_max_parallel_subtasks,
+    ready_subtasks,
+    subtask_files,
+)
+from agents.utils import get_subtask_commit_range
+from core.file_utils import update_json_locked
+from prompts_pkg.prompt_generator import generate_subtask_prompt
+from task_logger import LogPhase, TaskLogger
+
+
+def _subtask(subtask_id, files=None, status="pending"):
+    subtask = {"id": subtask_id, "description": f"Do {subtask_id}", "status": status}
+    if files is not None:
+        subtask["files_to_modify"] = files
+    return subtask
+
+
+def _plan():
+    return {
+        "feature": "Wide feature",
+        "phases": [
+            {
+                "id": "setup",
+                "name": "Setup",
+                "subtasks": [_subtask("s1", ["config.py"])],
+            },
+            {
+                "id": "api",
+                "name": "API",
+                "depends_on": ["setup"],
+                "parallel_safe": True,
+                "subtasks": [
+                    _subtask("a1", ["api/users.py"]),
+                    _subtask("a2", ["api/orders.py"]),
+                    _subtask("a3", ["api/users.py", "api/auth.py"]),
+                ],
+            },
+            {
+                "id": "docs",
+                "name": "Docs",
+                "subtasks": [
+                    _subtask("d1", ["docs/api.md"]),
+                    _subtask("d2", ["docs/usage.md"]),
+                ],
+            },
+        ],
+    }
+
+
+def _ids(subtasks):
+    return [s["id"] for s in subtasks]
+
+
+def _complete(plan, *subtask_ids):
+    for phase in plan["phases"]:
+        for subtask in phase["subtasks"]:
+            if subtask["id"] in subtask_ids:
+                subtask["status"] = "completed"
+
+
+@pytest.fixture
+def plan_dir(temp_dir: Path) -> Path:
+    (temp_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+    return temp_dir
+
+
+class TestReadySubtasks:
+    """Tests for ready_subtasks()."""
+
+    def test_dependencies_and_sequential_phases(self):
+        """Blocked phases wait; sequential phases offer their first subtask."""
+        plan = _plan()
+
+        assert _ids(ready_subtasks(plan)) == ["s1", "d1"]
+
+        _complete(plan, "s1")
+        ready = ready_subtasks(plan)
+        assert _ids(ready) == ["a1", "a2", "d1"]
+        assert ready[0]["phase_id"] == "api"
+        assert ready[0]["phase_name"] == "API"
+
+    def test_running_subtasks_and_file_conflicts(self):
+        """Running subtasks hold their phase (if sequential) and their files."""
+        plan = _plan()
+        _complete(plan, "s1")
+        running = {s["id"]: s for s in ready_subtasks(plan)[:1]}
+
+        # a3 shares api/users.py with the running a1
+        assert _ids(ready_subtasks(plan, running)) == ["a2", "d1"]
+
+        running = {"d1": _subtask("d1", ["docs/api.md"])}
+        assert _ids(ready_subtasks(plan, running)) == ["a1", "a2"]
+        assert _ids(ready_subtasks(plan, excluded=["a1", "d1"])) == ["a2", "a3"]
+
+    def test_undeclared_files_run_alone(self):
+        """A subtask without declared files never shares the workspace."""
+        plan = _plan()
+        plan["phases"][0]["subtasks"] = [_subtask("s1")]
+
+        assert _ids(ready_subtasks(plan)) == ["s1"]
+        assert ready_subtasks(plan, {"s1": _subtask("s1")}) == []
+        assert subtask_files({"files_to_create": ["./a\\b.py"]}) == {"a/b.py"}
+
+    def test_worker_limit_configuration(self, temp_dir: Path, monkeypatch):
+        """task_metadata.json wins over MAX_PARALLEL_SUBTASKS; default is 1."""
+        monkeypatch.delenv("MAX_PARALLEL_SUBTASKS", raising=False)
+        assert get_max_parallel_subtasks(temp_dir) == 1
+
+        monkeypatch.setenv("MAX_PARALLEL_SUBTASKS", "4")
+        assert get_max_parallel_subtasks(temp_dir) == 4
+
+        metadata = temp_dir / "task_metadata.json"
+        metadata.write_text(json.dumps({"maxParallelSubtasks": 2}))
+        assert get_max_parallel_subtasks(temp_dir) == 2
+
+        metadata.write_text(json.dumps({"maxParallelSubtasks": "many"}))
+        monkeypatch.setenv("MAX_PARALLEL_SUBTASKS", "0")
+        assert get_max_parallel_subtasks(temp_dir) == 1
+
+
+class TestSubtaskScheduler:
+    """Tests for SubtaskScheduler.run()."""
+
+    @staticmethod
+    def _session(plan_dir: Path, log: list, fail=(), delay=0.01):
+        """Fake coder session that completes its subtask in the plan."""
+        active = set()
+
+        async def run_subtask(subtask):
+            active.add(subtask["id"])
+            log.append(sorted(active))
+            await asyncio.sleep(delay)
+            active.discard(subtask["id"])
+            if subtask["id"] in fail:
+                return "error"
+            with update_json_locked(plan_dir / "implementation_plan.json") as plan:
+                _complete(plan, subtask["id"])
+            return "continue"
+
+        return run_subtask
+
+    def test_runs_plan_to_completion_concurrently(self, plan_dir: Path):
+        """Independent subtasks overlap, up to the worker limit."""
+        log = []
+        scheduler = SubtaskScheduler(plan_dir, max_workers=3)
+
+        assert asyncio.run(scheduler.run(self._session(plan_dir, log))) is True
+
+        assert scheduler.sessions_run == 6
+        assert scheduler.ready() == []
+        assert max(len(active) for active in log) == 3
+        assert ["d1", "s1"] in log
+        assert not any({"a1", "a3"} <= set(active) for active in log)
+        assert not any({"d1", "d2"} <= set(active) for active in log)
+
+    def test_stops_dispatching_after_error(self, plan_dir: Path):
+        """Running sessions finish, but nothing new starts after an error."""
+        log = []
+        scheduler = SubtaskScheduler(plan_dir, max_workers=2)
+
+        ok = asyncio.run(scheduler.run(self._session(plan_dir, log, fail={"s1"})))
+
+        assert ok is False
+        assert scheduler.sessions_run == 2
+        assert _ids(scheduler.ready()) == ["s1", "d2"]
+
+    def test_session_limit_and_exclusions(self, plan_dir: Path):
+        """max_sessions caps dispatches; excluded subtasks are never run."""
+        log = []
+        scheduler = SubtaskScheduler(plan_dir, max_workers=4, excluded=lambda: ["d1"])
+
+        asyncio.run(scheduler.run(self._session(plan_dir, log), max_sessions=2))
+
+        assert scheduler.sessions_run == 2
+        assert log[0] == ["s1"]
+        assert all("d1" not in active for active in log)
+
+
+class TestConcurrentPlanUpdates:
+    """Tests for update_json_locked() and concurrent-session prompts."""
+
+    def test_no_lost_updates_across_threads(self, plan_dir: Path):
+        """Concurrent read-modify-write updates all land."""
+        plan_file = plan_dir / "implementation_plan.json"
+
+        def bump(n):
+            for _ in range(25):
+                with update_json_locked(plan_file) as plan:
+                    plan[f"counter_{n}"] = plan.get(f"counter_{n}", 0) + 1
+                    plan["total"] = plan.get("total", 0) + 1
+
+        threads = [threading.Thread(target=bump, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        plan = json.loads(plan_file.read_text())
+        assert plan["total"] == 100
+        assert [plan[f"counter_{n}"] for n in range(4)] == [25] * 4
+
+    def test_failed_update_leaves_file_unchanged(self, plan_dir: Path):
+        plan_file = plan_dir / "implementation_plan.json"
+        before = plan_file.read_text()
+
+        with pytest.raises(RuntimeError):
+            with update_json_locked(plan_file) as plan:
+                plan["phases"] = []
+                raise RuntimeError("abort")
+
+        assert plan_file.read_text() == before
+
+    def test_concurrent_prompt_instructions(self, plan_dir: Path):
+        """Parallel sessions commit by path and update status via the tool."""
+        subtask = _subtask("a1", ["api/users.py"])
+        phase = {"name": "API"}
+
+        sequential = generate_subtask_prompt(plan_dir, plan_dir, subtask, phase)
+        concurrent = generate_subtask_prompt(
+            plan_dir, plan_dir, subtask, phase, concurrent=True
+        )
+
+        assert "git add .\n" in sequential
+        assert "## Parallel Build" not in sequential
+        assert "## Parallel Build" in concurrent
+        assert "git add .\n" not in concurrent
+        assert "git add api/users.py\n" in concurrent
+        assert 'a1 - Do a1" -- api/users.py\n' in concurrent
+        assert 'a1 - Do a1"\n' in sequential
+        assert "update_subtask_status" in concurrent
+
+
+class TestConcurrentSessions:
+    """Tests for keeping concurrent sessions' logs and commits apart."""
+
+    def test_log_entries_attributed_per_session(self, temp_dir: Path):
+        logger = TaskLogger(temp_dir, emit_markers=False)
+        logger.start_phase(LogPhase.CODING)
+        logger.set_subtask("main")
+
+        async def session(subtask_id, session_num, delay):
+            with logger.session_context(subtask_id, session_num):
+                await asyncio.sleep(delay)
+                logger.log(f"working on {subtask_id}", phase=LogPhase.CODING)
+                await asyncio.sleep(delay)
+                logger.log(f"done with {subtask_id}", phase=LogPhase.CODING)
+
+        async def run():
+            await asyncio.gather(session("s1", 1, 0.02), session("s2", 2, 0.01))
+
+        asyncio.run(run())
+
+        entries = logger.storage.get_data()["phases"]["coding"]["entries"]
+        attributed = {
+            (e["content"], e.get("subtask_id"), e.get("session"))
+            for e in entries
+            if e["content"].startswith(("working", "done"))
+        }
+        assert attributed == {
+            ("working on s1", "s1", 1),
+            ("done with s1", "s1", 1),
+            ("working on s2", "s2", 2),
+            ("done with s2", "s2", 2),
+        }
+        assert logger.current_subtask == "main"
+
+    def test_commit_range_skips_other_sessions(self, temp_git_repo: Path):
+        def commit(message):
+            subprocess.run(
+                ["git", "commit", "--allow-empty", "-q", "-m", message],
+                cwd=temp_git_repo,
+                check=True,
+            )
+            return subprocess.run(
+                ["git", "rev-parse", "HEAD"],
+                cwd=temp_git_repo,
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+
+        start = commit("before sessions")
+        commit("auto-claude: s1 - first part")
+        other = commit("auto-claude: s10 - another session")
+        commit("auto-claude: s1 - second part")
+        s1_last = commit("auto-claude: Complete s1 - wrap up")
+        commit("auto-claude: s2 - yet another session")
+
+        # The range starts after the other session's commit
+        assert get_subtask_commit_range(temp_git_repo, "s1", start) == (
+            other,
+            s1_last,
+            3,
+        )
+        assert get_subtask_commit_range(temp_git_repo, "s3", start) == (
+            start,
+            start,
+            0,
+        )
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for Project Inventory
+===========================
+
+Tests the single-pass file inventory shared by the project analyzers:
+- Pruning of SKIP_DIRS and .gitignore'd paths
+- Glob queries answered from the inventory
+- Sharing one inventory across service analyzers
+"""
+
+from pathlib import Path
+
+from analysis.analyzers.route_detector import RouteDetector
+from project.inventory import ProjectInventory
+
+
+def _write(root: Path, rel: str, content: str = "") -> Path:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _rel(root: Path, paths: list[Path]) -> list[str]:
+    return sorted(p.relative_to(root.resolve()).as_posix() for p in paths)
+
+
+class TestProjectInventory:
+    """Tests for ProjectInventory traversal and queries."""
+
+    def test_skips_dependency_directories(self, temp_dir: Path):
+        _write(temp_dir, "src/app.py")
+        _write(temp_dir, "node_modules/pkg/index.js")
+        _write(temp_dir, ".venv/lib/site.py")
+        _write(temp_dir, "pkg.egg-info/PKG-INFO")
+
+        inventory = ProjectInventory(temp_dir)
+
+        assert _rel(temp_dir, inventory.files) == ["src/app.py"]
+
+    def test_honours_nested_gitignore(self, temp_dir: Path):
+        _write(temp_dir, ".gitignore", "*.log\ngenerated/\n!keep.log\n")
+        _write(temp_dir, "web/.gitignore", "/local.py\n")
+        _write(temp_dir, "debug.log")
+        _write(temp_dir, "keep.log")
+        _write(temp_dir, "generated/models.py")
+        _write(temp_dir, "web/local.py")
+        _write(temp_dir, "web/sub/local.py")
+
+        inventory = ProjectInventory(temp_dir)
+
+        assert _rel(temp_dir, inventory.glob("**/*.log")) == ["keep.log"]
+        assert _rel(temp_dir, inventory.glob("**/*.py")) == ["web/sub/local.py"]
+
+    def test_glob_matches_path_semantics(self, temp_dir: Path):
+        _write(temp_dir, "models.py")
+        _write(temp_dir, "api/models.py")
+        _write(temp_dir, "api/user.entity.ts")
+        _write(temp_dir, "api/routes/item.ts")
+
+        inventory = ProjectInventory(temp_dir)
+        api = temp_dir / "api"
+
+        assert _rel(temp_dir, inventory.glob("*.py")) == ["models.py"]
+        assert _rel(temp_dir, inventory.glob("**/models.py")) == [
+            "api/models.py",
+            "models.py",
+        ]
+        assert _rel(temp_dir, inventory.glob("**/*.entity.ts", api)) == [
+            "api/user.entity.ts"
+        ]
+        assert _rel(temp_dir, inventory.glob("routes/*.{ts,js}", api)) == [
+            "api/routes/item.ts"
+        ]
+        assert inventory.glob("**/*.py", temp_dir.parent / "elsewhere") == []
+
+    def test_refresh_picks_up_new_files(self, temp_dir: Path):
+        inventory = ProjectInventory(temp_dir)
+        assert inventory.files == []
+
+        _write(temp_dir, "main.go")
+        assert inventory.files == []
+
+        inventory.refresh()
+        assert _rel(temp_dir, inventory.files) == ["main.go"]
+
+    def test_route_detector_expands_brace_patterns(self, temp_dir: Path):
+        _write(
+            temp_dir,
+            "app/api/users/route.ts",
+            "export async function GET() {}\nexport async function POST() {}\n",
+        )
+
+        inventory = ProjectInventory(temp_dir)
+        routes = RouteDetector(temp_dir, inventory).detect_all_routes()
+
+        assert {(r["path"], tuple(r["methods"])) for r in routes} == {
+            ("/api/users", ("GET", "POST"))
+        }
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Tests for the query_memory Server Mode
+======================================
+
+Tests the long-lived JSON-RPC server used by the desktop memory panel.
+
+Covers:
+- Request validation and JSON-RPC error responses
+- Concurrent requests answered out of order
+- Pooled database connections and idle cleanup
+- Subcommands forwarding to a running server over a Unix socket
+- Refusing sockets other users could control, and never sending API keys
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+import query_memory
+from query_memory import MemoryServer, forward_to_server
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def has_next(self):
+        return bool(self._rows)
+
+    def get_next(self):
+        return self._rows.pop(0)
+
+
+class FakeKuzu:
+    """Records databases and connections opened through the server."""
+
+    def __init__(self):
+        self.databases = []
+        self.connections = []
+
+    def Database(self, path):
+        db = type("FakeDatabase", (), {"closed": False})()
+        db.close = lambda: setattr(db, "closed", True)
+        self.databases.append(db)
+        return db
+
+    def Connection(self, db):
+        conn = type("FakeConnection", (), {})()
+        conn.execute = lambda query, parameters=None: FakeResult(
+            [("uuid-1", "session_1", "2024-01-01", "content", "desc", "group")]
+        )
+        self.connections.append(conn)
+        return conn
+
+
+def _request(method, params=None, request_id=1):
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method}
+    if params is not None:
+        request["params"] = params
+    return json.dumps(request)
+
+
+class TestRequestHandling:
+    """Tests for MemoryServer.handle_line()."""
+
+    def test_protocol_errors(self):
+        """Malformed requests get JSON-RPC error codes, not exceptions."""
+        server = MemoryServer()
+
+        async def run():
+            return [
+                await server.handle_line("{not json"),
+                await server.handle_line(json.dumps(["batch"])),
+                await server.handle_line(_request("drop-tables", {})),
+                await server.handle_line(_request("search", {"db_path": "/x"})),
+                await server.handle_line(
+                    _request("ping", {"verbose": True}, request_id="a")
+                ),
+            ]
+
+        responses = asyncio.run(run())
+
+        assert [r["error"]["code"] for r in responses] == [
+            -32700,
+            -32600,
+            -32601,
+            -32602,
+            -32602,
+        ]
+        assert "missing database, query" in responses[3]["error"]["message"]
+        assert responses[4]["id"] == "a"
+
+    def test_ping_and_notifications(self):
+        """Requests without an id are run but not answered."""
+        server = MemoryServer()
+
+        async def run():
+            ping = await server.handle_line(_request("ping", request_id=7))
+            notification = await server.handle_line(
+                json.dumps({"jsonrpc": "2.0", "method": "ping"})
+            )
+            return ping, notification
+
+        ping, notification = asyncio.run(run())
+
+        assert ping["id"] == 7
+        assert ping["result"]["success"] is True
+        assert notification is None
+
+    def test_missing_backend_reported(self, temp_dir: Path):
+        """Command results match the CLI output when kuzu is unavailable."""
+        with patch.object(query_memory, "apply_monkeypatch", return_value=None):
+            server = MemoryServer()
+            response = asyncio.run(
+                server.handle_line(
+                    _request(
+                        "get-status", {"db_path": str(temp_dir), "database": "mem"}
+                    )
+                )
+            )
+
+        assert response["result"]["success"] is True
+        assert response["result"]["data"]["available"] is False
+
+
+class TestConcurrency:
+    """Tests for concurrent requests on one stream."""
+
+    def test_slow_request_does_not_block_others(self):
+        """A fast request is answered while a slow one is still running."""
+        server = MemoryServer()
+        release = threading.Event()
+
+        def slow_search(args, connect):
+            release.wait(timeout=5)
+            return query_memory.make_result(True, data={"query": args.query})
+
+        def quick_entities(args, connect):
+            return query_memory.make_result(True, data={"entities": []})
+
+        lines = [
+            _request("search", {"db_path": "/db", "database": "m", "query": "q"}, 1),
+            _request("get-entities", {"db_path": "/db", "database": "m"}, 2),
+        ]
+        written = []
+
+        async def run():
+            queue = [line.encode() + b"\n" for line in lines] + [b""]
+
+            async def readline():
+                return queue.pop(0)
+
+            async def write_line(text):
+                written.append(json.loads(text)["id"])
+                release.set()
+
+            await server.serve_stream(readline, write_line)
+
+        with patch.dict(
+            query_memory.COMMANDS,
+            {"search": slow_search, "get-entities": quick_entities},
+        ):
+            asyncio.run(run())
+
+        assert written == [2, 1]
+
+
+class TestConnectionPool:
+    """Tests for warm database handles."""
+
+    def test_connections_reused_and_closed_when_idle(self, temp_dir: Path):
+        """One database and connection serve sequential queries."""
+        (temp_dir / "mem").mkdir()
+        fake = FakeKuzu()
+        params = {"db_path": str(temp_dir), "database": "mem", "limit": 5}
+
+        with (
+            patch.dict(sys.modules, {"kuzu": fake}),
+            patch.object(query_memory, "apply_monkeypatch", return_value="kuzu"),
+        ):
+            server = MemoryServer(idle_timeout=0)
+
+            async def run():
+                first = await server.call("get-memories", dict(params))
+                second = await server.call("get-memories", dict(params))
+                return first, second
+
+            first, second = asyncio.run(run())
+            assert first["data"]["memories"][0]["session_number"] == 1
+            assert second["success"] is True
+            assert len(fake.databases) == 1
+            assert len(fake.connections) == 1
+
+            server._close_idle_handles()
+
+        assert fake.databases[0].closed
+        assert server._databases == {}
+
+    def test_missing_database_not_cached(self, temp_dir: Path):
+        """Queries against a missing database fail without opening it."""
+        fake = FakeKuzu()
+        with (
+            patch.dict(sys.modules, {"kuzu": fake}),
+            patch.object(query_memory, "apply_monkeypatch", return_value="kuzu"),
+        ):
+            server = MemoryServer()
+            result = asyncio.run(
+                server.call(
+                    "get-entities",
+                    {"db_path": str(temp_dir), "database": "absent", "limit": 5},
+                )
+            )
+
+        assert result["success"] is False
+        assert "Database not found" in result["error"]
+        assert fake.databases == []
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix sockets only")
+class TestForwarding:
+    """Tests for subcommands acting as thin clients."""
+
+    def test_forward_round_trip(self):
+        """forward_to_server() gets results from a server on the socket."""
+        # AF_UNIX paths are length-limited, so avoid deep pytest tmp dirs
+        with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+            socket_path = Path(tmp) / "memory.sock"
+            server = MemoryServer()
+            loop = asyncio.new_event_loop()
+            task = loop.create_task(server.serve(socket_path))
+            thread = threading.Thread(target=loop.run_forever, daemon=True)
+            thread.start()
+            try:
+                deadline = time.monotonic() + 5
+                while not socket_path.exists() and time.monotonic() < deadline:
+                    time.sleep(0.01)
+
+                result = forward_to_server("ping", {}, socket_path=socket_path)
+                invalid = forward_to_server("nope", {}, socket_path=socket_path)
+            finally:
+                loop.call_soon_threadsafe(task.cancel)
+                thread.join(timeout=0.2)
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join(timeout=5)
+
+        assert result["success"] is True
+        assert "pid" in result["data"]
+        # Protocol errors make the caller run the command itself
+        assert invalid is None
+
+    def test_no_server_runs_locally(self, temp_dir: Path):
+        """Without a socket the subcommand doesn't try to forward."""
+        assert forward_to_server("ping", {}, socket_path=temp_dir / "none") is None
+
+    def test_untrusted_socket_not_used(self):
+        """A socket in a directory others can write is never connected to."""
+        with tempfile.TemporaryDirectory(dir="/tmp") as tmp:
+            socket_path = Path(tmp) / "memory.sock"
+            listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            listener.bind(str(socket_path))
+            listener.listen()
+            try:
+                os.chmod(tmp, 0o777)
+                with patch.object(query_memory.socket, "socket") as connect:
+                    assert forward_to_server("ping", {}, socket_path) is None
+                connect.assert_not_called()
+
+                with pytest.raises(RuntimeError, match="not writable by others"):
+                    asyncio.run(MemoryServer().serve(Path(tmp) / "other.sock"))
+            finally:
+                listener.close()
+
+    def test_default_socket_in_private_runtime_dir(self, temp_dir, monkeypatch):
+        monkeypatch.delenv(query_memory.SOCKET_ENV_VAR, raising=False)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(temp_dir))
+
+        path = query_memory.default_socket_path()
+
+        assert path == temp_dir / "auto-claude" / "memory.sock"
+
+    def test_semantic_search_never_forwards_keys(self, monkeypatch):
+        monkeypatch.setenv("GRAPHITI_EMBEDDER_PROVIDER", "openai")
+        monkeypatch.setenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-secret")
+        monkeypatch.setenv("AZURE_OPENAI_API_KEY", "azure-secret")
+        args = argparse.Namespace(
+            command="semantic-search", db_path="db", database="memory", query="q"
+        )
+
+        env = query_memory._request_params(args)["env"]
+
+        assert env["GRAPHITI_EMBEDDER_PROVIDER"] == "openai"
+        assert env["OPENAI_EMBEDDING_MODEL"] == "text-embedding-3-small"
+        assert "sk-secret" not in env.values()
+        assert "azure-secret" not in env.values()
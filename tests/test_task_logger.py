@@ -14,7 +14,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'apps', 'backen
 from task_logger.ansi import strip_ansi_codes
 from task_logger.capture import StreamingLogCapture
 from task_logger.logger import TaskLogger
-from task_logger.models import LogEntryType, LogPhase
+from task_logger.models import LogEntry, LogEntryType, LogPhase
+from task_logger.storage import LogStorage, load_task_logs
 
 
 # ============================================================================
@@ -303,6 +304,119 @@ class TestStreamingLogCaptureAnsiIntegration:
         assert coding_entries[1]["content"] == "Success"
 
 
+# ============================================================================
+# Journal Storage Tests
+# ============================================================================
+
+def _entry(content: str, phase: str = "coding") -> LogEntry:
+    return LogEntry(
+        timestamp="2026-01-01T00:00:00+00:00",
+        type=LogEntryType.TEXT.value,
+        content=content,
+        phase=phase,
+    )
+
+
+class TestLogStorageJournal:
+    """Tests for the append-only journal used by LogStorage."""
+
+    def _large_storage(self, tmp_path, monkeypatch) -> LogStorage:
+        """Storage whose snapshot is past the compaction threshold."""
+        monkeypatch.setattr(LogStorage, "COMPACT_MIN_BYTES", 0)
+        monkeypatch.setattr(LogStorage, "COMPACT_DELAY_SECONDS", 60.0)
+        storage = LogStorage(tmp_path)
+        storage.save()
+        return storage
+
+    def test_small_log_writes_snapshot_immediately(self, tmp_path):
+        """Small logs are written straight to task_logs.json."""
+        storage = LogStorage(tmp_path)
+        storage.add_entry(_entry("first"))
+
+        logs = json.loads((tmp_path / "task_logs.json").read_text())
+        assert [e["content"] for e in logs["phases"]["coding"]["entries"]] == ["first"]
+        assert not (tmp_path / LogStorage.JOURNAL_FILE).exists()
+
+    def test_large_log_appends_to_journal(self, tmp_path, monkeypatch):
+        """Past the threshold entries go to the journal, not the snapshot."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("journaled"))
+
+        snapshot = json.loads((tmp_path / "task_logs.json").read_text())
+        assert snapshot["phases"]["coding"]["entries"] == []
+        journal_lines = (tmp_path / LogStorage.JOURNAL_FILE).read_text().splitlines()
+        assert len(journal_lines) == 1
+        assert json.loads(journal_lines[0])["entry"]["content"] == "journaled"
+        storage.flush()
+
+    def test_load_task_logs_replays_journal(self, tmp_path, monkeypatch):
+        """load_task_logs() includes entries not yet compacted."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("one"))
+        storage.update_phase_status("coding", "active")
+        storage.add_entry(_entry("two"))
+
+        logs = load_task_logs(tmp_path)
+        assert [e["content"] for e in logs["phases"]["coding"]["entries"]] == [
+            "one",
+            "two",
+        ]
+        assert logs["phases"]["coding"]["status"] == "active"
+        storage.flush()
+
+    def test_flush_compacts_journal(self, tmp_path, monkeypatch):
+        """flush() folds the journal into the snapshot and removes it."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("pending"))
+        storage.flush()
+
+        snapshot = json.loads((tmp_path / "task_logs.json").read_text())
+        assert [e["content"] for e in snapshot["phases"]["coding"]["entries"]] == [
+            "pending"
+        ]
+        assert not (tmp_path / LogStorage.JOURNAL_FILE).exists()
+
+    def test_ratio_triggers_compaction(self, tmp_path, monkeypatch):
+        """A journal larger than COMPACT_RATIO of the snapshot is compacted."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("x" * 10_000))
+
+        snapshot = json.loads((tmp_path / "task_logs.json").read_text())
+        assert len(snapshot["phases"]["coding"]["entries"]) == 1
+        assert not (tmp_path / LogStorage.JOURNAL_FILE).exists()
+
+    def test_reload_recovers_uncompacted_entries(self, tmp_path, monkeypatch):
+        """A new storage instance (e.g. after a crash) replays the journal."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("survives", phase="custom"))
+        storage._cancel_compaction()
+
+        reloaded = LogStorage(tmp_path)
+        phase = reloaded.get_phase_data("custom")
+        assert [e["content"] for e in phase["entries"]] == ["survives"]
+
+    def test_stale_journal_records_are_not_duplicated(self, tmp_path, monkeypatch):
+        """Records already folded into the snapshot are skipped on replay."""
+        storage = self._large_storage(tmp_path, monkeypatch)
+        storage.add_entry(_entry("once"))
+        journal = (tmp_path / LogStorage.JOURNAL_FILE).read_text()
+        storage.flush()
+        # Simulate a crash between writing the snapshot and removing the journal
+        (tmp_path / LogStorage.JOURNAL_FILE).write_text(journal + "{torn")
+
+        logs = load_task_logs(tmp_path)
+        assert [e["content"] for e in logs["phases"]["coding"]["entries"]] == ["once"]
+
+    def test_legacy_mode_has_no_journal(self, tmp_path):
+        """journal=False keeps the original write-through behaviour."""
+        storage = LogStorage(tmp_path, journal=False)
+        storage.add_entry(_entry("legacy"))
+
+        snapshot = json.loads((tmp_path / "task_logs.json").read_text())
+        assert "journal_seq" not in snapshot
+        assert not (tmp_path / LogStorage.JOURNAL_FILE).exists()
+
+
 # ============================================================================
 # Public API Tests
 # ============================================================================